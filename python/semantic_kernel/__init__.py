@@ -1,9 +1,20 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.kernel import Kernel
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.kernel import Kernel
+
+_LAZY_ATTRIBUTES = {
+    "Kernel": ".kernel",
+}
 
 __version__ = "1.30.0"
 
 DEFAULT_RC_VERSION = f"{__version__}-rc8"
 
 __all__ = ["DEFAULT_RC_VERSION", "Kernel", "__version__"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 from collections.abc import AsyncIterable, Sequence
-from functools import reduce
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, cast
 
 from openai import BadRequestError
@@ -37,6 +36,7 @@ from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.contents.image_content import ImageContent
 from semantic_kernel.contents.streaming_annotation_content import StreamingAnnotationContent
+from semantic_kernel.contents.streaming_chat_message_accumulator import StreamingChatMessageAccumulator
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.streaming_text_content import StreamingTextContent
 from semantic_kernel.contents.text_content import TextContent
@@ -363,7 +363,7 @@ class ResponsesAgentThreadActions:
                 stream=True,
             )
 
-            all_messages: list[StreamingChatMessageContent] = []
+            accumulator = StreamingChatMessageAccumulator()
             function_call_returned = False
 
             async with response as response_stream:
@@ -385,7 +385,7 @@ class ResponsesAgentThreadActions:
                                 items=function_calls,
                                 choice_index=request_index,
                             )
-                            all_messages.append(msg)
+                            accumulator.add(msg)
                         case ResponseFunctionCallArgumentsDeltaEvent():
                             function_call = FunctionCallContent(
                                 id=event.item_id,
@@ -399,7 +399,7 @@ class ResponsesAgentThreadActions:
                                 items=[function_call],
                                 choice_index=request_index,
                             )
-                            all_messages.append(msg)
+                            accumulator.add(msg)
                         case ResponseTextDeltaEvent():
                             text_content = StreamingTextContent(
                                 text=event.delta,
@@ -427,7 +427,7 @@ class ResponsesAgentThreadActions:
             if not function_call_returned:
                 return
 
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion: StreamingChatMessageContent = accumulator.build()  # type: ignore[assignment]
             if output_messages is not None:
                 # Append the content with function call content to the msgs used for the callback
                 output_messages.append(full_completion)
@@ -12,6 +12,7 @@ from semantic_kernel.agents.runtime.core.topic import TopicId
 from semantic_kernel.agents.runtime.in_process.default_subscription import DefaultSubscription
 from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
 from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+from semantic_kernel.agents.runtime.multi_process.multi_process_runtime import MultiProcessRuntime
 
 __all__ = [
     "Agent",
@@ -25,6 +26,7 @@ __all__ = [
     "InProcessRuntime",
     "MessageContext",
     "MessageHandler",
+    "MultiProcessRuntime",
     "RoutedAgent",
     "Subscription",
     "TopicId",
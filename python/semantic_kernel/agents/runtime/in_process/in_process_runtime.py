@@ -8,7 +8,7 @@ import uuid
 import warnings
 from asyncio import CancelledError, Future, Queue, Task
 from collections.abc import Awaitable, Callable, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, ParamSpec, TypeVar, cast
 
 from semantic_kernel.utils.feature_stage_decorator import experimental
@@ -74,6 +74,7 @@ class PublishMessageEnvelope:
     topic_id: TopicId
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    _serialized_message: tuple[Any, str] | None = field(default=None, init=False, repr=False, compare=False)
 
 
 @experimental
@@ -88,6 +89,7 @@ class SendMessageEnvelope:
     cancellation_token: CancellationToken
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    _serialized_message: tuple[Any, str] | None = field(default=None, init=False, repr=False, compare=False)
 
 
 @experimental
@@ -100,6 +102,7 @@ class ResponseMessageEnvelope:
     sender: AgentId
     recipient: AgentId | None
     metadata: EnvelopeMetadata | None = None
+    _serialized_message: tuple[Any, str] | None = field(default=None, init=False, repr=False, compare=False)
 
 
 P = ParamSpec("P")
@@ -222,15 +225,18 @@ class InProcessRuntime(CoreRuntime):
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        payload: str | None = None
+        if event_logger.isEnabledFor(logging.INFO):
+            payload = self._try_serialize(message)
+            event_logger.info(
+                MessageEvent(
+                    payload=payload,
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -242,20 +248,22 @@ class InProcessRuntime(CoreRuntime):
             if recipient.type not in self._known_agent_names:
                 future.set_exception(Exception("Recipient not found"))
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
 
-            await self._message_queue.put(
-                SendMessageEnvelope(
-                    message=message,
-                    recipient=recipient,
-                    future=future,
-                    cancellation_token=cancellation_token,
-                    sender=sender,
-                    metadata=get_telemetry_envelope_metadata(),
-                    message_id=message_id,
-                )
+            message_envelope = SendMessageEnvelope(
+                message=message,
+                recipient=recipient,
+                future=future,
+                cancellation_token=cancellation_token,
+                sender=sender,
+                metadata=get_telemetry_envelope_metadata(),
+                message_id=message_id,
             )
+            if payload is not None:
+                message_envelope._serialized_message = (message, payload)
+            await self._message_queue.put(message_envelope)
 
             cancellation_token.link_future(future)
 
@@ -279,32 +287,33 @@ class InProcessRuntime(CoreRuntime):
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
-                )
+            message_envelope = PublishMessageEnvelope(
+                message=message,
+                cancellation_token=cancellation_token,
+                sender=sender,
+                topic_id=topic_id,
+                metadata=get_telemetry_envelope_metadata(),
+                message_id=message_id,
             )
-
-            await self._message_queue.put(
-                PublishMessageEnvelope(
-                    message=message,
-                    cancellation_token=cancellation_token,
-                    sender=sender,
-                    topic_id=topic_id,
-                    metadata=get_telemetry_envelope_metadata(),
-                    message_id=message_id,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize_envelope(message_envelope),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
+
+            await self._message_queue.put(message_envelope)
 
     async def save_state(self) -> Mapping[str, Any]:
         """Save the state of all instantiated agents.
@@ -349,20 +358,22 @@ class InProcessRuntime(CoreRuntime):
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
-                logger.info(
-                    f"Calling message handler for {recipient} with message type "
-                    f"{type(message_envelope.message).__name__} sent by {sender_id}"
-                )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                if logger.isEnabledFor(logging.INFO):
+                    sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                    logger.info(
+                        f"Calling message handler for {recipient} with message type "
+                        f"{type(message_envelope.message).__name__} sent by {sender_id}"
+                    )
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=self._try_serialize_envelope(message_envelope),
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
                     )
-                )
                 recipient_agent = await self._get_agent(recipient)
 
                 message_context = MessageContext(
@@ -384,45 +395,47 @@ class InProcessRuntime(CoreRuntime):
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._try_serialize_envelope(message_envelope),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
             except BaseException as e:
                 message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._try_serialize_envelope(message_envelope),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
-                )
+            response_envelope = ResponseMessageEnvelope(
+                message=response,
+                future=message_envelope.future,
+                sender=message_envelope.recipient,
+                recipient=message_envelope.sender,
+                metadata=get_telemetry_envelope_metadata(),
             )
-
-            await self._message_queue.put(
-                ResponseMessageEnvelope(
-                    message=response,
-                    future=message_envelope.future,
-                    sender=message_envelope.recipient,
-                    recipient=message_envelope.sender,
-                    metadata=get_telemetry_envelope_metadata(),
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize_envelope(response_envelope),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
+
+            await self._message_queue.put(response_envelope)
             self._message_queue.task_done()
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
@@ -430,28 +443,34 @@ class InProcessRuntime(CoreRuntime):
             try:
                 responses: list[Awaitable[Any]] = []
                 recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
+                # Avoid sending the message back to the sender
+                if message_envelope.sender is not None:
+                    recipients = [agent_id for agent_id in recipients if agent_id != message_envelope.sender]
+                # The sender and the log settings are the same for every recipient
+                sender_agent = (
+                    await self._get_agent(message_envelope.sender)
+                    if message_envelope.sender is not None and recipients
+                    else None
+                )
+                sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
+                log_delivery = logger.isEnabledFor(logging.INFO)
+                log_delivery_event = event_logger.isEnabledFor(logging.INFO)
                 for agent_id in recipients:
-                    # Avoid sending the message back to the sender
-                    if message_envelope.sender is not None and agent_id == message_envelope.sender:
-                        continue
-
-                    sender_agent = (
-                        await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
-                    )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type "
-                        f"{type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                    if log_delivery:
+                        logger.info(
+                            f"Calling message handler for {agent_id.type} with message type "
+                            f"{type(message_envelope.message).__name__} published by {sender_name}"
+                        )
+                    if log_delivery_event:
+                        event_logger.info(
+                            MessageEvent(
+                                payload=self._try_serialize_envelope(message_envelope),
+                                sender=message_envelope.sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
                         )
-                    )
                     message_context = MessageContext(
                         sender=message_envelope.sender,
                         topic_id=message_envelope.topic_id,
@@ -473,13 +492,14 @@ class InProcessRuntime(CoreRuntime):
                                 )
                             except BaseException as e:
                                 logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                event_logger.info(
-                                    MessageHandlerExceptionEvent(
-                                        payload=self._try_serialize(message_envelope.message),
-                                        handling_agent=agent.id,
-                                        exception=e,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageHandlerExceptionEvent(
+                                            payload=self._try_serialize_envelope(message_envelope),
+                                            handling_agent=agent.id,
+                                            exception=e,
+                                        )
                                     )
-                                )
                                 raise e
 
                     future = _on_message(agent, message_context)
@@ -495,24 +515,26 @@ class InProcessRuntime(CoreRuntime):
 
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("ack", message_envelope.recipient, parent=message_envelope.metadata):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient "
-                f"{message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    f"Resolving response with message type {type(message_envelope.message).__name__} for recipient "
+                    f"{message_envelope.recipient} from {message_envelope.sender.type}: {content}"
+                )
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize_envelope(message_envelope),
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -565,14 +587,15 @@ class InProcessRuntime(CoreRuntime):
                                 future.set_exception(e)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._try_serialize(message),
+                                            sender=sender,
+                                            receiver=recipient,
+                                            kind=MessageKind.DIRECT,
+                                        )
                                     )
-                                )
                                 future.set_exception(MessageDroppedException())
                                 return
 
@@ -605,14 +628,15 @@ class InProcessRuntime(CoreRuntime):
                                 logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._try_serialize(message),
+                                            sender=sender,
+                                            receiver=topic_id,
+                                            kind=MessageKind.PUBLISH,
+                                        )
                                     )
-                                )
                                 return
 
                         message_envelope.message = temp_message
@@ -631,14 +655,15 @@ class InProcessRuntime(CoreRuntime):
                             future.set_exception(e)
                             return
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                            event_logger.info(
-                                MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
-                                    sender=sender,
-                                    receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                            if event_logger.isEnabledFor(logging.INFO):
+                                event_logger.info(
+                                    MessageDroppedEvent(
+                                        payload=self._try_serialize(message),
+                                        sender=sender,
+                                        receiver=recipient,
+                                        kind=MessageKind.RESPOND,
+                                    )
                                 )
-                            )
                             future.set_exception(MessageDroppedException())
                             return
                         message_envelope.message = temp_message
@@ -844,6 +869,20 @@ class InProcessRuntime(CoreRuntime):
         """Add a message serializer to the runtime."""
         self._serialization_registry.add_serializer(serializer)
 
+    def _try_serialize_envelope(
+        self, message_envelope: PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope
+    ) -> str:
+        """Serialize the message of an envelope for the event logger, at most once per envelope.
+
+        Intervention handlers can replace the message of an envelope, the cached payload is only used
+        while the envelope holds the message it was serialized from.
+        """
+        serialized_message = message_envelope._serialized_message
+        if serialized_message is None or serialized_message[0] is not message_envelope.message:
+            serialized_message = (message_envelope.message, self._try_serialize(message_envelope.message))
+            message_envelope._serialized_message = serialized_message
+        return serialized_message[1]
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
@@ -1,14 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from collections import defaultdict
-from collections.abc import Awaitable, Callable, Sequence
-from typing import DefaultDict
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from typing import DefaultDict, cast
 
 from semantic_kernel.agents.runtime.core.agent import Agent
 from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
 from semantic_kernel.agents.runtime.core.agent_type import AgentType
 from semantic_kernel.agents.runtime.core.subscription import Subscription
 from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.type_prefix_subscription import TypePrefixSubscription
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 
@@ -35,60 +37,199 @@ async def get_impl(
     return id
 
 
-@experimental
-class SubscriptionManager:
-    """Manages subscriptions for agents."""
+class _PrefixTrieNode:
+    """A node of the prefix trie, holding the subscriptions whose prefix ends at this node."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixTrieNode] = {}
+        self.subscriptions: dict[int, Subscription] = {}
+
+
+class _PrefixTrie:
+    """A trie of the topic type prefixes of subscriptions, subscriptions are keyed by their sequence number."""
 
     def __init__(self) -> None:
-        """Initialize the SubscriptionManager."""
-        self._subscriptions: list[Subscription] = []
-        self._seen_topics: set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, list[AgentId]] = defaultdict(list)
+        self._root = _PrefixTrieNode()
+
+    def add(self, prefix: str, sequence: int, subscription: Subscription) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixTrieNode())
+        node.subscriptions[sequence] = subscription
+
+    def remove(self, prefix: str, sequence: int) -> None:
+        path = [self._root]
+        for char in prefix:
+            path.append(path[-1].children[char])
+        del path[-1].subscriptions[sequence]
+        # Prune the nodes that no longer lead to a subscription
+        for char, parent, node in zip(reversed(prefix), reversed(path[:-1]), reversed(path[1:])):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[char]
+
+    def get(self, prefix: str) -> dict[int, Subscription]:
+        """Get the subscriptions with exactly the given prefix."""
+        node = self._root
+        for char in prefix:
+            if (child := node.children.get(char)) is None:
+                return {}
+            node = child
+        return node.subscriptions
+
+    def matches(self, topic_type: str) -> Iterator[tuple[int, Subscription]]:
+        """Get the subscriptions with a prefix of the given topic type."""
+        node = self._root
+        yield from node.subscriptions.items()
+        for char in topic_type:
+            if (child := node.children.get(char)) is None:
+                return
+            node = child
+            yield from node.subscriptions.items()
+
+
+def _is_indexed(subscription: Subscription, base: type[Subscription]) -> bool:
+    """Check if a subscription matches topics like the base class, so it can be indexed instead of tested."""
+    subscription_type = type(subscription)
+    return (
+        isinstance(subscription, base)
+        and subscription_type.is_match is base.is_match
+        and subscription_type.__eq__ is base.__eq__
+    )
+
+
+@experimental
+class SubscriptionManager:
+    """Manages subscriptions for agents.
+
+    Type subscriptions are indexed by their topic type and type prefix subscriptions are kept in a prefix trie,
+    so the recipients of a topic are found without testing every subscription. Other subscriptions are tested
+    with `is_match`. The recipients of the most recently used topics are cached, adding or removing a subscription
+    only drops the cached topics it matches.
+    """
+
+    def __init__(self, max_cached_topics: int = 10_000) -> None:
+        """Initialize the SubscriptionManager.
+
+        Args:
+            max_cached_topics (int): The number of topics whose recipients are cached, the least recently used
+                topics are evicted first.
+        """
+        self._max_cached_topics = max_cached_topics
+        # Subscriptions by a sequence number, which keeps the recipients in the order the subscriptions were added
+        self._subscriptions: dict[int, Subscription] = {}
+        self._next_sequence = 0
+        self._sequences_by_id: DefaultDict[str, set[int]] = defaultdict(set)
+        self._type_index: DefaultDict[str, dict[int, Subscription]] = defaultdict(dict)
+        self._prefix_trie = _PrefixTrie()
+        self._other_subscriptions: dict[int, Subscription] = {}
+        self._subscribed_recipients: OrderedDict[TopicId, list[AgentId]] = OrderedDict()
+        self._cached_topics_by_type: DefaultDict[str, set[TopicId]] = defaultdict(set)
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
         """Get the list of subscriptions."""
-        return self._subscriptions
+        return list(self._subscriptions.values())
 
     async def add_subscription(self, subscription: Subscription) -> None:
         """Add a subscription to the manager."""
         # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        if any(sub == subscription for sub in self._equality_candidates(subscription)):
             raise ValueError("Subscription already exists")
 
-        self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._subscriptions[sequence] = subscription
+        self._sequences_by_id[subscription.id].add(sequence)
+        if _is_indexed(subscription, TypeSubscription):
+            self._type_index[cast(TypeSubscription, subscription).topic_type][sequence] = subscription
+        elif _is_indexed(subscription, TypePrefixSubscription):
+            self._prefix_trie.add(cast(TypePrefixSubscription, subscription).topic_type_prefix, sequence, subscription)
+        else:
+            self._other_subscriptions[sequence] = subscription
+        self._invalidate_topics(subscription)
 
     async def remove_subscription(self, id: str) -> None:
         """Remove a subscription from the manager."""
         # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        if id not in self._sequences_by_id:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
-
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
-
-        # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+        for sequence in self._sequences_by_id.pop(id):
+            subscription = self._subscriptions.pop(sequence)
+            if _is_indexed(subscription, TypeSubscription):
+                topic_type = cast(TypeSubscription, subscription).topic_type
+                del self._type_index[topic_type][sequence]
+                if not self._type_index[topic_type]:
+                    del self._type_index[topic_type]
+            elif _is_indexed(subscription, TypePrefixSubscription):
+                self._prefix_trie.remove(cast(TypePrefixSubscription, subscription).topic_type_prefix, sequence)
+            else:
+                del self._other_subscriptions[sequence]
+            self._invalidate_topics(subscription)
 
     async def get_subscribed_recipients(self, topic: TopicId) -> list[AgentId]:
         """Get the list of recipients subscribed to a topic."""
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
-
-    # TODO(evmattso): optimize this...
-    def _rebuild_subscriptions(self, topics: set[TopicId]) -> None:
-        """Rebuild the subscriptions for the given topics."""
-        self._subscribed_recipients.clear()
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is not None:
+            self._subscribed_recipients.move_to_end(topic)
+            return recipients
+
+        matches = [
+            *self._type_index.get(topic.type, {}).items(),
+            *self._prefix_trie.matches(topic.type),
+            *(
+                (sequence, subscription)
+                for sequence, subscription in self._other_subscriptions.items()
+                if subscription.is_match(topic)
+            ),
+        ]
+        matches.sort(key=lambda match: match[0])
+        recipients = [subscription.map_to_agent(topic) for _, subscription in matches]
+
+        self._subscribed_recipients[topic] = recipients
+        self._cached_topics_by_type[topic.type].add(topic)
+        if len(self._subscribed_recipients) > self._max_cached_topics:
+            evicted, _ = self._subscribed_recipients.popitem(last=False)
+            self._discard_cached_topic_type(evicted)
+        return recipients
+
+    def _equality_candidates(self, subscription: Subscription) -> list[Subscription]:
+        """Get the subscriptions that can be equal to the given subscription.
+
+        Indexed subscriptions are only equal to subscriptions with the same id, or of the same class with the same
+        topic type or prefix, other subscriptions are always compared.
+        """
+        candidates = [self._subscriptions[sequence] for sequence in self._sequences_by_id.get(subscription.id, ())]
+        candidates.extend(self._other_subscriptions.values())
+        if isinstance(subscription, TypeSubscription):
+            candidates.extend(self._type_index.get(subscription.topic_type, {}).values())
+        if isinstance(subscription, TypePrefixSubscription):
+            candidates.extend(self._prefix_trie.get(subscription.topic_type_prefix).values())
+        return candidates
+
+    def _invalidate_topics(self, subscription: Subscription) -> None:
+        """Drop the cached recipients of the topics that match the subscription."""
+        if _is_indexed(subscription, TypeSubscription):
+            topics = list(self._cached_topics_by_type.get(cast(TypeSubscription, subscription).topic_type, ()))
+        elif _is_indexed(subscription, TypePrefixSubscription):
+            prefix = cast(TypePrefixSubscription, subscription).topic_type_prefix
+            topics = [
+                topic
+                for topic_type, topics_of_type in self._cached_topics_by_type.items()
+                if topic_type.startswith(prefix)
+                for topic in topics_of_type
+            ]
+        else:
+            topics = [topic for topic in self._subscribed_recipients if subscription.is_match(topic)]
         for topic in topics:
-            self._build_for_new_topic(topic)
-
-    def _build_for_new_topic(self, topic: TopicId) -> None:
-        """Build the subscriptions for a new topic."""
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
-            if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+            del self._subscribed_recipients[topic]
+            self._discard_cached_topic_type(topic)
+
+    def _discard_cached_topic_type(self, topic: TopicId) -> None:
+        topics_of_type = self._cached_topics_by_type[topic.type]
+        topics_of_type.discard(topic)
+        if not topics_of_type:
+            del self._cached_topics_by_type[topic.type]
@@ -0,0 +1,328 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import builtins
+import logging
+import multiprocessing
+import os
+import zlib
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Literal, TypeVar, cast
+
+from opentelemetry.trace import TracerProvider
+
+from semantic_kernel.agents.runtime.core.agent import Agent
+from semantic_kernel.agents.runtime.core.agent_id import AgentId
+from semantic_kernel.agents.runtime.core.agent_metadata import AgentMetadata, CoreAgentMetadata
+from semantic_kernel.agents.runtime.core.agent_type import AgentType
+from semantic_kernel.agents.runtime.core.base_agent import BaseAgent
+from semantic_kernel.agents.runtime.core.cancellation_token import CancellationToken
+from semantic_kernel.agents.runtime.core.intervention import InterventionHandler
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent
+from semantic_kernel.agents.runtime.core.serialization import try_get_known_serializers_for_type
+from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
+from semantic_kernel.agents.runtime.multi_process.transport import (
+    Frame,
+    decode_agent_id,
+    decode_message,
+    decode_topic_id,
+    encode_agent_id,
+    encode_message,
+    encode_topic_id,
+    portable_exception,
+    start_reader,
+)
+from semantic_kernel.agents.runtime.multi_process.worker_runtime import run_worker
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger = logging.getLogger("multi_process_runtime")
+
+T = TypeVar("T", bound=Agent)
+
+
+@dataclass
+class _Worker:
+    """A worker process and the connection to it."""
+
+    process: BaseProcess
+    connection: Connection
+    closed: bool = False
+
+
+class _WorkerAgentProxy(BaseAgent):
+    """Stands in the main process for an agent that is hosted in a worker process."""
+
+    def __init__(self) -> None:
+        super().__init__("An agent hosted in a worker process.")
+
+    @property
+    def _multi_process_runtime(self) -> "MultiProcessRuntime":
+        return cast(MultiProcessRuntime, self.runtime)
+
+    async def on_message_impl(self, message: Any, ctx: MessageContext) -> Any:
+        return await self._multi_process_runtime._deliver(self.id, message, ctx)
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return await self._multi_process_runtime._request_for_agent(self.id, "save_state")
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        await self._multi_process_runtime._request_for_agent(self.id, "load_state", dict(state))
+
+
+@experimental
+class MultiProcessRuntime(InProcessRuntime):
+    """A runtime that shards agents across a pool of worker processes on one machine.
+
+    The agents of the sharded agent types are hosted in worker processes, so CPU-heavy agents do not block the
+    event loop of the other agents. The agents are assigned to the workers by a hash of their type and key, or of
+    their type only, and an agent is always hosted by the same worker. All other agent types, such as the internal
+    actors of the orchestrations, run in the main process as in the `InProcessRuntime`.
+
+    The main process routes all messages: subscriptions, intervention handlers, the `send_message` futures and the
+    `publish_message` fan-out work as in the `InProcessRuntime`. An agent in a worker process is represented in the
+    main process by a proxy agent that forwards the messages, and `save_state` and `load_state`, to its worker.
+    Messages to and from the workers are encoded with the message serializers of the runtime and sent through
+    pipes, so their types must have a serializer. `RoutedAgent.register` adds them for the handled types, and this
+    runtime adds them for the types that the handlers return.
+
+    The workers are forked from the main process when the runtime is first started, so they inherit the agent
+    factories. The sharded agent types must be registered before then, and the fork start method is required.
+    """
+
+    def __init__(
+        self,
+        *,
+        sharded_agent_types: Iterable[str],
+        num_workers: int | None = None,
+        shard_by: Literal["key", "type"] = "key",
+        intervention_handlers: list[InterventionHandler] | None = None,
+        tracer_provider: TracerProvider | None = None,
+        ignore_unhandled_exceptions: bool = True,
+    ) -> None:
+        """Initialize the runtime.
+
+        Args:
+            sharded_agent_types: The agent types that are hosted in the worker processes.
+            num_workers: The number of worker processes, defaults to the number of CPUs.
+            shard_by: Whether the agents are assigned to the workers by their type and key, or by their type,
+                which keeps all agents of a type in the same worker.
+            intervention_handlers: The intervention handlers of the runtime.
+            tracer_provider: The tracer provider of the runtime.
+            ignore_unhandled_exceptions: Whether exceptions of publish message handlers are ignored.
+        """
+        super().__init__(
+            intervention_handlers=intervention_handlers,
+            tracer_provider=tracer_provider,
+            ignore_unhandled_exceptions=ignore_unhandled_exceptions,
+        )
+        if num_workers is not None and num_workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+        self._sharded_agent_types = frozenset(sharded_agent_types)
+        self._num_workers = num_workers or os.cpu_count() or 1
+        self._shard_by = shard_by
+        self._worker_agent_factories: dict[str, Callable[[], Agent | Awaitable[Agent]]] = {}
+        self._workers: list[_Worker] = []
+        self._pending_requests: dict[int, tuple[_Worker, asyncio.Future[Any]]] = {}
+        self._next_request_id = 0
+
+    async def register_factory(
+        self,
+        type: str | AgentType,
+        agent_factory: Callable[[], T | Awaitable[T]],
+        *,
+        expected_class: type[T] | None = None,
+    ) -> AgentType:
+        """Register a factory for creating agents, the agents of a sharded type are created in the workers."""
+        agent_type = await super().register_factory(type, agent_factory, expected_class=expected_class)
+        if expected_class is not None and issubclass(expected_class, RoutedAgent):
+            # The responses of the agents cross the process boundary too, so their types need serializers
+            for handler in expected_class._discover_handlers():
+                for produced_type in handler.produces_types:
+                    if isinstance(produced_type, builtins.type):
+                        self.add_message_serializer(try_get_known_serializers_for_type(produced_type))
+        if agent_type.type in self._sharded_agent_types:
+            if self._workers:
+                del self._agent_factories[agent_type.type]
+                raise RuntimeError(
+                    f"Agent type {agent_type.type} is hosted in the worker processes, "
+                    "it must be registered before the runtime is started."
+                )
+            # The workers inherit the factory, the main process creates proxies for the agents of the type.
+            self._worker_agent_factories[agent_type.type] = cast(
+                Callable[[], Agent | Awaitable[Agent]], self._agent_factories[agent_type.type]
+            )
+            self._agent_factories[agent_type.type] = _WorkerAgentProxy
+        return agent_type
+
+    def start(self) -> None:
+        """Start the runtime message processing loop, and the worker processes when it is first started."""
+        if self._run_context is not None:
+            raise RuntimeError("Runtime is already started")
+        if self._worker_agent_factories and not self._workers:
+            self._start_workers()
+        super().start()
+
+    async def close(self) -> None:
+        """Stop the runtime, close the agents of the main process and stop the worker processes."""
+        await super().close()
+        for worker in self._workers:
+            self._send_frame(worker, ("stop", None))
+        for worker in self._workers:
+            await asyncio.to_thread(worker.process.join, 10)
+            if worker.process.is_alive():
+                logger.warning(f"Worker process {worker.process.pid} did not stop, terminating it.")
+                worker.process.terminate()
+            worker.connection.close()
+        self._workers = []
+
+    async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
+        """Get the metadata for an agent."""
+        if agent.type not in self._worker_agent_factories:
+            return await super().agent_metadata(agent)
+        type, key, description = await self._request_for_agent(agent, "metadata")
+        return CoreAgentMetadata(type, key, description)
+
+    async def try_get_underlying_agent_instance(self, id: AgentId, type: type[T] = Agent) -> T:  # type: ignore[assignment]
+        """Try to get the underlying agent instance, the agents hosted in the workers are not accessible."""
+        if id.type in self._worker_agent_factories:
+            raise LookupError(f"Agent {id} is hosted in a worker process, its instance is not accessible.")
+        return await super().try_get_underlying_agent_instance(id, type)
+
+    def _start_workers(self) -> None:
+        context = multiprocessing.get_context("fork")
+        for index in range(self._num_workers):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=run_worker,
+                args=(
+                    worker_connection,
+                    self._worker_agent_factories,
+                    self._serialization_registry,
+                    [connection, *(worker.connection for worker in self._workers)],
+                ),
+                name=f"agent-runtime-worker-{index}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._workers.append(_Worker(process, connection))
+        # The readers are started once all workers are forked, forking a process with threads can deadlock.
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            start_reader(
+                worker.connection,
+                loop,
+                partial(self._on_worker_frame, worker),
+                partial(self._on_worker_closed, worker),
+            )
+
+    def _worker_for(self, agent_id: AgentId) -> _Worker:
+        if not self._workers:
+            raise RuntimeError("The worker processes are started with the runtime.")
+        shard_key = agent_id.type if self._shard_by == "type" else f"{agent_id.type}/{agent_id.key}"
+        return self._workers[zlib.crc32(shard_key.encode("utf-8")) % len(self._workers)]
+
+    async def _deliver(self, agent_id: AgentId, message: Any, ctx: MessageContext) -> Any:
+        """Deliver a message to an agent in a worker process and get its response."""
+        result = await self._request_for_agent(
+            agent_id,
+            "deliver",
+            encode_agent_id(ctx.sender),
+            encode_topic_id(ctx.topic_id),
+            ctx.message_id,
+            encode_message(self._serialization_registry, message),
+            cancellation_token=ctx.cancellation_token,
+        )
+        return decode_message(self._serialization_registry, result)
+
+    async def _request_for_agent(
+        self,
+        agent_id: AgentId,
+        operation: str,
+        *args: Any,
+        cancellation_token: CancellationToken | None = None,
+    ) -> Any:
+        """Send a request about an agent to its worker and wait for the result."""
+        worker = self._worker_for(agent_id)
+        if worker.closed:
+            raise RuntimeError(f"The worker process of agent {agent_id} exited.")
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = (worker, future)
+        try:
+            worker.connection.send((operation, request_id, encode_agent_id(agent_id), *args))
+            if cancellation_token is not None:
+                cancellation_token.add_callback(lambda: self._send_frame(worker, ("cancel", request_id)))
+            return await future
+        finally:
+            del self._pending_requests[request_id]
+
+    def _send_frame(self, worker: _Worker, frame: Frame) -> None:
+        if worker.closed:
+            return
+        with suppress(OSError):
+            worker.connection.send(frame)
+
+    def _on_worker_frame(self, worker: _Worker, frame: Frame) -> None:
+        operation, request_id, *args = frame
+        match operation:
+            case "result":
+                _, future = self._pending_requests.get(request_id, (None, None))
+                if future is not None and not future.done():
+                    succeeded, result = args
+                    if succeeded:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(result)
+            case "send":
+                self._run_in_background(self._handle_worker_send(worker, request_id, *args))
+            case "publish":
+                topic_id, sender, message_id, message = args
+                self._run_in_background(
+                    self.publish_message(
+                        decode_message(self._serialization_registry, message),
+                        cast(Any, decode_topic_id(topic_id)),
+                        sender=decode_agent_id(sender),
+                        message_id=message_id,
+                    )
+                )
+
+    def _on_worker_closed(self, worker: _Worker) -> None:
+        worker.closed = True
+        for pending_worker, future in self._pending_requests.values():
+            if pending_worker is worker and not future.done():
+                future.set_exception(RuntimeError(f"The worker process {worker.process.pid} exited."))
+
+    async def _handle_worker_send(
+        self,
+        worker: _Worker,
+        request_id: int,
+        recipient: tuple[str, str],
+        sender: tuple[str, str] | None,
+        message_id: str,
+        message: Any,
+    ) -> None:
+        """Send a message of an agent in a worker process, and send the response back to the worker."""
+        try:
+            response = await self.send_message(
+                decode_message(self._serialization_registry, message),
+                cast(AgentId, decode_agent_id(recipient)),
+                sender=decode_agent_id(sender),
+                message_id=message_id,
+            )
+            frame: Frame = ("result", request_id, True, encode_message(self._serialization_registry, response))
+        except BaseException as e:
+            frame = ("result", request_id, False, portable_exception(e))
+        self._send_frame(worker, frame)
+
+    def _run_in_background(self, coroutine: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
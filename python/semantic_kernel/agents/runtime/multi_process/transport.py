@@ -0,0 +1,101 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import pickle  # nosec
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any
+
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.serialization import JSON_DATA_CONTENT_TYPE, SerializationRegistry
+from semantic_kernel.agents.runtime.core.topic import TopicId
+
+# Frames are tuples of an operation name, a request id and the arguments of the operation. Messages are encoded
+# with the message serializers of the runtime, the frames themselves only hold builtin types.
+Frame = tuple[Any, ...]
+# A message encoded as its type name, data content type and payload, None is encoded as (None, None, b"").
+EncodedMessage = tuple[str | None, str | None, bytes]
+
+
+def encode_message(registry: SerializationRegistry, message: Any) -> EncodedMessage:
+    """Encode a message with the message serializers of the registry.
+
+    Raises:
+        ValueError: If no serializer is registered for the type of the message.
+    """
+    if message is None:
+        return None, None, b""
+    type_name = registry.type_name(message)
+    return (
+        type_name,
+        JSON_DATA_CONTENT_TYPE,
+        registry.serialize(message, type_name=type_name, data_content_type=JSON_DATA_CONTENT_TYPE),
+    )
+
+
+def decode_message(registry: SerializationRegistry, encoded_message: EncodedMessage) -> Any:
+    """Decode a message encoded with `encode_message`."""
+    type_name, data_content_type, payload = encoded_message
+    if type_name is None or data_content_type is None:
+        return None
+    return registry.deserialize(payload, type_name=type_name, data_content_type=data_content_type)
+
+
+def encode_agent_id(agent_id: AgentId | None) -> tuple[str, str] | None:
+    """Encode an agent id as its type and key."""
+    return None if agent_id is None else (agent_id.type, agent_id.key)
+
+
+def decode_agent_id(encoded_agent_id: tuple[str, str] | None) -> AgentId | None:
+    """Decode an agent id encoded with `encode_agent_id`."""
+    return None if encoded_agent_id is None else CoreAgentId(*encoded_agent_id)
+
+
+def encode_topic_id(topic_id: TopicId | None) -> tuple[str, str] | None:
+    """Encode a topic id as its type and source."""
+    return None if topic_id is None else (topic_id.type, topic_id.source)
+
+
+def decode_topic_id(encoded_topic_id: tuple[str, str] | None) -> TopicId | None:
+    """Decode a topic id encoded with `encode_topic_id`."""
+    return None if encoded_topic_id is None else TopicId(*encoded_topic_id)
+
+
+def portable_exception(exception: BaseException) -> BaseException:
+    """Get an exception that can be sent to another process, the exception itself if it can be pickled."""
+    try:
+        pickle.dumps(exception)
+        return exception
+    except Exception:
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+def start_reader(
+    connection: Connection,
+    loop: asyncio.AbstractEventLoop,
+    on_frame: Callable[[Frame], None],
+    on_closed: Callable[[], None],
+) -> threading.Thread:
+    """Read the frames of a connection in a thread and pass them to the event loop in order.
+
+    Reading in a thread keeps the pipe drained while the event loop writes to the other side, so two processes
+    that write large frames to each other can not block on full pipes.
+    """
+
+    def read() -> None:
+        try:
+            while True:
+                try:
+                    frame = connection.recv()
+                except (EOFError, OSError):
+                    break
+                loop.call_soon_threadsafe(on_frame, frame)
+            loop.call_soon_threadsafe(on_closed)
+        except RuntimeError:
+            # The event loop was closed
+            pass
+
+    thread = threading.Thread(target=read, name="agent-runtime-connection-reader", daemon=True)
+    thread.start()
+    return thread
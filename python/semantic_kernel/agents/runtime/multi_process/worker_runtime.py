@@ -0,0 +1,279 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import inspect
+import logging
+import uuid
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from multiprocessing.connection import Connection
+from typing import Any
+
+from semantic_kernel.agents.runtime.core.agent import Agent
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.agent_metadata import AgentMetadata
+from semantic_kernel.agents.runtime.core.agent_type import AgentType
+from semantic_kernel.agents.runtime.core.cancellation_token import CancellationToken
+from semantic_kernel.agents.runtime.core.core_runtime import CoreRuntime
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.serialization import MessageSerializer, SerializationRegistry
+from semantic_kernel.agents.runtime.core.subscription import Subscription
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.agent_instantiation_context import AgentInstantiationContext
+from semantic_kernel.agents.runtime.in_process.message_handler_context import MessageHandlerContext
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import get_impl
+from semantic_kernel.agents.runtime.multi_process.transport import (
+    EncodedMessage,
+    Frame,
+    decode_agent_id,
+    decode_message,
+    decode_topic_id,
+    encode_agent_id,
+    encode_message,
+    encode_topic_id,
+    portable_exception,
+    start_reader,
+)
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger = logging.getLogger("multi_process_runtime.worker")
+
+AgentFactory = Callable[[], Agent | Awaitable[Agent]]
+
+
+@experimental
+class WorkerRuntime(CoreRuntime):
+    """The runtime of a worker process of the `MultiProcessRuntime`.
+
+    The worker hosts the agents of its shard. It handles the messages that the main process delivers to them,
+    and forwards the messages that its agents send and publish to the main process, which routes them.
+    Agents, subscriptions and the agent factories are registered in the main process.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        agent_factories: Mapping[str, AgentFactory],
+        serialization_registry: SerializationRegistry,
+    ) -> None:
+        """Initialize the worker runtime.
+
+        Args:
+            connection: The connection to the main process.
+            agent_factories: The factories of the agent types that are hosted in worker processes.
+            serialization_registry: The message serializers of the main process.
+        """
+        self._connection = connection
+        self._agent_factories = agent_factories
+        self._serialization_registry = serialization_registry
+        self._instantiated_agents: dict[AgentId, Agent] = {}
+        self._pending_requests: dict[int, asyncio.Future[Any]] = {}
+        self._cancellation_tokens: dict[int, CancellationToken] = {}
+        self._background_tasks: set[asyncio.Task[Any]] = set()
+        self._next_request_id = 0
+        self._stopped = asyncio.Event()
+
+    async def run(self) -> None:
+        """Handle the frames of the main process until it stops the worker, then close the agents."""
+        start_reader(self._connection, asyncio.get_running_loop(), self._on_frame, self._stopped.set)
+        await self._stopped.wait()
+        for agent in self._instantiated_agents.values():
+            await agent.close()
+
+    async def send_message(
+        self,
+        message: Any,
+        recipient: AgentId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> Any:
+        """Send a message to an agent through the main process and get a response."""
+        future = self._request(
+            "send",
+            encode_agent_id(recipient),
+            encode_agent_id(sender),
+            message_id or str(uuid.uuid4()),
+            encode_message(self._serialization_registry, message),
+        )
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        return decode_message(self._serialization_registry, await future)
+
+    async def publish_message(
+        self,
+        message: Any,
+        topic_id: TopicId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> None:
+        """Publish a message through the main process to all agents that are subscribed to the topic."""
+        self._connection.send((
+            "publish",
+            None,
+            encode_topic_id(topic_id),
+            encode_agent_id(sender),
+            message_id or str(uuid.uuid4()),
+            encode_message(self._serialization_registry, message),
+        ))
+
+    async def register_factory(
+        self,
+        type: str | AgentType,
+        agent_factory: Callable[[], Any],
+        *,
+        expected_class: type | None = None,
+    ) -> AgentType:
+        """Agent factories are registered in the main process."""
+        raise RuntimeError("Agent factories can only be registered in the main process.")
+
+    async def try_get_underlying_agent_instance(self, id: AgentId, type: type = Agent) -> Any:
+        """Get an agent of this worker by its id."""
+        agent = await self._get_agent(id)
+        if not isinstance(agent, type):
+            raise TypeError(f"Agent with name {id.type} is not of type {type.__name__}.")
+        return agent
+
+    async def get(
+        self, id_or_type: AgentId | AgentType | str, /, key: str = "default", *, lazy: bool = True
+    ) -> AgentId:
+        """Get an agent by id or type."""
+        return await get_impl(id_or_type=id_or_type, key=key, lazy=lazy, instance_getter=self._get_agent)
+
+    async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
+        """Get the metadata of an agent of this worker."""
+        return (await self._get_agent(agent)).metadata
+
+    async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
+        """Save the state of an agent of this worker."""
+        return await (await self._get_agent(agent)).save_state()
+
+    async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
+        """Load the state of an agent of this worker."""
+        await (await self._get_agent(agent)).load_state(state)
+
+    async def add_subscription(self, subscription: Subscription) -> None:
+        """Subscriptions are added in the main process."""
+        raise RuntimeError("Subscriptions can only be added in the main process.")
+
+    async def remove_subscription(self, id: str) -> None:
+        """Subscriptions are removed in the main process."""
+        raise RuntimeError("Subscriptions can only be removed in the main process.")
+
+    def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
+        """Add a message serializer to the worker."""
+        self._serialization_registry.add_serializer(serializer)
+
+    def _request(self, operation: str, *args: Any) -> asyncio.Future[Any]:
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: self._pending_requests.pop(request_id, None))
+        self._pending_requests[request_id] = future
+        self._connection.send((operation, request_id, *args))
+        return future
+
+    def _on_frame(self, frame: Frame) -> None:
+        operation, request_id, *args = frame
+        match operation:
+            case "result":
+                future = self._pending_requests.get(request_id)
+                if future is not None and not future.done():
+                    succeeded, result = args
+                    if succeeded:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(result)
+            case "cancel":
+                if (cancellation_token := self._cancellation_tokens.get(request_id)) is not None:
+                    cancellation_token.cancel()
+            case "stop":
+                self._stopped.set()
+            case _:
+                if operation == "deliver":
+                    # The token is created before the delivery starts, the main process may cancel it right away
+                    self._cancellation_tokens[request_id] = CancellationToken()
+                task = asyncio.create_task(self._handle_request(operation, request_id, *args))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+    async def _handle_request(self, operation: str, request_id: int, *args: Any) -> None:
+        result: Any = None
+        try:
+            match operation:
+                case "deliver":
+                    result = encode_message(self._serialization_registry, await self._deliver(request_id, *args))
+                case "save_state":
+                    result = dict(await self.agent_save_state(CoreAgentId(*args[0])))
+                case "load_state":
+                    await self.agent_load_state(CoreAgentId(*args[0]), args[1])
+                case "metadata":
+                    metadata = await self.agent_metadata(CoreAgentId(*args[0]))
+                    result = (metadata.type, metadata.key, metadata.description)
+                case _:
+                    raise ValueError(f"Unknown operation {operation}")
+        except BaseException as e:
+            self._connection.send(("result", request_id, False, portable_exception(e)))
+        else:
+            self._connection.send(("result", request_id, True, result))
+
+    async def _deliver(
+        self,
+        request_id: int,
+        recipient: tuple[str, str],
+        sender: tuple[str, str] | None,
+        topic_id: tuple[str, str] | None,
+        message_id: str,
+        encoded_message: EncodedMessage,
+    ) -> Any:
+        cancellation_token = self._cancellation_tokens[request_id]
+        message_context = MessageContext(
+            sender=decode_agent_id(sender),
+            topic_id=decode_topic_id(topic_id),
+            is_rpc=topic_id is None,
+            cancellation_token=cancellation_token,
+            message_id=message_id,
+        )
+        try:
+            agent = await self._get_agent(CoreAgentId(*recipient))
+            with MessageHandlerContext.populate_context(agent.id):
+                return await agent.on_message(
+                    decode_message(self._serialization_registry, encoded_message), ctx=message_context
+                )
+        finally:
+            del self._cancellation_tokens[request_id]
+
+    async def _get_agent(self, agent_id: AgentId) -> Agent:
+        if agent_id in self._instantiated_agents:
+            return self._instantiated_agents[agent_id]
+        if agent_id.type not in self._agent_factories:
+            raise LookupError(f"Agent with name {agent_id.type} is not hosted in this worker.")
+
+        with AgentInstantiationContext.populate_context((self, agent_id)):
+            agent = self._agent_factories[agent_id.type]()
+            if inspect.isawaitable(agent):
+                agent = await agent
+        self._instantiated_agents[agent_id] = agent
+        return agent
+
+
+def run_worker(
+    connection: Connection,
+    agent_factories: Mapping[str, AgentFactory],
+    serialization_registry: SerializationRegistry,
+    inherited_connections: Sequence[Connection],
+) -> None:
+    """The entry point of a worker process.
+
+    Args:
+        connection: The connection to the main process.
+        agent_factories: The factories of the agent types that are hosted in worker processes.
+        serialization_registry: The message serializers of the main process.
+        inherited_connections: The connections of the main process that the fork inherited, they are closed
+            so the workers see the main process close its end of their connection.
+    """
+    for inherited_connection in inherited_connections:
+        inherited_connection.close()
+    asyncio.run(WorkerRuntime(connection, agent_factories, serialization_registry).run())
@@ -1,7 +1,20 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
-from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
-from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+    from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+_LAZY_ATTRIBUTES = {
+    "CompletionUsage": ".completion_usage",
+    "FunctionChoiceBehavior": ".function_choice_behavior",
+    "PromptExecutionSettings": ".prompt_execution_settings",
+}
 
 __all__ = ["CompletionUsage", "FunctionChoiceBehavior", "PromptExecutionSettings"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
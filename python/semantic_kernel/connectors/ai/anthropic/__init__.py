@@ -1,11 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.anthropic.prompt_execution_settings.anthropic_prompt_execution_settings import (
-    AnthropicChatPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.anthropic.services.anthropic_chat_completion import AnthropicChatCompletion
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.anthropic.prompt_execution_settings.anthropic_prompt_execution_settings import (
+        AnthropicChatPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.anthropic.services.anthropic_chat_completion import AnthropicChatCompletion
+
+_LAZY_ATTRIBUTES = {
+    "AnthropicChatPromptExecutionSettings": ".prompt_execution_settings.anthropic_prompt_execution_settings",
+    "AnthropicChatCompletion": ".services.anthropic_chat_completion",
+}
 
 __all__ = [
     "AnthropicChatCompletion",
     "AnthropicChatPromptExecutionSettings",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -214,6 +214,12 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
         system_message_content = None
         system_message_count = 0
         formatted_messages: list[dict[str, Any]] = []
+        converted_messages = chat_history.serialize_messages(
+            lambda message: MESSAGE_CONVERTERS[message.role](message)
+            if message.role in (AuthorRole.USER, AuthorRole.ASSISTANT, AuthorRole.TOOL)
+            else None,
+            key="anthropic",
+        )
         for i in range(len(chat_history)):
             prev_message = chat_history[i - 1] if i > 0 else None
             curr_message = chat_history[i]
@@ -223,7 +229,9 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     system_message_content = curr_message.content
                 system_message_count += 1
             elif curr_message.role == AuthorRole.USER or curr_message.role == AuthorRole.ASSISTANT:
-                formatted_messages.append(MESSAGE_CONVERTERS[curr_message.role](curr_message))
+                formatted_message = converted_messages[i]
+                assert formatted_message is not None  # nosec
+                formatted_messages.append(formatted_message)
             elif curr_message.role == AuthorRole.TOOL:
                 if prev_message is None:
                     # Under no circumstances should a tool message be the first message in the chat history
@@ -234,7 +242,8 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     # the tool messages are considered as USER messages. We are checking against the SK roles.
                     raise ServiceInvalidRequestError("Tool message found after a user or system message.")
 
-                formatted_message = MESSAGE_CONVERTERS[curr_message.role](curr_message)
+                formatted_message = converted_messages[i]
+                assert formatted_message is not None  # nosec
                 if prev_message.role == AuthorRole.ASSISTANT:
                     # The first tool message after an assistant message should be a new message
                     formatted_messages.append(formatted_message)
@@ -242,7 +251,11 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     # Append the tool message to the previous tool message.
                     # This indicates that the assistant message requested multiple parallel tool calls.
                     # Anthropic requires that parallel Tool messages are grouped together in a single message.
-                    formatted_messages[-1][content_key] += formatted_message[content_key]
+                    # The converted messages are cached by the chat history, so a new message is created.
+                    formatted_messages[-1] = {
+                        **formatted_messages[-1],
+                        content_key: formatted_messages[-1][content_key] + formatted_message[content_key],
+                    }
             else:
                 raise ServiceInvalidRequestError(f"Unsupported role in chat history: {curr_message.role}")
 
@@ -131,10 +131,9 @@ def update_settings_from_function_call_configuration(
         and hasattr(settings, "tools")
         and hasattr(settings, "tool_choice")
     ):
-        settings.tools = [
-            kernel_function_metadata_to_function_call_format(f)
-            for f in function_choice_configuration.available_functions
-        ]
+        settings.tools = list(
+            function_choice_configuration.get_function_call_formats(kernel_function_metadata_to_function_call_format)
+        )
 
         if (
             settings.function_choice_behavior and settings.function_choice_behavior.type_ == FunctionChoiceType.REQUIRED
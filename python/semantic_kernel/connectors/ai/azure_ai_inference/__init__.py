@@ -1,17 +1,31 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.azure_ai_inference.azure_ai_inference_prompt_execution_settings import (
-    AzureAIInferenceChatPromptExecutionSettings,
-    AzureAIInferenceEmbeddingPromptExecutionSettings,
-    AzureAIInferencePromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.azure_ai_inference.azure_ai_inference_settings import AzureAIInferenceSettings
-from semantic_kernel.connectors.ai.azure_ai_inference.services.azure_ai_inference_chat_completion import (
-    AzureAIInferenceChatCompletion,
-)
-from semantic_kernel.connectors.ai.azure_ai_inference.services.azure_ai_inference_text_embedding import (
-    AzureAIInferenceTextEmbedding,
-)
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.azure_ai_inference.azure_ai_inference_prompt_execution_settings import (
+        AzureAIInferenceChatPromptExecutionSettings,
+        AzureAIInferenceEmbeddingPromptExecutionSettings,
+        AzureAIInferencePromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.azure_ai_inference.azure_ai_inference_settings import AzureAIInferenceSettings
+    from semantic_kernel.connectors.ai.azure_ai_inference.services.azure_ai_inference_chat_completion import (
+        AzureAIInferenceChatCompletion,
+    )
+    from semantic_kernel.connectors.ai.azure_ai_inference.services.azure_ai_inference_text_embedding import (
+        AzureAIInferenceTextEmbedding,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "AzureAIInferenceChatPromptExecutionSettings": ".azure_ai_inference_prompt_execution_settings",
+    "AzureAIInferenceEmbeddingPromptExecutionSettings": ".azure_ai_inference_prompt_execution_settings",
+    "AzureAIInferencePromptExecutionSettings": ".azure_ai_inference_prompt_execution_settings",
+    "AzureAIInferenceSettings": ".azure_ai_inference_settings",
+    "AzureAIInferenceChatCompletion": ".services.azure_ai_inference_chat_completion",
+    "AzureAIInferenceTextEmbedding": ".services.azure_ai_inference_text_embedding",
+}
 
 __all__ = [
     "AzureAIInferenceChatCompletion",
@@ -21,3 +35,5 @@ __all__ = [
     "AzureAIInferenceSettings",
     "AzureAIInferenceTextEmbedding",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -210,18 +210,14 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
         role_key: str = "role",
         content_key: str = "content",
     ) -> list[ChatRequestMessage]:
-        chat_request_messages: list[ChatRequestMessage] = []
+        use_developer_role = self.instruction_role == "developer"
 
-        for message in chat_history.messages:
+        def serialize(message: ChatMessageContent) -> ChatRequestMessage:
             # If instruction_role is 'developer' and the message role is 'system', change it to 'developer'
-            role = (
-                AuthorRole.DEVELOPER
-                if self.instruction_role == "developer" and message.role == AuthorRole.SYSTEM
-                else message.role
-            )
-            chat_request_messages.append(MESSAGE_CONVERTERS[role](message))
+            role = AuthorRole.DEVELOPER if use_developer_role and message.role == AuthorRole.SYSTEM else message.role
+            return MESSAGE_CONVERTERS[role](message)
 
-        return chat_request_messages
+        return chat_history.serialize_messages(serialize, key=("azure_ai_inference", use_developer_role))
 
     # endregion
 
@@ -1,15 +1,31 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.bedrock.bedrock_prompt_execution_settings import (
-    BedrockChatPromptExecutionSettings,
-    BedrockEmbeddingPromptExecutionSettings,
-    BedrockPromptExecutionSettings,
-    BedrockTextPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.bedrock.bedrock_settings import BedrockSettings
-from semantic_kernel.connectors.ai.bedrock.services.bedrock_chat_completion import BedrockChatCompletion
-from semantic_kernel.connectors.ai.bedrock.services.bedrock_text_completion import BedrockTextCompletion
-from semantic_kernel.connectors.ai.bedrock.services.bedrock_text_embedding import BedrockTextEmbedding
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.bedrock.bedrock_prompt_execution_settings import (
+        BedrockChatPromptExecutionSettings,
+        BedrockEmbeddingPromptExecutionSettings,
+        BedrockPromptExecutionSettings,
+        BedrockTextPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.bedrock.bedrock_settings import BedrockSettings
+    from semantic_kernel.connectors.ai.bedrock.services.bedrock_chat_completion import BedrockChatCompletion
+    from semantic_kernel.connectors.ai.bedrock.services.bedrock_text_completion import BedrockTextCompletion
+    from semantic_kernel.connectors.ai.bedrock.services.bedrock_text_embedding import BedrockTextEmbedding
+
+_LAZY_ATTRIBUTES = {
+    "BedrockChatPromptExecutionSettings": ".bedrock_prompt_execution_settings",
+    "BedrockEmbeddingPromptExecutionSettings": ".bedrock_prompt_execution_settings",
+    "BedrockPromptExecutionSettings": ".bedrock_prompt_execution_settings",
+    "BedrockTextPromptExecutionSettings": ".bedrock_prompt_execution_settings",
+    "BedrockSettings": ".bedrock_settings",
+    "BedrockChatCompletion": ".services.bedrock_chat_completion",
+    "BedrockTextCompletion": ".services.bedrock_text_completion",
+    "BedrockTextEmbedding": ".services.bedrock_text_embedding",
+}
 
 __all__ = [
     "BedrockChatCompletion",
@@ -21,3 +37,5 @@ __all__ = [
     "BedrockTextEmbedding",
     "BedrockTextPromptExecutionSettings",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,360 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import hashlib
+import json
+import logging
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.const import ContentTypes
+from semantic_kernel.contents.streaming_chat_message_accumulator import StreamingChatMessageAccumulator
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.contents.text_content import TextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+    from semantic_kernel.connectors.memory.in_memory.in_memory_collection import InMemoryVectorCollection
+    from semantic_kernel.contents.chat_history import ChatHistory
+    from semantic_kernel.kernel import Kernel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES: Final[int] = 1024
+DEFAULT_SIMILARITY_THRESHOLD: Final[float] = 0.95
+# The key of the serialized messages in the cache of the chat history.
+MESSAGE_SERIALIZER_KEY: Final[str] = "cached_chat_completion"
+# Items that can not be part of a streaming message are left out when a cached message is streamed.
+STREAMABLE_CONTENT_TYPES: Final[frozenset[ContentTypes]] = frozenset({
+    ContentTypes.BINARY_CONTENT,
+    ContentTypes.AUDIO_CONTENT,
+    ContentTypes.IMAGE_CONTENT,
+    ContentTypes.FUNCTION_CALL_CONTENT,
+    ContentTypes.FUNCTION_RESULT_CONTENT,
+})
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response, as messages, streamed chunks, or both."""
+
+    expires_at: float | None
+    messages: list[ChatMessageContent] | None = None
+    chunks: list[list[StreamingChatMessageContent]] | None = None
+
+    def get_messages(self) -> list[ChatMessageContent]:
+        if self.messages is None:
+            accumulators: dict[int, StreamingChatMessageAccumulator] = {}
+            for chunk in self.chunks or []:
+                for message in chunk:
+                    accumulators.setdefault(message.choice_index, StreamingChatMessageAccumulator()).add(message)
+            built = [accumulator.build() for _, accumulator in sorted(accumulators.items())]
+            self.messages = [streamed for streamed in built if streamed is not None]
+        return self.messages
+
+    def get_chunks(self) -> list[list[StreamingChatMessageContent]]:
+        if self.chunks is None:
+            self.chunks = [[_to_streaming_message(message, index) for index, message in enumerate(self.messages or [])]]
+        return self.chunks
+
+
+def _to_streaming_message(message: ChatMessageContent, choice_index: int) -> StreamingChatMessageContent:
+    """Create a streaming message with the content of a message, so it can be replayed as a single chunk."""
+    items: list[Any] = []
+    for item in message.items:
+        if isinstance(item, TextContent):
+            items.append(StreamingTextContent(choice_index=choice_index, text=item.text, encoding=item.encoding))
+        elif item.content_type in STREAMABLE_CONTENT_TYPES:
+            items.append(item)
+    return StreamingChatMessageContent(
+        role=message.role,
+        choice_index=choice_index,
+        items=items,
+        name=message.name,
+        ai_model_id=message.ai_model_id,
+        metadata=message.metadata,
+        finish_reason=message.finish_reason,
+        encoding=message.encoding,
+    )
+
+
+def _serialize_message(message: ChatMessageContent) -> str:
+    return json.dumps(message.to_dict(), sort_keys=True, default=str)
+
+
+@dataclass
+class _RequestKey:
+    """The keys of a request, the exact key and, for the semantic cache, the key of the context and the query."""
+
+    exact: str
+    context: str
+    query: str | None
+    embedding: list[float] | None = None
+
+
+@experimental
+class CachedChatCompletion(ChatCompletionClientBase):
+    """Chat completion service that caches the responses of another chat completion service.
+
+    Responses are cached by a hash of the model id, the execution settings, the messages and the schema
+    of the tools that are offered to the model, and are served again for a request with the same key.
+    The least recently used responses are evicted when there are more than `max_entries`,
+    and responses expire after `ttl` seconds, when set.
+
+    With an `embedding_generator`, a response is also served for a request for which only the last user message
+    differs, when the embedding of that message has a cosine similarity of at least `similarity_threshold`
+    with the embedding of the cached request. This suits prompts that repeat in other words, like FAQ questions.
+
+    Responses of the streaming API are cached as chunks and replayed, a response that was not streamed
+    is replayed as a single chunk, and streamed chunks are combined when served through the non-streaming API.
+
+    Requests in which the kernel functions are invoked automatically are not cached, since their results
+    depend on the functions that are called.
+
+    The service takes over the service id of the inner service, so it can be added to the kernel
+    in place of it, for instance: `kernel.add_service(CachedChatCompletion(OpenAIChatCompletion(), ttl=3600))`.
+    """
+
+    inner_service: ChatCompletionClientBase
+    max_entries: int = Field(default=DEFAULT_MAX_ENTRIES, gt=0)
+    ttl: float | None = Field(default=None, gt=0)
+    embedding_generator: EmbeddingGeneratorBase | None = None
+    similarity_threshold: float = Field(default=DEFAULT_SIMILARITY_THRESHOLD, gt=0, le=1)
+    cache_hits: int = 0
+    semantic_cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    _entries: OrderedDict[str, _CacheEntry] = PrivateAttr(default_factory=OrderedDict)
+    _semantic_collection: "InMemoryVectorCollection | None" = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        inner_service: ChatCompletionClientBase,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float | None = None,
+        embedding_generator: EmbeddingGeneratorBase | None = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        service_id: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create a caching chat completion service.
+
+        Args:
+            inner_service: The chat completion service to cache the responses of.
+            max_entries: The maximum number of cached responses.
+            ttl: The number of seconds a response is cached, responses do not expire when None.
+            embedding_generator: The embedding generator for the semantic cache, optional.
+            similarity_threshold: The minimum cosine similarity of the last user message
+                for a response to be served from the semantic cache.
+            service_id: The service id, defaults to the service id of the inner service.
+            kwargs: Additional arguments.
+        """
+        super().__init__(
+            inner_service=inner_service,
+            ai_model_id=inner_service.ai_model_id,
+            service_id=service_id or inner_service.service_id,
+            max_entries=max_entries,
+            ttl=ttl,
+            embedding_generator=embedding_generator,
+            similarity_threshold=similarity_threshold,
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        """The number of cached responses."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the requests that were served from the cache, including the semantic cache."""
+        total = self.cache_hits + self.semantic_cache_hits + self.cache_misses
+        return (self.cache_hits + self.semantic_cache_hits) / total if total else 0.0
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.inner_service.get_prompt_execution_settings_class()
+
+    @override
+    async def get_chat_message_contents(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        **kwargs: Any,
+    ) -> list["ChatMessageContent"]:
+        key = self._create_request_key(chat_history, settings, kwargs.get("kernel"))
+        if key is None:
+            return await self.inner_service.get_chat_message_contents(chat_history, settings, **kwargs)
+        if (entry := await self._lookup(key)) is not None:
+            return deepcopy(entry.get_messages())
+        messages = await self.inner_service.get_chat_message_contents(chat_history, settings, **kwargs)
+        await self._store(key, _CacheEntry(expires_at=self._get_expires_at(), messages=deepcopy(messages)))
+        return messages
+
+    @override
+    async def get_streaming_chat_message_contents(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        **kwargs: Any,
+    ) -> AsyncGenerator[list["StreamingChatMessageContent"], Any]:
+        key = self._create_request_key(chat_history, settings, kwargs.get("kernel"))
+        if key is None:
+            async for messages in self.inner_service.get_streaming_chat_message_contents(
+                chat_history, settings, **kwargs
+            ):
+                yield messages
+            return
+        if (entry := await self._lookup(key)) is not None:
+            for chunk in entry.get_chunks():
+                yield deepcopy(chunk)
+            return
+        chunks: list[list[StreamingChatMessageContent]] = []
+        async for messages in self.inner_service.get_streaming_chat_message_contents(chat_history, settings, **kwargs):
+            chunks.append(deepcopy(messages))
+            yield messages
+        # only a complete stream is cached, this is not reached when the consumer stops early
+        await self._store(key, _CacheEntry(expires_at=self._get_expires_at(), chunks=chunks))
+
+    def clear_cache(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        self._semantic_collection = None
+
+    def _create_request_key(
+        self, chat_history: "ChatHistory", settings: "PromptExecutionSettings", kernel: "Kernel | None"
+    ) -> _RequestKey | None:
+        """Create the key of a request, or None when the request should not be cached."""
+        function_choice_behavior = settings.function_choice_behavior
+        tools: list[dict[str, Any]] = []
+        if function_choice_behavior is not None and kernel is not None:
+            if function_choice_behavior.auto_invoke_kernel_functions:
+                return None
+            from semantic_kernel.connectors.ai.function_calling_utils import (
+                kernel_function_metadata_to_function_call_format,
+            )
+
+            tools = [
+                kernel_function_metadata_to_function_call_format(metadata)
+                for metadata in function_choice_behavior.get_config(kernel).available_functions or []
+            ]
+        settings_dict = settings.model_dump(
+            mode="json", exclude_none=True, exclude={"service_id", "function_choice_behavior"}
+        )
+        messages = chat_history.serialize_messages(_serialize_message, MESSAGE_SERIALIZER_KEY)
+        query: str | None = None
+        last_message = chat_history.messages[-1] if chat_history.messages else None
+        if last_message is not None and last_message.role == AuthorRole.USER and last_message.content:
+            # the semantic cache matches the last user message, the rest of the request has to be equal
+            query = last_message.content
+            messages = messages[:-1]
+        context = [
+            self.inner_service.ai_model_id,
+            settings_dict,
+            function_choice_behavior.type_ if function_choice_behavior is not None else None,
+            tools,
+        ]
+        context_key = self._hash([*context, messages])
+        exact_key = self._hash([context_key, query]) if query is not None else context_key
+        return _RequestKey(exact=exact_key, context=context_key, query=query)
+
+    @staticmethod
+    def _hash(value: Any) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _get_expires_at(self) -> float | None:
+        return time.monotonic() + self.ttl if self.ttl is not None else None
+
+    def _get_entry(self, key: str) -> _CacheEntry | None:
+        """Get a cached response that has not expired, expired responses are removed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def _lookup(self, key: _RequestKey) -> _CacheEntry | None:
+        if (entry := self._get_entry(key.exact)) is not None:
+            self.cache_hits += 1
+            return entry
+        if self.embedding_generator is not None and key.query is not None:
+            embeddings = await self.embedding_generator.generate_embeddings([key.query])
+            key.embedding = [float(value) for value in embeddings[0]]
+            if self._semantic_collection is not None:
+                from semantic_kernel.data.vector_search import VectorSearchFilter, VectorSearchOptions
+
+                results = await self._semantic_collection.vectorized_search(
+                    key.embedding,
+                    VectorSearchOptions(top=1, filter=VectorSearchFilter.equal_to("context", key.context)),
+                )
+                async for result in results.results:
+                    if result.score is None or result.score < self.similarity_threshold:
+                        continue
+                    if (entry := self._get_entry(result.record["key"])) is None:
+                        # the response expired, so the request is removed from the semantic cache as well
+                        await self._semantic_collection.delete(result.record["key"])
+                        continue
+                    logger.debug(f"Serving a cached response for a similar request, with score {result.score}.")
+                    self.semantic_cache_hits += 1
+                    return entry
+        self.cache_misses += 1
+        return None
+
+    async def _store(self, key: _RequestKey, entry: _CacheEntry) -> None:
+        self._entries[key.exact] = entry
+        self._entries.move_to_end(key.exact)
+        evicted: list[str] = []
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False)[0])
+        self.cache_evictions += len(evicted)
+        if key.embedding is None:
+            return
+        collection = self._get_semantic_collection()
+        await collection.upsert({"key": key.exact, "context": key.context, "embedding": key.embedding})
+        if evicted:
+            await collection.delete(keys=evicted)
+
+    def _get_semantic_collection(self) -> "InMemoryVectorCollection":
+        if self._semantic_collection is None:
+            from semantic_kernel.connectors.memory.in_memory.in_memory_collection import InMemoryVectorCollection
+            from semantic_kernel.data.const import DistanceFunction
+            from semantic_kernel.data.record_definition import (
+                VectorStoreRecordDataField,
+                VectorStoreRecordDefinition,
+                VectorStoreRecordKeyField,
+                VectorStoreRecordVectorField,
+            )
+
+            self._semantic_collection = InMemoryVectorCollection(
+                collection_name="cached_chat_completion",
+                data_model_type=dict,
+                data_model_definition=VectorStoreRecordDefinition(
+                    fields={
+                        "key": VectorStoreRecordKeyField(property_type="str"),
+                        "context": VectorStoreRecordDataField(property_type="str", is_filterable=True),
+                        "embedding": VectorStoreRecordVectorField(
+                            property_type="float", distance_function=DistanceFunction.COSINE_SIMILARITY
+                        ),
+                    }
+                ),
+            )
+        return self._semantic_collection
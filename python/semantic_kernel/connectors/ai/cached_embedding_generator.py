@@ -0,0 +1,217 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+DEFAULT_MAX_CACHE_BYTES: Final[int] = 256 * 1024 * 1024
+# SQLite limits the number of parameters of a statement, so lookups are done in chunks.
+SQLITE_LOOKUP_CHUNK_SIZE: Final[int] = 500
+
+
+@experimental
+class CachedEmbeddingGenerator(EmbeddingGeneratorBase):
+    """Embedding generator that caches the embeddings of another embedding generator.
+
+    Embeddings are cached by the model id, the dimensions and a hash of the normalized text,
+    the text is normalized to Unicode NFC and runs of whitespace are collapsed.
+    The cache is kept in memory, with the least recently used embeddings evicted once they exceed
+    `max_cache_bytes`, and optionally also in a SQLite database at `cache_path`, which is kept between runs.
+    Only the texts that are not cached are sent to the inner generator, in a single call.
+
+    The generator takes over the service id of the inner generator, so it can be added to the kernel
+    in place of it, for instance:
+    `kernel.add_service(CachedEmbeddingGenerator(OpenAITextEmbedding(), cache_path="embeddings.db"))`.
+    """
+
+    inner_generator: EmbeddingGeneratorBase
+    max_cache_bytes: int = Field(default=DEFAULT_MAX_CACHE_BYTES, gt=0)
+    cache_path: str | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    _cache: OrderedDict[str, NDArray] = PrivateAttr(default_factory=OrderedDict)
+    _cache_bytes: int = PrivateAttr(default=0)
+    _connection: sqlite3.Connection | None = PrivateAttr(default=None)
+    _connection_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(
+        self,
+        inner_generator: EmbeddingGeneratorBase,
+        max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        cache_path: str | None = None,
+        service_id: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create a caching embedding generator.
+
+        Args:
+            inner_generator: The embedding generator to cache the embeddings of.
+            max_cache_bytes: The maximum size of the embeddings kept in memory, in bytes.
+            cache_path: The path of a SQLite database to also store the embeddings in, optional.
+            service_id: The service id, defaults to the service id of the inner generator.
+            kwargs: Additional arguments.
+        """
+        super().__init__(
+            inner_generator=inner_generator,
+            ai_model_id=inner_generator.ai_model_id,
+            service_id=service_id or inner_generator.service_id,
+            max_cache_bytes=max_cache_bytes,
+            cache_path=cache_path,
+            **kwargs,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the texts that were served from the cache."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.inner_generator.get_prompt_execution_settings_class()
+
+    @override
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> NDArray:
+        return np.array(await self.generate_raw_embeddings(texts, settings, **kwargs))
+
+    @override
+    async def generate_raw_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> list[list[float]]:
+        """Returns embeddings for the given texts, from the cache where possible.
+
+        Args:
+            texts (List[str]): The texts to generate embeddings for.
+            settings (PromptExecutionSettings): The settings to use for the request, optional.
+            kwargs (Any): Additional arguments to pass to the request.
+
+        Returns:
+            The embeddings as lists of floats, in the same order as the texts.
+        """
+        keys = [self._cache_key(text, settings, kwargs) for text in texts]
+        vectors: dict[str, NDArray] = {}
+        for key in keys:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                vectors[key] = self._cache[key]
+        if self.cache_path and (missing := [key for key in dict.fromkeys(keys) if key not in vectors]):
+            for key, vector in (await asyncio.to_thread(self._load, missing)).items():
+                self._remember(key, vector)
+                vectors[key] = vector
+        to_generate = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        self.cache_misses += len(to_generate)
+        self.cache_hits += len(texts) - len(to_generate)
+        if to_generate:
+            generated = await self.inner_generator.generate_raw_embeddings(
+                list(to_generate.values()), settings, **kwargs
+            )
+            new_vectors = {key: np.asarray(vector) for key, vector in zip(to_generate, generated)}
+            for key, vector in new_vectors.items():
+                self._remember(key, vector)
+                vectors[key] = vector
+            if self.cache_path:
+                await asyncio.to_thread(self._store, new_vectors)
+        return [vectors[key].tolist() for key in keys]
+
+    def clear_cache(self) -> None:
+        """Remove all embeddings from the in memory cache, the database is left as is."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def close(self) -> None:
+        """Close the connection to the database, it is reopened when needed."""
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _cache_key(self, text: str, settings: "PromptExecutionSettings | None", kwargs: dict[str, Any]) -> str:
+        if not isinstance(text, str):
+            text = json.dumps(text)
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        dimensions = kwargs.get("dimensions") or self._get_setting(settings, "dimensions")
+        model_id = self._get_setting(settings, "ai_model_id")
+        key = json.dumps([model_id or self.inner_generator.ai_model_id, dimensions, normalized])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_setting(settings: "PromptExecutionSettings | None", name: str) -> Any:
+        if settings is None:
+            return None
+        return getattr(settings, name, None) or settings.extension_data.get(name)
+
+    def _remember(self, key: str, vector: NDArray) -> None:
+        """Add an embedding to the in memory cache, evicting the least recently used ones when full."""
+        if (previous := self._cache.pop(key, None)) is not None:
+            self._cache_bytes -= previous.nbytes
+        if vector.nbytes > self.max_cache_bytes:
+            return
+        self._cache[key] = vector
+        self._cache_bytes += vector.nbytes
+        while self._cache_bytes > self.max_cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            assert self.cache_path is not None  # nosec
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, dtype TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _load(self, keys: Sequence[str]) -> dict[str, NDArray]:
+        vectors: dict[str, NDArray] = {}
+        with self._connection_lock:
+            connection = self._get_connection()
+            for start in range(0, len(keys), SQLITE_LOOKUP_CHUNK_SIZE):
+                chunk = keys[start : start + SQLITE_LOOKUP_CHUNK_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})",  # nosec
+                    chunk,
+                )
+                for key, dtype, blob in rows:
+                    vectors[key] = np.frombuffer(blob, dtype=np.dtype(dtype))
+        return vectors
+
+    def _store(self, vectors: dict[str, NDArray]) -> None:
+        with self._connection_lock:
+            connection = self._get_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dtype, vector) VALUES (?, ?, ?)",
+                [(key, vector.dtype.str, vector.tobytes()) for key, vector in vectors.items()],
+            )
+            connection.commit()
@@ -1,11 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import copy
 import logging
 from abc import ABC
 from collections.abc import AsyncGenerator, Callable
-from functools import reduce
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from opentelemetry.trace import Span, Tracer, get_tracer, use_span
@@ -151,19 +149,14 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
                 # This function either updates the chat history with the function call results
                 # or returns the context, with terminate set to True in which case the loop will
                 # break and the function calls are returned.
-                results = await asyncio.gather(
-                    *[
-                        kernel.invoke_function_call(
-                            function_call=function_call,
-                            chat_history=chat_history,
-                            arguments=kwargs.get("arguments"),
-                            execution_settings=settings,
-                            function_call_count=fc_count,
-                            request_index=request_index,
-                            function_behavior=settings.function_choice_behavior,
-                        )
-                        for function_call in function_calls
-                    ],
+                results = await kernel.invoke_function_calls(
+                    function_calls=function_calls,
+                    chat_history=chat_history,
+                    arguments=kwargs.get("arguments"),
+                    execution_settings=settings,
+                    function_call_count=fc_count,
+                    request_index=request_index,
+                    function_behavior=settings.function_choice_behavior,
                 )
 
                 if any(result.terminate for result in results if result is not None):
@@ -213,6 +206,7 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
         from semantic_kernel.connectors.ai.function_calling_utils import (
             merge_streaming_function_results,
         )
+        from semantic_kernel.contents.streaming_chat_message_accumulator import StreamingChatMessageAccumulator
 
         # Create a copy of the settings to avoid modifying the original settings
         settings = copy.deepcopy(settings)
@@ -275,8 +269,12 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
 
                 # There is one FunctionCallContent response stream in the messages, combining now to create
                 # the full completion depending on the prompt, the message may contain both function call
-                # content and others
-                full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+                # content and others. The chunks are only combined now, so streams without a function call
+                # are never combined, as they may hold chunks of several choices.
+                accumulator = StreamingChatMessageAccumulator()
+                for msg in all_messages:
+                    accumulator.add(msg)
+                full_completion: StreamingChatMessageContent = accumulator.build()  # type: ignore[assignment]
                 function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
                 chat_history.add_message(message=full_completion)
 
@@ -286,20 +284,15 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
                 # This function either updates the chat history with the function call results
                 # or returns the context, with terminate set to True in which case the loop will
                 # break and the function calls are returned.
-                results = await asyncio.gather(
-                    *[
-                        kernel.invoke_function_call(
-                            function_call=function_call,
-                            chat_history=chat_history,
-                            arguments=kwargs.get("arguments"),
-                            is_streaming=True,
-                            execution_settings=settings,
-                            function_call_count=fc_count,
-                            request_index=request_index,
-                            function_behavior=settings.function_choice_behavior,
-                        )
-                        for function_call in function_calls
-                    ],
+                results = await kernel.invoke_function_calls(
+                    function_calls=function_calls,
+                    chat_history=chat_history,
+                    arguments=kwargs.get("arguments"),
+                    is_streaming=True,
+                    execution_settings=settings,
+                    function_call_count=fc_count,
+                    request_index=request_index,
+                    function_behavior=settings.function_choice_behavior,
                 )
 
                 # Merge and yield the function results, regardless of the termination status
@@ -361,7 +354,8 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
             They require a "tool_call_id" and (function) "name" key, and the "metadata" key should
             be removed. The "encoding" key should also be removed.
 
-        Override this method to customize the formatting of the chat history for a request.
+        Override this method to customize the formatting of the chat history for a request,
+        use `chat_history.serialize_messages` to only format the messages that were not formatted before.
 
         Args:
             chat_history (ChatHistory): The chat history to prepare.
@@ -372,9 +366,14 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
             prepared_chat_history (Any): The prepared chat history for a request.
         """
         return [
-            message.to_dict(role_key=role_key, content_key=content_key)
-            for message in chat_history.messages
-            if not isinstance(message, (AnnotationContent, FileReferenceContent))
+            message
+            for message in chat_history.serialize_messages(
+                lambda message: None
+                if isinstance(message, (AnnotationContent, FileReferenceContent))
+                else message.to_dict(role_key=role_key, content_key=content_key),
+                key=("to_dict", role_key, content_key),
+            )
+            if message is not None
         ]
 
     def _verify_function_choice_settings(self, settings: "PromptExecutionSettings") -> None:
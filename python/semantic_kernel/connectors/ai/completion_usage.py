@@ -1,9 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from openai.types import CompletionUsage as OpenAICompletionUsage
+from typing import TYPE_CHECKING
 
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 
+if TYPE_CHECKING:
+    from openai.types import CompletionUsage as OpenAICompletionUsage
+
 
 class CompletionUsage(KernelBaseModel):
     """Completion usage information."""
@@ -12,7 +15,7 @@ class CompletionUsage(KernelBaseModel):
     completion_tokens: int | None = None
 
     @classmethod
-    def from_openai(cls, openai_completion_usage: OpenAICompletionUsage):
+    def from_openai(cls, openai_completion_usage: "OpenAICompletionUsage"):
         """Create a CompletionUsage object from an OpenAI response."""
         return cls(
             prompt_tokens=openai_completion_usage.prompt_tokens,
@@ -1,11 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from collections.abc import Callable
+from dataclasses import field
+from typing import Any, TypeVar
 
 from pydantic.dataclasses import dataclass
 
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
+_T = TypeVar("_T")
+
 
 @experimental
 @dataclass
@@ -13,3 +18,19 @@ class FunctionCallChoiceConfiguration:
     """Configuration for function call choice."""
 
     available_functions: list[KernelFunctionMetadata] | None = None
+    _function_call_formats: dict[Callable[..., Any], list[Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_function_call_formats(self, formatter: Callable[[KernelFunctionMetadata], _T]) -> list[_T]:
+        """Get the available functions in the format of a connector, they are formatted once per formatter.
+
+        Args:
+            formatter: The function that turns the metadata of a function into the format of the connector.
+
+        Returns:
+            The formatted functions, these are shared between calls, so they should not be changed.
+        """
+        if formatter not in self._function_call_formats:
+            self._function_call_formats[formatter] = [formatter(f) for f in self.available_functions or []]
+        return self._function_call_formats[formatter]
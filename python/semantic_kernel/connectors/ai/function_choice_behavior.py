@@ -80,12 +80,25 @@ class FunctionChoiceBehavior(KernelBaseModel):
         ]
         | None = None,
     ) -> "FunctionCallChoiceConfiguration":
-        """Check for missing functions and get the function call choice configuration."""
+        """Check for missing functions and get the function call choice configuration.
+
+        The configuration is cached by the kernel until its plugins change, so the functions
+        are only filtered and formatted once.
+        """
         from semantic_kernel.connectors.ai.function_call_choice_configuration import FunctionCallChoiceConfiguration
+        from semantic_kernel.functions.kernel_function_extension import function_filters_cache_key
 
         if filters:
-            return FunctionCallChoiceConfiguration(available_functions=kernel.get_list_of_function_metadata(filters))
-        return FunctionCallChoiceConfiguration(available_functions=kernel.get_full_list_of_function_metadata())
+            return kernel.get_cached_function_data(
+                ("function_call_choice_configuration", function_filters_cache_key(filters)),
+                lambda: FunctionCallChoiceConfiguration(
+                    available_functions=kernel.get_list_of_function_metadata(filters)
+                ),
+            )
+        return kernel.get_cached_function_data(
+            ("function_call_choice_configuration",),
+            lambda: FunctionCallChoiceConfiguration(available_functions=kernel.get_full_list_of_function_metadata()),
+        )
 
     def configure(
         self,
@@ -1,14 +1,29 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.google.google_ai.google_ai_prompt_execution_settings import (
-    GoogleAIChatPromptExecutionSettings,
-    GoogleAIEmbeddingPromptExecutionSettings,
-    GoogleAIPromptExecutionSettings,
-    GoogleAITextPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_chat_completion import GoogleAIChatCompletion
-from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_text_completion import GoogleAITextCompletion
-from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_text_embedding import GoogleAITextEmbedding
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.google.google_ai.google_ai_prompt_execution_settings import (
+        GoogleAIChatPromptExecutionSettings,
+        GoogleAIEmbeddingPromptExecutionSettings,
+        GoogleAIPromptExecutionSettings,
+        GoogleAITextPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_chat_completion import GoogleAIChatCompletion
+    from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_text_completion import GoogleAITextCompletion
+    from semantic_kernel.connectors.ai.google.google_ai.services.google_ai_text_embedding import GoogleAITextEmbedding
+
+_LAZY_ATTRIBUTES = {
+    "GoogleAIChatPromptExecutionSettings": ".google_ai_prompt_execution_settings",
+    "GoogleAIEmbeddingPromptExecutionSettings": ".google_ai_prompt_execution_settings",
+    "GoogleAIPromptExecutionSettings": ".google_ai_prompt_execution_settings",
+    "GoogleAITextPromptExecutionSettings": ".google_ai_prompt_execution_settings",
+    "GoogleAIChatCompletion": ".services.google_ai_chat_completion",
+    "GoogleAITextCompletion": ".services.google_ai_text_completion",
+    "GoogleAITextEmbedding": ".services.google_ai_text_embedding",
+}
 
 __all__ = [
     "GoogleAIChatCompletion",
@@ -19,3 +34,5 @@ __all__ = [
     "GoogleAITextEmbedding",
     "GoogleAITextPromptExecutionSettings",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
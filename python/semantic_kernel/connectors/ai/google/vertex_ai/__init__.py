@@ -1,14 +1,29 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_chat_completion import VertexAIChatCompletion
-from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_text_completion import VertexAITextCompletion
-from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_text_embedding import VertexAITextEmbedding
-from semantic_kernel.connectors.ai.google.vertex_ai.vertex_ai_prompt_execution_settings import (
-    VertexAIChatPromptExecutionSettings,
-    VertexAIEmbeddingPromptExecutionSettings,
-    VertexAIPromptExecutionSettings,
-    VertexAITextPromptExecutionSettings,
-)
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_chat_completion import VertexAIChatCompletion
+    from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_text_completion import VertexAITextCompletion
+    from semantic_kernel.connectors.ai.google.vertex_ai.services.vertex_ai_text_embedding import VertexAITextEmbedding
+    from semantic_kernel.connectors.ai.google.vertex_ai.vertex_ai_prompt_execution_settings import (
+        VertexAIChatPromptExecutionSettings,
+        VertexAIEmbeddingPromptExecutionSettings,
+        VertexAIPromptExecutionSettings,
+        VertexAITextPromptExecutionSettings,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "VertexAIChatCompletion": ".services.vertex_ai_chat_completion",
+    "VertexAITextCompletion": ".services.vertex_ai_text_completion",
+    "VertexAITextEmbedding": ".services.vertex_ai_text_embedding",
+    "VertexAIChatPromptExecutionSettings": ".vertex_ai_prompt_execution_settings",
+    "VertexAIEmbeddingPromptExecutionSettings": ".vertex_ai_prompt_execution_settings",
+    "VertexAIPromptExecutionSettings": ".vertex_ai_prompt_execution_settings",
+    "VertexAITextPromptExecutionSettings": ".vertex_ai_prompt_execution_settings",
+}
 
 __all__ = [
     "VertexAIChatCompletion",
@@ -19,3 +34,5 @@ __all__ = [
     "VertexAITextEmbedding",
     "VertexAITextPromptExecutionSettings",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -167,10 +167,11 @@ def update_settings_from_function_choice_configuration(
         )
         settings.tools = [
             Tool(
-                function_declarations=[
-                    kernel_function_metadata_to_vertex_ai_function_call_format(f)
-                    for f in function_choice_configuration.available_functions
-                ]
+                function_declarations=list(
+                    function_choice_configuration.get_function_call_formats(
+                        kernel_function_metadata_to_vertex_ai_function_call_format
+                    )
+                )
             )
         ]
 
@@ -1,17 +1,30 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import (
-    HuggingFacePromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion import (
-    HuggingFaceTextCompletion,
-)
-from semantic_kernel.connectors.ai.hugging_face.services.hf_text_embedding import (
-    HuggingFaceTextEmbedding,
-)
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import (
+        HuggingFacePromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion import (
+        HuggingFaceTextCompletion,
+    )
+    from semantic_kernel.connectors.ai.hugging_face.services.hf_text_embedding import (
+        HuggingFaceTextEmbedding,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "HuggingFacePromptExecutionSettings": ".hf_prompt_execution_settings",
+    "HuggingFaceTextCompletion": ".services.hf_text_completion",
+    "HuggingFaceTextEmbedding": ".services.hf_text_embedding",
+}
 
 __all__ = [
     "HuggingFacePromptExecutionSettings",
     "HuggingFaceTextCompletion",
     "HuggingFaceTextEmbedding",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
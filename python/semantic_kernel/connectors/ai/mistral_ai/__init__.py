@@ -1,11 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.mistral_ai.prompt_execution_settings.mistral_ai_prompt_execution_settings import (
-    MistralAIChatPromptExecutionSettings,
-    MistralAIPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.mistral_ai.services.mistral_ai_chat_completion import MistralAIChatCompletion
-from semantic_kernel.connectors.ai.mistral_ai.services.mistral_ai_text_embedding import MistralAITextEmbedding
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.mistral_ai.prompt_execution_settings.mistral_ai_prompt_execution_settings import (  # noqa: E501
+        MistralAIChatPromptExecutionSettings,
+        MistralAIPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.mistral_ai.services.mistral_ai_chat_completion import MistralAIChatCompletion
+    from semantic_kernel.connectors.ai.mistral_ai.services.mistral_ai_text_embedding import MistralAITextEmbedding
+
+_LAZY_ATTRIBUTES = {
+    "MistralAIChatPromptExecutionSettings": ".prompt_execution_settings.mistral_ai_prompt_execution_settings",
+    "MistralAIPromptExecutionSettings": ".prompt_execution_settings.mistral_ai_prompt_execution_settings",
+    "MistralAIChatCompletion": ".services.mistral_ai_chat_completion",
+    "MistralAITextEmbedding": ".services.mistral_ai_text_embedding",
+}
 
 __all__ = [
     "MistralAIChatCompletion",
@@ -13,3 +25,5 @@ __all__ = [
     "MistralAIPromptExecutionSettings",
     "MistralAITextEmbedding",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
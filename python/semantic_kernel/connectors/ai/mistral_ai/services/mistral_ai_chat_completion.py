@@ -303,10 +303,11 @@ class MistralAIChatCompletion(MistralAIBase, ChatCompletionClientBase):
             and hasattr(settings, "tools")
         ):
             settings.tool_choice = type
-            settings.tools = [
-                kernel_function_metadata_to_function_call_format(f)
-                for f in function_choice_configuration.available_functions
-            ]
+            settings.tools = list(
+                function_choice_configuration.get_function_call_formats(
+                    kernel_function_metadata_to_function_call_format
+                )
+            )
             # Function Choice behavior required maps to MistralAI any
             if (
                 settings.function_choice_behavior
@@ -1,11 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.nvidia.prompt_execution_settings.nvidia_prompt_execution_settings import (
-    NvidiaEmbeddingPromptExecutionSettings,
-    NvidiaPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.nvidia.services.nvidia_text_embedding import NvidiaTextEmbedding
-from semantic_kernel.connectors.ai.nvidia.settings.nvidia_settings import NvidiaSettings
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.nvidia.prompt_execution_settings.nvidia_prompt_execution_settings import (
+        NvidiaEmbeddingPromptExecutionSettings,
+        NvidiaPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.nvidia.services.nvidia_text_embedding import NvidiaTextEmbedding
+    from semantic_kernel.connectors.ai.nvidia.settings.nvidia_settings import NvidiaSettings
+
+_LAZY_ATTRIBUTES = {
+    "NvidiaEmbeddingPromptExecutionSettings": ".prompt_execution_settings.nvidia_prompt_execution_settings",
+    "NvidiaPromptExecutionSettings": ".prompt_execution_settings.nvidia_prompt_execution_settings",
+    "NvidiaTextEmbedding": ".services.nvidia_text_embedding",
+    "NvidiaSettings": ".settings.nvidia_settings",
+}
 
 __all__ = [
     "NvidiaEmbeddingPromptExecutionSettings",
@@ -13,3 +25,5 @@ __all__ = [
     "NvidiaSettings",
     "NvidiaTextEmbedding",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -1,14 +1,29 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.ollama.ollama_prompt_execution_settings import (
-    OllamaChatPromptExecutionSettings,
-    OllamaEmbeddingPromptExecutionSettings,
-    OllamaPromptExecutionSettings,
-    OllamaTextPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.ollama.services.ollama_chat_completion import OllamaChatCompletion
-from semantic_kernel.connectors.ai.ollama.services.ollama_text_completion import OllamaTextCompletion
-from semantic_kernel.connectors.ai.ollama.services.ollama_text_embedding import OllamaTextEmbedding
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.ollama.ollama_prompt_execution_settings import (
+        OllamaChatPromptExecutionSettings,
+        OllamaEmbeddingPromptExecutionSettings,
+        OllamaPromptExecutionSettings,
+        OllamaTextPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.ollama.services.ollama_chat_completion import OllamaChatCompletion
+    from semantic_kernel.connectors.ai.ollama.services.ollama_text_completion import OllamaTextCompletion
+    from semantic_kernel.connectors.ai.ollama.services.ollama_text_embedding import OllamaTextEmbedding
+
+_LAZY_ATTRIBUTES = {
+    "OllamaChatPromptExecutionSettings": ".ollama_prompt_execution_settings",
+    "OllamaEmbeddingPromptExecutionSettings": ".ollama_prompt_execution_settings",
+    "OllamaPromptExecutionSettings": ".ollama_prompt_execution_settings",
+    "OllamaTextPromptExecutionSettings": ".ollama_prompt_execution_settings",
+    "OllamaChatCompletion": ".services.ollama_chat_completion",
+    "OllamaTextCompletion": ".services.ollama_text_completion",
+    "OllamaTextEmbedding": ".services.ollama_text_embedding",
+}
 
 __all__ = [
     "OllamaChatCompletion",
@@ -19,3 +34,5 @@ __all__ = [
     "OllamaTextEmbedding",
     "OllamaTextPromptExecutionSettings",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -122,7 +122,7 @@ class OllamaChatCompletion(OllamaBase, ChatCompletionClientBase):
         role_key: str = "role",
         content_key: str = "content",
     ) -> list[Message]:
-        return [MESSAGE_CONVERTERS[message.role](message) for message in chat_history.messages]
+        return chat_history.serialize_messages(lambda message: MESSAGE_CONVERTERS[message.role](message), key="ollama")
 
     @override
     def _verify_function_choice_settings(self, settings: "PromptExecutionSettings") -> None:
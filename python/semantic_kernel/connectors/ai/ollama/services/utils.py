@@ -123,10 +123,9 @@ def update_settings_from_function_choice_configuration(
     We need to try to use the tools attribute or fallback to the extension_data attribute.
     """
     if function_choice_configuration.available_functions:
-        tools = [
-            kernel_function_metadata_to_function_call_format(f)
-            for f in function_choice_configuration.available_functions
-        ]
+        tools = list(
+            function_choice_configuration.get_function_call_formats(kernel_function_metadata_to_function_call_format)
+        )
         try:
             settings.tools = tools  # type: ignore
         except Exception:
@@ -1,8 +1,24 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.onnx.onnx_gen_ai_prompt_execution_settings import OnnxGenAIPromptExecutionSettings
-from semantic_kernel.connectors.ai.onnx.services.onnx_gen_ai_chat_completion import OnnxGenAIChatCompletion
-from semantic_kernel.connectors.ai.onnx.services.onnx_gen_ai_text_completion import OnnxGenAITextCompletion
-from semantic_kernel.connectors.ai.onnx.utils import ONNXTemplate
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.onnx.onnx_gen_ai_prompt_execution_settings import (
+        OnnxGenAIPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.onnx.services.onnx_gen_ai_chat_completion import OnnxGenAIChatCompletion
+    from semantic_kernel.connectors.ai.onnx.services.onnx_gen_ai_text_completion import OnnxGenAITextCompletion
+    from semantic_kernel.connectors.ai.onnx.utils import ONNXTemplate
+
+_LAZY_ATTRIBUTES = {
+    "OnnxGenAIPromptExecutionSettings": ".onnx_gen_ai_prompt_execution_settings",
+    "OnnxGenAIChatCompletion": ".services.onnx_gen_ai_chat_completion",
+    "OnnxGenAITextCompletion": ".services.onnx_gen_ai_text_completion",
+    "ONNXTemplate": ".utils",
+}
 
 __all__ = ["ONNXTemplate", "OnnxGenAIChatCompletion", "OnnxGenAIPromptExecutionSettings", "OnnxGenAITextCompletion"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -1,59 +1,108 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import (
-    ApiKeyAuthentication,
-    AzureAISearchDataSource,
-    AzureAISearchDataSourceParameters,
-    AzureChatPromptExecutionSettings,
-    AzureCosmosDBDataSource,
-    AzureCosmosDBDataSourceParameters,
-    AzureDataSourceParameters,
-    AzureEmbeddingDependency,
-    ConnectionStringAuthentication,
-    DataSourceFieldsMapping,
-    ExtraBody,
-)
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_audio_to_text_execution_settings import (
-    OpenAIAudioToTextExecutionSettings,
-)
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
-    OpenAIChatPromptExecutionSettings,
-    OpenAIEmbeddingPromptExecutionSettings,
-    OpenAIPromptExecutionSettings,
-    OpenAITextPromptExecutionSettings,
-)
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_realtime_execution_settings import (
-    AzureRealtimeExecutionSettings,
-    InputAudioTranscription,
-    OpenAIRealtimeExecutionSettings,
-    TurnDetection,
-)
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_text_to_audio_execution_settings import (
-    OpenAITextToAudioExecutionSettings,
-)
-from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_text_to_image_execution_settings import (
-    OpenAITextToImageExecutionSettings,
-)
-from semantic_kernel.connectors.ai.open_ai.services._open_ai_realtime import ListenEvents, SendEvents
-from semantic_kernel.connectors.ai.open_ai.services.azure_audio_to_text import AzureAudioToText
-from semantic_kernel.connectors.ai.open_ai.services.azure_chat_completion import AzureChatCompletion
-from semantic_kernel.connectors.ai.open_ai.services.azure_realtime import AzureRealtimeWebsocket
-from semantic_kernel.connectors.ai.open_ai.services.azure_text_completion import AzureTextCompletion
-from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import AzureTextEmbedding
-from semantic_kernel.connectors.ai.open_ai.services.azure_text_to_audio import AzureTextToAudio
-from semantic_kernel.connectors.ai.open_ai.services.azure_text_to_image import AzureTextToImage
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_audio_to_text import OpenAIAudioToText
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_realtime import (
-    OpenAIRealtimeWebRTC,
-    OpenAIRealtimeWebsocket,
-)
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion import OpenAITextCompletion
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding import OpenAITextEmbedding
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_to_audio import OpenAITextToAudio
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_to_image import OpenAITextToImage
-from semantic_kernel.connectors.ai.open_ai.settings.azure_open_ai_settings import AzureOpenAISettings
-from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import (
+        ApiKeyAuthentication,
+        AzureAISearchDataSource,
+        AzureAISearchDataSourceParameters,
+        AzureChatPromptExecutionSettings,
+        AzureCosmosDBDataSource,
+        AzureCosmosDBDataSourceParameters,
+        AzureDataSourceParameters,
+        AzureEmbeddingDependency,
+        ConnectionStringAuthentication,
+        DataSourceFieldsMapping,
+        ExtraBody,
+    )
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_audio_to_text_execution_settings import (  # noqa: E501
+        OpenAIAudioToTextExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+        OpenAIChatPromptExecutionSettings,
+        OpenAIEmbeddingPromptExecutionSettings,
+        OpenAIPromptExecutionSettings,
+        OpenAITextPromptExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_realtime_execution_settings import (
+        AzureRealtimeExecutionSettings,
+        InputAudioTranscription,
+        OpenAIRealtimeExecutionSettings,
+        TurnDetection,
+    )
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_text_to_audio_execution_settings import (  # noqa: E501
+        OpenAITextToAudioExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_text_to_image_execution_settings import (  # noqa: E501
+        OpenAITextToImageExecutionSettings,
+    )
+    from semantic_kernel.connectors.ai.open_ai.services._open_ai_realtime import ListenEvents, SendEvents
+    from semantic_kernel.connectors.ai.open_ai.services.azure_audio_to_text import AzureAudioToText
+    from semantic_kernel.connectors.ai.open_ai.services.azure_chat_completion import AzureChatCompletion
+    from semantic_kernel.connectors.ai.open_ai.services.azure_realtime import AzureRealtimeWebsocket
+    from semantic_kernel.connectors.ai.open_ai.services.azure_text_completion import AzureTextCompletion
+    from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import AzureTextEmbedding
+    from semantic_kernel.connectors.ai.open_ai.services.azure_text_to_audio import AzureTextToAudio
+    from semantic_kernel.connectors.ai.open_ai.services.azure_text_to_image import AzureTextToImage
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_audio_to_text import OpenAIAudioToText
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_realtime import (
+        OpenAIRealtimeWebRTC,
+        OpenAIRealtimeWebsocket,
+    )
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion import OpenAITextCompletion
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding import OpenAITextEmbedding
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_to_audio import OpenAITextToAudio
+    from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_to_image import OpenAITextToImage
+    from semantic_kernel.connectors.ai.open_ai.settings.azure_open_ai_settings import AzureOpenAISettings
+    from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
+
+_LAZY_ATTRIBUTES = {
+    "ApiKeyAuthentication": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureAISearchDataSource": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureAISearchDataSourceParameters": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureChatPromptExecutionSettings": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureCosmosDBDataSource": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureCosmosDBDataSourceParameters": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureDataSourceParameters": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "AzureEmbeddingDependency": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "ConnectionStringAuthentication": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "DataSourceFieldsMapping": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "ExtraBody": ".prompt_execution_settings.azure_chat_prompt_execution_settings",
+    "OpenAIAudioToTextExecutionSettings": ".prompt_execution_settings.open_ai_audio_to_text_execution_settings",
+    "OpenAIChatPromptExecutionSettings": ".prompt_execution_settings.open_ai_prompt_execution_settings",
+    "OpenAIEmbeddingPromptExecutionSettings": ".prompt_execution_settings.open_ai_prompt_execution_settings",
+    "OpenAIPromptExecutionSettings": ".prompt_execution_settings.open_ai_prompt_execution_settings",
+    "OpenAITextPromptExecutionSettings": ".prompt_execution_settings.open_ai_prompt_execution_settings",
+    "AzureRealtimeExecutionSettings": ".prompt_execution_settings.open_ai_realtime_execution_settings",
+    "InputAudioTranscription": ".prompt_execution_settings.open_ai_realtime_execution_settings",
+    "OpenAIRealtimeExecutionSettings": ".prompt_execution_settings.open_ai_realtime_execution_settings",
+    "TurnDetection": ".prompt_execution_settings.open_ai_realtime_execution_settings",
+    "OpenAITextToAudioExecutionSettings": ".prompt_execution_settings.open_ai_text_to_audio_execution_settings",
+    "OpenAITextToImageExecutionSettings": ".prompt_execution_settings.open_ai_text_to_image_execution_settings",
+    "ListenEvents": ".services._open_ai_realtime",
+    "SendEvents": ".services._open_ai_realtime",
+    "AzureAudioToText": ".services.azure_audio_to_text",
+    "AzureChatCompletion": ".services.azure_chat_completion",
+    "AzureRealtimeWebsocket": ".services.azure_realtime",
+    "AzureTextCompletion": ".services.azure_text_completion",
+    "AzureTextEmbedding": ".services.azure_text_embedding",
+    "AzureTextToAudio": ".services.azure_text_to_audio",
+    "AzureTextToImage": ".services.azure_text_to_image",
+    "OpenAIAudioToText": ".services.open_ai_audio_to_text",
+    "OpenAIChatCompletion": ".services.open_ai_chat_completion",
+    "OpenAIRealtimeWebRTC": ".services.open_ai_realtime",
+    "OpenAIRealtimeWebsocket": ".services.open_ai_realtime",
+    "OpenAITextCompletion": ".services.open_ai_text_completion",
+    "OpenAITextEmbedding": ".services.open_ai_text_embedding",
+    "OpenAITextToAudio": ".services.open_ai_text_to_audio",
+    "OpenAITextToImage": ".services.open_ai_text_to_image",
+    "AzureOpenAISettings": ".settings.azure_open_ai_settings",
+    "OpenAISettings": ".settings.open_ai_settings",
+}
 
 __all__ = [
     "ApiKeyAuthentication",
@@ -99,3 +148,5 @@ __all__ = [
     "SendEvents",
     "TurnDetection",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -291,15 +291,23 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         Returns:
             prepared_chat_history (Any): The prepared chat history for a request.
         """
+        use_developer_role = self.instruction_role == "developer"
+
+        def serialize(message: ChatMessageContent) -> dict[str, Any] | None:
+            if isinstance(message, (AnnotationContent, FileReferenceContent)):
+                return None
+            message_dict = message.to_dict(role_key=role_key, content_key=content_key)
+            if use_developer_role and message_dict[role_key] == "system":
+                message_dict[role_key] = "developer"
+            return message_dict
+
         return [
-            {
-                **message.to_dict(role_key=role_key, content_key=content_key),
-                role_key: "developer"
-                if self.instruction_role == "developer" and message.to_dict(role_key=role_key)[role_key] == "system"
-                else message.to_dict(role_key=role_key)[role_key],
-            }
-            for message in chat_history.messages
-            if not isinstance(message, (AnnotationContent, FileReferenceContent))
+            message
+            for message in chat_history.serialize_messages(
+                serialize,
+                key=("openai", role_key, content_key, use_developer_role),
+            )
+            if message is not None
         ]
 
     # endregion
@@ -1,9 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import sys
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final
 
 from numpy import array, ndarray
+from pydantic import Field, PrivateAttr
 
 if sys.version_info >= (3, 12):
     from typing import override  # pragma: no cover
@@ -15,15 +18,42 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
     OpenAIEmbeddingPromptExecutionSettings,
 )
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import OpenAIHandler
+from semantic_kernel.utils.async_utils import RateLimiter
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 if TYPE_CHECKING:
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 
+# The maximum number of tokens summed over all inputs of a single embeddings request.
+MAX_TOKENS_PER_REQUEST: Final[int] = 300_000
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative estimate of the number of tokens in a text, without a tokenizer."""
+    return len(text) // 3 + 1
+
 
 @experimental
 class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
-    """Base class for OpenAI text embedding services."""
+    """Base class for OpenAI text embedding services.
+
+    The texts are sent in batches, by default one batch at a time.
+    Set `max_concurrent_requests` to have multiple batches in flight,
+    and `requests_per_minute` and `tokens_per_minute` to stay within the rate limits of the model,
+    these limits are shared by all calls to the service.
+    Batches with more tokens than `max_tokens_per_request` are split into smaller requests,
+    the tokens are estimated from the length of the texts, unless a `token_counter` is set,
+    for instance `lambda text: len(tiktoken.get_encoding("cl100k_base").encode(text))`.
+    """
+
+    max_concurrent_requests: int = Field(default=1, gt=0)
+    requests_per_minute: int | None = Field(default=None, gt=0)
+    tokens_per_minute: int | None = Field(default=None, gt=0)
+    max_tokens_per_request: int = Field(default=MAX_TOKENS_PER_REQUEST, gt=0)
+    token_counter: Callable[[str], int] | None = Field(default=None, exclude=True)
+    _request_semaphore: tuple[int, asyncio.Semaphore] | None = PrivateAttr(default=None)
+    _request_limiter: RateLimiter | None = PrivateAttr(default=None)
+    _token_limiter: RateLimiter | None = PrivateAttr(default=None)
 
     @override
     async def generate_embeddings(
@@ -51,6 +81,9 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
             settings (PromptExecutionSettings): The settings to use for the request.
             batch_size (int): The batch size to use for the request.
             kwargs (Dict[str, Any]): Additional arguments to pass to the request.
+
+        Returns:
+            The embeddings, in the same order as the texts.
         """
         if not settings:
             settings = OpenAIEmbeddingPromptExecutionSettings(ai_model_id=self.ai_model_id)
@@ -62,15 +95,64 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
             settings.ai_model_id = self.ai_model_id
         for key, value in kwargs.items():
             setattr(settings, key, value)
-        raw_embeddings = []
-        batch_size = batch_size or len(texts)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            settings.input = batch
-            raw_embedding = await self._send_request(settings=settings)
-            assert isinstance(raw_embedding, list)  # nosec
-            raw_embeddings.extend(raw_embedding)
-        return raw_embeddings
+        tasks = [
+            asyncio.ensure_future(self._send_batch(settings, batch, tokens))
+            for batch, tokens in self._split_batches(texts, batch_size or len(texts))
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [raw_embedding for result in results for raw_embedding in result]
+
+    def _split_batches(self, texts: list[str], batch_size: int) -> list[tuple[list[str], int]]:
+        """Split the texts into batches of at most batch_size texts and max_tokens_per_request tokens.
+
+        Returns:
+            The batches with their number of tokens.
+        """
+        counter = self.token_counter or estimate_tokens
+        batches: list[tuple[list[str], int]] = []
+        for start in range(0, len(texts), batch_size):
+            batch: list[str] = []
+            batch_tokens = 0
+            for text in texts[start : start + batch_size]:
+                # already tokenized input is a list of token ids or a single token id
+                tokens = counter(text) if isinstance(text, str) else len(text) if isinstance(text, list) else 1
+                if batch and batch_tokens + tokens > self.max_tokens_per_request:
+                    batches.append((batch, batch_tokens))
+                    batch, batch_tokens = [], 0
+                batch.append(text)
+                batch_tokens += tokens
+            batches.append((batch, batch_tokens))
+        return batches
+
+    async def _send_batch(
+        self, settings: OpenAIEmbeddingPromptExecutionSettings, batch: list[str], tokens: int
+    ) -> list[Any]:
+        """Send a single batch, within the concurrency and rate limits.
+
+        The settings are copied, so that batches can be sent concurrently.
+        """
+        async with self._get_request_semaphore():
+            if self.requests_per_minute:
+                if self._request_limiter is None or self._request_limiter.limit != self.requests_per_minute:
+                    self._request_limiter = RateLimiter(self.requests_per_minute)
+                await self._request_limiter.acquire()
+            if self.tokens_per_minute:
+                if self._token_limiter is None or self._token_limiter.limit != self.tokens_per_minute:
+                    self._token_limiter = RateLimiter(self.tokens_per_minute)
+                await self._token_limiter.acquire(tokens)
+            raw_embedding = await self._send_request(settings=settings.model_copy(update={"input": batch}))
+        assert isinstance(raw_embedding, list)  # nosec
+        return raw_embedding
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        if self._request_semaphore is None or self._request_semaphore[0] != self.max_concurrent_requests:
+            self._request_semaphore = (self.max_concurrent_requests, asyncio.Semaphore(self.max_concurrent_requests))
+        return self._request_semaphore[1]
 
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Get the request settings class."""
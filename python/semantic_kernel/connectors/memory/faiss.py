@@ -6,10 +6,9 @@ from typing import TYPE_CHECKING, Any, Generic
 
 import faiss
 import numpy as np
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.connectors.memory.in_memory.in_memory_collection import (
-    IN_MEMORY_SCORE_KEY,
     InMemoryVectorCollection,
 )
 from semantic_kernel.data.const import DistanceFunction, IndexKind
@@ -21,6 +20,7 @@ from semantic_kernel.exceptions import (
     VectorStoreInitializationException,
     VectorStoreOperationException,
 )
+from semantic_kernel.utils.list_handler import empty_generator
 
 if TYPE_CHECKING:
     from semantic_kernel.data.vector_storage import VectorStoreRecordCollection
@@ -34,15 +34,33 @@ else:
 logger = logging.getLogger(__name__)
 
 
+def _supports_ids(index: faiss.Index) -> bool:
+    """Check if vectors can be added to the index with ids, like IVF indexes, flat indexes only number them."""
+    try:
+        index.add_with_ids(np.empty((0, index.d), dtype=np.float32), np.empty(0, dtype=np.int64))
+    except RuntimeError:
+        return False
+    return True
+
+
 class FaissCollection(InMemoryVectorCollection[TKey, TModel], Generic[TKey, TModel]):
     """Create a Faiss collection.
 
     The Faiss Collection builds on the InMemoryVectorCollection,
     it maintains indexes and mappings for each vector field.
+
+    Every record gets an int64 id, that is used for its vectors in the Faiss indexes and mapped back to its key
+    with a list indexed by id. Indexes that do not support ids, like the flat indexes, are wrapped in an
+    `IndexIDMap`. Upserting an existing key replaces its vectors. Filters are pushed down to Faiss as a
+    bitmap `IDSelector` of the matching records, so a filtered search still returns `top` results when enough
+    records match. For indexes that do not support search parameters, the filter is applied to the full ranking.
     """
 
     indexes: MutableMapping[str, faiss.Index] = Field(default_factory=dict)
     indexes_key_map: MutableMapping[str, MutableMapping[TKey, int]] = Field(default_factory=dict)
+    _id_indexes: dict[str, tuple[faiss.Index, faiss.Index]] = PrivateAttr(default_factory=dict)
+    _ids: dict[TKey, int] = PrivateAttr(default_factory=dict)
+    _keys: list[TKey | None] = PrivateAttr(default_factory=list)
 
     def __init__(
         self,
@@ -146,34 +164,71 @@ class FaissCollection(InMemoryVectorCollection[TKey, TModel], Generic[TKey, TMod
         """
         self._create_indexes(index=index, indexes=indexes)
 
+    def _get_id_index(self, vector_field: str) -> faiss.Index:
+        """Get the index of the vector field that is used with the ids of the records."""
+        index = self.indexes[vector_field]
+        if not index.is_trained:
+            raise VectorStoreOperationException(
+                f"This index (of type {type(index)}) requires training, "
+                "which is not supported. To train the index, "
+                f"use <collection>.indexes[{vector_field}].train, "
+                "see faiss docs for more details."
+            )
+        # the index can be replaced through the indexes field, so the wrapper is kept with the index it wraps
+        cached = self._id_indexes.get(vector_field)
+        if cached is None or cached[0] is not index:
+            cached = (index, index if _supports_ids(index) else faiss.IndexIDMap(index))
+            self._id_indexes[vector_field] = cached
+        return cached[1]
+
+    @staticmethod
+    def _remove_ids(index: faiss.Index, ids: np.ndarray) -> None:
+        try:
+            index.remove_ids(ids)
+        except RuntimeError as exc:
+            raise VectorStoreOperationException(
+                f"The index (of type {type(index)}) does not support removing vectors, "
+                "which is needed to delete or replace records."
+            ) from exc
+
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[TKey]:
-        """Upsert records."""
+        """Upsert records, the vectors of existing records are replaced."""
+        key_field = self.data_model_definition.key_field.name
+        # when a key occurs more than once, the last record is kept, like in the inner storage
+        records_by_key = {record[key_field]: record for record in records}
+        for key in records_by_key:
+            if key not in self._ids:
+                self._ids[key] = len(self._keys)
+                self._keys.append(key)
+        ids = np.array([self._ids[key] for key in records_by_key], dtype=np.int64)
         for vector_field in self.data_model_definition.vector_field_names:
-            vectors_to_add = [record.get(vector_field) for record in records]
-            vectors = np.array(vectors_to_add, dtype=np.float32)
-            if not self.indexes[vector_field].is_trained:
-                raise VectorStoreOperationException(
-                    f"This index (of type {type(self.indexes[vector_field])}) requires training, "
-                    "which is not supported. To train the index, "
-                    f"use <collection>.indexes[{vector_field}].train, "
-                    "see faiss docs for more details."
-                )
-            self.indexes[vector_field].add(vectors)  # type: ignore[call-arg]
-            start = len(self.indexes_key_map[vector_field])
-            for i, record in enumerate(records):
-                key = record[self.data_model_definition.key_field.name]
-                self.indexes_key_map[vector_field][key] = start + i
+            index = self._get_id_index(vector_field)
+            key_map = self.indexes_key_map.setdefault(vector_field, {})
+            replaced = np.array([key_map[key] for key in records_by_key if key in key_map], dtype=np.int64)
+            if len(replaced) > 0:
+                self._remove_ids(index, replaced)
+            vectors = np.array([record.get(vector_field) for record in records_by_key.values()], dtype=np.float32)
+            index.add_with_ids(vectors, ids)  # type: ignore[call-arg]
+            for key in records_by_key:
+                key_map[key] = self._ids[key]
         return await super()._inner_upsert(records, **kwargs)
 
+    @override
+    def _upsert_vectors(self, key: TKey, record: Any) -> None:
+        # the vectors are kept in the Faiss indexes only
+        pass
+
     @override
     async def _inner_delete(self, keys: Sequence[TKey], **kwargs: Any) -> None:
+        for vector_field in self.data_model_definition.vector_field_names:
+            key_map = self.indexes_key_map.get(vector_field, {})
+            ids = np.array([key_map.pop(key) for key in keys if key in key_map], dtype=np.int64)
+            if len(ids) > 0:
+                self._remove_ids(self._get_id_index(vector_field), ids)
         for key in keys:
-            for vector_field in self.data_model_definition.vector_field_names:
-                if key in self.indexes_key_map[vector_field]:
-                    vector_index = self.indexes_key_map[vector_field][key]
-                    self.indexes[vector_field].remove_ids(np.array([vector_index]))
-                    self.indexes_key_map[vector_field].pop(key, None)
+            if (id := self._ids.pop(key, None)) is not None:
+                self._keys[id] = None
         await super()._inner_delete(keys, **kwargs)
 
     @override
@@ -183,42 +238,81 @@ class FaissCollection(InMemoryVectorCollection[TKey, TModel], Generic[TKey, TMod
                 del self.indexes[vector_field]
             if vector_field in self.indexes_key_map:
                 del self.indexes_key_map[vector_field]
+        self._id_indexes = {}
+        self._ids = {}
+        self._keys = []
         await super().delete_collection(**kwargs)
 
     @override
     async def does_collection_exist(self, **kwargs: Any) -> bool:
         return bool(self.indexes)
 
-    async def _inner_search_vectorized(
+    @override
+    async def _inner_search_batch(
         self,
-        vector: list[float | int],
         options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
         **kwargs: Any,
-    ) -> KernelSearchResults[VectorSearchResult[TModel]]:
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Search the vectors, the whole query matrix is searched by Faiss at once."""
         field = options.vector_field_name or self.data_model_definition.vector_field_names[0]
         assert isinstance(self.data_model_definition.fields.get(field), VectorStoreRecordVectorField)  # nosec
-        if vector and field:
-            return_list = []
-            # since the vector index works independently of the record index,
-            # we will need to get all records that adhere to the filter first
-            filtered_records = self._get_filtered_records(options)
-            np_vector = np.array(vector, dtype=np.float32).reshape(1, -1)
-            # then do the actual vector search
-            distances, indexes = self.indexes[field].search(np_vector, min(options.top, self.indexes[field].ntotal))  # type: ignore[call-arg]
-            # we then iterate through the results, the order is the order of relevance
-            # (less or most distance, dependant on distance metric used)
-            for i, index in enumerate(indexes[0]):
-                key = list(self.indexes_key_map[field].keys())[index]
-                # if the key is not in the filtered records, we ignore it
-                if key not in filtered_records:
-                    continue
-                filtered_records[key][IN_MEMORY_SCORE_KEY] = distances[0][i]
-                # so we return the list in the order of the search, with the record from the inner_storage.
-                return_list.append(filtered_records[key])
-        return KernelSearchResults(
-            results=self._get_vector_search_results_from_results(return_list, options),
-            total_count=len(return_list) if options and options.include_total_count else None,
-        )
+        keys = self._get_filtered_keys(options)
+        if field not in self.indexes or not vectors or (keys is not None and not keys):
+            return [KernelSearchResults(results=empty_generator()) for _ in vectors]
+        index = self._get_id_index(field)
+        k = min(options.skip + options.top, index.ntotal)
+        if k == 0:
+            return [KernelSearchResults(results=empty_generator()) for _ in vectors]
+        queries = np.array(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        distances, ids = self._search(index, queries, k, keys)
+        search_results: list[KernelSearchResults[VectorSearchResult[TModel]]] = []
+        # the order of the results is the order of relevance
+        # (less or most distance, dependant on distance metric used)
+        for row_distances, row_ids in zip(distances, ids):
+            return_records = {
+                self._keys[id]: float(distance) for distance, id in zip(row_distances, row_ids) if id >= 0
+            }
+            search_results.append(
+                KernelSearchResults(
+                    results=self._get_vector_search_results_from_results(
+                        self._generate_return_list(return_records, options),  # type: ignore[arg-type]
+                        options,
+                    ),
+                    total_count=len(return_records) if options.include_total_count else None,
+                )
+            )
+        return search_results
+
+    def _search(
+        self, index: faiss.Index, queries: np.ndarray, k: int, keys: set[Any] | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Search the index, only the records with one of the keys are returned when keys are given."""
+        if keys is None:
+            return index.search(queries, k)  # type: ignore[call-arg]
+        ids = np.fromiter((self._ids[key] for key in keys if key in self._ids), dtype=np.int64)
+        k = min(k, len(ids))
+        bitmap = np.zeros(len(self._keys), dtype=bool)
+        bitmap[ids] = True
+        packed = np.packbits(bitmap, bitorder="little")
+        selector = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(packed))
+        if isinstance(faiss.downcast_index(index), faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=index.nprobe)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        try:
+            return index.search(queries, k, params=params)  # type: ignore[call-arg]
+        except RuntimeError:
+            logger.debug(f"The index (of type {type(index)}) does not support filters, filtering the full ranking.")
+        distances, labels = index.search(queries, index.ntotal)  # type: ignore[call-arg]
+        matches = (labels >= 0) & bitmap[np.maximum(labels, 0)]
+        filtered_distances = np.zeros((len(queries), k), dtype=distances.dtype)
+        filtered_labels = np.full((len(queries), k), -1, dtype=np.int64)
+        for row, row_matches in enumerate(matches):
+            columns = np.flatnonzero(row_matches)[:k]
+            filtered_distances[row, : len(columns)] = distances[row, columns]
+            filtered_labels[row, : len(columns)] = labels[row, columns]
+        return filtered_distances, filtered_labels
 
 
 class FaissStore(VectorStore):
@@ -1,18 +1,20 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import sys
-from collections.abc import AsyncIterable, Callable, Mapping, Sequence
-from typing import Any, ClassVar, Generic
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from typing import Any, ClassVar, Generic, cast
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from semantic_kernel.connectors.memory.in_memory.const import DISTANCE_FUNCTION_MAP
-from semantic_kernel.data.const import DISTANCE_FUNCTION_DIRECTION_HELPER, DistanceFunction
+from semantic_kernel.connectors.memory.in_memory.record_index import FieldIndex, TextIndex, compile_filter
+from semantic_kernel.connectors.memory.in_memory.vector_index import FlatVectorIndex, IvfFlatVectorIndex
+from semantic_kernel.data.const import DistanceFunction, IndexKind
 from semantic_kernel.data.record_definition import (
+    VectorStoreRecordDataField,
     VectorStoreRecordDefinition,
     VectorStoreRecordVectorField,
 )
-from semantic_kernel.data.text_search import AnyTagsEqualTo, EqualTo, FilterClauseBase, KernelSearchResults
+from semantic_kernel.data.text_search import KernelSearchResults
 from semantic_kernel.data.vector_search import (
     VectorizedSearchMixin,
     VectorSearchOptions,
@@ -39,10 +41,25 @@ class InMemoryVectorCollection(
     VectorizedSearchMixin[TKey, TModel],
     Generic[TKey, TModel],
 ):
-    """In Memory Collection."""
+    """In Memory Collection.
+
+    Vector fields are searched exactly. A vector field with index kind IVF Flat can opt in to an approximate
+    nearest neighbor index by passing its parameters, like `nlist` and `nprobe`, through `index_settings`,
+    for instance: `index_settings={"vector": {"nlist": 256, "nprobe": 16}}`, an empty dict uses the defaults.
+    Other index kinds, and IVF Flat fields without settings, keep the exact search.
+
+    Data fields marked as filterable get a secondary index that is used for the EqualTo and AnyTagsEqualTo
+    filters, filters on other fields are evaluated per record. Text search uses a token index to find
+    the records to check.
+    """
 
     inner_storage: dict[TKey, dict] = Field(default_factory=dict)
+    index_settings: dict[str, dict[str, Any]] = Field(default_factory=dict)
     supported_key_types: ClassVar[list[str] | None] = ["str", "int", "float"]
+    _vector_indexes: dict[str, FlatVectorIndex] = PrivateAttr(default_factory=dict)
+    _field_indexes: dict[str, FieldIndex] = PrivateAttr(default_factory=dict)
+    _text_index: TextIndex = PrivateAttr(default_factory=TextIndex)
+    _text_field_names: list[str] = PrivateAttr(default_factory=list)
 
     def __init__(
         self,
@@ -58,6 +75,16 @@ class InMemoryVectorCollection(
             collection_name=collection_name,
             **kwargs,
         )
+        self._field_indexes = {
+            name: FieldIndex()
+            for name, field in self.data_model_definition.fields.items()
+            if isinstance(field, VectorStoreRecordDataField) and field.is_filterable
+        }
+        self._text_field_names = [
+            name
+            for name, field in self.data_model_definition.fields.items()
+            if not isinstance(field, VectorStoreRecordVectorField)
+        ]
 
     def _validate_data_model(self):
         """Check if the In Memory Score key is not used."""
@@ -69,6 +96,11 @@ class InMemoryVectorCollection(
     async def _inner_delete(self, keys: Sequence[TKey], **kwargs: Any) -> None:
         for key in keys:
             self.inner_storage.pop(key, None)
+        for index in self._vector_indexes.values():
+            index.delete(keys)
+        for field_index in self._field_indexes.values():
+            field_index.delete(keys)
+        self._text_index.delete(keys)
 
     @override
     async def _inner_get(self, keys: Sequence[TKey], **kwargs: Any) -> Any | OneOrMany[TModel] | None:
@@ -79,10 +111,36 @@ class InMemoryVectorCollection(
         updated_keys = []
         for record in records:
             key = record[self._key_field_name] if isinstance(record, Mapping) else getattr(record, self._key_field_name)
+            self._upsert_vectors(key, record)
+            for field_name, field_index in self._field_indexes.items():
+                field_index.upsert(key, self._get_field_value(record, field_name))
+            self._text_index.upsert(
+                key, (self._get_field_value(record, field_name) for field_name in self._text_field_names)
+            )
             self.inner_storage[key] = record
             updated_keys.append(key)
         return updated_keys
 
+    def _upsert_vectors(self, key: TKey, record: Any) -> None:
+        """Add the vectors of a record to the vector indexes."""
+        for field_name in self.data_model_definition.vector_field_names:
+            vector = self._get_field_value(record, field_name)
+            if field_name not in self._vector_indexes:
+                self._vector_indexes[field_name] = self._create_vector_index(field_name)
+            self._vector_indexes[field_name].upsert(key, vector)
+
+    def _create_vector_index(self, field_name: str) -> FlatVectorIndex:
+        field = self.data_model_definition.fields[field_name]
+        assert isinstance(field, VectorStoreRecordVectorField)  # nosec
+        settings = self.index_settings.get(field_name)
+        if field.index_kind == IndexKind.IVF_FLAT and settings is not None:
+            return IvfFlatVectorIndex(field.distance_function or DistanceFunction.COSINE_DISTANCE, **settings)
+        return FlatVectorIndex()
+
+    @staticmethod
+    def _get_field_value(record: Any, field_name: str) -> Any:
+        return record.get(field_name) if isinstance(record, Mapping) else getattr(record, field_name, None)
+
     def _deserialize_store_models_to_dicts(self, records: Sequence[Any], **kwargs: Any) -> Sequence[dict[str, Any]]:
         return records
 
@@ -96,6 +154,10 @@ class InMemoryVectorCollection(
     @override
     async def delete_collection(self, **kwargs: Any) -> None:
         self.inner_storage = {}
+        self._vector_indexes = {}
+        for field_index in self._field_indexes.values():
+            field_index.clear()
+        self._text_index.clear()
 
     @override
     async def does_collection_exist(self, **kwargs: Any) -> bool:
@@ -126,9 +188,13 @@ class InMemoryVectorCollection(
         **kwargs: Any,
     ) -> KernelSearchResults[VectorSearchResult[TModel]]:
         """Inner search method."""
+        keys = self._get_filtered_keys(options)
+        candidates = cast("set[TKey] | None", self._text_index.candidates(search_text))
+        if candidates is not None:
+            keys = candidates if keys is None else keys & candidates
         return_records: dict[TKey, float] = {}
-        for key, record in self._get_filtered_records(options).items():
-            if self._should_add_text_search(search_text, record):
+        for key, record in self.inner_storage.items():
+            if (keys is None or key in keys) and self._should_add_text_search(search_text, record):
                 return_records[key] = 1.0
         if return_records:
             return KernelSearchResults(
@@ -137,7 +203,7 @@ class InMemoryVectorCollection(
                 ),
                 total_count=len(return_records) if options and options.include_total_count else None,
             )
-        return KernelSearchResults(results=None)
+        return KernelSearchResults(results=empty_generator())
 
     async def _inner_search_vectorized(
         self,
@@ -145,38 +211,44 @@ class InMemoryVectorCollection(
         options: VectorSearchOptions,
         **kwargs: Any,
     ) -> KernelSearchResults[VectorSearchResult[TModel]]:
-        return_records: dict[TKey, float] = {}
+        return (await self._inner_search_batch(options=options, vectors=[vector], **kwargs))[0]
+
+    @override
+    async def _inner_search_batch(
+        self,
+        options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
+        **kwargs: Any,
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Search multiple vectors in one pass over the vector matrix."""
         field = options.vector_field_name or self.data_model_definition.vector_field_names[0]
         assert isinstance(self.data_model_definition.fields.get(field), VectorStoreRecordVectorField)  # nosec
         distance_metric = (
             self.data_model_definition.fields.get(field).distance_function  # type: ignore
             or DistanceFunction.COSINE_DISTANCE
         )
-        distance_func = DISTANCE_FUNCTION_MAP[distance_metric]
-
-        for key, record in self._get_filtered_records(options).items():
-            if vector and field is not None:
-                return_records[key] = self._calculate_vector_similarity(
-                    vector,
-                    record[field],
-                    distance_func,
-                    invert_score=distance_metric == DistanceFunction.COSINE_SIMILARITY,
+        index = self._vector_indexes.get(field)
+        if index is None:
+            return [KernelSearchResults(results=empty_generator()) for _ in vectors]
+        search_results: list[KernelSearchResults[VectorSearchResult[TModel]]] = []
+        for results, total_count in index.search_batch(
+            vectors, distance_metric, options.skip + options.top, keys=self._get_filtered_keys(options)
+        ):
+            # the index holds the keys of this collection
+            top_records = cast(list[tuple[TKey, float]], results)
+            if top_records:
+                search_results.append(
+                    KernelSearchResults(
+                        results=self._get_vector_search_results_from_results(
+                            self._generate_return_list(dict(top_records), options),
+                            options,  # type: ignore[arg-type]
+                        ),
+                        total_count=total_count if options.include_total_count else None,
+                    )
                 )
-        sorted_records = dict(
-            sorted(
-                return_records.items(),
-                key=lambda item: item[1],
-                reverse=DISTANCE_FUNCTION_DIRECTION_HELPER[distance_metric](1, 0),
-            )
-        )
-        if sorted_records:
-            return KernelSearchResults(
-                results=self._get_vector_search_results_from_results(
-                    self._generate_return_list(sorted_records, options), options
-                ),
-                total_count=len(return_records) if options and options.include_total_count else None,
-            )
-        return KernelSearchResults(results=empty_generator())
+            else:
+                search_results.append(KernelSearchResults(results=empty_generator()))
+        return search_results
 
     async def _generate_return_list(
         self, return_records: dict[TKey, float], options: VectorSearchOptions | None
@@ -193,48 +265,44 @@ class InMemoryVectorCollection(
                 if returned >= top:
                     break
 
+    def _get_filtered_keys(self, options: VectorSearchOptions | None) -> set[TKey] | None:
+        """Get the keys of the records matching all filter clauses, None when there is no filter.
+
+        The clauses on indexed fields are intersected first, starting with the most selective one,
+        the remaining clauses are then checked on those records only.
+        """
+        if not options or not options.filter or not options.filter.filters:
+            return None
+        indexed: list[set[TKey]] = []
+        predicates = []
+        for clause in options.filter.filters:
+            field_index = self._field_indexes.get(clause.field_name)
+            keys = field_index.lookup(clause) if field_index else None
+            if keys is None:
+                predicates.append(compile_filter(clause))
+            else:
+                indexed.append(cast(set[TKey], keys))
+        if indexed:
+            indexed.sort(key=len)
+            candidates = set(indexed[0]).intersection(*indexed[1:])
+            records: Iterable[tuple[TKey, dict]] = ((key, self.inner_storage[key]) for key in candidates)
+        else:
+            records = self.inner_storage.items()
+        return {key for key, record in records if all(predicate(record) for predicate in predicates)}
+
     def _get_filtered_records(self, options: VectorSearchOptions | None) -> dict[TKey, dict]:
-        if options and options.filter:
-            for filter in options.filter.filters:
-                return {key: record for key, record in self.inner_storage.items() if self._apply_filter(record, filter)}
-        return self.inner_storage
+        keys = self._get_filtered_keys(options)
+        if keys is None:
+            return self.inner_storage
+        return {key: record for key, record in self.inner_storage.items() if key in keys}
 
     def _should_add_text_search(self, search_text: str, record: dict) -> bool:
-        for field in self.data_model_definition.fields.values():
-            if not isinstance(field, VectorStoreRecordVectorField) and search_text in record.get(field.name, ""):
+        for field_name in self._text_field_names:
+            value = record.get(field_name)
+            if isinstance(value, str | list) and search_text in value:
                 return True
         return False
 
-    def _calculate_vector_similarity(
-        self,
-        search_vector: list[float | int],
-        record_vector: list[float | int],
-        distance_func: Callable,
-        invert_score: bool = False,
-    ) -> float:
-        calc = distance_func(record_vector, search_vector)
-        if invert_score:
-            return 1.0 - float(calc)
-        return float(calc)
-
-    @staticmethod
-    def _apply_filter(record: dict[str, Any], filter: FilterClauseBase) -> bool:
-        match filter:
-            case EqualTo():
-                value = record.get(filter.field_name)
-                if not value:
-                    return False
-                return value.lower() == filter.value.lower()
-            case AnyTagsEqualTo():
-                tag_list = record.get(filter.field_name)
-                if not tag_list:
-                    return False
-                if not isinstance(tag_list, list):
-                    tag_list = [tag_list]
-                return filter.value in tag_list
-            case _:
-                return True
-
     def _get_record_from_result(self, result: Any) -> Any:
         return result
 
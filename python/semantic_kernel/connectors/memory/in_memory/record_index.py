@@ -0,0 +1,174 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import re
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Final
+
+from semantic_kernel.data.text_search import AnyTagsEqualTo, EqualTo, FilterClauseBase
+
+TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+
+
+def _normalize(value: Any) -> Any:
+    """Strings are compared case insensitive by the EqualTo filter."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _tags(value: Any) -> list[Any]:
+    if not value:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _discard(postings: dict[Any, set[Hashable]], value: Any, key: Hashable) -> None:
+    keys = postings[value]
+    keys.discard(key)
+    if not keys:
+        del postings[value]
+
+
+def compile_filter(clause: FilterClauseBase) -> Callable[[dict[str, Any]], bool]:
+    """Compile a filter clause into a predicate on a record, the filter value is normalized once."""
+    field_name = clause.field_name
+    match clause:
+        case EqualTo():
+            target = _normalize(clause.value)
+            return lambda record: bool(value := record.get(field_name)) and _normalize(value) == target
+        case AnyTagsEqualTo():
+            target = clause.value
+            return lambda record: target in _tags(record.get(field_name))
+        case _:
+            return lambda record: True
+
+
+class FieldIndex:
+    """Secondary index on a data field, used for the EqualTo and AnyTagsEqualTo filters.
+
+    Maps the normalized value of the field and each of its tags to the keys of the records that have them,
+    values that are not hashable are not indexed and never match.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all records from the index."""
+        self._values: dict[Hashable, set[Hashable]] = {}
+        self._tags: dict[Hashable, set[Hashable]] = {}
+        self._entries: dict[Hashable, tuple[Hashable | None, list[Hashable]]] = {}
+
+    def upsert(self, key: Hashable, value: Any) -> None:
+        """Add or replace the value of the field for a key."""
+        self.delete([key])
+        equal_value = _normalize(value) if value and isinstance(value, Hashable) else None
+        tags = [tag for tag in _tags(value) if isinstance(tag, Hashable)]
+        if equal_value is not None:
+            self._values.setdefault(equal_value, set()).add(key)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        self._entries[key] = (equal_value, tags)
+
+    def delete(self, keys: Iterable[Hashable]) -> None:
+        """Remove keys from the index, unknown keys are ignored."""
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                continue
+            equal_value, tags = entry
+            if equal_value is not None:
+                _discard(self._values, equal_value, key)
+            for tag in tags:
+                _discard(self._tags, tag, key)
+
+    def lookup(self, clause: FilterClauseBase) -> set[Hashable] | None:
+        """Get the keys matching a filter clause, None when the clause can not be answered by the index."""
+        if not isinstance(clause.value, Hashable):
+            return None
+        match clause:
+            case EqualTo():
+                return self._values.get(_normalize(clause.value), set())
+            case AnyTagsEqualTo():
+                return self._tags.get(clause.value, set())
+            case _:
+                return None
+
+
+class TextIndex:
+    """Token inverted index over the text fields of the records, used to find candidates for text search.
+
+    Text search matches records where the search text is a substring of a field,
+    this index narrows the records down to those that contain all the word tokens of the search text,
+    the candidates still need to be checked against the actual fields.
+    Tokens inside the search text must match a token exactly, while the first and last token
+    may be part of a longer token, for those the vocabulary is scanned instead of the records.
+    String elements of list fields are indexed as whole values, as those match only on equality.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all records from the index."""
+        self._postings: dict[str, set[Hashable]] = {}
+        self._values: dict[str, set[Hashable]] = {}
+        self._entries: dict[Hashable, tuple[set[str], set[str]]] = {}
+
+    def upsert(self, key: Hashable, values: Iterable[Any]) -> None:
+        """Add or replace the text fields of a key."""
+        self.delete([key])
+        tokens: set[str] = set()
+        elements: set[str] = set()
+        for value in values:
+            if isinstance(value, str):
+                tokens.update(TOKEN_PATTERN.findall(value))
+            elif isinstance(value, list):
+                elements.update(element for element in value if isinstance(element, str))
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(key)
+        for element in elements:
+            self._values.setdefault(element, set()).add(key)
+        self._entries[key] = (tokens, elements)
+
+    def delete(self, keys: Iterable[Hashable]) -> None:
+        """Remove keys from the index, unknown keys are ignored."""
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                continue
+            tokens, elements = entry
+            for token in tokens:
+                _discard(self._postings, token, key)
+            for element in elements:
+                _discard(self._values, element, key)
+
+    def candidates(self, search_text: str) -> set[Hashable] | None:
+        """Get the keys of the records that might contain the search text.
+
+        Returns None when the search text has no word tokens, then all records are candidates.
+        """
+        matches = list(TOKEN_PATTERN.finditer(search_text))
+        if not matches:
+            return None
+        candidates: set[Hashable] | None = None
+        for match in matches:
+            token = match.group()
+            open_start = match.start() == 0
+            open_end = match.end() == len(search_text)
+            if not open_start and not open_end:
+                keys = self._postings.get(token, set())
+            else:
+                keys = set()
+                for indexed, indexed_keys in self._postings.items():
+                    if (
+                        (open_start and open_end and token in indexed)
+                        or (open_start and not open_end and indexed.endswith(token))
+                        or (open_end and not open_start and indexed.startswith(token))
+                    ):
+                        keys.update(indexed_keys)
+            candidates = set(keys) if candidates is None else candidates & keys
+            if not candidates:
+                break
+        assert candidates is not None  # nosec
+        return candidates | self._values.get(search_text, set())
@@ -0,0 +1,541 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any, Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from semantic_kernel.data.const import DISTANCE_FUNCTION_DIRECTION_HELPER, DistanceFunction
+
+# Number of rows that are scored at once for the distance functions that need a
+# (rows x dimensions) intermediate, this keeps the peak memory bounded for large collections.
+SCORING_BLOCK_SIZE: Final[int] = 4096
+INITIAL_CAPACITY: Final[int] = 64
+
+
+def _cosine_distance(matrix: NDArray, norms: NDArray, query: NDArray) -> NDArray:
+    # mirrors scipy.spatial.distance.cosine, including the clipping to [0, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distances = 1.0 - (matrix @ query) / np.sqrt(norms * np.dot(query, query))
+    return np.clip(distances, 0.0, 2.0)
+
+
+def _cosine_similarity(matrix: NDArray, norms: NDArray, query: NDArray) -> NDArray:
+    return 1.0 - _cosine_distance(matrix, norms, query)
+
+
+def _dot_product(matrix: NDArray, norms: NDArray, query: NDArray) -> NDArray:
+    return matrix @ query
+
+
+def _blockwise(func: Callable[[NDArray], NDArray]) -> Callable[[NDArray, NDArray, NDArray], NDArray]:
+    """Apply a function to the difference between the rows of the matrix and the query, in blocks of rows."""
+
+    def _score(matrix: NDArray, norms: NDArray, query: NDArray) -> NDArray:
+        scores = np.empty(matrix.shape[0], dtype=np.float64)
+        for start in range(0, matrix.shape[0], SCORING_BLOCK_SIZE):
+            block = matrix[start : start + SCORING_BLOCK_SIZE]
+            scores[start : start + block.shape[0]] = func(block - query)
+        return scores
+
+    return _score
+
+
+BATCH_DISTANCE_FUNCTION_MAP: Final[dict[DistanceFunction, Callable[[NDArray, NDArray, NDArray], NDArray]]] = {
+    DistanceFunction.COSINE_DISTANCE: _cosine_distance,
+    DistanceFunction.COSINE_SIMILARITY: _cosine_similarity,
+    DistanceFunction.DOT_PROD: _dot_product,
+    DistanceFunction.EUCLIDEAN_DISTANCE: _blockwise(lambda diff: np.sqrt(np.einsum("ij,ij->i", diff, diff))),
+    DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE: _blockwise(lambda diff: np.einsum("ij,ij->i", diff, diff)),
+    DistanceFunction.MANHATTAN: _blockwise(lambda diff: np.abs(diff).sum(axis=1)),
+    DistanceFunction.HAMMING: _blockwise(lambda diff: (diff != 0).mean(axis=1)),
+}
+
+
+def score_queries(matrix: NDArray, norms: NDArray, queries: NDArray, distance_function: DistanceFunction) -> NDArray:
+    """Score the rows of the matrix for multiple queries at once, returns a (queries x rows) array.
+
+    The dot product based distance functions are computed with a single matrix multiplication,
+    the others are scored per query.
+    """
+    if distance_function in (
+        DistanceFunction.COSINE_DISTANCE,
+        DistanceFunction.COSINE_SIMILARITY,
+        DistanceFunction.DOT_PROD,
+    ):
+        products = queries @ matrix.T
+        if distance_function == DistanceFunction.DOT_PROD:
+            return products
+        query_norms = np.einsum("ij,ij->i", queries, queries)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = np.clip(1.0 - products / np.sqrt(norms[np.newaxis, :] * query_norms[:, np.newaxis]), 0.0, 2.0)
+        return 1.0 - distances if distance_function == DistanceFunction.COSINE_SIMILARITY else distances
+    function = BATCH_DISTANCE_FUNCTION_MAP[distance_function]
+    return np.stack([function(matrix, norms, query) for query in queries]) if queries.shape[0] else np.empty((0, 0))
+
+
+def select_top(scores: NDArray, count: int, distance_function: DistanceFunction) -> NDArray:
+    """Select the positions of the best scores, in ranked order.
+
+    Uses argpartition to avoid sorting the full score array, ties are resolved by position,
+    so the order is the same as a stable sort over all scores. Undefined (NaN) scores are selected last.
+
+    Args:
+        scores: The scores to select from.
+        count: The number of positions to return.
+        distance_function: The distance function used to create the scores, determines the direction.
+
+    Returns:
+        The positions of the selected scores, best first.
+    """
+    if count <= 0 or scores.shape[0] == 0:
+        return np.empty(0, dtype=np.intp)
+    ranking = -scores if DISTANCE_FUNCTION_DIRECTION_HELPER[distance_function](1, 0) else scores
+    # undefined scores, such as the cosine of a zero vector, are ranked last like in rank
+    ranking = np.nan_to_num(ranking, nan=np.inf)
+    if count < ranking.shape[0]:
+        threshold = ranking[np.argpartition(ranking, count - 1)[:count]].max()
+        # keep every tie of the threshold so that the stable sort decides between them
+        candidates = np.flatnonzero(ranking <= threshold)
+    else:
+        candidates = np.arange(ranking.shape[0])
+    return candidates[np.argsort(ranking[candidates], kind="stable")][:count]
+
+
+def rank(matrix: NDArray, norms: NDArray, query: NDArray, distance_function: DistanceFunction) -> NDArray:
+    """Score the rows of the matrix so that lower is always better, undefined scores are ranked last."""
+    scores = BATCH_DISTANCE_FUNCTION_MAP[distance_function](matrix, norms, query)
+    if DISTANCE_FUNCTION_DIRECTION_HELPER[distance_function](1, 0):
+        scores = -scores
+    return np.nan_to_num(scores, nan=np.inf)
+
+
+class FlatVectorIndex:
+    """Exact vector index, keeps the vectors of a single field in a contiguous matrix.
+
+    Rows are kept in insertion order of the keys, updates of existing keys overwrite their row,
+    deletes leave a tombstone that is compacted away once they make up a share of the rows.
+    This keeps the order of the rows identical to the order of the records in the collection,
+    so that ties are ranked the same as when scoring each record separately.
+    """
+
+    compaction_ratio: float = 0.5
+
+    def __init__(self) -> None:
+        """Create an empty index, the dimensions are set by the first vector that is added."""
+        self.clear()
+
+    def __len__(self) -> int:
+        """The number of vectors in the index."""
+        return len(self._key_to_row)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if the index contains a vector for the key."""
+        return key in self._key_to_row
+
+    @property
+    def dimensions(self) -> int | None:
+        """The dimensions of the vectors in the index, None when nothing has been added yet."""
+        return self._vectors.shape[1] if self._vectors.shape[1] else None
+
+    def clear(self) -> None:
+        """Remove all vectors from the index."""
+        self._vectors: NDArray = np.empty((0, 0), dtype=np.float64)
+        self._norms: NDArray = np.empty(0, dtype=np.float64)
+        self._live: NDArray = np.empty(0, dtype=bool)
+        self._keys: list[Hashable | None] = []
+        self._key_to_row: dict[Hashable, int] = {}
+        self._deleted = 0
+
+    def upsert(self, key: Hashable, vector: Any) -> None:
+        """Add or replace the vector for a key, a vector of None removes the key."""
+        if vector is None:
+            self.delete([key])
+            return
+        array = self._validate(key, vector)
+        row = self._key_to_row.get(key)
+        if row is None:
+            row = self._append(key)
+        self._store(row, array)
+
+    def delete(self, keys: Iterable[Hashable]) -> None:
+        """Remove the vectors for the keys, unknown keys are ignored."""
+        for key in keys:
+            row = self._key_to_row.pop(key, None)
+            if row is None:
+                continue
+            self._keys[row] = None
+            self._live[row] = False
+            self._deleted += 1
+        if self._deleted and self._deleted >= self.compaction_ratio * len(self._keys):
+            self._compact()
+
+    def search(
+        self,
+        vector: Sequence[float | int],
+        distance_function: DistanceFunction,
+        count: int,
+        keys: Iterable[Hashable] | None = None,
+    ) -> tuple[list[tuple[Hashable, float]], int]:
+        """Score all vectors, or only those of the given keys, and return the best ones.
+
+        Args:
+            vector: The query vector.
+            distance_function: The distance function to score with.
+            count: The number of results to return.
+            keys: Restrict the search to these keys, keys that are not in the index are skipped.
+
+        Returns:
+            The list of (key, score) tuples, best first, and the number of vectors that were scored.
+        """
+        return self._exact_search(self._query(vector), distance_function, count, self._rows(keys))
+
+    def search_batch(
+        self,
+        vectors: Sequence[Sequence[float | int]],
+        distance_function: DistanceFunction,
+        count: int,
+        keys: Iterable[Hashable] | None = None,
+    ) -> list[tuple[list[tuple[Hashable, float]], int]]:
+        """Search with multiple query vectors at once, see search for the arguments.
+
+        Returns:
+            The results of search for each of the vectors, in the same order.
+        """
+        queries = np.stack([self._query(vector) for vector in vectors]) if vectors else np.empty((0, 0))
+        rows = self._rows(keys)
+        if rows is None:
+            matrix, norms = self._vectors[: len(self._keys)], self._norms[: len(self._keys)]
+        else:
+            matrix, norms = self._vectors[rows], self._norms[rows]
+        if matrix.shape[0] == 0:
+            return [([], 0) for _ in vectors]
+        all_scores = score_queries(matrix, norms, queries, distance_function)
+        results = []
+        for scores in all_scores:
+            selected = select_top(scores, count, distance_function)
+            positions = selected if rows is None else rows[selected]
+            results.append((
+                [(self._keys[pos], float(scores[sel])) for pos, sel in zip(positions, selected)],
+                matrix.shape[0],
+            ))
+        return results
+
+    def _exact_search(
+        self, query: NDArray, distance_function: DistanceFunction, count: int, rows: NDArray | None
+    ) -> tuple[list[tuple[Hashable, float]], int]:
+        if rows is None:
+            matrix, norms = self._vectors[: len(self._keys)], self._norms[: len(self._keys)]
+        else:
+            matrix, norms = self._vectors[rows], self._norms[rows]
+        if matrix.shape[0] == 0:
+            return [], 0
+        scores = BATCH_DISTANCE_FUNCTION_MAP[distance_function](matrix, norms, query)
+        selected = select_top(scores, count, distance_function)
+        positions = selected if rows is None else rows[selected]
+        return [(self._keys[pos], float(scores[sel])) for pos, sel in zip(positions, selected)], matrix.shape[0]
+
+    def _query(self, vector: Sequence[float | int]) -> NDArray:
+        query = np.asarray(vector, dtype=np.float64).ravel()
+        if self.dimensions is not None and query.shape[0] != self.dimensions:
+            raise ValueError(f"Query vector has {query.shape[0]} dimensions, expected {self.dimensions}.")
+        return query
+
+    def _rows(self, keys: Iterable[Hashable] | None) -> NDArray | None:
+        """Get the rows to score in row order, None means all rows."""
+        if keys is None:
+            if not self._deleted:
+                return None
+            return np.flatnonzero(self._live[: len(self._keys)])
+        rows = np.fromiter(
+            (row for key in keys if (row := self._key_to_row.get(key)) is not None),
+            dtype=np.intp,
+        )
+        rows.sort()
+        return rows
+
+    def _validate(self, key: Hashable, vector: Any) -> NDArray:
+        array = np.asarray(vector, dtype=np.float64).ravel()
+        if self.dimensions is None:
+            self._vectors = np.empty((INITIAL_CAPACITY, array.shape[0]), dtype=np.float64)
+            self._norms = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+            self._live = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        elif array.shape[0] != self.dimensions:
+            raise ValueError(f"Vector for key '{key}' has {array.shape[0]} dimensions, expected {self.dimensions}.")
+        return array
+
+    def _append(self, key: Hashable) -> int:
+        row = len(self._keys)
+        if row == self._vectors.shape[0]:
+            self._grow()
+        self._keys.append(key)
+        self._key_to_row[key] = row
+        self._live[row] = True
+        return row
+
+    def _store(self, row: int, array: NDArray) -> None:
+        self._vectors[row] = array
+        self._norms[row] = np.dot(array, array)
+
+    def _grow(self) -> None:
+        capacity = self._vectors.shape[0] * 2
+        vectors = np.empty((capacity, self._vectors.shape[1]), dtype=np.float64)
+        vectors[: self._vectors.shape[0]] = self._vectors
+        norms = np.empty(capacity, dtype=np.float64)
+        norms[: self._norms.shape[0]] = self._norms
+        live = np.zeros(capacity, dtype=bool)
+        live[: self._live.shape[0]] = self._live
+        self._vectors, self._norms, self._live = vectors, norms, live
+
+    def _compact(self) -> None:
+        used = len(self._keys)
+        rows = np.flatnonzero(self._live[:used])
+        count = rows.shape[0]
+        self._vectors[:count] = self._vectors[rows]
+        self._norms[:count] = self._norms[rows]
+        self._live[:count] = True
+        self._live[count:used] = False
+        self._keys = [self._keys[row] for row in rows]
+        self._key_to_row = {key: row for row, key in enumerate(self._keys)}  # type: ignore[misc]
+        self._deleted = 0
+
+
+class ApproximateVectorIndex(FlatVectorIndex):
+    """Base class for the approximate nearest neighbor indexes.
+
+    The vectors are stored in the same matrix as the flat index, the approximate structure is
+    built on top of it with the distance function of the field.
+    Updates of existing keys are treated as a delete followed by an insert,
+    deleted vectors are tombstoned and the structure is marked stale once the tombstones
+    make up the compaction ratio of the rows, it is then rebuilt by the next search.
+
+    Searches fall back to the exact search when the index is not usable,
+    when a different distance function is requested than the one the index was built with,
+    or when a filter leaves only a small share of the records.
+    """
+
+    def __init__(
+        self,
+        distance_function: DistanceFunction,
+        compaction_ratio: float = 0.25,
+        exact_search_ratio: float = 0.1,
+    ) -> None:
+        """Create an approximate index.
+
+        Args:
+            distance_function: The distance function used to build the index.
+            compaction_ratio: The share of deleted rows that triggers a rebuild.
+            exact_search_ratio: When a filter leaves less than this share of the records,
+                those are scored exactly instead.
+        """
+        self.distance_function = distance_function
+        self.compaction_ratio = compaction_ratio
+        self.exact_search_ratio = exact_search_ratio
+        super().__init__()
+
+    def clear(self) -> None:
+        """Remove all vectors from the index."""
+        super().clear()
+        self._stale = False
+
+    def upsert(self, key: Hashable, vector: Any) -> None:
+        """Add or replace the vector for a key, a vector of None removes the key."""
+        if vector is None:
+            self.delete([key])
+            return
+        array = self._validate(key, vector)
+        if key in self._key_to_row:
+            self.delete([key])
+        row = self._append(key)
+        self._store(row, array)
+        if not self._stale:
+            self._add(row)
+
+    def search(
+        self,
+        vector: Sequence[float | int],
+        distance_function: DistanceFunction,
+        count: int,
+        keys: Iterable[Hashable] | None = None,
+    ) -> tuple[list[tuple[Hashable, float]], int]:
+        """Search the index, see FlatVectorIndex.search for the arguments."""
+        query = self._query(vector)
+        rows = None if keys is None else self._rows(keys)
+        total = len(self) if rows is None else rows.shape[0]
+        # the exact search skips the deleted rows also without a filter
+        exact_rows = self._rows(None) if rows is None else rows
+        if (
+            distance_function != self.distance_function
+            or (rows is not None and rows.shape[0] < self.exact_search_ratio * len(self))
+            or not self._ready()
+        ):
+            return self._exact_search(query, distance_function, count, exact_rows)
+        allowed = None if rows is None else np.zeros(len(self._keys), dtype=bool)
+        if allowed is not None:
+            allowed[rows] = True
+        results = self._approximate_search(query, count, allowed)
+        if len(results) < min(count, total):
+            # the approximate structure did not find enough matches for this filter
+            return self._exact_search(query, distance_function, count, exact_rows)
+        sign = -1.0 if DISTANCE_FUNCTION_DIRECTION_HELPER[distance_function](1, 0) else 1.0
+        return [(self._keys[row], sign * distance) for distance, row in results], total
+
+    def search_batch(
+        self,
+        vectors: Sequence[Sequence[float | int]],
+        distance_function: DistanceFunction,
+        count: int,
+        keys: Iterable[Hashable] | None = None,
+    ) -> list[tuple[list[tuple[Hashable, float]], int]]:
+        """Search with multiple query vectors, the approximate structure is searched per vector."""
+        if distance_function != self.distance_function or not self._ready():
+            return super().search_batch(vectors, distance_function, count, keys)
+        keys = None if keys is None else list(keys)
+        return [self.search(vector, distance_function, count, keys) for vector in vectors]
+
+    def _compact(self) -> None:
+        super()._compact()
+        # the rows moved, the structure is rebuilt by the next search instead of in the delete
+        self._stale = True
+
+    def _ready(self) -> bool:
+        """Whether the approximate structure can be searched, rebuilds a stale structure first."""
+        if self._stale:
+            self._stale = False
+            self._rebuild()
+        return self._trained()
+
+    def _trained(self) -> bool:
+        """Whether the approximate structure has been built."""
+        return True
+
+    def _rank_rows(self, query: NDArray, rows: Sequence[int] | NDArray) -> NDArray:
+        rows = np.asarray(rows, dtype=np.intp)
+        return rank(self._vectors[rows], self._norms[rows], query, self.distance_function)
+
+    def _add(self, row: int) -> None:
+        """Add a stored row to the approximate structure."""
+        raise NotImplementedError
+
+    def _rebuild(self) -> None:
+        """Rebuild the approximate structure from the live rows."""
+        raise NotImplementedError
+
+    def _approximate_search(self, query: NDArray, count: int, allowed: NDArray | None) -> list[tuple[float, int]]:
+        """Get up to count (ranking, row) tuples of live and allowed rows, best first."""
+        raise NotImplementedError
+
+
+class IvfFlatVectorIndex(ApproximateVectorIndex):
+    """Inverted file index with flat (uncompressed) lists.
+
+    The vectors are clustered around nlist centroids with k-means, searches only score
+    the vectors in the nprobe clusters closest to the query.
+    Until enough vectors are added to train the centroids, searches are exact.
+    """
+
+    def __init__(
+        self,
+        distance_function: DistanceFunction,
+        nlist: int = 100,
+        nprobe: int = 8,
+        training_size: int | None = None,
+        max_iterations: int = 10,
+        seed: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create a IVF Flat index.
+
+        Args:
+            distance_function: The distance function used to cluster the vectors.
+            nlist: The number of clusters.
+            nprobe: The number of clusters to search, higher improves recall at the cost of latency.
+            training_size: The number of vectors after which the centroids are trained, and the number
+                of vectors they are trained on, defaults to 39 times nlist.
+            max_iterations: The maximum number of k-means iterations.
+            seed: Seed for the centroid initialization.
+            kwargs: Passed on to ApproximateVectorIndex.
+        """
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.training_size = training_size or nlist * 39
+        self.max_iterations = max_iterations
+        self._generator = np.random.default_rng(seed)
+        super().__init__(distance_function, **kwargs)
+
+    def clear(self) -> None:
+        """Remove all vectors from the index."""
+        super().clear()
+        self._centroids: NDArray | None = None
+        self._centroid_norms: NDArray = np.empty(0, dtype=np.float64)
+        # the cluster of each row, -1 for rows that are not assigned
+        self._assignments: NDArray = np.empty(0, dtype=np.intp)
+
+    def _trained(self) -> bool:
+        return self._centroids is not None
+
+    def _add(self, row: int) -> None:
+        if self._centroids is not None:
+            if row >= self._assignments.shape[0]:
+                assignments = np.full(self._vectors.shape[0], -1, dtype=np.intp)
+                assignments[: self._assignments.shape[0]] = self._assignments
+                self._assignments = assignments
+            ranking = rank(self._centroids, self._centroid_norms, self._vectors[row], self.distance_function)
+            self._assignments[row] = int(ranking.argmin())
+        elif len(self) >= self.training_size:
+            # the centroids are trained by the next search
+            self._stale = True
+
+    def _rebuild(self) -> None:
+        self._centroids = None
+        self._assignments = np.full(self._vectors.shape[0], -1, dtype=np.intp)
+        rows = np.flatnonzero(self._live[: len(self._keys)])
+        if rows.shape[0] < max(self.training_size, self.nlist):
+            return
+        # the centroids are trained on a sample of training_size rows, all rows are assigned afterwards
+        sample = self._generator.choice(rows, min(rows.shape[0], self.training_size), replace=False)
+        centroids = self._vectors[sample[: self.nlist]].copy()
+        for _ in range(self.max_iterations):
+            assignments = self._assign(sample, centroids)
+            counts = np.bincount(assignments, minlength=self.nlist)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, self._vectors[sample])
+            updated = centroids.copy()
+            non_empty = counts > 0
+            updated[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+            converged = np.allclose(updated, centroids)
+            centroids = updated
+            if converged:
+                break
+        self._centroids = centroids
+        self._centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+        self._assignments[rows] = self._assign(rows, centroids)
+
+    def _assign(self, rows: NDArray, centroids: NDArray) -> NDArray:
+        """Get the closest centroid for each of the rows, in blocks of rows to bound the memory."""
+        norms = np.einsum("ij,ij->i", centroids, centroids)
+        assignments = np.empty(rows.shape[0], dtype=np.intp)
+        for start in range(0, rows.shape[0], SCORING_BLOCK_SIZE):
+            block = rows[start : start + SCORING_BLOCK_SIZE]
+            # rank the centroids against the rows, the distance functions are symmetric
+            ranking = score_queries(centroids, norms, self._vectors[block], self.distance_function)
+            if DISTANCE_FUNCTION_DIRECTION_HELPER[self.distance_function](1, 0):
+                ranking = -ranking
+            assignments[start : start + block.shape[0]] = np.nan_to_num(ranking, nan=np.inf).argmin(axis=1)
+        return assignments
+
+    def _approximate_search(self, query: NDArray, count: int, allowed: NDArray | None) -> list[tuple[float, int]]:
+        assert self._centroids is not None  # nosec
+        used = len(self._keys)
+        centroid_ranking = rank(self._centroids, self._centroid_norms, query, self.distance_function)
+        probes = np.argsort(centroid_ranking, kind="stable")[: self.nprobe]
+        mask = np.isin(self._assignments[:used], probes) & self._live[:used]
+        if allowed is not None:
+            mask &= allowed
+        rows = np.flatnonzero(mask)
+        if rows.shape[0] == 0:
+            return []
+        ranking = self._rank_rows(query, rows)
+        selected = select_top(ranking, count, DistanceFunction.EUCLIDEAN_DISTANCE)
+        return list(zip(ranking[selected].tolist(), rows[selected].tolist()))
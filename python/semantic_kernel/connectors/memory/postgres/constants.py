@@ -9,6 +9,9 @@ MAX_DIMENSIONALITY = 2000
 # It is used in the similarity search query. Must not conflict with model property.
 DISTANCE_COLUMN_NAME = "sk_pg_distance"
 
+# The name of the temporary table that is used to stage the records of a bulk upsert.
+STAGING_TABLE_NAME = "sk_pg_staging"
+
 # Environment Variables
 PGHOST_ENV_VAR = "PGHOST"
 PGPORT_ENV_VAR = "PGPORT"
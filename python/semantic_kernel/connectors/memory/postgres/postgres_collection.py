@@ -1,13 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
+import math
 import random
 import string
 import sys
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from typing import Any, ClassVar, Generic
 
-from psycopg import sql
+from psycopg import AsyncCursor, sql
 from psycopg_pool import AsyncConnectionPool
 from pydantic import PrivateAttr
 
@@ -15,11 +16,14 @@ from semantic_kernel.connectors.memory.postgres.constants import (
     DEFAULT_SCHEMA,
     DISTANCE_COLUMN_NAME,
     MAX_DIMENSIONALITY,
+    STAGING_TABLE_NAME,
 )
 from semantic_kernel.connectors.memory.postgres.postgres_settings import PostgresSettings
 from semantic_kernel.connectors.memory.postgres.utils import (
+    convert_dict_to_copy_row,
     convert_dict_to_row,
     convert_row_to_dict,
+    create_vector_binary_dumper,
     get_vector_distance_ops_str,
     get_vector_index_ops_str,
     python_type_to_postgres,
@@ -52,6 +56,9 @@ else:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The pgvector index methods of the index kinds that can be created through the vector store.
+INDEX_METHODS: dict[IndexKind, str] = {IndexKind.HNSW: "hnsw", IndexKind.IVF_FLAT: "ivfflat"}
+
 
 @experimental
 class PostgresCollection(
@@ -69,6 +76,10 @@ class PostgresCollection(
 
     _settings: PostgresSettings = PrivateAttr()
     """Postgres settings"""
+    _deferred_index_fields: list[VectorStoreRecordVectorField] = PrivateAttr(default_factory=list)
+    """Vector fields whose index was deferred by `create_collection`"""
+    _column_types: list[tuple[int, str]] | None = PrivateAttr(None)
+    """The oid and type name of the columns of the fields, used by a binary COPY"""
 
     def __init__(
         self,
@@ -182,6 +193,17 @@ class PostgresCollection(
             )
 
         keys = []
+        fields = list(self.data_model_definition.fields.items())
+        # The statement is the same for all batches, so it is composed once
+        insert_query = sql.SQL(
+            "INSERT INTO {schema}.{table} ({col_names}) VALUES ({placeholders}) {on_conflict}"
+        ).format(
+            schema=sql.Identifier(self.db_schema),
+            table=sql.Identifier(self.collection_name),
+            col_names=self._get_column_names(),
+            placeholders=sql.SQL(", ").join(sql.Placeholder() * len(fields)),
+            on_conflict=self._get_on_conflict_clause(),
+        )
         async with (
             self.connection_pool.connection() as conn,
             conn.transaction(),
@@ -192,32 +214,194 @@ class PostgresCollection(
             for i in range(0, len(records), max_rows_per_transaction):
                 record_batch = records[i : i + max_rows_per_transaction]
 
-                fields = list(self.data_model_definition.fields.items())
-
                 row_values = [convert_dict_to_row(record, fields) for record in record_batch]
 
                 # Execute the INSERT statement for each batch
-                await cur.executemany(
+                await cur.executemany(insert_query, row_values)
+                keys.extend(record.get(self.data_model_definition.key_field.name) for record in record_batch)
+        return keys
+
+    async def upsert_bulk(
+        self,
+        records: Iterable[TModel] | AsyncIterable[TModel],
+        create_deferred_indexes: bool = True,
+        embedding_generation_function: Callable[
+            [Sequence[TModel], type[TModel] | None, VectorStoreRecordDefinition | None], Awaitable[Sequence[TModel]]
+        ]
+        | None = None,
+    ) -> Sequence[TKey]:
+        """Upsert a large number of records with a binary COPY.
+
+        The records are streamed with `COPY ... FROM STDIN (FORMAT BINARY)` into a temporary staging table,
+        and then merged into the table with a single `INSERT ... ON CONFLICT DO UPDATE`, in one transaction.
+        Vectors are sent in the binary format of pgvector, instead of being formatted as text,
+        numpy arrays are encoded without converting them to lists.
+        The records are read and serialized in batches of `max_rows_per_transaction` records,
+        so the records of a (async) generator do not all have to be in memory at the same time.
+
+        When the collection was created with `defer_index_creation=True`, the vector indexes are
+        created after the records are loaded, which is much faster than updating them for every row.
+
+        Args:
+            records: The records to upsert.
+            create_deferred_indexes: Whether to create the deferred vector indexes after the records are loaded,
+                set this to False when more bulk upserts follow.
+            embedding_generation_function: Supply this function to generate embeddings,
+                it is called for every batch of records, like in `upsert`.
+
+        Returns:
+            The keys of the upserted records, in the order of the records.
+
+        Raises:
+            VectorStoreOperationException: If an error occurs during upserting.
+        """
+        if self.connection_pool is None:
+            raise VectorStoreOperationException(
+                "Connection pool is not available, use the collection as a context manager."
+            )
+
+        fields = list(self.data_model_definition.fields.items())
+        key_name = self.data_model_definition.key_field.name
+        keys: list[Any] = []
+        try:
+            async with (
+                self.connection_pool.connection() as conn,
+                conn.transaction(),
+                conn.cursor() as cur,
+            ):
+                column_types = await self._get_column_types(cur)
+                json_columns = {
+                    field.name
+                    for (_, field), (_, type_name) in zip(fields, column_types)
+                    if type_name in ("json", "jsonb")
+                }
+                for oid, type_name in column_types:
+                    if type_name == "vector":
+                        # only the dumpers of this cursor are changed, the connection is shared through the pool
+                        cur.adapters.register_dumper(None, create_vector_binary_dumper(oid))
+
+                await cur.execute(
                     sql.SQL(
-                        "INSERT INTO {schema}.{table} ({col_names}) VALUES ({placeholders}) "
-                        "ON CONFLICT ({key_name}) DO UPDATE SET {update_columns}"
+                        "CREATE TEMP TABLE {staging} (LIKE {schema}.{table} INCLUDING DEFAULTS) ON COMMIT DROP"
                     ).format(
+                        staging=sql.Identifier(STAGING_TABLE_NAME),
                         schema=sql.Identifier(self.db_schema),
                         table=sql.Identifier(self.collection_name),
-                        col_names=sql.SQL(", ").join(sql.Identifier(field.name) for _, field in fields),
-                        placeholders=sql.SQL(", ").join(sql.Placeholder() * len(fields)),
-                        key_name=sql.Identifier(self.data_model_definition.key_field.name),
-                        update_columns=sql.SQL(", ").join(
-                            sql.SQL("{field} = EXCLUDED.{field}").format(field=sql.Identifier(field.name))
-                            for _, field in fields
-                            if field.name != self.data_model_definition.key_field.name
-                        ),
-                    ),
-                    row_values,
+                    )
                 )
-                keys.extend(record.get(self.data_model_definition.key_field.name) for record in record_batch)
+                async with cur.copy(
+                    sql.SQL("COPY {staging} ({col_names}) FROM STDIN (FORMAT BINARY)").format(
+                        staging=sql.Identifier(STAGING_TABLE_NAME), col_names=self._get_column_names()
+                    )
+                ) as copy:
+                    copy.set_types([oid for oid, _ in column_types])
+                    async for batch in self._read_batches(records):
+                        if embedding_generation_function:
+                            batch = await embedding_generation_function(  # type: ignore[assignment]
+                                batch, self.data_model_type, self.data_model_definition
+                            )
+                        for record in self.serialize(batch):
+                            keys.append(record.get(key_name))
+                            await copy.write_row(convert_dict_to_copy_row(record, fields, json_columns))
+
+                # A key can only be updated once by an INSERT, so when a key was loaded more than once,
+                # only the last row of the key is merged, the rows of the staging table are in the order of the COPY.
+                select_query = sql.SQL("SELECT {col_names} FROM {staging}").format(
+                    col_names=self._get_column_names(), staging=sql.Identifier(STAGING_TABLE_NAME)
+                )
+                if len(set(keys)) != len(keys):
+                    select_query = sql.SQL(
+                        "SELECT DISTINCT ON ({key_name}) {col_names} FROM {staging} ORDER BY {key_name}, ctid DESC"
+                    ).format(
+                        key_name=sql.Identifier(key_name),
+                        col_names=self._get_column_names(),
+                        staging=sql.Identifier(STAGING_TABLE_NAME),
+                    )
+                await cur.execute(
+                    sql.SQL("INSERT INTO {schema}.{table} ({col_names}) {select} {on_conflict}").format(
+                        schema=sql.Identifier(self.db_schema),
+                        table=sql.Identifier(self.collection_name),
+                        col_names=self._get_column_names(),
+                        select=select_query,
+                        on_conflict=self._get_on_conflict_clause(),
+                    )
+                )
+        except VectorStoreOperationException:
+            raise
+        except Exception as exc:
+            raise VectorStoreOperationException(f"Error bulk upserting records: {exc}") from exc
+
+        logger.info(f"Bulk upserted {len(keys)} records into Postgres table '{self.collection_name}'.")
+        if create_deferred_indexes:
+            await self.create_deferred_indexes()
         return keys
 
+    async def _read_batches(self, records: Iterable[TModel] | AsyncIterable[TModel]) -> AsyncIterator[list[TModel]]:
+        """Read the records in batches of `max_rows_per_transaction` records."""
+        max_rows_per_transaction = self._settings.max_rows_per_transaction
+        batch: list[TModel] = []
+        if isinstance(records, AsyncIterable):
+            async for record in records:
+                batch.append(record)
+                if len(batch) >= max_rows_per_transaction:
+                    yield batch
+                    batch = []
+        else:
+            for record in records:
+                batch.append(record)
+                if len(batch) >= max_rows_per_transaction:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    async def _get_column_types(self, cur: AsyncCursor) -> list[tuple[int, str]]:
+        """Get the oid and type name of the columns of the fields, in the order of the fields."""
+        if self._column_types is not None:
+            return self._column_types
+        await cur.execute(
+            """
+            SELECT a.attname, a.atttypid, t.typname
+            FROM pg_attribute a
+            JOIN pg_type t ON t.oid = a.atttypid
+            JOIN pg_class c ON c.oid = a.attrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s AND a.attnum > 0 AND NOT a.attisdropped
+            """,
+            (self.db_schema, self.collection_name),
+        )
+        types = {name: (oid, type_name) for name, oid, type_name in await cur.fetchall()}
+        column_types = []
+        for field in self.data_model_definition.fields.values():
+            if field.name not in types:
+                raise VectorStoreOperationException(
+                    f"Column '{field.name}' not found in Postgres table '{self.db_schema}.{self.collection_name}'."
+                )
+            oid, type_name = types[field.name]
+            if isinstance(field, VectorStoreRecordVectorField) and type_name != "vector":
+                raise VectorStoreOperationException(
+                    f"Column '{field.name}' has type '{type_name}', only 'vector' columns can be bulk upserted."
+                )
+            column_types.append((oid, type_name))
+        self._column_types = column_types
+        return column_types
+
+    def _get_column_names(self) -> sql.Composed:
+        """Get the column names of the fields, for the INSERT and COPY statements."""
+        return sql.SQL(", ").join(sql.Identifier(field.name) for field in self.data_model_definition.fields.values())
+
+    def _get_on_conflict_clause(self) -> sql.Composed:
+        """Get the clause that updates the existing records with the same key."""
+        key_name = self.data_model_definition.key_field.name
+        return sql.SQL("ON CONFLICT ({key_name}) DO UPDATE SET {update_columns}").format(
+            key_name=sql.Identifier(key_name),
+            update_columns=sql.SQL(", ").join(
+                sql.SQL("{field} = EXCLUDED.{field}").format(field=sql.Identifier(field.name))
+                for field in self.data_model_definition.fields.values()
+                if field.name != key_name
+            ),
+        )
+
     @override
     async def _inner_get(self, keys: Sequence[TKey], **kwargs: Any) -> OneOrMany[dict[str, Any]] | None:
         """Get records from the database.
@@ -306,7 +490,8 @@ class PostgresCollection(
         Args:
             table_name: Name of the table to be created
             fields: A dictionary where keys are column names and values are VectorStoreRecordField instances
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments, set `defer_index_creation=True` to create the vector indexes
+                after the records are loaded with `upsert_bulk`, or with `create_deferred_indexes`.
         """
         if self.connection_pool is None:
             raise VectorStoreOperationException(
@@ -358,11 +543,28 @@ class PostgresCollection(
             await conn.commit()
 
         logger.info(f"Postgres table '{table_name}' created successfully.")
+        self._column_types = None
 
         # If the vector field defines an index, apply it
+        defer_index_creation = kwargs.get("defer_index_creation", False)
         for vector_field in self.data_model_definition.vector_fields:
             if vector_field.index_kind:
-                await self._create_index(table_name, vector_field)
+                if defer_index_creation:
+                    # Check the index kind now, instead of after the records are loaded
+                    self._get_index_method(vector_field)
+                    self._deferred_index_fields.append(vector_field)
+                else:
+                    await self._create_index(table_name, vector_field)
+
+    async def create_deferred_indexes(self) -> None:
+        """Create the vector indexes that were deferred with `create_collection(defer_index_creation=True)`.
+
+        Building an index once after a bulk load is much faster than updating it for every inserted row,
+        and an IVFFlat index is created with a number of lists that fits the number of rows.
+        """
+        while self._deferred_index_fields:
+            await self._create_index(self.collection_name, self._deferred_index_fields[0])
+            self._deferred_index_fields.pop(0)
 
     @override
     async def does_collection_exist(self, **kwargs: Any) -> bool:
@@ -399,6 +601,8 @@ class PostgresCollection(
                 ),
             )
             await conn.commit()
+        self._deferred_index_fields.clear()
+        self._column_types = None
 
     async def _create_index(self, table_name: str, vector_field: VectorStoreRecordVectorField) -> None:
         """Create an index on a column in the table.
@@ -414,38 +618,54 @@ class PostgresCollection(
 
         column_name = vector_field.name
         index_name = f"{table_name}_{column_name}_idx"
+        index_method = self._get_index_method(vector_field)
+        ops_str = get_vector_index_ops_str(vector_field.distance_function)  # type: ignore[arg-type]
+
+        async with self.connection_pool.connection() as conn, conn.cursor() as cur:
+            query = sql.SQL(
+                "CREATE INDEX {index_name} ON {schema}.{table} USING {index_kind} ({column_name} {op})"
+            ).format(
+                index_name=sql.Identifier(index_name),
+                schema=sql.Identifier(self.db_schema),
+                table=sql.Identifier(table_name),
+                index_kind=sql.SQL(index_method),
+                column_name=sql.Identifier(column_name),
+                op=sql.SQL(ops_str),
+            )
+            if vector_field.index_kind == IndexKind.IVF_FLAT:
+                # pgvector recommends rows / 1000 lists up to 1M rows, and sqrt(rows) lists above that
+                await cur.execute(
+                    sql.SQL("SELECT count(*) FROM {schema}.{table}").format(
+                        schema=sql.Identifier(self.db_schema), table=sql.Identifier(table_name)
+                    )
+                )
+                row = await cur.fetchone()
+                row_count = row[0] if row else 0
+                lists = row_count // 1000 if row_count <= 1_000_000 else math.isqrt(row_count)
+                query += sql.SQL(" WITH (lists = {lists})").format(lists=sql.Literal(max(lists, 1)))
+            await cur.execute(query)
+            await conn.commit()
 
-        # Only support creating HNSW indexes through the vector store
-        if vector_field.index_kind != IndexKind.HNSW:
+        logger.info(f"Index '{index_name}' created successfully on column '{column_name}'.")
+
+    @staticmethod
+    def _get_index_method(vector_field: VectorStoreRecordVectorField) -> str:
+        """Get the pgvector index method of the index kind of a vector field."""
+        # Only support creating HNSW and IVFFlat indexes through the vector store
+        if vector_field.index_kind not in INDEX_METHODS:
             raise VectorStoreOperationException(
                 f"Unsupported index kind: {vector_field.index_kind}. "
                 "If you need to create an index of this type, please do so manually. "
-                "Only HNSW indexes are supported through the vector store."
+                "Only HNSW and IVFFlat indexes are supported through the vector store."
             )
 
-        # Require the distance function to be set for HNSW indexes
+        # Require the distance function to be set for indexes
         if not vector_field.distance_function:
             raise VectorStoreOperationException(
-                "Distance function must be set for HNSW indexes. "
+                f"Distance function must be set for {vector_field.index_kind} indexes. "
                 "Please set the distance function in the vector field definition."
             )
-
-        ops_str = get_vector_index_ops_str(vector_field.distance_function)
-
-        async with self.connection_pool.connection() as conn, conn.cursor() as cur:
-            await cur.execute(
-                sql.SQL("CREATE INDEX {index_name} ON {schema}.{table} USING {index_kind} ({column_name} {op})").format(
-                    index_name=sql.Identifier(index_name),
-                    schema=sql.Identifier(self.db_schema),
-                    table=sql.Identifier(table_name),
-                    index_kind=sql.SQL(vector_field.index_kind),
-                    column_name=sql.Identifier(column_name),
-                    op=sql.SQL(ops_str),
-                )
-            )
-            await conn.commit()
-
-        logger.info(f"Index '{index_name}' created successfully on column '{column_name}'.")
+        return INDEX_METHODS[vector_field.index_kind]
 
     # endregion
     # region: VectorSearchBase implementation
@@ -495,6 +715,36 @@ class PostgresCollection(
                 total_count=None,
             )
 
+    @override
+    async def _inner_search_batch(
+        self,
+        options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
+        **kwargs: Any,
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Search multiple vectors, the statement is prepared once and executed for all vectors in a pipeline."""
+        if self.connection_pool is None:
+            raise VectorStoreOperationException(
+                "Connection pool is not available, use the collection as a context manager."
+            )
+        query, params, return_fields = self._construct_vector_query(vectors[0], options, **kwargs)
+        params_seq = [params, *([self._vector_to_param(vector)] for vector in vectors[1:])]
+        search_results: list[KernelSearchResults[VectorSearchResult[TModel]]] = []
+        async with self.connection_pool.connection() as conn, conn.cursor() as cur:
+            await cur.executemany(query, params_seq, returning=True)
+            while True:
+                rows = await cur.fetchall()
+                row_dicts = [convert_row_to_dict(row, return_fields) for row in rows]
+                search_results.append(
+                    KernelSearchResults(
+                        results=self._get_vector_search_results_from_results(row_dicts, options),
+                        total_count=len(row_dicts) if options.include_total_count else None,
+                    )
+                )
+                if not cur.nextset():
+                    break
+        return search_results
+
     def _construct_vector_query(
         self,
         vector: list[float | int],
@@ -576,18 +826,20 @@ class PostgresCollection(
                 subquery=query,
             )
 
-        # Convert the vector to a string for the query
-        params = ["[" + ",".join([str(float(v)) for v in vector]) + "]"]
-
         return (
             query,
-            params,
+            [self._vector_to_param(vector)],
             [
                 *((name, f) for (name, f) in self.data_model_definition.fields.items() if name in select_list),
                 (self._distance_column_name, None),
             ],
         )
 
+    @staticmethod
+    def _vector_to_param(vector: list[float | int]) -> str:
+        """Convert the vector to a string for the query."""
+        return "[" + ",".join([str(float(v)) for v in vector]) + "]"
+
     def _build_where_clauses_from_filter(self, filters: VectorSearchFilter | None) -> sql.Composed | None:
         """Build the WHERE clause for the search query from the filter in the search options.
 
@@ -2,8 +2,14 @@
 
 import json
 import re
+import struct
+from collections.abc import Container
 from typing import Any
 
+import numpy as np
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
+from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
 
 from semantic_kernel.data.const import DistanceFunction
@@ -99,6 +105,75 @@ def convert_dict_to_row(record: dict[str, Any], fields: list[tuple[str, VectorSt
     return tuple(_convert(record.get(field.name)) for _, field in fields)
 
 
+def convert_dict_to_copy_row(
+    record: dict[str, Any], fields: list[tuple[str, VectorStoreRecordField]], json_columns: Container[str]
+) -> tuple[Any, ...]:
+    """Convert a dictionary to a row for a binary COPY.
+
+    Unlike `convert_dict_to_row`, the values of JSON columns are not serialized here,
+    dicts are serialized by the JSON dumper of psycopg and strings are passed as JSON documents.
+
+    Args:
+        record: A dictionary representing a record.
+        fields: A list of tuples, where each tuple contains the field name and field definition.
+        json_columns: The names of the columns with a JSON or JSONB type.
+
+    Returns:
+        A tuple representing the record.
+    """
+
+    def _convert(v: Any | None, name: str) -> Any | None:
+        if name in json_columns:
+            return Jsonb(v, dumps=str) if isinstance(v, str) else v
+        if isinstance(v, dict):
+            return json.dumps(v)
+        return v
+
+    return tuple(_convert(record.get(field.name), field.name) for _, field in fields)
+
+
+def vector_to_binary(vector: Any) -> bytes:
+    """Encode a vector in the binary format of the pgvector `vector` type.
+
+    The binary format is the number of dimensions and an unused value, as 16 bit integers,
+    followed by the values as big-endian 32 bit floats.
+    Numpy arrays are converted as a whole, without creating a Python float per value.
+
+    Args:
+        vector: The vector, a sequence of numbers or a one-dimensional numpy array.
+
+    Returns:
+        The encoded vector.
+    """
+    values = np.asarray(vector, dtype=">f4")
+    if values.ndim != 1:
+        raise ValueError(f"A vector must have one dimension, got an array with shape {values.shape}.")
+    return struct.pack(">HH", values.shape[0], 0) + values.tobytes()
+
+
+class VectorBinaryDumper(Dumper):
+    """Dumps vectors in the binary format of the pgvector `vector` type.
+
+    The oid of the `vector` type differs per database, use `create_vector_binary_dumper`
+    to create a dumper for the oid of a database.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        """Dump the vector."""
+        return vector_to_binary(obj)
+
+
+def create_vector_binary_dumper(oid: int) -> type[VectorBinaryDumper]:
+    """Create a dumper for the `vector` type with the given oid.
+
+    The dumper can be registered without a Python type, it is then used by a COPY
+    for the columns that `set_types` gives the `vector` type.
+    """
+    return type("VectorBinaryDumper", (VectorBinaryDumper,), {"oid": oid})
+
+
 def get_vector_index_ops_str(distance_function: DistanceFunction) -> str:
     """Get the PostgreSQL ops string for creating an index for a given distance function.
 
@@ -7,7 +7,17 @@ from typing import Any, ClassVar, Generic
 
 from pydantic import ValidationError
 from qdrant_client.async_qdrant_client import AsyncQdrantClient
-from qdrant_client.models import FieldCondition, Filter, MatchAny, PointStruct, QueryResponse, ScoredPoint, VectorParams
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchAny,
+    NamedVector,
+    PointStruct,
+    QueryResponse,
+    ScoredPoint,
+    SearchRequest,
+    VectorParams,
+)
 
 from semantic_kernel.connectors.memory.qdrant.const import DISTANCE_FUNCTION_MAP, TYPE_MAPPER_VECTOR
 from semantic_kernel.connectors.memory.qdrant.utils import AsyncQdrantClientWrapper
@@ -202,6 +212,41 @@ class QdrantCollection(
             total_count=len(results) if options.include_total_count else None,
         )
 
+    @override
+    async def _inner_search_batch(
+        self,
+        options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
+        **kwargs: Any,
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Search multiple vectors with a single batch search request."""
+        query_filter = self._create_filter(options)
+        requests = [
+            SearchRequest(
+                vector=NamedVector(name=options.vector_field_name, vector=vector)
+                if self.named_vectors and options.vector_field_name
+                else vector,
+                filter=query_filter,
+                limit=options.top,
+                offset=options.skip,
+                with_payload=True,
+                with_vector=options.include_vectors,
+            )
+            for vector in vectors
+        ]
+        batch_results = await self.qdrant_client.search_batch(
+            collection_name=self.collection_name,
+            requests=requests,
+            **kwargs,
+        )
+        return [
+            KernelSearchResults(
+                results=self._get_vector_search_results_from_results(results, options),
+                total_count=len(results) if options.include_total_count else None,
+            )
+            for results in batch_results
+        ]
+
     @override
     def _get_record_from_result(self, result: ScoredPoint | QueryResponse) -> Any:
         return result
@@ -8,6 +8,9 @@ from redisvl.schema import StorageType
 
 from semantic_kernel.data.const import DistanceFunction
 
+# The number of records that are sent in a single pipeline or JSON.MSET/JSON.MGET command.
+DEFAULT_BATCH_SIZE = 1000
+
 
 class RedisCollectionTypes(str, Enum):
     JSON = "json"
@@ -6,20 +6,26 @@ import json
 import logging
 import sys
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Iterator, Sequence
 from copy import copy
 from typing import Any, ClassVar, Generic, TypeVar
 
 import numpy as np
-from pydantic import ValidationError
+from pydantic import Field, PrivateAttr, ValidationError
 from redis.asyncio.client import Redis
+from redis.client import NEVER_DECODE
+from redis.commands.helpers import get_protocol_version
+from redis.commands.search.commands import SEARCH_CMD
 from redis.commands.search.indexDefinition import IndexDefinition
+from redis.commands.search.result import Result
+from redis.exceptions import ResponseError
 from redisvl.index.index import process_results
 from redisvl.query.filter import FilterExpression
 from redisvl.query.query import BaseQuery, FilterQuery, VectorQuery
 from redisvl.redis.utils import array_to_buffer, buffer_to_array, convert_bytes
 
 from semantic_kernel.connectors.memory.redis.const import (
+    DEFAULT_BATCH_SIZE,
     INDEX_TYPE_MAP,
     STORAGE_TYPE_MAP,
     TYPE_MAPPER_VECTOR,
@@ -61,6 +67,7 @@ else:
 logger: logging.Logger = logging.getLogger(__name__)
 
 TQuery = TypeVar("TQuery", bound=BaseQuery)
+_T = TypeVar("_T")
 
 
 @experimental
@@ -75,6 +82,7 @@ class RedisCollection(
     redis_database: Redis
     prefix_collection_name_to_key_names: bool
     collection_type: RedisCollectionTypes
+    batch_size: int = Field(default=DEFAULT_BATCH_SIZE, gt=0)
     supported_key_types: ClassVar[list[str] | None] = ["str"]
     supported_vector_types: ClassVar[list[str] | None] = ["float"]
 
@@ -89,6 +97,7 @@ class RedisCollection(
         connection_string: str | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
         **kwargs: Any,
     ) -> None:
         """RedisMemoryStore is an abstracted interface to interact with a Redis node connection.
@@ -96,6 +105,9 @@ class RedisCollection(
         See documentation about connections: https://redis-py.readthedocs.io/en/stable/connections.html
         See documentation about vector attributes: https://redis.io/docs/stack/search/reference/vectors.
 
+        The records are upserted, retrieved and deleted in batches of `batch_size` records,
+        each batch is sent in a single pipeline or command.
+
         """
         if redis_database:
             super().__init__(
@@ -105,6 +117,7 @@ class RedisCollection(
                 redis_database=redis_database,
                 prefix_collection_name_to_key_names=prefix_collection_name_to_key_names,
                 collection_type=collection_type,
+                batch_size=batch_size,
                 managed_client=False,
             )
             return
@@ -125,6 +138,7 @@ class RedisCollection(
             redis_database=RedisWrapper.from_url(redis_settings.connection_string.get_secret_value()),
             prefix_collection_name_to_key_names=prefix_collection_name_to_key_names,
             collection_type=collection_type,
+            batch_size=batch_size,
         )
 
     def _get_redis_key(self, key: str) -> str:
@@ -137,6 +151,10 @@ class RedisCollection(
             return key[len(self.collection_name) + 1 :]
         return key
 
+    def _batches(self, items: Sequence[_T]) -> Iterator[Sequence[_T]]:
+        for start in range(0, len(items), self.batch_size):
+            yield items[start : start + self.batch_size]
+
     @override
     async def create_collection(self, **kwargs) -> None:
         """Create a new index in Redis.
@@ -178,6 +196,67 @@ class RedisCollection(
         else:
             logger.debug("Collection does not exist, skipping deletion.")
 
+    async def upsert_stream(
+        self,
+        records: AsyncIterable[TModel],
+        max_pending_batches: int = 2,
+        **kwargs: Any,
+    ) -> Sequence[TKey]:
+        """Upsert the records of an async iterable, in batches of `batch_size` records.
+
+        While a batch is being upserted, the next batch is read from the iterable,
+        the iterable is not read further while `max_pending_batches` batches are being upserted,
+        so a large or slow source can be loaded without keeping all records in memory.
+
+        Args:
+            records: The records to upsert.
+            max_pending_batches: The maximum number of batches that are upserted at the same time.
+            **kwargs: Additional arguments, passed to `upsert`, such as the embedding_generation_function.
+
+        Returns:
+            The keys of the upserted records, in the order of the records.
+
+        Raises:
+            VectorStoreOperationException: If an error occurs during upserting,
+                the batches that are still pending are cancelled.
+        """
+        if max_pending_batches < 1:
+            raise VectorStoreOperationException("max_pending_batches must be at least 1.")
+        tasks: list[asyncio.Task[Sequence[TKey]]] = []
+        pending: set[asyncio.Task[Sequence[TKey]]] = set()
+
+        async def wait_for_pending(return_when: str) -> None:
+            done, _ = await asyncio.wait(pending, return_when=return_when)
+            pending.difference_update(done)
+            for task in done:
+                # raise the error of a failed batch, before reading more records
+                task.result()
+
+        try:
+            batch: list[TModel] = []
+            async for record in records:
+                batch.append(record)
+                if len(batch) < self.batch_size:
+                    continue
+                if len(pending) >= max_pending_batches:
+                    await wait_for_pending(asyncio.FIRST_COMPLETED)
+                task = asyncio.create_task(self.upsert(records=batch, **kwargs))
+                tasks.append(task)
+                pending.add(task)
+                batch = []
+            if batch:
+                task = asyncio.create_task(self.upsert(records=batch, **kwargs))
+                tasks.append(task)
+                pending.add(task)
+            if pending:
+                await wait_for_pending(asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return [key for task in tasks for key in task.result()]
+
     @override
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
         """Exit the context manager."""
@@ -208,6 +287,38 @@ class RedisCollection(
             total_count=results.total,
         )
 
+    @override
+    async def _inner_search_batch(
+        self,
+        options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
+        **kwargs: Any,
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Search multiple vectors, the FT.SEARCH commands are sent in a single pipeline."""
+        queries = [self._construct_vector_query(vector, options, **kwargs) for vector in vectors]
+        search = self.redis_database.ft(self.collection_name)
+        resp3 = get_protocol_version(self.redis_database) in ["3", 3]
+        command_options = {} if resp3 else {NEVER_DECODE: True}
+        field_encodings = self._get_return_field_encodings(options.include_vectors)
+        # redis-py does not support FT.SEARCH on a pipeline, so the commands are built and parsed manually
+        async with self.redis_database.pipeline(transaction=False) as pipe:
+            for query in queries:
+                args = [self.collection_name, *query.get_args(), *search.get_params_args(query.params)]
+                pipe.execute_command(SEARCH_CMD, *args, **command_options)
+            raw_results = await pipe.execute()
+        search_results: list[KernelSearchResults[VectorSearchResult[TModel]]] = []
+        for query, raw_result in zip(queries, raw_results):
+            # the vector queries return the content of the documents, without payloads or scores
+            results = raw_result if resp3 else Result(raw_result, hascontent=True, field_encodings=field_encodings)
+            processed = process_results(results, query, STORAGE_TYPE_MAP[self.collection_type])
+            search_results.append(
+                KernelSearchResults(
+                    results=self._get_vector_search_results_from_results(desync_list(processed), options),
+                    total_count=results.total,
+                )
+            )
+        return search_results
+
     def _construct_vector_query(
         self, vector: list[float | int], options: VectorSearchOptions, **kwargs: Any
     ) -> VectorQuery:
@@ -243,9 +354,15 @@ class RedisCollection(
         query.paging(offset=options.skip, num=options.top + options.skip)
         return self._add_return_fields(query, options.include_vectors)
 
-    @abstractmethod
     def _add_return_fields(self, query: TQuery, include_vectors: bool) -> TQuery:
-        """Add the return fields to the query.
+        """Add the return fields to the query."""
+        for name, encoding in self._get_return_field_encodings(include_vectors).items():
+            query.return_field(name, decode_field=encoding is not None)
+        return query
+
+    @abstractmethod
+    def _get_return_field_encodings(self, include_vectors: bool) -> dict[str, str | None]:
+        """Get the fields to return with their encoding, None for the fields that are returned as bytes.
 
         There is a difference between the JSON and Hashset collections,
         this method should be overridden by the subclasses.
@@ -282,6 +399,7 @@ class RedisHashsetCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel
         connection_string: str | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
         **kwargs: Any,
     ) -> None:
         """RedisMemoryStore is an abstracted interface to interact with a Redis node connection.
@@ -300,28 +418,35 @@ class RedisHashsetCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel
             connection_string=connection_string,
             env_file_path=env_file_path,
             env_file_encoding=env_file_encoding,
+            batch_size=batch_size,
             **kwargs,
         )
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[str]:
-        return await asyncio.gather(*[self._single_upsert(record) for record in records])
-
-    async def _single_upsert(self, upsert_record: Any) -> str:
-        await self.redis_database.hset(**upsert_record)
-        return self._unget_redis_key(upsert_record["name"])
+        """Upsert the records, with a pipeline of HSET commands per batch."""
+        for batch in self._batches(records):
+            async with self.redis_database.pipeline(transaction=False) as pipe:
+                for record in batch:
+                    pipe.hset(**record)
+                await pipe.execute()
+        return [self._unget_redis_key(record["name"]) for record in records]
 
     @override
     async def _inner_get(self, keys: Sequence[str], **kwargs) -> Sequence[dict[str, Any]] | None:
-        results = await asyncio.gather(*[self._single_get(self._get_redis_key(key)) for key in keys])
-        return [result for result in results if result]
-
-    async def _single_get(self, key: str) -> dict[str, Any] | None:
-        result = await self.redis_database.hgetall(key)
-        if result:
-            result = convert_bytes(result)
-            result[self.data_model_definition.key_field_name] = key
-        return result
+        """Get the records, with a pipeline of HGETALL commands per batch."""
+        records: list[dict[str, Any]] = []
+        for batch in self._batches([self._get_redis_key(key) for key in keys]):
+            async with self.redis_database.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.hgetall(key)
+                results = await pipe.execute()
+            for key, result in zip(batch, results):
+                if result:
+                    record = convert_bytes(result)
+                    record[self.data_model_definition.key_field_name] = key
+                    records.append(record)
+        return records
 
     @override
     async def _inner_delete(self, keys: Sequence[str], **kwargs: Any) -> None:
@@ -371,27 +496,30 @@ class RedisHashsetCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel
             results.append(rec)
         return results
 
-    def _add_return_fields(self, query: TQuery, include_vectors: bool) -> TQuery:
-        """Add the return fields to the query.
+    def _get_return_field_encodings(self, include_vectors: bool) -> dict[str, str | None]:
+        """Get the fields to return with their encoding.
 
-        For a Hashset index this should not be decoded, that is the only difference
+        For a Hashset index the vectors should not be decoded, that is the only difference
         between this and the JSON collection.
 
         """
+        encodings: dict[str, str | None] = {}
         for field in self.data_model_definition.fields.values():
             match field:
                 case VectorStoreRecordVectorField():
                     if include_vectors:
-                        query.return_field(field.name, decode_field=False)
+                        encodings[field.name] = None
                 case _:
-                    query.return_field(field.name)
-        return query
+                    encodings[field.name] = "utf8"
+        return encodings
 
 
 @experimental
 class RedisJsonCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel]):
     """A vector store record collection implementation using Redis Json."""
 
+    _json_mset_supported: bool | None = PrivateAttr(default=None)
+
     def __init__(
         self,
         data_model_type: type[TModel],
@@ -402,6 +530,7 @@ class RedisJsonCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel]):
         connection_string: str | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
         **kwargs: Any,
     ) -> None:
         """RedisMemoryStore is an abstracted interface to interact with a Redis node connection.
@@ -420,24 +549,48 @@ class RedisJsonCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel]):
             connection_string=connection_string,
             env_file_path=env_file_path,
             env_file_encoding=env_file_encoding,
+            batch_size=batch_size,
             **kwargs,
         )
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[str]:
-        return await asyncio.gather(*[self._single_upsert(record) for record in records])
+        """Upsert the records, with a JSON.MSET command per batch.
 
-    async def _single_upsert(self, upsert_record: Any) -> str:
-        await self.redis_database.json().set(upsert_record["name"], "$", upsert_record["value"])
-        return self._unget_redis_key(upsert_record["name"])
+        When the server does not support JSON.MSET, which was added in RedisJSON 2.6,
+        a pipeline of JSON.SET commands is used per batch instead.
+        """
+        for batch in self._batches(records):
+            await self._set_batch(batch)
+        return [self._unget_redis_key(record["name"]) for record in records]
+
+    async def _set_batch(self, batch: Sequence[Any]) -> None:
+        if self._json_mset_supported is not False:
+            try:
+                await self.redis_database.json().mset([(record["name"], "$", record["value"]) for record in batch])
+                self._json_mset_supported = True
+                return
+            except ResponseError as exc:
+                if self._json_mset_supported or "unknown command" not in str(exc).lower():
+                    raise
+                logger.debug("JSON.MSET is not supported by the server, using pipelined JSON.SET commands instead.")
+                self._json_mset_supported = False
+        async with self.redis_database.pipeline(transaction=False) as pipe:
+            json_pipe = pipe.json()
+            for record in batch:
+                json_pipe.set(record["name"], "$", record["value"])
+            await pipe.execute()
 
     @override
     async def _inner_get(self, keys: Sequence[str], **kwargs) -> Sequence[dict[bytes, bytes]] | None:
+        """Get the records, with a JSON.MGET command per batch."""
         kwargs_copy = copy(kwargs)
         kwargs_copy.pop("include_vectors", None)
-        redis_keys = [self._get_redis_key(key) for key in keys]
-        results = await self.redis_database.json().mget(redis_keys, "$", **kwargs_copy)
-        return [self._add_key(key, result[0]) for key, result in zip(redis_keys, results) if result]
+        records: list[dict[str, Any]] = []
+        for batch in self._batches([self._get_redis_key(key) for key in keys]):
+            results = await self.redis_database.json().mget(batch, "$", **kwargs_copy)
+            records.extend(self._add_key(key, result[0]) for key, result in zip(batch, results) if result)
+        return records
 
     def _add_key(self, key: str, record: dict[str, Any]) -> dict[str, Any]:
         record[self.data_model_definition.key_field_name] = key
@@ -445,7 +598,13 @@ class RedisJsonCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel]):
 
     @override
     async def _inner_delete(self, keys: Sequence[str], **kwargs: Any) -> None:
-        await asyncio.gather(*[self.redis_database.json().delete(key, **kwargs) for key in keys])
+        """Delete the records, with a pipeline of JSON.DEL commands per batch."""
+        for batch in self._batches(keys):
+            async with self.redis_database.pipeline(transaction=False) as pipe:
+                json_pipe = pipe.json()
+                for key in batch:
+                    json_pipe.delete(key, **kwargs)
+                await pipe.execute()
 
     @override
     def _serialize_dicts_to_store_models(
@@ -483,13 +642,10 @@ class RedisJsonCollection(RedisCollection[TKey, TModel], Generic[TKey, TModel]):
             results.append(rec)
         return results
 
-    def _add_return_fields(self, query: TQuery, include_vectors: bool) -> TQuery:
-        """Add the return fields to the query."""
-        for field in self.data_model_definition.fields.values():
-            match field:
-                case VectorStoreRecordVectorField():
-                    if include_vectors:
-                        query.return_field(field.name)
-                case _:
-                    query.return_field(field.name)
-        return query
+    def _get_return_field_encodings(self, include_vectors: bool) -> dict[str, str | None]:
+        """Get the fields to return with their encoding."""
+        return {
+            field.name: "utf8"
+            for field in self.data_model_definition.fields.values()
+            if include_vectors or not isinstance(field, VectorStoreRecordVectorField)
+        }
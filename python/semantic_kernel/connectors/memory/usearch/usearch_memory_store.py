@@ -1,14 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import itertools
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 from numpy import ndarray
@@ -26,19 +24,42 @@ from semantic_kernel.utils.feature_stage_decorator import experimental
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+# Number of buffered rows after which the append buffer is combined into one record batch of the embeddings table.
+_APPEND_BUFFER_SIZE = 65_536
+# The embeddings table is combined into a single chunk when the appended record batches exceed this number.
+_MAX_TABLE_CHUNKS = 64
+
+
 @dataclass
 class _USearchCollection:
     """Represents a collection for USearch with embeddings and related data.
 
+    Records are labeled in the index with their row in the embeddings data table. New rows are appended to a
+    buffer, which is combined into one record batch of the table when it is full or when the rows are read,
+    so the table does not fragment into a chunk per upsert. Rows of removed records stay in the table
+    until the collection is compacted.
+
     Attributes:
         embeddings_index (Index): The index of embeddings.
         embeddings_data_table (pa.Table): The PyArrow table holding embeddings data.
         embeddings_id_to_label (Dict[str, int]): Mapping of embeddings ID to label.
+        embeddings_buffer (List[pa.Table]): The appended rows that are not yet in the embeddings data table.
+        embeddings_buffer_rows (int): The number of rows in the append buffer.
+        embeddings_index_path (Optional[Path]): The file the index is a memory-mapped view of, None if the index
+            is held in memory.
+        embeddings_data_path (Optional[Path]): The Arrow IPC file the embeddings data table is memory-mapped from,
+            None if the table is held in memory.
+        modified (bool): Whether the collection changed since it was loaded from the persist directory.
     """
 
     embeddings_index: Index
     embeddings_data_table: pa.Table
     embeddings_id_to_label: dict[str, int]
+    embeddings_buffer: list[pa.Table] = field(default_factory=list)
+    embeddings_buffer_rows: int = 0
+    embeddings_index_path: Path | None = None
+    embeddings_data_path: Path | None = None
+    modified: bool = True
 
     @staticmethod
     def create_default(embeddings_index: Index) -> "_USearchCollection":
@@ -50,14 +71,73 @@ class _USearchCollection:
         Returns:
             _USearchCollection: A default `_USearchCollection` initialized with the given embeddings index.
         """
-        return _USearchCollection(
-            embeddings_index,
-            pa.Table.from_pandas(
-                pd.DataFrame(columns=_embeddings_data_schema.names),
-                schema=_embeddings_data_schema,
-            ),
-            {},
-        )
+        return _USearchCollection(embeddings_index, _embeddings_data_schema.empty_table(), {})
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows in the embeddings data table and the append buffer, the next free label."""
+        return self.embeddings_data_table.num_rows + self.embeddings_buffer_rows
+
+    @property
+    def num_removed(self) -> int:
+        """The number of rows of removed or replaced records."""
+        return self.num_rows - len(self.embeddings_id_to_label)
+
+    def prepare_write(self) -> None:
+        """Mark the collection as modified, loading the memory-mapped files into memory.
+
+        Views of the index are read-only, and the files are deleted and written again when the store is closed,
+        which fails on Windows while they are memory-mapped.
+        """
+        if self.embeddings_index_path is not None:
+            self.embeddings_index.load(str(self.embeddings_index_path))
+            self.embeddings_index_path = None
+        if self.embeddings_data_path is not None:
+            with pa.OSFile(str(self.embeddings_data_path)) as source:
+                self.embeddings_data_table = pa.ipc.open_file(source).read_all()
+            self.embeddings_data_path = None
+        self.modified = True
+
+    def append(self, table: pa.Table) -> None:
+        """Append rows to the buffer, the buffer is flushed when it holds `_APPEND_BUFFER_SIZE` rows."""
+        self.embeddings_buffer.append(table)
+        self.embeddings_buffer_rows += table.num_rows
+        if self.embeddings_buffer_rows >= _APPEND_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Combine the append buffer into one record batch and add it to the embeddings data table."""
+        if not self.embeddings_buffer:
+            return
+        table = pa.concat_tables([
+            self.embeddings_data_table,
+            pa.concat_tables(self.embeddings_buffer).combine_chunks(),
+        ])
+        if table.column(0).num_chunks > _MAX_TABLE_CHUNKS:
+            table = table.combine_chunks()
+        self.embeddings_data_table = table
+        self.embeddings_buffer = []
+        self.embeddings_buffer_rows = 0
+
+    def take(self, labels: ndarray | list[int]) -> pa.Table:
+        """Get the rows of the given labels, flushing the append buffer when a label is in it."""
+        if len(labels) and max(labels) >= self.embeddings_data_table.num_rows:
+            self.flush()
+        return self.embeddings_data_table.take(pa.array(labels, type=pa.int64()))
+
+    def compact(self) -> None:
+        """Rewrite the embeddings data table with the rows of the live records and relabel the index to match."""
+        self.prepare_write()
+        self.flush()
+        ids = sorted(self.embeddings_id_to_label, key=self.embeddings_id_to_label.__getitem__)
+        labels = np.array([self.embeddings_id_to_label[id] for id in ids], dtype=np.int64)
+        new_labels = np.arange(len(ids), dtype=np.int64)
+        # Labels only decrease and are renamed in ascending order, so a new label is never still in use.
+        moved = labels != new_labels
+        if moved.any():
+            self.embeddings_index.rename(labels[moved], new_labels[moved])
+        self.embeddings_data_table = self.embeddings_data_table.take(pa.array(labels)).combine_chunks()
+        self.embeddings_id_to_label = dict(zip(ids, new_labels.tolist()))
 
 
 # PyArrow Schema definition for the embeddings data from `MemoryRecord`.
@@ -78,12 +158,14 @@ class _CollectionFileType(Enum):
 
     USEARCH = 0
     PARQUET = 1
+    ARROW = 2
 
 
 # Mapping of collection file types to their file extensions.
 _collection_file_extensions: dict[_CollectionFileType, str] = {
     _CollectionFileType.USEARCH: ".usearch",
     _CollectionFileType.PARQUET: ".parquet",
+    _CollectionFileType.ARROW: ".arrow",
 }
 
 
@@ -214,25 +296,34 @@ class USearchMemoryStore(MemoryStoreBase):
 
         return
 
-    def _read_embeddings_table(self, path: os.PathLike) -> tuple[pa.Table, dict[str, int]]:
+    def _read_embeddings_table(self, path: Path) -> tuple[pa.Table, dict[str, int]]:
         """Read embeddings from the provided path and generate an ID to label mapping.
 
+        Arrow IPC files are memory-mapped, so the table is not copied into memory and its pages are shared
+        between the processes that read the file. Parquet files written by earlier versions are read into memory.
+
         Args:
-            path (os.PathLike): Path to the embeddings.
+            path (Path): Path to the embeddings.
 
         Returns:
             Tuple of embeddings table and a dictionary mapping from record ID to its label.
         """
-        embeddings_table = pq.read_table(path, schema=_embeddings_data_schema)
+        if path.suffix == _collection_file_extensions[_CollectionFileType.PARQUET]:
+            embeddings_table = pq.read_table(path, schema=_embeddings_data_schema)
+        else:
+            embeddings_table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
         embeddings_id_to_label: dict[str, int] = {
             record_id: idx for idx, record_id in enumerate(embeddings_table.column("id").to_pylist())
         }
         return embeddings_table, embeddings_id_to_label
 
     def _read_embeddings_index(self, path: Path) -> Index:
-        """Read embeddings index."""
+        """Read embeddings index as a memory-mapped view of the file, it is loaded into memory on the first write."""
         # str cast is temporarily fix for https://github.com/unum-cloud/usearch/issues/196
-        return Index.restore(str(path), view=False)
+        embeddings_index = Index.restore(str(path), view=True)
+        if embeddings_index is None:
+            raise ServiceInitializationError(f"Could not restore the USearch index from {path}")
+        return embeddings_index
 
     def _read_collections_from_dir(self) -> dict[str, _USearchCollection]:
         """Read all collections from directory to memory.
@@ -247,22 +338,27 @@ class USearchMemoryStore(MemoryStoreBase):
         collections: dict[str, _USearchCollection] = {}
 
         for collection_name, collection_files in self._get_all_storage_files().items():
-            expected_storage_files = len(_CollectionFileType)
-            if len(collection_files) != expected_storage_files:
+            usearch_file = collection_files.get(_CollectionFileType.USEARCH)
+            data_file = collection_files.get(
+                _CollectionFileType.ARROW, collection_files.get(_CollectionFileType.PARQUET)
+            )
+            if usearch_file is None or data_file is None:
                 raise ServiceInitializationError(
-                    f"Expected {expected_storage_files} files for collection {collection_name}"
+                    f"Expected an index file and a data file for collection {collection_name}"
                 )
-            parquet_file, usearch_file = collection_files
-            if parquet_file.suffix == _collection_file_extensions[_CollectionFileType.USEARCH]:
-                parquet_file, usearch_file = usearch_file, parquet_file
 
-            embeddings_table, embeddings_id_to_label = self._read_embeddings_table(parquet_file)
+            embeddings_table, embeddings_id_to_label = self._read_embeddings_table(data_file)
             embeddings_index = self._read_embeddings_index(usearch_file)
+            # Arrow IPC files are memory-mapped, Parquet files are read into memory
+            is_arrow_file = data_file.suffix == _collection_file_extensions[_CollectionFileType.ARROW]
 
             collections[collection_name] = _USearchCollection(
                 embeddings_index,
                 embeddings_table,
                 embeddings_id_to_label,
+                embeddings_index_path=usearch_file,
+                embeddings_data_path=data_file if is_arrow_file else None,
+                modified=False,
             )
 
         return collections
@@ -327,6 +423,7 @@ class USearchMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Collection {collection_name} does not exist, cannot insert.")
 
         ucollection = self._collections[collection_name]
+        ucollection.prepare_write()
         all_records_id = [record._id for record in records]
 
         # Remove vectors from index
@@ -336,8 +433,8 @@ class USearchMemoryStore(MemoryStoreBase):
         ucollection.embeddings_index.remove(remove_labels, compact=compact, threads=threads)
 
         # Determine label insertion points
-        table_num_rows = ucollection.embeddings_data_table.num_rows
-        insert_labels = np.arange(table_num_rows, table_num_rows + len(records))
+        num_rows = ucollection.num_rows
+        insert_labels = np.arange(num_rows, num_rows + len(records))
 
         # Add embeddings to index
         ucollection.embeddings_index.add(
@@ -349,10 +446,7 @@ class USearchMemoryStore(MemoryStoreBase):
         )
 
         # Update embeddings_table
-        ucollection.embeddings_data_table = pa.concat_tables([
-            ucollection.embeddings_data_table,
-            memoryrecords_to_pyarrow_table(records),
-        ])
+        ucollection.append(memoryrecords_to_pyarrow_table(records))
 
         # Update embeddings_id_to_label
         for index, record_id in enumerate(all_records_id):
@@ -397,7 +491,7 @@ class USearchMemoryStore(MemoryStoreBase):
             return []
         vectors = ucollection.embeddings_index.get(labels, dtype) if with_embeddings else None
 
-        return pyarrow_table_to_memoryrecords(ucollection.embeddings_data_table.take(pa.array(labels)), vectors)
+        return pyarrow_table_to_memoryrecords(ucollection.take(labels), vectors)
 
     async def remove(self, collection_name: str, key: str) -> None:
         """Remove a single MemoryRecord using its key."""
@@ -412,6 +506,7 @@ class USearchMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Collection {collection_name} does not exist, cannot insert.")
 
         ucollection = self._collections[collection_name]
+        ucollection.prepare_write()
 
         labels = [ucollection.embeddings_id_to_label[key] for key in keys]
         ucollection.embeddings_index.remove(labels)
@@ -515,14 +610,29 @@ class USearchMemoryStore(MemoryStoreBase):
         return [
             (mem_rec, relevance_score[index].item())
             for index, mem_rec in enumerate(
-                pyarrow_table_to_memoryrecords(
-                    ucollection.embeddings_data_table.take(pa.array(filtered_labels)),
-                    filtered_vectors,
-                )
+                pyarrow_table_to_memoryrecords(ucollection.take(filtered_labels), filtered_vectors)
             )
         ]
 
-    def _get_all_storage_files(self) -> dict[str, list[Path]]:
+    async def compact(self, collection_name: str) -> None:
+        """Drop the rows of removed and replaced records from a collection and relabel its index.
+
+        Removing or replacing a record only removes it from the index, its row stays in the embeddings table.
+        Compacting rewrites the table with the rows of the live records, collections are also compacted
+        when they are saved.
+
+        Args:
+            collection_name (str): Name of the collection to compact.
+
+        Raises:
+            ServiceResourceNotFoundError: If the collection does not exist.
+        """
+        collection_name = collection_name.lower()
+        if collection_name not in self._collections:
+            raise ServiceResourceNotFoundError(f"Collection {collection_name} does not exist")
+        self._collections[collection_name].compact()
+
+    def _get_all_storage_files(self) -> dict[str, dict[_CollectionFileType, Path]]:
         """Return storage files for each collection in `self._persist_directory`.
 
         Collection name is derived from file name and converted to lowercase. Files with extensions that
@@ -532,35 +642,45 @@ class USearchMemoryStore(MemoryStoreBase):
             ValueError: If persist directory is not set.
 
         Returns:
-            Dict[str, List[Path]]: Dictionary of collection names mapped to their respective files.
+            Dict[str, Dict[_CollectionFileType, Path]]: Dictionary of collection names mapped to their files
+              by file type.
         """
         if self._persist_directory is None:
             raise ServiceInitializationError("Persist directory is not set")
 
-        storage_exts = _collection_file_extensions.values()
-        collection_storage_files: dict[str, list[Path]] = {}
+        file_types = {extension: file_type for file_type, extension in _collection_file_extensions.items()}
+        collection_storage_files: dict[str, dict[_CollectionFileType, Path]] = {}
         for path in self._persist_directory.iterdir():
-            if path.is_file() and (path.suffix in storage_exts):
+            if path.is_file() and (path.suffix in file_types):
                 collection_name = path.stem.lower()
-                if collection_name in collection_storage_files:
-                    collection_storage_files[collection_name].append(path)
-                else:
-                    collection_storage_files[collection_name] = [path]
+                collection_storage_files.setdefault(collection_name, {})[file_types[path.suffix]] = path
         return collection_storage_files
 
     def _dump_collections(self) -> None:
-        collection_storage_files = self._get_all_storage_files()
-        for file_path in itertools.chain.from_iterable(collection_storage_files.values()):
-            file_path.unlink()
+        """Save the modified collections and delete the files of deleted collections.
+
+        Collections that were loaded and not modified are not rewritten, their files may be memory-mapped.
+        """
+        for collection_name, collection_files in self._get_all_storage_files().items():
+            ucollection = self._collections.get(collection_name)
+            if ucollection is None or ucollection.modified:
+                for file_path in collection_files.values():
+                    file_path.unlink()
 
         for collection_name, ucollection in self._collections.items():
+            if not ucollection.modified:
+                continue
+            if ucollection.num_removed:
+                ucollection.compact()
+            ucollection.flush()
             ucollection.embeddings_index.save(
                 self._get_collection_path(collection_name, file_type=_CollectionFileType.USEARCH)
             )
-            pq.write_table(
-                ucollection.embeddings_data_table,
-                self._get_collection_path(collection_name, file_type=_CollectionFileType.PARQUET),
-            )
+            with pa.ipc.new_file(
+                self._get_collection_path(collection_name, file_type=_CollectionFileType.ARROW),
+                _embeddings_data_schema,
+            ) as writer:
+                writer.write_table(ucollection.embeddings_data_table)
 
         return
 
@@ -3,9 +3,17 @@
 from semantic_kernel.connectors.openapi_plugin.openapi_function_execution_parameters import (
     OpenAPIFunctionExecutionParameters,
 )
+from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
 from semantic_kernel.connectors.openapi_plugin.openapi_parser import OpenApiParser
+from semantic_kernel.connectors.openapi_plugin.openapi_response_cache import OpenApiResponseCache
 from semantic_kernel.connectors.openapi_plugin.operation_selection_predicate_context import (
     OperationSelectionPredicateContext,
 )
 
-__all__ = ["OpenAPIFunctionExecutionParameters", "OpenApiParser", "OperationSelectionPredicateContext"]
+__all__ = [
+    "OpenAPIFunctionExecutionParameters",
+    "OpenApiHttpClientPool",
+    "OpenApiParser",
+    "OpenApiResponseCache",
+    "OperationSelectionPredicateContext",
+]
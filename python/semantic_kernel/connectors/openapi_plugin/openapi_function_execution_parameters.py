@@ -7,6 +7,7 @@ from urllib.parse import urlparse
 import httpx
 from pydantic import Field
 
+from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
 from semantic_kernel.connectors.openapi_plugin.operation_selection_predicate_context import (
     OperationSelectionPredicateContext,
 )
@@ -21,6 +22,7 @@ class OpenAPIFunctionExecutionParameters(KernelBaseModel):
     """OpenAPI function execution parameters."""
 
     http_client: httpx.AsyncClient | None = None
+    http_client_pool: OpenApiHttpClientPool | None = None
     auth_callback: AuthCallbackType | None = None
     server_url_override: str | None = None
     ignore_non_compliant_errors: bool = False
@@ -29,6 +31,10 @@ class OpenAPIFunctionExecutionParameters(KernelBaseModel):
     enable_payload_namespacing: bool = False
     operations_to_exclude: list[str] = Field(default_factory=list, description="The operationId(s) to exclude")
     operation_selection_predicate: Callable[[OperationSelectionPredicateContext], bool] | None = None
+    enable_response_cache: bool = Field(
+        default=False, description="Cache the responses of GET operations, following their caching headers"
+    )
+    response_cache_size: int = Field(default=128, gt=0, description="The maximum number of cached responses")
 
     def model_post_init(self, __context: Any) -> None:
         """Post initialization method for the model."""
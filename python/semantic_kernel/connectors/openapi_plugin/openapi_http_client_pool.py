@@ -0,0 +1,112 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@experimental
+class OpenApiHttpClientPool:
+    """A pooled HTTP client that is shared by the operations of OpenAPI plugins.
+
+    The client keeps connections alive between calls, so a call to an operation does not need
+    a new TCP and TLS handshake, and uses HTTP/2 when the `h2` package is installed.
+    The number of concurrent requests per host can be limited with `max_connections_per_host`.
+
+    The kernel creates one pool that is used by the OpenAPI plugins added with `add_plugin_from_openapi`,
+    unless the execution parameters of the plugin have an `http_client` or `http_client_pool`.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        max_connections_per_host: int | None = None,
+        timeout: float | None = 5.0,
+        http2: bool | None = None,
+    ) -> None:
+        """Create a pool, the client is created when it is first used.
+
+        Args:
+            max_connections: The maximum number of connections of the client.
+            max_keepalive_connections: The maximum number of idle connections that are kept alive.
+            keepalive_expiry: The number of seconds an idle connection is kept alive.
+            max_connections_per_host: The maximum number of concurrent requests per host, no limit when None.
+            timeout: The timeout of the requests, in seconds.
+            http2: Whether to use HTTP/2, defaults to True when the `h2` package is installed.
+        """
+        if max_connections_per_host is not None and max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1.")
+        if http2 is None:
+            http2 = find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "OpenApiHttpClientPool":
+        """The pool is shared, so copies of a kernel or of its plugins keep using the same connections.
+
+        The client and the semaphores can not be copied, they hold locks and belong to an event loop.
+        """
+        return self
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client, it is created again when it is used from another event loop."""
+        self._check_event_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+        return self._client
+
+    @asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[None]:
+        """Wait until a request to the host of the url is allowed by `max_connections_per_host`."""
+        if self.max_connections_per_host is None:
+            yield
+            return
+        self._check_event_loop()
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        async with semaphore:
+            yield
+
+    async def aclose(self) -> None:
+        """Close the client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._host_semaphores = {}
+            self._loop = None
+
+    def _check_event_loop(self) -> None:
+        """Drop the client and the semaphores when they were created in another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._client is not None and not self._client.is_closed:
+            # The connections of the previous client belong to an event loop that is no longer running.
+            logger.debug("The event loop changed, creating a new pooled OpenAPI HTTP client.")
+        self._client = None
+        self._host_semaphores = {}
+        self._loop = loop
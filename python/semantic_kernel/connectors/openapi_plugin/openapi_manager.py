@@ -11,6 +11,7 @@ from semantic_kernel.connectors.openapi_plugin.models.rest_api_run_options impor
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_security_requirement import RestApiSecurityRequirement
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_uri import Uri
 from semantic_kernel.connectors.openapi_plugin.openapi_parser import OpenApiParser
+from semantic_kernel.connectors.openapi_plugin.openapi_response_cache import OpenApiResponseCache
 from semantic_kernel.connectors.openapi_plugin.openapi_runner import OpenApiRunner
 from semantic_kernel.exceptions.function_exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
@@ -76,6 +77,10 @@ def create_functions_from_openapi(
         http_client=execution_settings.http_client if execution_settings else None,
         enable_dynamic_payload=execution_settings.enable_dynamic_payload if execution_settings else True,
         enable_payload_namespacing=execution_settings.enable_payload_namespacing if execution_settings else False,
+        http_client_pool=execution_settings.http_client_pool if execution_settings else None,
+        response_cache=OpenApiResponseCache(execution_settings.response_cache_size)
+        if execution_settings and execution_settings.enable_response_cache
+        else None,
     )
 
     functions = []
@@ -0,0 +1,129 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+
+import httpx
+
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+
+@dataclass
+class _CachedResponse:
+    text: str
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def _parse_cache_control(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+def _to_seconds(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+@experimental
+class OpenApiResponseCache:
+    """A small cache of the responses of GET operations, that follows the caching headers of the responses.
+
+    A response is fresh for the `max-age` of its `Cache-Control` header, minus its `Age`, and is returned
+    without a request while it is fresh. A response with an `ETag` or `Last-Modified` header is kept after that,
+    or when it is sent with `no-cache`, and the next request for it is made conditional, when the server
+    answers with 304 Not Modified, the cached response is used again.
+    Responses with `no-store`, or without a `max-age` and validators, are not cached.
+    Responses are cached per url and request headers, so responses for different credentials are kept apart.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        """Create a cache that keeps at most `max_entries` responses, the least recently used ones are evicted."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, _CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        """The number of cached responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def create_key(url: str, headers: Mapping[str, str]) -> Hashable:
+        """Create the key of a request."""
+        return url, tuple(sorted((name.lower(), value) for name, value in headers.items()))
+
+    def get_fresh(self, key: Hashable) -> str | None:
+        """Get the text of the cached response, when it is still fresh."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.text
+
+    def get_validators(self, key: Hashable) -> dict[str, str]:
+        """Get the headers to make the request for a stale cached response conditional."""
+        headers: dict[str, str] = {}
+        if (entry := self._entries.get(key)) is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def process_response(self, key: Hashable, response: httpx.Response) -> str | None:
+        """Update the cache with a response, returns the cached text when the response is a 304 Not Modified."""
+        entry = self._entries.get(key)
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            entry.expires_at = self._get_expires_at(response.headers)
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return entry.text
+        self.misses += 1
+        if not response.is_success:
+            return None
+        directives = _parse_cache_control(response.headers)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if "no-store" in directives or ("max-age" not in directives and not etag and not last_modified):
+            self._entries.pop(key, None)
+            return None
+        self._entries[key] = _CachedResponse(
+            text=response.text,
+            expires_at=self._get_expires_at(response.headers, directives),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return None
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    @staticmethod
+    def _get_expires_at(headers: Mapping[str, str], directives: dict[str, str | None] | None = None) -> float:
+        if directives is None:
+            directives = _parse_cache_control(headers)
+        now = time.monotonic()
+        if "no-cache" in directives:
+            return now
+        max_age = _to_seconds(directives.get("max-age"))
+        if max_age is None:
+            return now
+        return now + max_age - (_to_seconds(headers.get("age")) or 0.0)
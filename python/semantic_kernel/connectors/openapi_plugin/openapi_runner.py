@@ -17,6 +17,8 @@ from semantic_kernel.connectors.openapi_plugin.models.rest_api_expected_response
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation import RestApiOperation
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_payload import RestApiPayload
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_run_options import RestApiRunOptions
+from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
+from semantic_kernel.connectors.openapi_plugin.openapi_response_cache import OpenApiResponseCache
 from semantic_kernel.exceptions.function_exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.utils.feature_stage_decorator import experimental
@@ -39,11 +41,20 @@ class OpenApiRunner:
         http_client: httpx.AsyncClient | None = None,
         enable_dynamic_payload: bool = True,
         enable_payload_namespacing: bool = False,
+        http_client_pool: OpenApiHttpClientPool | None = None,
+        response_cache: OpenApiResponseCache | None = None,
     ):
-        """Initialize the OpenApiRunner."""
+        """Initialize the OpenApiRunner.
+
+        When no `http_client` is supplied, the requests are made with the pooled client of the `http_client_pool`,
+        a pool is created for the runner when that is not supplied either.
+        When a `response_cache` is supplied, the responses of GET operations are cached following their headers.
+        """
         self.spec = Spec.from_dict(parsed_openapi_document)  # type: ignore
         self.auth_callback = auth_callback
         self.http_client = http_client
+        self.http_client_pool = http_client_pool
+        self.response_cache = response_cache
         self.enable_dynamic_payload = enable_dynamic_payload
         self.enable_payload_namespacing = enable_payload_namespacing
 
@@ -60,8 +71,14 @@ class OpenApiRunner:
         url = operation.build_operation_url(arguments, server_url_override, api_host_url)
         return self.build_full_url(url, operation.build_query_string(arguments))
 
-    def build_json_payload(self, payload_metadata: RestApiPayload, arguments: dict[str, Any]) -> tuple[str, str]:
-        """Build the JSON payload."""
+    def build_json_payload(
+        self, payload_metadata: RestApiPayload, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any] | str, str]:
+        """Build the JSON payload.
+
+        A dynamic payload is returned as a dictionary, which is sent as is,
+        a payload supplied by the payload argument is returned as the JSON string.
+        """
         if self.enable_dynamic_payload:
             if payload_metadata is None:
                 raise FunctionExecutionException(
@@ -69,8 +86,7 @@ class OpenApiRunner:
                 )
 
             payload = self.build_json_object(payload_metadata.properties, arguments)
-            content = json.dumps(payload)
-            return content, payload_metadata.media_type
+            return payload, payload_metadata.media_type
 
         argument = arguments.get(self.payload_argument_name)
         if not isinstance(argument, str):
@@ -100,7 +116,7 @@ class OpenApiRunner:
 
     def build_operation_payload(
         self, operation: RestApiOperation, arguments: KernelArguments
-    ) -> tuple[str, str] | tuple[None, None]:
+    ) -> tuple[dict[str, Any] | str, str] | tuple[None, None]:
         """Build the operation payload."""
         if operation.request_body is None and self.payload_argument_name not in arguments:
             return None, None
@@ -159,22 +175,36 @@ class OpenApiRunner:
             )
             headers["Content-Type"] = self._get_first_response_media_type(responses)
 
-        async def fetch():
-            async def make_request(client: httpx.AsyncClient):
-                merged_headers = client.headers.copy()
-                merged_headers.update(headers)
-                response = await client.request(
-                    method=operation.method,
-                    url=url,
-                    headers=merged_headers,
-                    json=json.loads(payload) if payload else None,
-                )
-                response.raise_for_status()
-                return response.text
-
-            if hasattr(self, "http_client") and self.http_client is not None:
-                return await make_request(self.http_client)
-            async with httpx.AsyncClient(timeout=5) as client:
-                return await make_request(client)
-
-        return await fetch()
+        # a payload supplied as a JSON string is parsed, a dynamic payload is sent as it is
+        json_payload = (json.loads(payload) if payload else None) if isinstance(payload, str) else payload
+
+        response_cache = self.response_cache if operation.method == "GET" else None
+
+        async def make_request(client: httpx.AsyncClient) -> str:
+            merged_headers = client.headers.copy()
+            merged_headers.update(headers)
+            if response_cache is not None:
+                cache_key = response_cache.create_key(url, merged_headers)
+                if (cached := response_cache.get_fresh(cache_key)) is not None:
+                    return cached
+                merged_headers.update(response_cache.get_validators(cache_key))
+            response = await client.request(
+                method=operation.method,
+                url=url,
+                headers=merged_headers,
+                json=json_payload,
+            )
+            if (
+                response_cache is not None
+                and (cached := response_cache.process_response(cache_key, response)) is not None
+            ):
+                return cached
+            response.raise_for_status()
+            return response.text
+
+        if getattr(self, "http_client", None) is not None:
+            return await make_request(self.http_client)  # type: ignore[arg-type]
+        if self.http_client_pool is None:
+            self.http_client_pool = OpenApiHttpClientPool()
+        async with self.http_client_pool.limit(url):
+            return await make_request(self.http_client_pool.client)
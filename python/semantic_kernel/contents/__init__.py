@@ -1,32 +1,69 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.contents.annotation_content import AnnotationContent
-from semantic_kernel.contents.audio_content import AudioContent
-from semantic_kernel.contents.chat_history import ChatHistory
-from semantic_kernel.contents.chat_message_content import ChatMessageContent
-from semantic_kernel.contents.file_reference_content import FileReferenceContent
-from semantic_kernel.contents.function_call_content import FunctionCallContent
-from semantic_kernel.contents.function_result_content import FunctionResultContent
-from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
-from semantic_kernel.contents.history_reducer.chat_history_summarization_reducer import ChatHistorySummarizationReducer
-from semantic_kernel.contents.history_reducer.chat_history_truncation_reducer import ChatHistoryTruncationReducer
-from semantic_kernel.contents.image_content import ImageContent
-from semantic_kernel.contents.realtime_events import (
-    RealtimeAudioEvent,
-    RealtimeEvent,
-    RealtimeEvents,
-    RealtimeFunctionCallEvent,
-    RealtimeFunctionResultEvent,
-    RealtimeImageEvent,
-    RealtimeTextEvent,
-)
-from semantic_kernel.contents.streaming_annotation_content import StreamingAnnotationContent
-from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
-from semantic_kernel.contents.streaming_file_reference_content import StreamingFileReferenceContent
-from semantic_kernel.contents.streaming_text_content import StreamingTextContent
-from semantic_kernel.contents.text_content import TextContent
-from semantic_kernel.contents.utils.author_role import AuthorRole
-from semantic_kernel.contents.utils.finish_reason import FinishReason
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.contents.annotation_content import AnnotationContent
+    from semantic_kernel.contents.audio_content import AudioContent
+    from semantic_kernel.contents.chat_history import ChatHistory
+    from semantic_kernel.contents.chat_message_content import ChatMessageContent
+    from semantic_kernel.contents.file_reference_content import FileReferenceContent
+    from semantic_kernel.contents.function_call_content import FunctionCallContent
+    from semantic_kernel.contents.function_result_content import FunctionResultContent
+    from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
+    from semantic_kernel.contents.history_reducer.chat_history_summarization_reducer import (
+        ChatHistorySummarizationReducer,
+    )
+    from semantic_kernel.contents.history_reducer.chat_history_truncation_reducer import ChatHistoryTruncationReducer
+    from semantic_kernel.contents.image_content import ImageContent
+    from semantic_kernel.contents.realtime_events import (
+        RealtimeAudioEvent,
+        RealtimeEvent,
+        RealtimeEvents,
+        RealtimeFunctionCallEvent,
+        RealtimeFunctionResultEvent,
+        RealtimeImageEvent,
+        RealtimeTextEvent,
+    )
+    from semantic_kernel.contents.streaming_annotation_content import StreamingAnnotationContent
+    from semantic_kernel.contents.streaming_chat_message_accumulator import StreamingChatMessageAccumulator
+    from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+    from semantic_kernel.contents.streaming_file_reference_content import StreamingFileReferenceContent
+    from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+    from semantic_kernel.contents.text_content import TextContent
+    from semantic_kernel.contents.utils.author_role import AuthorRole
+    from semantic_kernel.contents.utils.finish_reason import FinishReason
+
+_LAZY_ATTRIBUTES = {
+    "AnnotationContent": ".annotation_content",
+    "AudioContent": ".audio_content",
+    "ChatHistory": ".chat_history",
+    "ChatMessageContent": ".chat_message_content",
+    "FileReferenceContent": ".file_reference_content",
+    "FunctionCallContent": ".function_call_content",
+    "FunctionResultContent": ".function_result_content",
+    "ChatHistoryReducer": ".history_reducer.chat_history_reducer",
+    "ChatHistorySummarizationReducer": ".history_reducer.chat_history_summarization_reducer",
+    "ChatHistoryTruncationReducer": ".history_reducer.chat_history_truncation_reducer",
+    "ImageContent": ".image_content",
+    "RealtimeAudioEvent": ".realtime_events",
+    "RealtimeEvent": ".realtime_events",
+    "RealtimeEvents": ".realtime_events",
+    "RealtimeFunctionCallEvent": ".realtime_events",
+    "RealtimeFunctionResultEvent": ".realtime_events",
+    "RealtimeImageEvent": ".realtime_events",
+    "RealtimeTextEvent": ".realtime_events",
+    "StreamingAnnotationContent": ".streaming_annotation_content",
+    "StreamingChatMessageAccumulator": ".streaming_chat_message_accumulator",
+    "StreamingChatMessageContent": ".streaming_chat_message_content",
+    "StreamingFileReferenceContent": ".streaming_file_reference_content",
+    "StreamingTextContent": ".streaming_text_content",
+    "TextContent": ".text_content",
+    "AuthorRole": ".utils.author_role",
+    "FinishReason": ".utils.finish_reason",
+}
 
 __all__ = [
     "AnnotationContent",
@@ -50,8 +87,11 @@ __all__ = [
     "RealtimeImageEvent",
     "RealtimeTextEvent",
     "StreamingAnnotationContent",
+    "StreamingChatMessageAccumulator",
     "StreamingChatMessageContent",
     "StreamingFileReferenceContent",
     "StreamingTextContent",
     "TextContent",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
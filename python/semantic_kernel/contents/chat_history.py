@@ -1,14 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Hashable, Iterable
 from functools import singledispatchmethod
 from html import unescape
 from typing import Any, TypeVar
 from xml.etree.ElementTree import Element, tostring  # nosec
 
 from defusedxml.ElementTree import XML, ParseError
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.const import CHAT_HISTORY_TAG, CHAT_MESSAGE_CONTENT_TAG
@@ -20,6 +20,30 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T", bound="ChatHistory")
+_S = TypeVar("_S")
+
+
+def _message_snapshot(message: ChatMessageContent) -> list[Any]:
+    """The field values of a message and its items, compared by identity to detect changes."""
+    snapshot = list(message.__dict__.values())
+    for item in message.items:
+        snapshot.append(item)
+        snapshot.extend(item.__dict__.values())
+    return snapshot
+
+
+class _SerializedMessageCache:
+    """Cache of serialized messages per serializer, keyed by the id of the message.
+
+    Every entry holds the message and a snapshot of its values, so an entry is only used for the same message,
+    when none of its fields or items were replaced. A copy of a history starts with an empty cache.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[Hashable, dict[int, tuple[ChatMessageContent, list[Any], Any]]] = {}
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_SerializedMessageCache":
+        return _SerializedMessageCache()
 
 
 class ChatHistory(KernelBaseModel):
@@ -38,6 +62,7 @@ class ChatHistory(KernelBaseModel):
 
     messages: list[ChatMessageContent] = Field(default_factory=list, kw_only=False)
     system_message: str | None = Field(default=None, kw_only=False, repr=False)
+    _serialized_messages: _SerializedMessageCache = PrivateAttr(default_factory=_SerializedMessageCache)
 
     @model_validator(mode="before")
     @classmethod
@@ -224,6 +249,47 @@ class ChatHistory(KernelBaseModel):
         except ValueError:
             return False
 
+    def serialize_messages(
+        self, serializer: Callable[[ChatMessageContent], _S], key: Hashable | None = None
+    ) -> list[_S]:
+        """Serialize the messages with the serializer, reusing the results of earlier calls.
+
+        Only messages that were added, or of which a field or item was replaced since the last call
+        with the same key are serialized, this makes building a request for a growing history linear
+        in the number of new messages. Changes made in place to mutable values, such as the arguments dict
+        of a function call, are not detected; replace the value or the message instead.
+
+        The serialized messages are shared between calls, so they should not be changed.
+
+        Args:
+            serializer: The function that serializes a message.
+            key: The key of the serializer, this should identify the serializer and any settings it uses.
+                Defaults to the serializer itself.
+
+        Returns:
+            The serialized messages, in the order of the messages.
+        """
+        entries = self._serialized_messages.entries.setdefault(serializer if key is None else key, {})
+        serialized_messages: list[_S] = []
+        for message in self.messages:
+            snapshot = _message_snapshot(message)
+            entry = entries.get(id(message))
+            if (
+                entry is None
+                or entry[0] is not message
+                or len(entry[1]) != len(snapshot)
+                or not all(cached is value for cached, value in zip(entry[1], snapshot))
+            ):
+                entry = (message, snapshot, serializer(message))
+                entries[id(message)] = entry
+            serialized_messages.append(entry[2])
+        if len(entries) > len(self.messages):
+            # drop the entries of messages that were removed from the history
+            message_ids = {id(message) for message in self.messages}
+            for message_id in [message_id for message_id in entries if message_id not in message_ids]:
+                del entries[message_id]
+        return serialized_messages
+
     def __len__(self) -> int:
         """Return the number of messages in the history."""
         return len(self.messages)
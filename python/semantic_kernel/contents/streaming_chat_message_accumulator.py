@@ -0,0 +1,258 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import logging
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+from semantic_kernel.contents.function_call_content import EMPTY_VALUES, FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.exceptions import ContentAdditionException
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _merge_inner_content(inner_contents: list[Any], inner_content: Any) -> None:
+    """Extend a list of inner contents the way StreamingContentMixin._merge_inner_contents does."""
+    if isinstance(inner_content, list):
+        inner_contents.extend(inner_content)
+    elif inner_content:
+        inner_contents.append(inner_content)
+
+
+def _inner_contents_of(item: Any) -> list[Any]:
+    inner_content = item.inner_content
+    return inner_content.copy() if isinstance(inner_content, list) else [inner_content]
+
+
+class _TextBuffer:
+    """Collects the text of StreamingTextContent fragments, the text is joined once when built."""
+
+    __slots__ = ("first", "fragments", "inner_contents")
+
+    def __init__(self, first: StreamingTextContent) -> None:
+        self.first = first
+        self.fragments: list[str] = [first.text or ""]
+        self.inner_contents: list[Any] | None = None
+
+    def add(self, other: Any) -> bool:
+        first = self.first
+        if (
+            type(other) is not StreamingTextContent
+            or first.choice_index != other.choice_index
+            or first.ai_model_id != other.ai_model_id
+            or first.encoding != other.encoding
+        ):
+            return False
+        if self.inner_contents is None:
+            self.inner_contents = _inner_contents_of(first)
+        _merge_inner_content(self.inner_contents, other.inner_content)
+        self.fragments.append(other.text or "")
+        return True
+
+    def build(self) -> StreamingTextContent:
+        first = self.first
+        if self.inner_contents is None:
+            return first
+        return StreamingTextContent(
+            choice_index=first.choice_index,
+            inner_content=self.inner_contents,
+            ai_model_id=first.ai_model_id,
+            metadata=first.metadata,
+            text="".join(self.fragments),
+            encoding=first.encoding,
+        )
+
+
+class _FunctionCallBuffer:
+    """Collects the fragments of a streamed FunctionCallContent, the arguments are joined once when built."""
+
+    __slots__ = ("call_id", "first", "fragments", "id", "index", "mapping_arguments", "merged", "metadata", "name")
+
+    def __init__(self, first: FunctionCallContent) -> None:
+        self.first = first
+        self.id = first.id
+        self.call_id = first.call_id
+        self.index = first.index
+        self.name = first.name
+        self.metadata = first.metadata
+        self.merged = False
+        self.mapping_arguments: dict[str, Any] | None = (
+            dict(first.arguments) if isinstance(first.arguments, Mapping) else None
+        )
+        self.fragments: list[str] = (
+            [] if self.mapping_arguments is not None or first.arguments in EMPTY_VALUES else [first.arguments]  # type: ignore[list-item]
+        )
+
+    def add(self, other: Any) -> bool:
+        if type(other) is not FunctionCallContent:
+            return False
+        if self.id and other.id and self.id != other.id:
+            return False
+        if self.index != other.index:
+            return False
+        if self.call_id and other.call_id and self.call_id != other.call_id:
+            return False
+        # FunctionCallContent.combine_arguments refuses to combine a mapping with anything else
+        if (self.mapping_arguments is not None) != isinstance(other.arguments, Mapping):
+            return False
+        if self.mapping_arguments is not None:
+            self.mapping_arguments.update(other.arguments)  # type: ignore[arg-type]
+        elif other.arguments not in EMPTY_VALUES:
+            self.fragments.append(other.arguments)  # type: ignore[arg-type]
+        self.id = self.id or other.id
+        self.call_id = self.call_id or other.call_id
+        self.index = self.index or other.index
+        self.name = self.name or other.name
+        self.metadata = self.metadata | other.metadata
+        self.merged = True
+        return True
+
+    def build(self) -> FunctionCallContent:
+        if not self.merged:
+            return self.first
+        return FunctionCallContent(
+            id=self.id,
+            call_id=self.call_id,
+            index=self.index,
+            name=self.name,
+            arguments=self.mapping_arguments if self.mapping_arguments is not None else "".join(self.fragments) or "{}",
+            metadata=self.metadata,
+        )
+
+
+class _ItemBuffer:
+    """Holds any other item, these are combined with their own `__add__` method, when they have one."""
+
+    __slots__ = ("item",)
+
+    def __init__(self, item: Any) -> None:
+        self.item = item
+
+    def add(self, other: Any) -> bool:
+        if type(self.item) is not type(other) or not hasattr(self.item, "__add__"):
+            return False
+        try:
+            self.item = self.item + other
+        except (ValueError, ContentAdditionException) as ex:
+            logger.debug(f"Could not add item {other} to {self.item}.", exc_info=ex)
+            return False
+        return True
+
+    def build(self) -> Any:
+        return self.item
+
+
+def _create_buffer(item: Any) -> _TextBuffer | _FunctionCallBuffer | _ItemBuffer:
+    if type(item) is StreamingTextContent:
+        return _TextBuffer(item)
+    if type(item) is FunctionCallContent:
+        return _FunctionCallBuffer(item)
+    return _ItemBuffer(item)
+
+
+@experimental
+class StreamingChatMessageAccumulator:
+    """Accumulates streamed chat message chunks into a single message.
+
+    Combining chunks with `StreamingChatMessageContent.__add__` creates and validates a new message,
+    and new items, for every chunk, which makes accumulating a long stream quadratic.
+    The accumulator instead appends the text of the chunks to a buffer and combines the argument
+    fragments of function calls in place, matched by their id and index, and creates the final
+    message only once, when `build` is called. The result is the same as adding up the chunks.
+
+    Example:
+        accumulator = StreamingChatMessageAccumulator()
+        async for chunks in service.get_streaming_chat_message_contents(chat_history, settings):
+            accumulator.add(chunks[0])
+        message = accumulator.build()
+    """
+
+    __slots__ = ("_buffers", "_chunks", "_finish_reason", "_first", "_inner_contents", "_metadata", "_name")
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self._first: StreamingChatMessageContent | None = None
+        self._chunks = 0
+        self._buffers: list[_TextBuffer | _FunctionCallBuffer | _ItemBuffer] = []
+        self._inner_contents: list[Any] = []
+        self._metadata: dict[str, Any] = {}
+        self._name: str | None = None
+        self._finish_reason: Any = None
+
+    def __len__(self) -> int:
+        """The number of chunks that were added."""
+        return self._chunks
+
+    def __iadd__(self, other: StreamingChatMessageContent) -> Self:
+        """Add a chunk, so that `accumulator += chunk` can replace `message += chunk`."""
+        self.add(other)
+        return self
+
+    def add(self, chunk: StreamingChatMessageContent) -> None:
+        """Add a streamed chunk to the accumulated message.
+
+        Args:
+            chunk: The chunk to add.
+
+        Raises:
+            ContentAdditionException: When the chunk can not be added to the previous chunks,
+                for the same reasons as `StreamingChatMessageContent.__add__`.
+        """
+        if not isinstance(chunk, StreamingChatMessageContent):
+            raise ContentAdditionException(
+                f"Cannot add other type to StreamingChatMessageAccumulator, type supplied: {type(chunk)}"
+            )
+        first = self._first
+        if first is None:
+            self._first = chunk
+            self._inner_contents = _inner_contents_of(chunk)
+            self._metadata = dict(chunk.metadata)
+            self._name = chunk.name
+            self._finish_reason = chunk.finish_reason
+            # the items of the first chunk are kept as they are, like the left side of `__add__`
+            self._buffers = [_create_buffer(item) for item in chunk.items]
+        else:
+            if first.choice_index != chunk.choice_index:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different choice_index")
+            if first.ai_model_id != chunk.ai_model_id:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent from different ai_model_id")
+            if first.encoding != chunk.encoding:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different encoding")
+            if first.role and chunk.role and first.role != chunk.role:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different role")
+            _merge_inner_content(self._inner_contents, chunk.inner_content)
+            self._metadata.update(chunk.metadata)
+            self._name = self._name or chunk.name
+            self._finish_reason = self._finish_reason or chunk.finish_reason
+            for item in chunk.items:
+                if not any(buffer.add(item) for buffer in self._buffers):
+                    self._buffers.append(_create_buffer(item))
+        self._chunks += 1
+
+    def build(self) -> StreamingChatMessageContent | None:
+        """Create the accumulated message, or None when no chunks were added."""
+        first = self._first
+        if first is None:
+            return None
+        if self._chunks == 1:
+            return first
+        return StreamingChatMessageContent(
+            role=first.role,
+            items=[buffer.build() for buffer in self._buffers],
+            choice_index=first.choice_index,
+            inner_content=self._inner_contents,
+            ai_model_id=first.ai_model_id,
+            metadata=self._metadata,
+            encoding=first.encoding,
+            finish_reason=self._finish_reason,
+            function_invoke_attempt=first.function_invoke_attempt,
+            name=self._name,
+        )
@@ -1,17 +1,33 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.core_plugins.conversation_summary_plugin import (
-    ConversationSummaryPlugin,
-)
-from semantic_kernel.core_plugins.http_plugin import HttpPlugin
-from semantic_kernel.core_plugins.math_plugin import MathPlugin
-from semantic_kernel.core_plugins.sessions_python_tool.sessions_python_plugin import (
-    SessionsPythonTool,
-)
-from semantic_kernel.core_plugins.text_memory_plugin import TextMemoryPlugin
-from semantic_kernel.core_plugins.text_plugin import TextPlugin
-from semantic_kernel.core_plugins.time_plugin import TimePlugin
-from semantic_kernel.core_plugins.web_search_engine_plugin import WebSearchEnginePlugin
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.core_plugins.conversation_summary_plugin import (
+        ConversationSummaryPlugin,
+    )
+    from semantic_kernel.core_plugins.http_plugin import HttpPlugin
+    from semantic_kernel.core_plugins.math_plugin import MathPlugin
+    from semantic_kernel.core_plugins.sessions_python_tool.sessions_python_plugin import (
+        SessionsPythonTool,
+    )
+    from semantic_kernel.core_plugins.text_memory_plugin import TextMemoryPlugin
+    from semantic_kernel.core_plugins.text_plugin import TextPlugin
+    from semantic_kernel.core_plugins.time_plugin import TimePlugin
+    from semantic_kernel.core_plugins.web_search_engine_plugin import WebSearchEnginePlugin
+
+_LAZY_ATTRIBUTES = {
+    "ConversationSummaryPlugin": ".conversation_summary_plugin",
+    "HttpPlugin": ".http_plugin",
+    "MathPlugin": ".math_plugin",
+    "SessionsPythonTool": ".sessions_python_tool.sessions_python_plugin",
+    "TextMemoryPlugin": ".text_memory_plugin",
+    "TextPlugin": ".text_plugin",
+    "TimePlugin": ".time_plugin",
+    "WebSearchEnginePlugin": ".web_search_engine_plugin",
+}
 
 __all__ = [
     "ConversationSummaryPlugin",
@@ -23,3 +39,5 @@ __all__ = [
     "TimePlugin",
     "WebSearchEnginePlugin",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -1,45 +1,84 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from typing import TYPE_CHECKING
 
-from semantic_kernel.data.const import (
-    DEFAULT_DESCRIPTION,
-    DEFAULT_FUNCTION_NAME,
-    DISTANCE_FUNCTION_DIRECTION_HELPER,
-    DistanceFunction,
-    IndexKind,
-)
-from semantic_kernel.data.record_definition import (
-    VectorStoreRecordDataField,
-    VectorStoreRecordDefinition,
-    VectorStoreRecordKeyField,
-    VectorStoreRecordVectorField,
-    vectorstoremodel,
-)
-from semantic_kernel.data.text_search import (
-    AnyTagsEqualTo,
-    EqualTo,
-    KernelSearchResults,
-    OptionsUpdateFunctionType,
-    SearchFilter,
-    SearchOptions,
-    TextSearch,
-    TextSearchOptions,
-    TextSearchResult,
-    create_options,
-    default_options_update_function,
-)
-from semantic_kernel.data.vector_search import (
-    VectorizableTextSearchMixin,
-    VectorizedSearchMixin,
-    VectorSearchBase,
-    VectorSearchFilter,
-    VectorSearchOptions,
-    VectorSearchResult,
-    VectorTextSearchMixin,
-    add_vector_to_records,
-)
-from semantic_kernel.data.vector_storage import VectorStore, VectorStoreRecordCollection
-from semantic_kernel.data.vector_store_text_search import VectorStoreTextSearch
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.data.const import (
+        DEFAULT_DESCRIPTION,
+        DEFAULT_FUNCTION_NAME,
+        DISTANCE_FUNCTION_DIRECTION_HELPER,
+        DistanceFunction,
+        IndexKind,
+    )
+    from semantic_kernel.data.record_definition import (
+        VectorStoreRecordDataField,
+        VectorStoreRecordDefinition,
+        VectorStoreRecordKeyField,
+        VectorStoreRecordVectorField,
+        vectorstoremodel,
+    )
+    from semantic_kernel.data.text_search import (
+        AnyTagsEqualTo,
+        EqualTo,
+        KernelSearchResults,
+        OptionsUpdateFunctionType,
+        SearchFilter,
+        SearchOptions,
+        TextSearch,
+        TextSearchOptions,
+        TextSearchResult,
+        create_options,
+        default_options_update_function,
+    )
+    from semantic_kernel.data.vector_search import (
+        VectorizableTextSearchMixin,
+        VectorizedSearchMixin,
+        VectorSearchBase,
+        VectorSearchFilter,
+        VectorSearchOptions,
+        VectorSearchResult,
+        VectorTextSearchMixin,
+        add_vector_to_records,
+    )
+    from semantic_kernel.data.vector_storage import VectorStore, VectorStoreRecordCollection
+    from semantic_kernel.data.vector_store_text_search import VectorStoreTextSearch
+
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_DESCRIPTION": ".const",
+    "DEFAULT_FUNCTION_NAME": ".const",
+    "DISTANCE_FUNCTION_DIRECTION_HELPER": ".const",
+    "DistanceFunction": ".const",
+    "IndexKind": ".const",
+    "VectorStoreRecordDataField": ".record_definition",
+    "VectorStoreRecordDefinition": ".record_definition",
+    "VectorStoreRecordKeyField": ".record_definition",
+    "VectorStoreRecordVectorField": ".record_definition",
+    "vectorstoremodel": ".record_definition",
+    "AnyTagsEqualTo": ".text_search",
+    "EqualTo": ".text_search",
+    "KernelSearchResults": ".text_search",
+    "OptionsUpdateFunctionType": ".text_search",
+    "SearchFilter": ".text_search",
+    "SearchOptions": ".text_search",
+    "TextSearch": ".text_search",
+    "TextSearchOptions": ".text_search",
+    "TextSearchResult": ".text_search",
+    "create_options": ".text_search",
+    "default_options_update_function": ".text_search",
+    "VectorizableTextSearchMixin": ".vector_search",
+    "VectorizedSearchMixin": ".vector_search",
+    "VectorSearchBase": ".vector_search",
+    "VectorSearchFilter": ".vector_search",
+    "VectorSearchOptions": ".vector_search",
+    "VectorSearchResult": ".vector_search",
+    "VectorTextSearchMixin": ".vector_search",
+    "add_vector_to_records": ".vector_search",
+    "VectorStore": ".vector_storage",
+    "VectorStoreRecordCollection": ".vector_storage",
+    "VectorStoreTextSearch": ".vector_store_text_search",
+}
 
 __all__ = [
     "DEFAULT_DESCRIPTION",
@@ -75,3 +114,5 @@ __all__ = [
     "default_options_update_function",
     "vectorstoremodel",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
 from abc import abstractmethod
@@ -160,6 +161,30 @@ class VectorSearchBase(VectorStoreRecordHandler[TKey, TModel], Generic[TKey, TMo
         """
         ...
 
+    async def _inner_search_batch(
+        self,
+        options: VectorSearchOptions,
+        vectors: Sequence[list[float | int]],
+        **kwargs: Any,
+    ) -> Sequence[KernelSearchResults[VectorSearchResult[TModel]]]:
+        """Inner search method for multiple vectors.
+
+        The default implementation runs a search per vector concurrently,
+        stores that can search multiple vectors in one request or pass should override this method.
+
+        Args:
+            options: The search options, used for all vectors.
+            vectors: The vectors to search for.
+            **kwargs: Additional arguments that might be needed.
+
+        Returns:
+            The search results for each of the vectors, in the same order.
+
+        """
+        return await asyncio.gather(*[
+            self._inner_search(options=options, vector=vector, **kwargs) for vector in vectors
+        ])
+
     @abstractmethod
     def _get_record_from_result(self, result: Any) -> Any:
         """Get the record from the returned search result.
@@ -246,6 +271,41 @@ class VectorizedSearchMixin(VectorSearchBase[TKey, TModel], Generic[TKey, TModel
         except Exception as exc:
             raise VectorSearchExecutionException(f"An error occurred during the search: {exc}") from exc
 
+    async def vectorized_search_batch(
+        self,
+        vectors: Sequence[list[float | int]],
+        options: "SearchOptions | None" = None,
+        **kwargs: Any,
+    ) -> "Sequence[KernelSearchResults[VectorSearchResult[TModel]]]":
+        """Search the vector store with multiple vectors (embeddings) using the same options and filter.
+
+        Stores that support it search all vectors in a single request or pass,
+        the others run the searches concurrently.
+
+        Args:
+            vectors: The vectors to search for.
+            options: options, used for each of the vectors.
+            **kwargs: if options are not set, this is used to create them.
+
+        Returns:
+            The search results for each of the vectors, in the same order as the vectors.
+
+        Raises:
+            VectorSearchExecutionException: If an error occurs during the search.
+            VectorStoreModelDeserializationException: If an error occurs during deserialization.
+            VectorSearchOptionsException: If the search options are invalid.
+
+        """
+        options = create_options(self.options_class, options, **kwargs)
+        if not vectors:
+            return []
+        try:
+            return await self._inner_search_batch(vectors=vectors, options=options)  # type: ignore
+        except (VectorStoreModelDeserializationException, VectorSearchOptionsException, VectorSearchExecutionException):
+            raise  # pragma: no cover
+        except Exception as exc:
+            raise VectorSearchExecutionException(f"An error occurred during the search: {exc}") from exc
+
     def create_text_search_from_vectorized_search(
         self,
         embedding_service: EmbeddingGeneratorBase,
@@ -415,7 +475,7 @@ async def add_vector_to_records(
 
     If so adds that to a list of embeddings to make.
 
-    Finally calls Kernel add_embedding_to_object with the list of embeddings to make.
+    Finally calls Kernel add_embedding_to_object for each of the embeddings to make, concurrently.
 
     Optional arguments are passed onto the Kernel add_embedding_to_object call.
     """
@@ -445,8 +505,9 @@ async def add_vector_to_records(
                 embedding_field.deserialize_function,
             ))
 
-    for field_to_embed, field_to_store, settings, cast_callable in embeddings_to_make:
-        await kernel.add_embedding_to_object(
+    # the fields are embedded concurrently, each of them stores its vectors in a different field
+    await asyncio.gather(*[
+        kernel.add_embedding_to_object(
             inputs=records,
             field_to_embed=field_to_embed,
             field_to_store=field_to_store,
@@ -455,6 +516,8 @@ async def add_vector_to_records(
             cast_function=cast_callable,
             **kwargs,
         )
+        for field_to_embed, field_to_store, settings, cast_callable in embeddings_to_make
+    ])
     return records
 
     # endregion
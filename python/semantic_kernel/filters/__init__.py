@@ -1,11 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
-    AutoFunctionInvocationContext,
-)
-from semantic_kernel.filters.filter_types import FilterTypes
-from semantic_kernel.filters.functions.function_invocation_context import FunctionInvocationContext
-from semantic_kernel.filters.prompts.prompt_render_context import PromptRenderContext
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
+        AutoFunctionInvocationContext,
+    )
+    from semantic_kernel.filters.filter_types import FilterTypes
+    from semantic_kernel.filters.functions.function_invocation_context import FunctionInvocationContext
+    from semantic_kernel.filters.prompts.prompt_render_context import PromptRenderContext
+
+_LAZY_ATTRIBUTES = {
+    "AutoFunctionInvocationContext": ".auto_function_invocation.auto_function_invocation_context",
+    "FilterTypes": ".filter_types",
+    "FunctionInvocationContext": ".functions.function_invocation_context",
+    "PromptRenderContext": ".prompts.prompt_render_context",
+}
 
 __all__ = [
     "AutoFunctionInvocationContext",
@@ -13,3 +25,5 @@ __all__ = [
     "FunctionInvocationContext",
     "PromptRenderContext",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
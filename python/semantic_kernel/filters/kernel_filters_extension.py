@@ -2,7 +2,7 @@
 
 from abc import ABC
 from collections.abc import Awaitable, Callable, Coroutine
-from functools import partial
+from functools import cache, partial
 from typing import Any, Literal, TypeVar
 
 from pydantic import Field
@@ -118,6 +118,7 @@ class KernelFilterExtension(KernelBaseModel, ABC):
         return stack[0]
 
 
+@cache
 def _rebuild_auto_function_invocation_context() -> None:
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings  # noqa: F401
     from semantic_kernel.contents.chat_history import ChatHistory  # noqa: F401
@@ -132,6 +133,7 @@ def _rebuild_auto_function_invocation_context() -> None:
     AutoFunctionInvocationContext.model_rebuild()
 
 
+@cache
 def _rebuild_function_invocation_context() -> None:
     from semantic_kernel.filters.functions.function_invocation_context import FunctionInvocationContext
     from semantic_kernel.functions.function_result import FunctionResult  # noqa: F401
@@ -142,6 +144,7 @@ def _rebuild_function_invocation_context() -> None:
     FunctionInvocationContext.model_rebuild()
 
 
+@cache
 def _rebuild_prompt_render_context() -> None:
     from semantic_kernel.filters.prompts.prompt_render_context import PromptRenderContext
     from semantic_kernel.functions.function_result import FunctionResult  # noqa: F401
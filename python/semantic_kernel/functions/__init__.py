@@ -1,16 +1,36 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.functions.function_result import FunctionResult
-from semantic_kernel.functions.kernel_arguments import KernelArguments
+from typing import TYPE_CHECKING
+
+# The kernel_function module is imported before the decorator of the same name,
+# otherwise importing the module later replaces the decorator on the package.
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
-from semantic_kernel.functions.kernel_function_from_method import KernelFunctionFromMethod
-from semantic_kernel.functions.kernel_function_from_prompt import KernelFunctionFromPrompt
-from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
-from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
-from semantic_kernel.functions.kernel_plugin import KernelPlugin
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.functions.function_call_scheduler import FunctionCallScheduler
+    from semantic_kernel.functions.function_result import FunctionResult
+    from semantic_kernel.functions.kernel_arguments import KernelArguments
+    from semantic_kernel.functions.kernel_function_from_method import KernelFunctionFromMethod
+    from semantic_kernel.functions.kernel_function_from_prompt import KernelFunctionFromPrompt
+    from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
+    from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
+    from semantic_kernel.functions.kernel_plugin import KernelPlugin
+
+_LAZY_ATTRIBUTES = {
+    "FunctionCallScheduler": ".function_call_scheduler",
+    "FunctionResult": ".function_result",
+    "KernelArguments": ".kernel_arguments",
+    "KernelFunctionFromMethod": ".kernel_function_from_method",
+    "KernelFunctionFromPrompt": ".kernel_function_from_prompt",
+    "KernelFunctionMetadata": ".kernel_function_metadata",
+    "KernelParameterMetadata": ".kernel_parameter_metadata",
+    "KernelPlugin": ".kernel_plugin",
+}
 
 __all__ = [
+    "FunctionCallScheduler",
     "FunctionResult",
     "KernelArguments",
     "KernelFunction",
@@ -21,3 +41,5 @@ __all__ = [
     "KernelPlugin",
     "kernel_function",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,202 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import Executor
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+if TYPE_CHECKING:
+    from semantic_kernel.contents.chat_history import ChatHistory
+    from semantic_kernel.contents.function_call_content import FunctionCallContent
+    from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
+        AutoFunctionInvocationContext,
+    )
+    from semantic_kernel.kernel import Kernel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FUNCTION_CALL_TIMEOUT_ERROR = "timeout"
+
+
+@experimental
+class FunctionCallScheduler(KernelBaseModel):
+    """Schedules the function calls that are automatically invoked for a response of a chat completion service.
+
+    The function calls of a response run concurrently, limited by `max_concurrency` for all calls
+    and by `max_concurrency_per_plugin`, or the limit of the plugin in `plugin_concurrency`, per plugin.
+    The limits are shared by all requests that use the kernel, calls that wait for a plugin do not take
+    a slot of `max_concurrency`, and waiting calls are started in the order of the function calls,
+    so a plugin with a limit of 1 runs its calls one by one, in the order the model requested them.
+
+    A call that takes longer than its timeout is cancelled, and its result is an error message for the model,
+    with the error in the metadata of the result, so that the other calls of the response are not held up.
+
+    The results are added to the chat history in the order of the function calls, regardless of the order
+    in which the calls finish.
+
+    Synchronous functions created with `@kernel_function(run_in_executor=True)` run in `executor`,
+    or in the default thread pool of the event loop when no executor is set. A process pool executor
+    can be used for functions that are defined at module level and have picklable arguments.
+
+    Args:
+        max_concurrency: The maximum number of function calls that run at the same time, no limit when None.
+        max_concurrency_per_plugin: The maximum number of calls to functions of the same plugin that run
+            at the same time, no limit when None.
+        plugin_concurrency: The maximum number of concurrent calls of specific plugins, by plugin name,
+            these take precedence over `max_concurrency_per_plugin`.
+        timeout: The timeout of a function call in seconds, no timeout when None.
+        function_timeouts: The timeouts of specific functions, by fully qualified function name,
+            these take precedence over `timeout`.
+        executor: The executor for the functions that opted in with `run_in_executor`.
+    """
+
+    max_concurrency: int | None = Field(default=None, gt=0)
+    max_concurrency_per_plugin: int | None = Field(default=None, gt=0)
+    plugin_concurrency: dict[str, int] = Field(default_factory=dict)
+    timeout: float | None = Field(default=None, gt=0)
+    function_timeouts: dict[str, float] = Field(default_factory=dict)
+    executor: Executor | None = Field(default=None, exclude=True)
+
+    _loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _semaphore: asyncio.Semaphore | None = PrivateAttr(default=None)
+    _plugin_semaphores: dict[str, asyncio.Semaphore] = PrivateAttr(default_factory=dict)
+
+    def get_timeout(self, function_name: str | None) -> float | None:
+        """Get the timeout of a function, by fully qualified name."""
+        if function_name is not None and function_name in self.function_timeouts:
+            return self.function_timeouts[function_name]
+        return self.timeout
+
+    def get_plugin_concurrency(self, plugin_name: str | None) -> int | None:
+        """Get the maximum number of concurrent calls of a plugin."""
+        if plugin_name is not None and plugin_name in self.plugin_concurrency:
+            return self.plugin_concurrency[plugin_name]
+        return self.max_concurrency_per_plugin
+
+    async def invoke_function_calls(
+        self,
+        kernel: "Kernel",
+        function_calls: Sequence["FunctionCallContent"],
+        chat_history: "ChatHistory",
+        **kwargs: Any,
+    ) -> list["AutoFunctionInvocationContext | None"]:
+        """Invoke the function calls and add their results to the chat history, in the order of the calls.
+
+        Args:
+            kernel: The kernel that invokes the function calls.
+            function_calls: The function calls of a response.
+            chat_history: The chat history, the results of the calls are added to it.
+            **kwargs: The arguments for `Kernel.invoke_function_call`.
+
+        Returns:
+            The invocation context of every call, when the call requested to terminate, None otherwise.
+        """
+        if len(function_calls) == 1:
+            return [await self._invoke_function_call(kernel, function_calls[0], chat_history, **kwargs)]
+
+        # The calls share the history, so the changes of filters to it are kept, and add their results
+        # in the order in which they finish; the results are put in the order of the calls afterwards.
+        existing = {id(message) for message in chat_history.messages}
+        results = await asyncio.gather(*[
+            self._invoke_function_call(kernel, function_call, chat_history, **kwargs)
+            for function_call in function_calls
+        ])
+        self._order_results(function_calls, chat_history, existing)
+        return list(results)
+
+    @staticmethod
+    def _order_results(
+        function_calls: Sequence["FunctionCallContent"], chat_history: "ChatHistory", existing: set[int]
+    ) -> None:
+        """Put the result messages that were added to the history in the order of the function calls.
+
+        The result messages are only swapped with each other, all other messages keep their place.
+
+        Args:
+            function_calls: The function calls of a response.
+            chat_history: The chat history that the results were added to.
+            existing: The ids of the messages that were in the history before the calls.
+        """
+        call_index: dict[str, int] = {}
+        for index, function_call in enumerate(function_calls):
+            call_index.setdefault(function_call.id or "unknown", index)
+        positions: list[int] = []
+        keys: list[int] = []
+        for position, message in enumerate(chat_history.messages):
+            if id(message) in existing:
+                continue
+            key = next(
+                (
+                    call_index[item.id]
+                    for item in message.items
+                    if isinstance(item, FunctionResultContent) and item.id in call_index
+                ),
+                None,
+            )
+            if key is not None:
+                positions.append(position)
+                keys.append(key)
+        ordered = [chat_history.messages[positions[i]] for i in sorted(range(len(positions)), key=keys.__getitem__)]
+        for position, message in zip(positions, ordered):
+            chat_history.messages[position] = message
+
+    async def _invoke_function_call(
+        self,
+        kernel: "Kernel",
+        function_call: "FunctionCallContent",
+        chat_history: "ChatHistory",
+        **kwargs: Any,
+    ) -> "AutoFunctionInvocationContext | None":
+        async with self._limit(function_call.plugin_name):
+            timeout = self.get_timeout(function_call.name)
+            try:
+                return await asyncio.wait_for(
+                    kernel.invoke_function_call(function_call=function_call, chat_history=chat_history, **kwargs),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"The function call `{function_call.name}` timed out after {timeout} seconds.")
+                frc = FunctionResultContent.from_function_call_content_and_result(
+                    function_call_content=function_call,
+                    result=f"The tool call `{function_call.name}` did not complete within {timeout} seconds.",
+                    metadata={"error": FUNCTION_CALL_TIMEOUT_ERROR, "timeout": timeout},
+                )
+                chat_history.add_message(
+                    frc.to_streaming_chat_message_content()
+                    if kwargs.get("is_streaming")
+                    else frc.to_chat_message_content()
+                )
+                return None
+
+    @asynccontextmanager
+    async def _limit(self, plugin_name: str | None) -> AsyncIterator[None]:
+        """Wait until a call to a function of the plugin is allowed by the limits."""
+        self._check_event_loop()
+        async with AsyncExitStack() as stack:
+            # the plugin limit is awaited first, so calls waiting for their plugin do not hold a global slot
+            if (plugin_limit := self.get_plugin_concurrency(plugin_name)) is not None:
+                key = plugin_name or ""
+                if (semaphore := self._plugin_semaphores.get(key)) is None:
+                    semaphore = self._plugin_semaphores[key] = asyncio.Semaphore(plugin_limit)
+                await stack.enter_async_context(semaphore)
+            if self.max_concurrency is not None:
+                if self._semaphore is None:
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                await stack.enter_async_context(self._semaphore)
+            yield
+
+    def _check_event_loop(self) -> None:
+        """Drop the semaphores when they were created in another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = None
+            self._plugin_semaphores = {}
+            self._loop = loop
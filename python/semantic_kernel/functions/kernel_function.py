@@ -1,12 +1,13 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import importlib
 import logging
 import time
 from abc import abstractmethod
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Iterator, Mapping, Sequence
 from copy import copy, deepcopy
 from inspect import isasyncgen, isgenerator
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from opentelemetry import metrics, trace
 from opentelemetry.semconv.attributes.error_attributes import ERROR_TYPE
@@ -27,9 +28,6 @@ from semantic_kernel.prompt_template.const import (
     KERNEL_TEMPLATE_FORMAT_NAME,
     TEMPLATE_FORMAT_TYPES,
 )
-from semantic_kernel.prompt_template.handlebars_prompt_template import HandlebarsPromptTemplate
-from semantic_kernel.prompt_template.jinja2_prompt_template import Jinja2PromptTemplate
-from semantic_kernel.prompt_template.kernel_prompt_template import KernelPromptTemplate
 from semantic_kernel.prompt_template.prompt_template_base import PromptTemplateBase
 
 if TYPE_CHECKING:
@@ -46,11 +44,35 @@ tracer: trace.Tracer = trace.get_tracer(__name__)
 meter: metrics.Meter = metrics.get_meter_provider().get_meter(__name__)
 MEASUREMENT_FUNCTION_TAG_NAME: str = "semantic_kernel.function.name"
 
-TEMPLATE_FORMAT_MAP: dict[TEMPLATE_FORMAT_TYPES, type[PromptTemplateBase]] = {
-    KERNEL_TEMPLATE_FORMAT_NAME: KernelPromptTemplate,
-    HANDLEBARS_TEMPLATE_FORMAT_NAME: HandlebarsPromptTemplate,
-    JINJA2_TEMPLATE_FORMAT_NAME: Jinja2PromptTemplate,
-}
+
+class _TemplateFormatMap(Mapping[TEMPLATE_FORMAT_TYPES, type[PromptTemplateBase]]):
+    """The prompt template classes by template format.
+
+    The classes are imported when they are first looked up, so the template engines,
+    like pybars for handlebars, are only imported when a prompt uses them.
+    """
+
+    _classes: ClassVar[dict[str, tuple[str, str]]] = {
+        KERNEL_TEMPLATE_FORMAT_NAME: ("semantic_kernel.prompt_template.kernel_prompt_template", "KernelPromptTemplate"),
+        HANDLEBARS_TEMPLATE_FORMAT_NAME: (
+            "semantic_kernel.prompt_template.handlebars_prompt_template",
+            "HandlebarsPromptTemplate",
+        ),
+        JINJA2_TEMPLATE_FORMAT_NAME: ("semantic_kernel.prompt_template.jinja2_prompt_template", "Jinja2PromptTemplate"),
+    }
+
+    def __getitem__(self, template_format: TEMPLATE_FORMAT_TYPES) -> type[PromptTemplateBase]:
+        module, name = self._classes[template_format]
+        return getattr(importlib.import_module(module), name)
+
+    def __iter__(self) -> Iterator[TEMPLATE_FORMAT_TYPES]:
+        return iter(self._classes)  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+TEMPLATE_FORMAT_MAP: Mapping[TEMPLATE_FORMAT_TYPES, type[PromptTemplateBase]] = _TemplateFormatMap()
 
 
 def _create_function_duration_histogram():
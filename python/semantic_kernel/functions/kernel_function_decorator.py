@@ -14,6 +14,7 @@ def kernel_function(
     func: Callable[..., object] | None = None,
     name: str | None = None,
     description: str | None = None,
+    run_in_executor: bool = False,
 ) -> Callable[..., Any]:
     """Decorator for kernel functions.
 
@@ -48,11 +49,17 @@ def kernel_function(
     It also checks if the function is a streaming type (generator or iterable, async or not),
     and that is stored as a bool in __kernel_function_streaming__.
 
+    Whether a synchronous function should run in an executor, when it is invoked, is stored in
+    __kernel_function_run_in_executor__.
+
     Args:
         func (Callable[..., object] | None): The function to decorate, can be None (if used as @kernel_function
         name (str | None): The name of the function, if not supplied, the function name will be used.
         description (str | None): The description of the function,
             if not supplied, the function docstring will be used, can be None.
+        run_in_executor (bool): Run a synchronous function in the executor of the `function_call_scheduler`
+            of the kernel, or the default executor of the event loop, so a CPU-bound or blocking function
+            does not block the other function calls, default is False.
 
     """
 
@@ -62,6 +69,7 @@ def kernel_function(
         setattr(func, "__kernel_function_description__", description or func.__doc__)
         setattr(func, "__kernel_function_name__", name or getattr(func, "__name__", "unknown"))
         setattr(func, "__kernel_function_streaming__", isasyncgenfunction(func) or isgeneratorfunction(func))
+        setattr(func, "__kernel_function_run_in_executor__", run_in_executor)
         logger.debug(f"Parsing decorator for function: {getattr(func, '__kernel_function_name__')}")
         func_sig = signature(func, eval_str=True)
 
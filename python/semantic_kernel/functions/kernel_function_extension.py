@@ -2,11 +2,11 @@
 
 import logging
 from abc import ABC
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Hashable, Mapping, Sequence
 from functools import singledispatchmethod
-from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, runtime_checkable
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.exceptions import KernelFunctionNotFoundError, KernelPluginNotFoundError
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from semantic_kernel.connectors.openapi_plugin.openapi_function_execution_parameters import (
         OpenAPIFunctionExecutionParameters,
     )
+    from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
     from semantic_kernel.functions.kernel_function import KernelFunction
     from semantic_kernel.functions.types import KERNEL_FUNCTION_TYPE
     from semantic_kernel.kernel import Kernel
@@ -28,6 +29,13 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def function_filters_cache_key(filters: Mapping[Any, Any]) -> Hashable:
+    """A hashable key for function filters, the values can be lists of names or a single name."""
+    return tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items()))
+
 
 @runtime_checkable
 class AddToKernelCallbackProtocol(Protocol):
@@ -46,6 +54,59 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
     """Kernel function extension."""
 
     plugins: dict[str, KernelPlugin] = Field(default_factory=dict)
+    _function_data_cache: dict[Hashable, Any] = PrivateAttr(default_factory=dict)
+    _function_data_cache_version: tuple[tuple[str, int], ...] | None = PrivateAttr(default=None)
+    _function_data_cache_hits: int = PrivateAttr(default=0)
+    _function_data_cache_misses: int = PrivateAttr(default=0)
+    # an OpenApiHttpClientPool, typed as Any so the type hints of the kernel resolve without importing httpx
+    _openapi_http_client_pool: Any = PrivateAttr(default=None)
+
+    @property
+    def plugins_version(self) -> tuple[tuple[str, int], ...]:
+        """The version of the set of plugins, this changes when plugins or functions are added, replaced or removed.
+
+        Can be used to cache information derived from the plugins.
+        """
+        return tuple((name, plugin.version) for name, plugin in self.plugins.items())
+
+    @property
+    def function_data_cache_hit_rate(self) -> float:
+        """The share of the lookups of function metadata and function call configurations served from the cache."""
+        total = self._function_data_cache_hits + self._function_data_cache_misses
+        return self._function_data_cache_hits / total if total else 0.0
+
+    @property
+    def openapi_http_client_pool(self) -> "OpenApiHttpClientPool":
+        """The pooled HTTP client shared by the OpenAPI plugins added to the kernel, created when first used."""
+        if self._openapi_http_client_pool is None:
+            from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
+
+            self._openapi_http_client_pool = OpenApiHttpClientPool()
+        return self._openapi_http_client_pool
+
+    def get_cached_function_data(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Get data derived from the functions of the kernel, creating it when it is not cached.
+
+        The cache is cleared whenever the plugins version changes, so the data should only depend
+        on the plugins and the key, and it is shared between callers, so it should not be changed.
+
+        Args:
+            key: The key of the data, this should include everything that the data depends on besides the plugins.
+            factory: The function that creates the data.
+
+        Returns:
+            The cached or newly created data.
+        """
+        version = self.plugins_version
+        if version != self._function_data_cache_version:
+            self._function_data_cache.clear()
+            self._function_data_cache_version = version
+        if key in self._function_data_cache:
+            self._function_data_cache_hits += 1
+            return self._function_data_cache[key]
+        self._function_data_cache_misses += 1
+        data = self._function_data_cache[key] = factory()
+        return data
 
     @field_validator("plugins", mode="before")
     @classmethod
@@ -243,6 +304,19 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         Raises:
             PluginInitializationError: if the plugin URL or plugin JSON/YAML is not provided
         """
+        if execution_settings is None or (
+            execution_settings.http_client is None and execution_settings.http_client_pool is None
+        ):
+            from semantic_kernel.connectors.openapi_plugin.openapi_function_execution_parameters import (
+                OpenAPIFunctionExecutionParameters,
+            )
+
+            # the operations of all the OpenAPI plugins share the connections of the kernel
+            execution_settings = (
+                execution_settings.model_copy(update={"http_client_pool": self.openapi_http_client_pool})
+                if execution_settings
+                else OpenAPIFunctionExecutionParameters(http_client_pool=self.openapi_http_client_pool)
+            )
         return self.add_plugin(
             KernelPlugin.from_openapi(
                 plugin_name=plugin_name,
@@ -324,7 +398,12 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         """Get a list of all function metadata in the plugins."""
         if not self.plugins:
             return []
-        return [func.metadata for plugin in self.plugins.values() for func in plugin]
+        return list(
+            self.get_cached_function_data(
+                ("function_metadata",),
+                lambda: [func.metadata for plugin in self.plugins.values() for func in plugin],
+            )
+        )
 
     @singledispatchmethod
     def get_list_of_function_metadata(self, *args: Any, **kwargs: Any) -> list["KernelFunctionMetadata"]:
@@ -346,12 +425,17 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         """
         if not self.plugins:
             return []
-        return [
-            func.metadata
-            for plugin in self.plugins.values()
-            for func in plugin.functions.values()
-            if (include_prompt and func.is_prompt) or (include_native and not func.is_prompt)
-        ]
+        return list(
+            self.get_cached_function_data(
+                ("function_metadata", include_prompt, include_native),
+                lambda: [
+                    func.metadata
+                    for plugin in self.plugins.values()
+                    for func in plugin.functions.values()
+                    if (include_prompt and func.is_prompt) or (include_native and not func.is_prompt)
+                ],
+            )
+        )
 
     @get_list_of_function_metadata.register(dict)
     def get_list_of_function_metadata_filters(
@@ -377,6 +461,19 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         """
         if not self.plugins:
             return []
+        return list(
+            self.get_cached_function_data(
+                ("function_metadata", function_filters_cache_key(filters)),
+                lambda: self._filter_function_metadata(filters),
+            )
+        )
+
+    def _filter_function_metadata(
+        self,
+        filters: dict[
+            Literal["excluded_plugins", "included_plugins", "excluded_functions", "included_functions"], list[str]
+        ],
+    ) -> list["KernelFunctionMetadata"]:
         included_plugins = filters.get("included_plugins")
         excluded_plugins = filters.get("excluded_plugins", [])
         included_functions = filters.get("included_functions")
@@ -1,8 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import inspect
 import logging
 from collections.abc import Callable
+from functools import partial
 from inspect import isasyncgen, isasyncgenfunction, isawaitable, iscoroutinefunction, isgenerator, isgeneratorfunction
 from typing import Any
 
@@ -23,6 +25,7 @@ class KernelFunctionFromMethod(KernelFunction):
 
     method: Callable[..., Any] = Field(exclude=True)
     stream_method: Callable[..., Any] | None = Field(default=None, exclude=True)
+    run_in_executor: bool = False
 
     def __init__(
         self,
@@ -90,6 +93,7 @@ class KernelFunctionFromMethod(KernelFunction):
                 if isasyncgenfunction(method) or isgeneratorfunction(method)
                 else None
             ),
+            "run_in_executor": getattr(method, "__kernel_function_run_in_executor__", False),
         }
 
         super().__init__(**args)
@@ -100,7 +104,12 @@ class KernelFunctionFromMethod(KernelFunction):
     ) -> None:
         """Invoke the function with the given arguments."""
         function_arguments = self.gather_function_parameters(context)
-        result = self.method(**function_arguments)
+        if self.run_in_executor and not self.metadata.is_asynchronous:
+            result = await asyncio.get_running_loop().run_in_executor(
+                context.kernel.function_call_scheduler.executor, partial(self.method, **function_arguments)
+            )
+        else:
+            result = self.method(**function_arguments)
         if isasyncgen(result):
             result = [x async for x in result]
         elif isawaitable(result):
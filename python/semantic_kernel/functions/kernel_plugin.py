@@ -2,6 +2,7 @@
 
 import importlib
 import inspect
+import itertools
 import logging
 import os
 from collections.abc import Generator, ItemsView
@@ -10,7 +11,7 @@ from glob import glob
 from types import MethodType
 from typing import TYPE_CHECKING, Annotated, Any, TypeVar
 
-from pydantic import Field, StringConstraints
+from pydantic import Field, PrivateAttr, StringConstraints
 
 from semantic_kernel.exceptions import PluginInitializationError
 from semantic_kernel.exceptions.function_exceptions import FunctionInitializationError
@@ -33,6 +34,9 @@ logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T", bound="KernelPlugin")
 
+# Versions are drawn from a single counter, so that a version identifies a plugin and its functions.
+_plugin_versions = itertools.count()
+
 
 class KernelPlugin(KernelBaseModel):
     """Represents a Kernel Plugin with functions.
@@ -78,6 +82,7 @@ class KernelPlugin(KernelBaseModel):
     name: Annotated[str, StringConstraints(pattern=PLUGIN_NAME_REGEX, min_length=1)]
     description: str | None = None
     functions: dict[str, KernelFunction] = Field(default_factory=dict)
+    _version: int = PrivateAttr(default_factory=lambda: next(_plugin_versions))
 
     def __init__(
         self,
@@ -115,6 +120,7 @@ class KernelPlugin(KernelBaseModel):
 
         """
         self.functions[key] = KernelPlugin._parse_or_copy(value, self.name)
+        self._version = next(_plugin_versions)
 
     def set(self, key: str, value: KERNEL_FUNCTION_TYPE) -> None:
         """Set a function in the plugin.
@@ -201,6 +207,14 @@ class KernelPlugin(KernelBaseModel):
     # endregion
     # region Properties
 
+    @property
+    def version(self) -> int:
+        """The version of the plugin, this changes when functions are set in the plugin.
+
+        Changes made directly to the `functions` dict are not tracked.
+        """
+        return self._version
+
     def get_functions_metadata(self) -> list["KernelFunctionMetadata"]:
         """Get the metadata for the functions in the plugin.
 
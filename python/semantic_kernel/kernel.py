@@ -6,6 +6,8 @@ from contextlib import AbstractAsyncContextManager
 from copy import copy, deepcopy
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
+from pydantic import Field
+
 from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.const import METADATA_EXCEPTION_KEY
 from semantic_kernel.contents.chat_history import ChatHistory
@@ -30,6 +32,7 @@ from semantic_kernel.filters.kernel_filters_extension import (
     KernelFilterExtension,
     _rebuild_auto_function_invocation_context,
 )
+from semantic_kernel.functions.function_call_scheduler import FunctionCallScheduler
 from semantic_kernel.functions.function_result import FunctionResult
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function_extension import KernelFunctionExtension
@@ -71,8 +74,11 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
         plugins: A dict with the plugins registered with the Kernel, from KernelFunctionExtension.
         services: A dict with the services registered with the Kernel, from KernelServicesExtension.
         ai_service_selector: The AI service selector to be used by the kernel, from KernelServicesExtension.
+        function_call_scheduler: The scheduler of the function calls that are automatically invoked.
     """
 
+    function_call_scheduler: FunctionCallScheduler = Field(default_factory=FunctionCallScheduler)
+
     def __init__(
         self,
         plugins: KernelPlugin | dict[str, KernelPlugin] | list[KernelPlugin] | None = None,
@@ -421,6 +427,37 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
 
         return invocation_context if invocation_context.terminate else None
 
+    async def invoke_function_calls(
+        self,
+        function_calls: list[FunctionCallContent],
+        chat_history: ChatHistory,
+        *,
+        arguments: "KernelArguments | None" = None,
+        execution_settings: "PromptExecutionSettings | None" = None,
+        function_call_count: int | None = None,
+        request_index: int | None = None,
+        is_streaming: bool = False,
+        function_behavior: "FunctionChoiceBehavior | None" = None,
+    ) -> list["AutoFunctionInvocationContext | None"]:
+        """Processes the function calls of a response with the function_call_scheduler and updates the chat history.
+
+        The results are added to the chat history in the order of the function calls.
+
+        Returns:
+            The invocation context of every call, when the call requested to terminate, None otherwise.
+        """
+        return await self.function_call_scheduler.invoke_function_calls(
+            self,
+            function_calls,
+            chat_history,
+            arguments=arguments,
+            execution_settings=execution_settings,
+            function_call_count=function_call_count,
+            request_index=request_index,
+            is_streaming=is_streaming,
+            function_behavior=function_behavior,
+        )
+
     async def _inner_auto_function_invoke_handler(self, context: AutoFunctionInvocationContext):
         """Inner auto function invocation handler."""
         try:
@@ -502,7 +539,7 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
 
         New lists of plugins and filters are created. It will not affect the original lists when the new instance
         is mutated. A new `ai_service_selector` is created. It will not affect the original instance when the new
-        instance is mutated.
+        instance is mutated. The `function_call_scheduler` is shared.
         """
         return Kernel(
             plugins=deepcopy(self.plugins),
@@ -512,6 +549,8 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
             function_invocation_filters=deepcopy(self.function_invocation_filters),
             prompt_rendering_filters=deepcopy(self.prompt_rendering_filters),
             auto_function_invocation_filters=deepcopy(self.auto_function_invocation_filters),
+            # The scheduler is shared, so its concurrency limits apply to both instances
+            function_call_scheduler=self.function_call_scheduler,
         )
 
     @experimental
@@ -1,5 +1,18 @@
 # Copyright (c) Microsoft. All rights reserved.
-from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
-from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+    from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+_LAZY_ATTRIBUTES = {
+    "SemanticTextMemory": ".semantic_text_memory",
+    "VolatileMemoryStore": ".volatile_memory_store",
+}
 
 __all__ = ["SemanticTextMemory", "VolatileMemoryStore"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
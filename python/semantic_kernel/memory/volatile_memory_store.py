@@ -1,8 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from copy import deepcopy
+from copy import copy
 
+import numpy as np
 from numpy import array, linalg, ndarray
 
 from semantic_kernel.exceptions import ServiceResourceNotFoundError
@@ -13,15 +14,122 @@ from semantic_kernel.utils.feature_stage_decorator import experimental
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _without_embedding(record: MemoryRecord) -> MemoryRecord:
+    """Create a view of the record without the embedding, the other attributes are shared with the record."""
+    view = copy(record)
+    view._embedding = None
+    return view
+
+
+class _EmbeddingMatrix:
+    """The normalized embeddings of the records of a collection, one row per record.
+
+    The rows are kept in sync with the records on upsert and remove, so a query is a single matrix product.
+    The capacity of the matrix grows by doubling, and a removed row is replaced by the last row.
+    Rows of records without an embedding, or with a zero embedding, are marked invalid and get a score of -1.
+    """
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.matrix: ndarray | None = None
+        self.valid: ndarray = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, key: str, embedding: ndarray | None) -> None:
+        vector = None if embedding is None else np.asarray(embedding, dtype=float).reshape(-1)
+        if vector is not None and self.matrix is None:
+            self.matrix = np.zeros((len(self.valid), vector.shape[0]))
+        if vector is not None and vector.shape[0] != self.matrix.shape[1]:  # type: ignore[union-attr]
+            raise ValueError(
+                f"The embedding of record '{key}' has {vector.shape[0]} dimensions, "
+                f"the embeddings of the collection have {self.matrix.shape[1]}."  # type: ignore[union-attr]
+            )
+        if (row := self.rows.get(key)) is None:
+            row = len(self.keys)
+            self.keys.append(key)
+            self.rows[key] = row
+            self._reserve(row + 1)
+        norm = 0.0 if vector is None else linalg.norm(vector)
+        self.valid[row] = norm != 0
+        if self.matrix is not None:
+            self.matrix[row] = vector / norm if norm != 0 else 0.0  # type: ignore[operator]
+
+    def remove(self, key: str) -> None:
+        if (row := self.rows.pop(key, None)) is None:
+            return
+        last = len(self.keys) - 1
+        last_key = self.keys.pop()
+        if row != last:
+            self.keys[row] = last_key
+            self.rows[last_key] = row
+            self.valid[row] = self.valid[last]
+            if self.matrix is not None:
+                self.matrix[row] = self.matrix[last]
+        self.valid[last] = False
+
+    def scores(self, queries: ndarray) -> ndarray:
+        """Compute the cosine similarity of the queries, one per row, with all the rows, in a single product."""
+        size = len(self.keys)
+        if self.matrix is None or not self.valid[:size].any():
+            raise ValueError("Invalid vectors, cannot compute cosine similarity scores for zero vectors.")
+        if queries.shape[1] != self.matrix.shape[1]:
+            raise ValueError(
+                f"The query embedding has {queries.shape[1]} dimensions, "
+                f"the embeddings of the collection have {self.matrix.shape[1]}."
+            )
+        norms = linalg.norm(queries, axis=1, keepdims=True)
+        if not norms.all():
+            raise ValueError("Invalid vectors, cannot compute cosine similarity scores for zero vectors.")
+        scores = (queries / norms) @ self.matrix[:size].T
+        if not self.valid[:size].all():
+            logger.warning(
+                "Some vectors in the embedding collection are zero vectors."
+                "Ignoring cosine similarity score computation for those vectors."
+            )
+            scores[:, ~self.valid[:size]] = -1.0
+        return scores
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self.valid):
+            return
+        capacity = max(size, 2 * len(self.valid), 16)
+        self.valid = np.concatenate([self.valid, np.zeros(capacity - len(self.valid), dtype=bool)])
+        if self.matrix is not None:
+            matrix = np.zeros((capacity, self.matrix.shape[1]))
+            matrix[: len(self.matrix)] = self.matrix
+            self.matrix = matrix
+
+
+def _top_matches(scores: ndarray, limit: int, min_relevance_score: float) -> ndarray:
+    """Get the indices of the best scores, that are at least the minimum relevance score, best first."""
+    candidates = np.flatnonzero(scores >= min_relevance_score)
+    if limit <= 0 or len(candidates) == 0:
+        return candidates[:0]
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
 @experimental
 class VolatileMemoryStore(MemoryStoreBase):
-    """A volatile memory store that stores data in memory."""
+    """A volatile memory store that stores data in memory.
+
+    The normalized embeddings of every collection are kept in a matrix, that is updated on upsert and remove,
+    so the relevance scores of a query are computed with a single matrix product and the best matches are
+    selected without sorting all the scores. Changes to the embedding of a record after it was upserted
+    are not picked up, upsert the record again instead.
+    """
 
     _store: dict[str, dict[str, MemoryRecord]]
+    _embeddings: dict[str, _EmbeddingMatrix]
 
     def __init__(self) -> None:
         """Initializes a new instance of the VolatileMemoryStore class."""
         self._store = {}
+        self._embeddings = {}
 
     async def create_collection(self, collection_name: str) -> None:
         """Creates a new collection if it does not exist.
@@ -36,6 +144,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             pass
         else:
             self._store[collection_name] = {}
+            self._embeddings[collection_name] = _EmbeddingMatrix()
 
     async def get_collections(
         self,
@@ -58,6 +167,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         """
         if collection_name in self._store:
             del self._store[collection_name]
+            del self._embeddings[collection_name]
 
     async def does_collection_exist(self, collection_name: str) -> bool:
         """Checks if a collection exists.
@@ -84,6 +194,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
         record._key = record._id
+        self._embeddings[collection_name].upsert(record._key, record._embedding)
         self._store[collection_name][record._key] = record
         return record._key
 
@@ -102,6 +213,7 @@ class VolatileMemoryStore(MemoryStoreBase):
 
         for record in records:
             record._key = record._id
+            self._embeddings[collection_name].upsert(record._key, record._embedding)
             self._store[collection_name][record._key] = record
         return [record._key for record in records]
 
@@ -123,12 +235,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Key '{key}' not found in collection '{collection_name}'")
 
         result = self._store[collection_name][key]
-
-        if not with_embedding:
-            # create copy of results without embeddings
-            result = deepcopy(result)
-            result._embedding = None
-        return result
+        return result if with_embedding else _without_embedding(result)
 
     async def get_batch(
         self, collection_name: str, keys: list[str], with_embeddings: bool = False
@@ -147,13 +254,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
         results = [self._store[collection_name][key] for key in keys if key in self._store[collection_name]]
-
-        if not with_embeddings:
-            # create copy of results without embeddings
-            for result in results:
-                result = deepcopy(result)
-                result._embedding = None
-        return results
+        return results if with_embeddings else [_without_embedding(result) for result in results]
 
     async def remove(self, collection_name: str, key: str) -> None:
         """Removes a record.
@@ -172,6 +273,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Key '{key}' not found in collection '{collection_name}'")
 
         del self._store[collection_name][key]
+        self._embeddings[collection_name].remove(key)
 
     async def remove_batch(self, collection_name: str, keys: list[str]) -> None:
         """Removes a batch of records.
@@ -189,6 +291,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         for key in keys:
             if key in self._store[collection_name]:
                 del self._store[collection_name][key]
+                self._embeddings[collection_name].remove(key)
 
     async def get_nearest_match(
         self,
@@ -196,7 +299,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         embedding: ndarray,
         min_relevance_score: float = 0.0,
         with_embedding: bool = False,
-    ) -> tuple[MemoryRecord, float]:
+    ) -> tuple[MemoryRecord, float] | None:
         """Gets the nearest match to an embedding using cosine similarity.
 
         Args:
@@ -206,15 +309,19 @@ class VolatileMemoryStore(MemoryStoreBase):
             with_embedding (bool): Whether to include the embedding in the result. (default: {False})
 
         Returns:
-            Tuple[MemoryRecord, float]: The record and the relevance score.
+            Tuple[MemoryRecord, float]: The record and the relevance score,
+                None if no record has the minimum relevance score.
         """
-        return self.get_nearest_matches(
+        results = await self.get_nearest_matches(
             collection_name=collection_name,
             embedding=embedding,
             limit=1,
             min_relevance_score=min_relevance_score,
             with_embeddings=with_embedding,
         )
+        if len(results) > 0:
+            return results[0]
+        return None
 
     async def get_nearest_matches(
         self,
@@ -243,43 +350,60 @@ class VolatileMemoryStore(MemoryStoreBase):
             )
             return []
 
-        # Get all the records in the collection
-        memory_records = list(self._store[collection_name].values())
-
-        # Convert the collection of embeddings into a numpy array (stacked)
-        embeddings = array([x._embedding for x in memory_records], dtype=float)
-        embeddings = embeddings.reshape(embeddings.shape[0], -1)
-
-        # If the query embedding has shape (1, embedding_size),
-        # reshape it to (embedding_size,)
-        if len(embedding.shape) == 2:
-            embedding = embedding.reshape(
-                embedding.shape[1],
+        return (
+            await self.get_nearest_matches_batch(
+                collection_name=collection_name,
+                embeddings=np.asarray(embedding, dtype=float).reshape(1, -1),
+                limit=limit,
+                min_relevance_score=min_relevance_score,
+                with_embeddings=with_embeddings,
             )
+        )[0]
 
-        # Use numpy to get the cosine similarity between the query
-        # embedding and all the embeddings in the collection
-        similarity_scores = self.compute_similarity_scores(embedding, embeddings)
-
-        # Then, sort the results by the similarity score
-        sorted_results = sorted(
-            zip(memory_records, similarity_scores),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+    async def get_nearest_matches_batch(
+        self,
+        collection_name: str,
+        embeddings: ndarray,
+        limit: int,
+        min_relevance_score: float = 0.0,
+        with_embeddings: bool = False,
+    ) -> list[list[tuple[MemoryRecord, float]]]:
+        """Gets the nearest matches to each of a batch of embeddings using cosine similarity.
 
-        # Then, filter out the results that are below the minimum relevance score
-        filtered_results = [x for x in sorted_results if x[1] >= min_relevance_score]
+        The scores of all the queries are computed with a single matrix product.
 
-        # Then, take the top N results
-        top_results = filtered_results[:limit]
+        Args:
+            collection_name (str): The name of the collection to get the nearest matches from.
+            embeddings (ndarray): The embeddings to find the nearest matches to, one per row.
+            limit (int): The maximum number of matches to return per embedding.
+            min_relevance_score (float): The minimum relevance score of the matches. (default: {0.0})
+            with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
 
-        if not with_embeddings:
-            # create copy of results without embeddings
-            for result in top_results:
-                result = deepcopy(result)
-                result[0]._embedding = None
-        return top_results
+        Returns:
+            List[List[Tuple[MemoryRecord, float]]]: The records and their relevance scores, per embedding.
+        """
+        queries = np.asarray(embeddings, dtype=float)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        if collection_name not in self._store:
+            logger.warning(
+                f"Collection '{collection_name}' does not exist in collections: "
+                f"{', '.join([collection for collection in await self.get_collections()])}"
+            )
+            return [[] for _ in queries]
+
+        matrix = self._embeddings[collection_name]
+        if len(matrix) == 0:
+            return [[] for _ in queries]
+        records = self._store[collection_name]
+        results: list[list[tuple[MemoryRecord, float]]] = []
+        for scores in matrix.scores(queries):
+            matches = []
+            for row in _top_matches(scores, limit, min_relevance_score):
+                record = records[matrix.keys[row]]
+                matches.append((record if with_embeddings else _without_embedding(record), float(scores[row])))
+            results.append(matches)
+        return results
 
     def compute_similarity_scores(self, embedding: ndarray, embedding_array: ndarray) -> ndarray:
         """Computes the cosine similarity scores between a query embedding and a group of embeddings.
@@ -3,8 +3,9 @@
 import asyncio
 import contextlib
 import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from queue import Queue
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,7 @@ from semantic_kernel.processes.local_runtime.local_event import (
 from semantic_kernel.processes.local_runtime.local_message import LocalMessage
 from semantic_kernel.processes.local_runtime.local_message_factory import LocalMessageFactory
 from semantic_kernel.processes.local_runtime.local_step import LocalStep
+from semantic_kernel.processes.local_runtime.local_superstep_metrics import LocalSuperstepMetrics
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 if TYPE_CHECKING:
@@ -34,7 +36,14 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 @experimental
 class LocalProcess(LocalStep):
-    """A local process that contains a collection of steps."""
+    """A local process that contains a collection of steps.
+
+    Each superstep, the events emitted by the steps are turned into messages, which are collected
+    in an inbox per destination step and then delivered, with the steps running concurrently and each
+    step handling the messages in its inbox in order. Only the steps that received messages in the previous
+    superstep are checked for new events. The throughput of each superstep of the last execution
+    is recorded in `superstep_metrics`.
+    """
 
     kernel: Kernel
     steps: list[LocalStep] = Field(default_factory=list)
@@ -47,6 +56,7 @@ class LocalProcess(LocalStep):
     max_supersteps: int = Field(
         default=100, ge=1, description="Maximum number of supersteps to execute before stopping the process."
     )
+    superstep_metrics: list[LocalSuperstepMetrics] = Field(default_factory=list, exclude=True)
 
     def __init__(
         self,
@@ -191,36 +201,74 @@ class LocalProcess(LocalStep):
     async def internal_execute(self, max_supersteps: int = 100, keep_alive: bool = True):
         """Internal execution logic for the process."""
         message_channel: Queue[LocalMessage] = Queue()
+        steps_by_id = {step.id: step for step in self.steps}
+        # Events can be left over from a previous execution, so the first superstep checks all steps.
+        active_steps: Sequence[LocalStep] = self.steps
+        self.superstep_metrics = []
 
         logger.debug(f"Running process for {max_supersteps} supersteps.")
 
         try:
-            for _ in range(max_supersteps):
+            for superstep in range(max_supersteps):
+                start_time = time.perf_counter()
                 self.enqueue_external_messages(message_channel)
-                for step in self.steps:
+                for step in active_steps:
                     await self.enqueue_step_messages(step, message_channel)
 
-                messages_to_process: list[LocalMessage] = []
-                while not message_channel.empty():
-                    messages_to_process.append(message_channel.get())
-
-                if not messages_to_process and (not keep_alive or self.external_event_queue.empty()):
+                inboxes = self._collect_inboxes(message_channel, steps_by_id)
+                if not inboxes and (not keep_alive or self.external_event_queue.empty()):
                     break
 
-                message_tasks = []
-                for message in messages_to_process:
-                    if message.destination_id == END_PROCESS_ID:
-                        break
+                await asyncio.gather(*(self._deliver_messages(step, messages) for step, messages in inboxes.values()))
+                active_steps = [step for step, _ in inboxes.values()]
 
-                    destination_step = next(step for step in self.steps if step.id == message.destination_id)
-                    message_tasks.append(destination_step.handle_message(message))
-
-                await asyncio.gather(*message_tasks)
+                metrics = LocalSuperstepMetrics(
+                    superstep=superstep,
+                    messages=sum(len(messages) for _, messages in inboxes.values()),
+                    active_steps=len(active_steps),
+                    duration_seconds=time.perf_counter() - start_time,
+                )
+                self.superstep_metrics.append(metrics)
+                logger.debug(
+                    f"Superstep {superstep} delivered {metrics.messages} messages to {metrics.active_steps} steps "
+                    f"in {metrics.duration_seconds:.6f} seconds."
+                )
 
         except Exception as ex:
             logger.error(f"An error occurred while running the process: {ex}.")
             raise
 
+    @staticmethod
+    def _collect_inboxes(
+        message_channel: Queue[LocalMessage], steps_by_id: dict[str, LocalStep]
+    ) -> dict[str, tuple[LocalStep, list[LocalMessage]]]:
+        """Group the messages in the channel by their destination step, in the order they were sent.
+
+        Messages after a message to the end of the process are dropped.
+        """
+        inboxes: dict[str, tuple[LocalStep, list[LocalMessage]]] = {}
+        ended = False
+        while not message_channel.empty():
+            message = message_channel.get()
+            if ended:
+                continue
+            if message.destination_id == END_PROCESS_ID:
+                ended = True
+                continue
+            if message.destination_id not in inboxes:
+                destination_step = steps_by_id.get(message.destination_id)
+                if destination_step is None:
+                    raise KernelException(f"The destination step `{message.destination_id}` is not in the process.")
+                inboxes[message.destination_id] = (destination_step, [])
+            inboxes[message.destination_id][1].append(message)
+        return inboxes
+
+    @staticmethod
+    async def _deliver_messages(step: LocalStep, messages: list[LocalMessage]) -> None:
+        """Deliver the messages of an inbox to the step, one at a time."""
+        for message in messages:
+            await step.handle_message(message)
+
     async def to_kernel_process(self) -> "KernelProcess":
         """Builds a KernelProcess from the current LocalProcess."""
         from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess
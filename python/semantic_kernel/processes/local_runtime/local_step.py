@@ -95,11 +95,12 @@ class LocalStep(KernelProcessMessageChannel, KernelBaseModel):
         if self.functions is None or self.inputs is None or self.initial_inputs is None:
             raise ValueError("The step has not been initialized.")
 
-        message_log_parameters = ", ".join(f"{k}: {v}" for k, v in message.values.items())
-        logger.info(
-            f"Received message from `{message.source_id}` targeting function "
-            f"`{message.function_name}` and parameters `{message_log_parameters}`."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            message_log_parameters = ", ".join(f"{k}: {v}" for k, v in message.values.items())
+            logger.info(
+                f"Received message from `{message.source_id}` targeting function "
+                f"`{message.function_name}` and parameters `{message_log_parameters}`."
+            )
 
         # Add the message values to the inputs for the function
         for k, v in message.values.items():
@@ -154,9 +155,12 @@ class LocalStep(KernelProcessMessageChannel, KernelBaseModel):
         event_value = None
 
         try:
-            logger.info(
-                f"Invoking plugin `{function.plugin_name}` and function `{function.name}` with arguments: {arguments}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                # the arguments include the step context, which is expensive to format
+                logger.info(
+                    f"Invoking plugin `{function.plugin_name}` and function `{function.name}` "
+                    f"with arguments: {arguments}"
+                )
             invoke_result = await self.invoke_function(function, self.kernel, arguments)
             if invoke_result is None:
                 raise KernelException(f"Function {target_function} returned None.")
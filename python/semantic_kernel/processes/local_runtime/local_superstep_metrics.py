@@ -0,0 +1,21 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from pydantic import Field
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+
+@experimental
+class LocalSuperstepMetrics(KernelBaseModel):
+    """Throughput metrics of a single superstep of a local process."""
+
+    superstep: int = Field(..., ge=0)
+    messages: int = Field(default=0, ge=0)
+    active_steps: int = Field(default=0, ge=0)
+    duration_seconds: float = Field(default=0.0, ge=0.0)
+
+    @property
+    def messages_per_second(self) -> float:
+        """The number of messages delivered per second during the superstep."""
+        return self.messages / self.duration_seconds if self.duration_seconds else 0.0
@@ -1,10 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.prompt_template.handlebars_prompt_template import HandlebarsPromptTemplate
-from semantic_kernel.prompt_template.input_variable import InputVariable
-from semantic_kernel.prompt_template.jinja2_prompt_template import Jinja2PromptTemplate
-from semantic_kernel.prompt_template.kernel_prompt_template import KernelPromptTemplate
-from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.prompt_template.handlebars_prompt_template import HandlebarsPromptTemplate
+    from semantic_kernel.prompt_template.input_variable import InputVariable
+    from semantic_kernel.prompt_template.jinja2_prompt_template import Jinja2PromptTemplate
+    from semantic_kernel.prompt_template.kernel_prompt_template import KernelPromptTemplate
+    from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+
+_LAZY_ATTRIBUTES = {
+    "HandlebarsPromptTemplate": ".handlebars_prompt_template",
+    "InputVariable": ".input_variable",
+    "Jinja2PromptTemplate": ".jinja2_prompt_template",
+    "KernelPromptTemplate": ".kernel_prompt_template",
+    "PromptTemplateConfig": ".prompt_template_config",
+}
 
 __all__ = [
     "HandlebarsPromptTemplate",
@@ -13,3 +26,5 @@ __all__ = [
     "KernelPromptTemplate",
     "PromptTemplateConfig",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
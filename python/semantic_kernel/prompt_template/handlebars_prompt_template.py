@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
+import re
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Matches every name that could be a helper, this is a superset of the helpers the template uses.
+HELPER_NAME_PATTERN = re.compile(r"[\w-]+")
+
 
 class HandlebarsPromptTemplate(PromptTemplateBase):
     """Create a Handlebars prompt template.
@@ -28,6 +32,9 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
     a value that is encountered is tried to resolve with the arguments and the functions,
     if not found, the literal value is returned.
 
+    The template is compiled once, and only the functions whose name occurs in the template
+    are made available as helpers.
+
     Args:
         prompt_template_config (PromptTemplateConfig): The prompt template configuration
             This is checked if the template format is 'handlebars'
@@ -41,6 +48,7 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
     """
 
     _template_compiler: Any = PrivateAttr()
+    _referenced_names: frozenset[str] = PrivateAttr(default=frozenset())
 
     @field_validator("prompt_template_config")
     @classmethod
@@ -57,6 +65,7 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
             return
         try:
             self._template_compiler = Compiler().compile(self.prompt_template_config.template)
+            self._referenced_names = frozenset(HELPER_NAME_PATTERN.findall(self.prompt_template_config.template))
         except PybarsError as e:
             logger.error(f"Invalid handlebars template: {self.prompt_template_config.template}")
             raise HandlebarsTemplateSyntaxError(
@@ -84,18 +93,16 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
 
         arguments = self._get_trusted_arguments(arguments)
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
-        helpers: dict[str, Callable[..., Any]] = {}
-        for plugin in kernel.plugins.values():
-            helpers.update({
-                function.fully_qualified_name: create_template_helper_from_function(
-                    function,
-                    kernel,
-                    arguments,
-                    self.prompt_template_config.template_format,
-                    allow_unsafe_function_output,
-                )
-                for function in plugin
-            })
+        helpers: dict[str, Callable[..., Any]] = {
+            name: create_template_helper_from_function(
+                function,
+                kernel,
+                arguments,
+                self.prompt_template_config.template_format,
+                allow_unsafe_function_output,
+            )
+            for name, function in self._get_referenced_functions(kernel, self._referenced_names).items()
+        }
         helpers.update(HANDLEBAR_SYSTEM_HELPERS)
 
         try:
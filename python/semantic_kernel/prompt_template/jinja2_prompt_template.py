@@ -4,7 +4,7 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import BaseLoader, TemplateError
+from jinja2 import BaseLoader, Template, TemplateError, meta
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from pydantic import PrivateAttr, field_validator
 
@@ -35,6 +35,9 @@ class Jinja2PromptTemplate(PromptTemplateBase):
     in Jinja2 because of the hyphen. Therefore, the function name is replaced with an underscore,
     which are allowed in Python function names.
 
+    The template is compiled on the first render and reused after that, and only the functions
+    that the template references are made available as helpers.
+
     Args:
         prompt_template_config (PromptTemplateConfig): The configuration object for the prompt template.
             This should specify the template format as 'jinja2' and include any necessary
@@ -49,6 +52,8 @@ class Jinja2PromptTemplate(PromptTemplateBase):
     """
 
     _env: ImmutableSandboxedEnvironment | None = PrivateAttr()
+    _template: tuple[str, Template] | None = PrivateAttr(default=None)
+    _referenced_names: frozenset[str] = PrivateAttr(default=frozenset())
 
     @field_validator("prompt_template_config")
     @classmethod
@@ -64,6 +69,7 @@ class Jinja2PromptTemplate(PromptTemplateBase):
             self._env = None
             return
         self._env = ImmutableSandboxedEnvironment(loader=BaseLoader(), enable_async=True)
+        self._env.globals.update(JINJA2_SYSTEM_HELPERS)
 
     async def render(self, kernel: "Kernel", arguments: "KernelArguments | None" = None) -> str:
         """Render the prompt template.
@@ -86,11 +92,12 @@ class Jinja2PromptTemplate(PromptTemplateBase):
 
         arguments = self._get_trusted_arguments(arguments)
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
-        helpers: dict[str, Callable[..., Any]] = {}
-        helpers.update(JINJA2_SYSTEM_HELPERS)
-        for plugin in kernel.plugins.values():
-            helpers.update({
-                function.fully_qualified_name.replace("-", "_"): create_template_helper_from_function(
+        if self.prompt_template_config.template is None:
+            raise Jinja2TemplateRenderException("Error rendering template, template is None")
+        try:
+            template = self._get_template()
+            helpers: dict[str, Callable[..., Any]] = {
+                name: create_template_helper_from_function(
                     function,
                     kernel,
                     arguments,
@@ -98,13 +105,9 @@ class Jinja2PromptTemplate(PromptTemplateBase):
                     allow_unsafe_function_output,
                     enable_async=True,
                 )
-                for function in plugin
-            })
-        if self.prompt_template_config.template is None:
-            raise Jinja2TemplateRenderException("Error rendering template, template is None")
-        try:
-            template = self._env.from_string(self.prompt_template_config.template, globals=helpers)
-            return await template.render_async(**arguments)
+                for name, function in self._get_referenced_functions(kernel, self._referenced_names, "_").items()
+            }
+            return await template.render_async(**{**helpers, **arguments})
         except TemplateError as exc:
             logger.error(
                 f"Error rendering prompt template: {self.prompt_template_config.template} with arguments: {arguments}"
@@ -113,3 +116,12 @@ class Jinja2PromptTemplate(PromptTemplateBase):
                 f"Error rendering prompt template: {self.prompt_template_config.template} with "
                 f"arguments: {arguments}: error: {exc}"
             ) from exc
+
+    def _get_template(self) -> Template:
+        """Compile the template, or get it when it was compiled before."""
+        assert self._env is not None and self.prompt_template_config.template is not None  # nosec
+        source = self.prompt_template_config.template
+        if self._template is None or self._template[0] != source:
+            self._referenced_names = frozenset(meta.find_undeclared_variables(self._env.parse(source)))
+            self._template = (source, self._env.from_string(source))
+        return self._template[1]
@@ -1,10 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
+from collections.abc import Iterator, Sequence
 from html import escape
 from typing import TYPE_CHECKING, Any
 
-from pydantic import PrivateAttr, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from semantic_kernel.exceptions import TemplateRenderException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
@@ -20,13 +22,27 @@ from semantic_kernel.template_engine.template_tokenizer import TemplateTokenizer
 if TYPE_CHECKING:
     from semantic_kernel.kernel import Kernel
     from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+    from semantic_kernel.template_engine.protocols.code_renderer import CodeRenderer
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 class KernelPromptTemplate(PromptTemplateBase):
-    """Create a Kernel prompt template."""
+    """Create a Kernel prompt template.
 
+    By default the code blocks of the template are rendered one after the other, set
+    `max_concurrent_code_blocks` to a value above 1 to render up to that many code blocks concurrently.
+    Only do that when the functions called by the template do not depend on each other's side effects.
+    The output order is kept, and when code blocks fail the error of the first failing block is raised.
+
+    Args:
+        prompt_template_config (PromptTemplateConfig): The prompt template configuration.
+        allow_dangerously_set_content (bool): Allow content without encoding throughout.
+        max_concurrent_code_blocks (int): The maximum number of code blocks to render concurrently,
+            defaults to 1, which renders them sequentially.
+    """
+
+    max_concurrent_code_blocks: int = Field(default=1, gt=0)
     _blocks: list[Block] = PrivateAttr(default_factory=list)
 
     @field_validator("prompt_template_config")
@@ -111,24 +127,63 @@ class KernelPromptTemplate(PromptTemplateBase):
         from semantic_kernel.template_engine.protocols.text_renderer import TextRenderer
 
         logger.debug(f"Rendering list of {len(blocks)} blocks")
-        rendered_blocks: list[str] = []
         arguments = self._get_trusted_arguments(arguments or KernelArguments())
+        code_blocks = [block for block in blocks if isinstance(block, CodeRenderer)]
+        if not code_blocks:
+            prompt = "".join(block.render(kernel, arguments) for block in blocks if isinstance(block, TextRenderer))
+            logger.debug(f"Rendered prompt: {prompt}")
+            return prompt
+
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
+        # rendered sequentially, the blocks are rendered in template order, as the side effects may depend on it
+        rendered_code: Iterator[str] | None = None
+        if self.max_concurrent_code_blocks > 1 and len(code_blocks) > 1:
+            rendered_code = iter(await self._render_code_blocks_concurrently(code_blocks, kernel, arguments))
+        rendered_blocks: list[str] = []
         for block in blocks:
             if isinstance(block, TextRenderer):
                 rendered_blocks.append(block.render(kernel, arguments))
                 continue
             if isinstance(block, CodeRenderer):
-                try:
-                    rendered = await block.render_code(kernel, arguments)
-                except Exception as exc:
-                    logger.error(f"Error rendering code block: {exc}")
-                    raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
+                if rendered_code is not None:
+                    rendered = next(rendered_code)
+                else:
+                    rendered = await self._render_code_block(block, kernel, arguments)
                 rendered_blocks.append(rendered if allow_unsafe_function_output else escape(rendered))
         prompt = "".join(rendered_blocks)
         logger.debug(f"Rendered prompt: {prompt}")
         return prompt
 
+    async def _render_code_blocks_concurrently(
+        self, blocks: Sequence["CodeRenderer"], kernel: "Kernel", arguments: "KernelArguments"
+    ) -> list[str]:
+        """Render code blocks concurrently, bounded by max_concurrent_code_blocks.
+
+        The results are awaited in the order of the blocks, so the error of the first failing block is raised,
+        after which the blocks that are still running are cancelled.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_code_blocks)
+
+        async def render_code_block(block: "CodeRenderer") -> str:
+            async with semaphore:
+                return await self._render_code_block(block, kernel, arguments)
+
+        tasks = [asyncio.create_task(render_code_block(block)) for block in blocks]
+        try:
+            return [await task for task in tasks]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _render_code_block(block: "CodeRenderer", kernel: "Kernel", arguments: "KernelArguments") -> str:
+        try:
+            return await block.render_code(kernel, arguments)
+        except Exception as exc:
+            logger.error(f"Error rendering code block: {exc}")
+            raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
+
     @staticmethod
     def quick_render(template: str, arguments: dict[str, Any]) -> str:
         """Quick render a Kernel prompt template, only supports text and variable blocks.
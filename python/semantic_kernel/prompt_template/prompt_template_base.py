@@ -1,15 +1,18 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Sequence, Set
 from html import escape
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from pydantic import PrivateAttr
 
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 
 if TYPE_CHECKING:
     from semantic_kernel.functions.kernel_arguments import KernelArguments
+    from semantic_kernel.functions.kernel_function import KernelFunction
     from semantic_kernel.kernel import Kernel
     from semantic_kernel.prompt_template.input_variable import InputVariable
 
@@ -19,12 +22,38 @@ class PromptTemplateBase(KernelBaseModel, ABC):
 
     prompt_template_config: PromptTemplateConfig
     allow_dangerously_set_content: bool = False
+    _referenced_functions: tuple[Any, dict[str, "KernelFunction"]] | None = PrivateAttr(default=None)
 
     @abstractmethod
     async def render(self, kernel: "Kernel", arguments: "KernelArguments | None" = None) -> str:
         """Render the prompt template."""
         pass
 
+    def _get_referenced_functions(
+        self, kernel: "Kernel", referenced_names: Set[str], separator: str = "-"
+    ) -> dict[str, "KernelFunction"]:
+        """Get the functions of the kernel that are referenced by the template, by their helper name.
+
+        The helper name is the fully qualified name of the function, with the given separator
+        between the plugin and function name. The result is cached until the kernel, its plugins
+        or the referenced names change.
+
+        Args:
+            kernel: The kernel with the plugins.
+            referenced_names: The names referenced by the template.
+            separator: The separator used in the helper names.
+        """
+        key = (id(kernel), kernel.plugins_version, frozenset(referenced_names), separator)
+        if self._referenced_functions is None or self._referenced_functions[0] != key:
+            functions: dict[str, "KernelFunction"] = {}
+            for plugin in kernel.plugins.values():
+                for function in plugin:
+                    name = function.fully_qualified_name.replace("-", separator)
+                    if name in referenced_names:
+                        functions[name] = function
+            self._referenced_functions = (key, functions)
+        return self._referenced_functions[1]
+
     def _get_trusted_arguments(
         self,
         arguments: "KernelArguments",
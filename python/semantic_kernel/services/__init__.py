@@ -1,5 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.services.ai_service_selector import AIServiceSelector
+from typing import TYPE_CHECKING
+
+from semantic_kernel.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from semantic_kernel.services.ai_service_selector import AIServiceSelector
+
+_LAZY_ATTRIBUTES = {
+    "AIServiceSelector": ".ai_service_selector",
+}
 
 __all__ = ["AIServiceSelector"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -2,16 +2,20 @@
 
 from semantic_kernel.text.function_extension import aggregate_chunked_results
 from semantic_kernel.text.text_chunker import (
+    get_tiktoken_tokenizer,
     split_markdown_lines,
     split_markdown_paragraph,
     split_plaintext_lines,
     split_plaintext_paragraph,
+    split_text_stream,
 )
 
 __all__ = [
     "aggregate_chunked_results",
+    "get_tiktoken_tokenizer",
     "split_markdown_lines",
     "split_markdown_paragraph",
     "split_plaintext_lines",
     "split_plaintext_paragraph",
+    "split_text_stream",
 ]
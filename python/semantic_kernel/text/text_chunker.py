@@ -8,7 +8,10 @@ For markdown, split looking at punctuation first, and so on.
 
 import os
 import re
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
+from typing import Protocol
 
 NEWLINE = os.linesep
 
@@ -49,6 +52,37 @@ def _token_counter(text: str) -> int:
     return len(text) // 4
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough estimate of the number of tokens in a string, rounded up so that counts of parts add up."""
+    return -(-len(text) // 4)
+
+
+class Tokenizer(Protocol):
+    """A tokenizer with the interface of a tiktoken encoding."""
+
+    def encode(self, text: str) -> list[int]:
+        """Encode a text into tokens."""
+        ...
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        """Decode tokens into a text."""
+        ...
+
+
+@lru_cache(maxsize=None)
+def get_tiktoken_tokenizer(encoding_name: str = "cl100k_base") -> Tokenizer:
+    """Get a tiktoken encoding by name, loaded once and cached.
+
+    This requires the tiktoken package, the BPE files are downloaded on first use,
+    to work offline set the TIKTOKEN_CACHE_DIR environment variable to a folder with the BPE files.
+    """
+    try:
+        import tiktoken
+    except ImportError as exc:
+        raise ImportError("The tiktoken package is required, install it with `pip install tiktoken`.") from exc
+    return tiktoken.get_encoding(encoding_name)
+
+
 def split_plaintext_lines(text: str, max_token_per_line: int, token_counter: Callable = _token_counter) -> list[str]:
     """Split plain text into lines.
 
@@ -114,16 +148,22 @@ def _split_text_paragraph(text: list[str], max_tokens: int, token_counter: Calla
 
     paragraphs: list[str] = []
     current_paragraph: list[str] = []
+    # the default counter only depends on the length of the text, so the length of the paragraph is tracked
+    # instead of joining and recounting the paragraph for every line, other counters count the joined paragraph
+    count_by_length = token_counter is _token_counter
+    paragraph_length = 0
 
     for line in text:
         num_tokens_line = token_counter(line)
-        num_tokens_paragraph = token_counter("".join(current_paragraph))
+        num_tokens_paragraph = paragraph_length // 4 if count_by_length else token_counter("".join(current_paragraph))
 
         if num_tokens_paragraph + num_tokens_line + 1 >= max_tokens and len(current_paragraph) > 0:
             paragraphs.append("".join(current_paragraph).strip())
             current_paragraph = []
+            paragraph_length = 0
 
         current_paragraph.append(f"{line}{NEWLINE}")
+        paragraph_length += len(current_paragraph[-1])
 
     if len(current_paragraph) > 0:
         paragraphs.append("".join(current_paragraph).strip())
@@ -305,3 +345,99 @@ def _split_list(
         input_was_split = input_was_split or was_split
 
     return lines, input_was_split
+
+
+def split_text_stream(
+    text: str | Iterable[str],
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    token_counter: Callable[[str], int] = _estimate_tokens,
+    tokenizer: Tokenizer | None = None,
+    markdown: bool = False,
+) -> Iterator[str]:
+    """Split text into chunks of at most max_tokens tokens, yielding the chunks as they are completed.
+
+    The text is read line by line, it can be a string or any iterable of strings, like an open file,
+    so large documents are split without holding them in memory.
+    Lines are added to the current chunk with a running count of its tokens, so each line is counted once,
+    lines longer than max_tokens are first split on punctuation, like split_plaintext_lines does.
+    Consecutive chunks share up to overlap_tokens tokens of whole lines or line parts.
+
+    Args:
+        text: The text, or an iterable of parts of the text, like its lines.
+        max_tokens: The maximum number of tokens in a chunk.
+        overlap_tokens: The maximum number of tokens that a chunk repeats from the end of the previous one.
+        token_counter: The function that counts the tokens of a text, ignored when a tokenizer is given.
+        tokenizer: A tokenizer with a tiktoken compatible interface, see get_tiktoken_tokenizer.
+            Lines that can not be split on punctuation are then split on token boundaries.
+        markdown: Whether the text is markdown, which changes the order of the separators used to split lines.
+
+    Returns:
+        An iterator over the chunks.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be greater than 0.")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be at least 0 and less than max_tokens.")
+    count_tokens = _tokenizer_counter(tokenizer) if tokenizer is not None else token_counter
+    window: deque[tuple[str, int]] = deque()
+    window_tokens = 0
+    for piece in _split_long_lines(_iter_lines(text), max_tokens, count_tokens, tokenizer, markdown):
+        piece_tokens = count_tokens(piece)
+        if window and window_tokens + piece_tokens > max_tokens:
+            if chunk := "".join(part for part, _ in window).strip():
+                yield chunk
+            # keep the end of the chunk as the overlap, as long as the new piece still fits
+            while window and (window_tokens > overlap_tokens or window_tokens + piece_tokens > max_tokens):
+                window_tokens -= window.popleft()[1]
+        window.append((piece, piece_tokens))
+        window_tokens += piece_tokens
+    if chunk := "".join(part for part, _ in window).strip():
+        yield chunk
+
+
+def _tokenizer_counter(tokenizer: Tokenizer) -> Callable[[str], int]:
+    encode = tokenizer.encode
+    return lambda text: len(encode(text))
+
+
+def _iter_lines(text: str | Iterable[str]) -> Iterator[str]:
+    """Iterate over the lines of a text or of an iterable of texts, keeping the line endings."""
+    parts = [text] if isinstance(text, str) else text
+    pending = ""
+    for part in parts:
+        start = 0
+        while (end := part.find("\n", start)) != -1:
+            yield pending + part[start : end + 1]
+            pending = ""
+            start = end + 1
+        pending += part[start:]
+    if pending:
+        yield pending
+
+
+def _split_long_lines(
+    lines: Iterable[str],
+    max_tokens: int,
+    token_counter: Callable[[str], int],
+    tokenizer: Tokenizer | None,
+    markdown: bool,
+) -> Iterator[str]:
+    """Split the lines that have more than max_tokens tokens, other lines are passed through as is."""
+    separators = MD_SPLIT_OPTIONS if markdown else TEXT_SPLIT_OPTIONS
+    if tokenizer is not None:
+        # the last resort of splitting in half is replaced by splitting on token boundaries
+        separators = [option for option in separators if option is not None]
+    for line in lines:
+        if token_counter(line) <= max_tokens:
+            yield line
+            continue
+        for part in _split_str_lines(
+            text=line, max_tokens=max_tokens, separators=separators, trim=False, token_counter=token_counter
+        ):
+            if tokenizer is not None and token_counter(part) > max_tokens:
+                tokens = tokenizer.encode(part)
+                for start in range(0, len(tokens), max_tokens):
+                    yield tokenizer.decode(tokens[start : start + max_tokens])
+            else:
+                yield part
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import time
 from collections.abc import Callable
 from functools import partial
 from typing import Any
@@ -9,3 +10,40 @@ from typing import Any
 async def run_in_executor(executor: Any, func: Callable, *args, **kwargs) -> Any:
     """Run a function in an executor."""
     return await asyncio.get_event_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+class RateLimiter:
+    """Limits the use of a resource, like requests or tokens, to a budget per period.
+
+    The budget is kept in a bucket that holds at most one period worth and refills continuously,
+    callers wait in order until enough of the budget is available.
+    A single acquire larger than the budget waits for a full bucket and then takes all of it.
+    """
+
+    def __init__(self, limit: int, period: float = 60.0) -> None:
+        """Create a rate limiter.
+
+        Args:
+            limit: The budget per period.
+            period: The length of the period in seconds, defaults to a minute.
+        """
+        if limit <= 0:
+            raise ValueError("The limit must be greater than 0.")
+        self.limit = limit
+        self.period = period
+        self._available = float(limit)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: int = 1) -> None:
+        """Wait until the amount is available and take it from the budget."""
+        amount = min(amount, self.limit)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._available = min(self.limit, self._available + (now - self._updated) * self.limit / self.period)
+                self._updated = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                await asyncio.sleep((amount - self._available) * self.period / self.limit)
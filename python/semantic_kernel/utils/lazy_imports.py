@@ -0,0 +1,37 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_module_attributes(
+    package: str, attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module `__getattr__` and `__dir__` functions (PEP 562) that import the attributes of a package lazily.
+
+    An attribute is imported from its submodule the first time it is accessed, and is then set on the package,
+    so later lookups do not go through `__getattr__`. This keeps `import semantic_kernel` and the imports of the
+    connector packages cheap, only the modules that are used are imported.
+
+    Args:
+        package: The name of the package, `__name__` of the `__init__` module.
+        attributes: The names of the attributes, mapped to the submodules that define them,
+            relative to the package.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions for the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if (submodule := attributes.get(name)) is None:
+            raise AttributeError(f"module {package} has no attribute {name}")
+        value = getattr(importlib.import_module(submodule, package=package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,62 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of the import time of common entry points of the semantic_kernel package.
+
+Every entry point is imported in a new interpreter with `python -X importtime`. The import time is the sum of
+the cumulative times of the top level imports of the statement, the modules that the interpreter imports at
+startup are not counted. The modules that take the longest to import, including their own imports,
+are listed with `--top`.
+
+Run with: `python tests/benchmarks/import_time.py --runs 5 --top 10`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = [
+    "import semantic_kernel",
+    "from semantic_kernel import Kernel",
+    "from semantic_kernel.functions import kernel_function",
+    "from semantic_kernel.contents import ChatHistory",
+    "from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion",
+    "from semantic_kernel.agents import ChatCompletionAgent",
+]
+
+
+def import_times(statement: str) -> list[tuple[str, float, bool]]:
+    """Run the statement in a new interpreter, returns the modules with their cumulative import time in ms,
+    and whether they are top level imports."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    ).stderr
+    modules: list[tuple[str, float, bool]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules.append((name.strip(), int(cumulative) / 1000, not name.startswith("  ")))
+    return modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="The number of slowest modules to list per entry point.")
+    args = parser.parse_args()
+
+    startup = {name for name, _, _ in import_times("pass")}
+    for statement in ENTRY_POINTS:
+        totals: list[float] = []
+        for _ in range(args.runs):
+            modules = import_times(statement)
+            totals.append(sum(ms for name, ms, top_level in modules if top_level and name not in startup))
+        print(f"{statement}: median {statistics.median(totals):.1f} ms, min {min(totals):.1f} ms over {args.runs} runs")
+        slowest = sorted((module for module in modules if module[0] not in startup), key=lambda m: m[1], reverse=True)
+        for name, ms, _ in slowest[: args.top]:
+            print(f"    {ms:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
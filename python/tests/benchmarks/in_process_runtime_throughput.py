@@ -0,0 +1,83 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of the messages per second through the send and publish paths of the InProcessRuntime.
+
+Messages carrying a chat history are sent to one agent and published to a topic with several subscribers.
+With `--log-events` the event logger of the runtime is enabled, so the cost of the message events is included.
+
+Run with: `python tests/benchmarks/in_process_runtime_throughput.py --messages 2000 --subscribers 5 --log-events`
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+from semantic_kernel.agents.runtime.core.agent_id import CoreAgentId
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.core.serialization import try_get_known_serializers_for_type
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+
+
+@dataclass
+class ChatMessage:
+    history: list[str] = field(default_factory=list)
+
+
+class EchoAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An echo agent.")
+
+    @message_handler
+    async def on_chat_message(self, message: ChatMessage, ctx: MessageContext) -> ChatMessage:
+        return message
+
+
+async def run(messages: int, subscribers: int) -> tuple[float, float]:
+    runtime = InProcessRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(ChatMessage))
+    for index in range(subscribers):
+        await EchoAgent.register(runtime, f"echo{index}", EchoAgent)
+        await runtime.add_subscription(TypeSubscription("chat", f"echo{index}"))
+    message = ChatMessage(history=[f"turn {turn}: " + "lorem ipsum " * 20 for turn in range(20)])
+    runtime.start()
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        await runtime.send_message(message, CoreAgentId("echo0", "default"))
+    send_rate = messages / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        await runtime.publish_message(message, TopicId("chat", "default"))
+    await runtime.stop_when_idle()
+    publish_rate = messages / (time.perf_counter() - start)
+
+    await runtime.close()
+    return send_rate, publish_rate
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--subscribers", type=int, default=5)
+    parser.add_argument("--log-events", action="store_true", help="Enable the event logger of the runtime.")
+    args = parser.parse_args()
+
+    if args.log_events:
+        event_logger = logging.getLogger("in_process_runtime.events")
+        event_logger.setLevel(logging.INFO)
+        event_logger.addHandler(logging.NullHandler())
+        event_logger.propagate = False
+
+    send_rate, publish_rate = await run(args.messages, args.subscribers)
+    print(f"send: {send_rate:.0f} messages/s")
+    print(f"publish to {args.subscribers} subscribers: {publish_rate:.0f} messages/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of the local process runtime on a fan-out/fan-in process graph.
+
+A source step fans out to the worker steps, and every worker sends its result to a single collector step,
+which stops the process once it received all results.
+
+Run with: `python tests/benchmarks/local_process_fan_out.py --steps 500 --runs 5`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from pydantic import BaseModel, Field
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions import kernel_function
+from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess
+from semantic_kernel.processes.kernel_process.kernel_process_step import KernelProcessStep
+from semantic_kernel.processes.kernel_process.kernel_process_step_context import KernelProcessStepContext
+from semantic_kernel.processes.kernel_process.kernel_process_step_state import KernelProcessStepState
+from semantic_kernel.processes.local_runtime.local_event import KernelProcessEvent
+from semantic_kernel.processes.local_runtime.local_kernel_process_context import LocalKernelProcessContext
+from semantic_kernel.processes.local_runtime.local_process import LocalProcess
+from semantic_kernel.processes.process_builder import ProcessBuilder
+
+
+class SourceStep(KernelProcessStep):
+    @kernel_function
+    async def start(self, context: KernelProcessStepContext, value: int):
+        await context.emit_event(process_event="Started", data=value)
+
+
+class WorkerStep(KernelProcessStep):
+    @kernel_function
+    async def work(self, context: KernelProcessStepContext, value: int):
+        await context.emit_event(process_event="Done", data=value + 1)
+
+
+class CollectorState(BaseModel):
+    expected: int = 0
+    received: list[int] = Field(default_factory=list)
+
+
+class CollectorStep(KernelProcessStep[CollectorState]):
+    state: CollectorState = Field(default_factory=CollectorState)
+
+    async def activate(self, state: KernelProcessStepState[CollectorState]):
+        self.state = state.state
+
+    @kernel_function
+    async def collect(self, context: KernelProcessStepContext, value: int):
+        self.state.received.append(value)
+        if len(self.state.received) == self.state.expected:
+            await context.emit_event(process_event="AllDone", data=sum(self.state.received))
+
+
+def build_fan_out_process(steps: int) -> KernelProcess:
+    """Build a process with a source step fanning out to `steps` workers that fan in to a collector."""
+    process = ProcessBuilder(name="FanOutFanIn")
+    source = process.add_step(SourceStep, name="Source")
+    collector = process.add_step(CollectorStep, name="Collector", initial_state=CollectorState(expected=steps))
+    process.on_input_event("Start").send_event_to(source)
+    for index in range(steps):
+        worker = process.add_step(WorkerStep, name=f"Worker{index}")
+        source.on_event("Started").send_event_to(worker)
+        worker.on_event("Done").send_event_to(collector)
+    collector.on_event("AllDone").stop_process()
+    return process.build()
+
+
+async def run_once(steps: int) -> tuple[float, LocalProcess]:
+    """Run the process once, returns the wall time in seconds and the process."""
+    process_context = LocalKernelProcessContext(build_fan_out_process(steps), Kernel())
+    start_time = time.perf_counter()
+    await process_context.start_with_event(KernelProcessEvent(id="Start", data=1))
+    return time.perf_counter() - start_time, process_context.local_process
+
+
+async def main(steps: int, runs: int) -> None:
+    durations = []
+    for _ in range(runs):
+        duration, local_process = await run_once(steps)
+        durations.append(duration)
+    print(f"{steps} steps, {runs} runs: median {statistics.median(durations):.3f}s, min {min(durations):.3f}s")
+    for metrics in local_process.superstep_metrics:
+        print(
+            f"  superstep {metrics.superstep}: {metrics.messages} messages to {metrics.active_steps} steps, "
+            f"{metrics.messages_per_second:.0f} messages/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=500, help="The number of worker steps.")
+    parser.add_argument("--runs", type=int, default=5, help="The number of runs.")
+    args = parser.parse_args()
+    asyncio.run(main(args.steps, args.runs))
@@ -0,0 +1,96 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of CPU-heavy agents on the InProcessRuntime and on the MultiProcessRuntime.
+
+Every agent hashes its input a number of rounds for every message, which holds the event loop like a local model
+or a parser would. The messages are sent concurrently to agents with different keys, on the InProcessRuntime they
+are handled one after another, on the MultiProcessRuntime the agents are sharded across the worker processes.
+The time includes the messages to and from the workers, not the start of the workers.
+
+Run with: `python tests/benchmarks/multi_process_runtime.py --messages 64 --agents 8 --rounds 20000 --workers 4`
+"""
+
+import argparse
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+
+from semantic_kernel.agents.runtime.core.agent_id import CoreAgentId
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
+from semantic_kernel.agents.runtime.multi_process.multi_process_runtime import MultiProcessRuntime
+
+
+@dataclass
+class Work:
+    data: str
+    rounds: int
+
+
+@dataclass
+class Digest:
+    digest: str
+
+
+class HashingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("A CPU-heavy agent.")
+
+    @message_handler
+    async def on_work(self, message: Work, ctx: MessageContext) -> Digest:
+        digest = message.data.encode("utf-8")
+        for _ in range(message.rounds):
+            digest = hashlib.sha256(digest).digest()
+        return Digest(digest=digest.hex())
+
+
+async def run(runtime: InProcessRuntime, messages: int, agents: int, rounds: int) -> float:
+    await HashingAgent.register(runtime, "hashing", HashingAgent)
+    runtime.start()
+    # Instantiate the agents, and start the workers of the MultiProcessRuntime, before the time is taken
+    await asyncio.gather(
+        *(
+            runtime.send_message(Work(data="warm up", rounds=1), CoreAgentId("hashing", str(key)))
+            for key in range(agents)
+        )
+    )
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            runtime.send_message(
+                Work(data=f"message {index}", rounds=rounds), CoreAgentId("hashing", str(index % agents))
+            )
+            for index in range(messages)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    await runtime.close()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=64)
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to the number of CPUs.")
+    args = parser.parse_args()
+
+    in_process = await run(InProcessRuntime(), args.messages, args.agents, args.rounds)
+    print(f"InProcessRuntime: {in_process:.2f} s, {args.messages / in_process:.1f} messages/s")
+    multi_process = await run(
+        MultiProcessRuntime(sharded_agent_types=["hashing"], num_workers=args.workers),
+        args.messages,
+        args.agents,
+        args.rounds,
+    )
+    print(f"MultiProcessRuntime: {multi_process:.2f} s, {args.messages / multi_process:.1f} messages/s")
+    print(f"speed up: {in_process / multi_process:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of the upserts, saving and loading of the USearchMemoryStore.
+
+Records are upserted in small batches, the collection is saved with `close`, then the persist directory is opened
+again and searched. The first search after opening is timed separately, as it touches the memory-mapped files.
+
+Run with: `python tests/benchmarks/usearch_memory_store_persistence.py --records 100000 --batch-size 10`
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import numpy as np
+
+from semantic_kernel.connectors.memory.usearch import USearchMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((args.records, args.dimensions), dtype=np.float32)
+    with tempfile.TemporaryDirectory() as persist_directory:
+        store = USearchMemoryStore(persist_directory)
+        await store.create_collection("benchmark", ndim=args.dimensions, metric="cos")
+        start = time.perf_counter()
+        for offset in range(0, args.records, args.batch_size):
+            await store.upsert_batch(
+                "benchmark",
+                [
+                    MemoryRecord.local_record(
+                        id=str(i), text=f"record {i}", description=None, additional_metadata=None, embedding=embedding
+                    )
+                    for i, embedding in enumerate(embeddings[offset : offset + args.batch_size], start=offset)
+                ],
+            )
+        print(f"upsert of {args.records} records in batches of {args.batch_size}: {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        await store.close()
+        print(f"save: {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        store = USearchMemoryStore(persist_directory)
+        print(f"open: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        queries = rng.standard_normal((args.queries, args.dimensions), dtype=np.float32)
+        start = time.perf_counter()
+        await store.get_nearest_matches("benchmark", queries[0], limit=10, with_embeddings=False)
+        print(f"first query: {(time.perf_counter() - start) * 1000:.2f} ms")
+        start = time.perf_counter()
+        for query in queries:
+            await store.get_nearest_matches("benchmark", query, limit=10, with_embeddings=False)
+        print(f"queries: {(time.perf_counter() - start) / args.queries * 1000:.2f} ms per query")
+        await store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
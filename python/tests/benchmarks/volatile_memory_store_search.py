@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of the nearest match search of the VolatileMemoryStore.
+
+A collection of random embeddings is searched with single queries and with a batch of queries,
+the time per query is reported for both.
+
+Run with: `python tests/benchmarks/volatile_memory_store_search.py --records 50000 --dimensions 1536 --queries 100`
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    store = VolatileMemoryStore()
+    await store.create_collection("benchmark")
+    start = time.perf_counter()
+    await store.upsert_batch(
+        "benchmark",
+        [
+            MemoryRecord.local_record(
+                id=str(i), text=f"record {i}", description=None, additional_metadata=None, embedding=embedding
+            )
+            for i, embedding in enumerate(rng.standard_normal((args.records, args.dimensions)))
+        ],
+    )
+    print(f"upsert of {args.records} records: {time.perf_counter() - start:.2f} s")
+
+    queries = rng.standard_normal((args.queries, args.dimensions))
+    start = time.perf_counter()
+    for query in queries:
+        await store.get_nearest_matches("benchmark", query, limit=args.limit)
+    print(f"single queries: {(time.perf_counter() - start) / args.queries * 1000:.2f} ms per query")
+
+    start = time.perf_counter()
+    await store.get_nearest_matches_batch("benchmark", queries, limit=args.limit)
+    print(f"batched queries: {(time.perf_counter() - start) / args.queries * 1000:.2f} ms per query")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
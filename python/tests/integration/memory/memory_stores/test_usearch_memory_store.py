@@ -262,11 +262,11 @@ async def test_create_and_save_collection(tmpdir, memory_record1, memory_record2
     await memory.upsert_batch("test_collection3", [memory_record1, memory_record3])
     await memory.close()
 
-    assert (tmpdir / "test_collection1.parquet").exists()
+    assert (tmpdir / "test_collection1.arrow").exists()
     assert (tmpdir / "test_collection1.usearch").exists()
-    assert (tmpdir / "test_collection2.parquet").exists()
+    assert (tmpdir / "test_collection2.arrow").exists()
     assert (tmpdir / "test_collection2.usearch").exists()
-    assert (tmpdir / "test_collection3.parquet").exists()
+    assert (tmpdir / "test_collection3.arrow").exists()
     assert (tmpdir / "test_collection3.usearch").exists()
 
     memory = USearchMemoryStore(tmpdir)
@@ -0,0 +1,179 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from semantic_kernel.agents.orchestration.concurrent import ConcurrentOrchestration
+from semantic_kernel.agents.runtime.core.agent_id import CoreAgentId
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+from semantic_kernel.agents.runtime.multi_process.multi_process_runtime import MultiProcessRuntime
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from tests.unit.agents.orchestration.conftest import MockAgent
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The worker processes are forked.")
+
+
+@dataclass
+class Ping:
+    content: str
+
+
+@dataclass
+class Pong:
+    content: str
+    pid: int
+
+
+@dataclass
+class Forward:
+    recipient_key: str
+    content: str
+
+
+class EchoAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An echo agent.")
+        self.count = 0
+
+    @message_handler
+    async def on_ping(self, message: Ping, ctx: MessageContext) -> Pong:
+        self.count += 1
+        if message.content == "fail":
+            raise ValueError("echo failed")
+        return Pong(content=message.content, pid=os.getpid())
+
+    @message_handler
+    async def on_forward(self, message: Forward, ctx: MessageContext) -> Pong:
+        return await self.send_message(Ping(message.content), CoreAgentId("echo", message.recipient_key))
+
+    async def save_state(self):
+        return {"count": self.count}
+
+    async def load_state(self, state):
+        self.count = state["count"]
+
+
+class CollectorAgent(RoutedAgent):
+    received: asyncio.Queue
+
+    def __init__(self) -> None:
+        super().__init__("A collector agent.")
+
+    @message_handler
+    async def on_pong(self, message: Pong, ctx: MessageContext) -> None:
+        CollectorAgent.received.put_nowait(message)
+
+
+class ReplyingEchoAgent(EchoAgent):
+    @message_handler
+    async def on_ping(self, message: Ping, ctx: MessageContext) -> Pong:
+        pong = Pong(content=message.content, pid=os.getpid())
+        await self.publish_message(pong, TopicId("pongs", "default"))
+        return pong
+
+
+async def _start_runtime(agent_class: type[EchoAgent] = EchoAgent) -> MultiProcessRuntime:
+    runtime = MultiProcessRuntime(sharded_agent_types=["echo"], num_workers=2)
+    await agent_class.register(runtime, "echo", agent_class)
+    runtime.start()
+    return runtime
+
+
+async def test_send_message_to_worker_agent():
+    runtime = await _start_runtime()
+    try:
+        pong = await runtime.send_message(Ping("hello"), CoreAgentId("echo", "a"))
+        assert pong == Pong(content="hello", pid=pong.pid)
+        assert pong.pid != os.getpid()
+
+        with pytest.raises(LookupError):
+            await runtime.try_get_underlying_agent_instance(CoreAgentId("echo", "a"))
+        metadata = await runtime.agent_metadata(CoreAgentId("echo", "a"))
+        assert (metadata.type, metadata.key, metadata.description) == ("echo", "a", "An echo agent.")
+    finally:
+        await runtime.close()
+
+
+async def test_agents_are_sharded_across_workers():
+    runtime = await _start_runtime()
+    try:
+        pids = {(await runtime.send_message(Ping("hello"), CoreAgentId("echo", str(key)))).pid for key in range(16)}
+        assert len(pids) == 2
+        # An agent is always hosted by the same worker
+        first = await runtime.send_message(Ping("hello"), CoreAgentId("echo", "0"))
+        second = await runtime.send_message(Ping("hello"), CoreAgentId("echo", "0"))
+        assert first.pid == second.pid
+    finally:
+        await runtime.close()
+
+
+async def test_worker_agents_send_and_publish_through_main_process():
+    CollectorAgent.received = asyncio.Queue()
+    runtime = await _start_runtime(ReplyingEchoAgent)
+    await CollectorAgent.register(runtime, "collector", CollectorAgent)
+    await runtime.add_subscription(TypeSubscription("pongs", "collector"))
+    try:
+        pong = await runtime.send_message(Forward(recipient_key="b", content="hi"), CoreAgentId("echo", "a"))
+        assert pong.content == "hi"
+        published = await asyncio.wait_for(CollectorAgent.received.get(), timeout=10)
+        assert published == pong
+    finally:
+        await runtime.close()
+
+
+async def test_save_and_load_worker_agent_state():
+    runtime = await _start_runtime()
+    try:
+        agent_id = CoreAgentId("echo", "a")
+        await runtime.send_message(Ping("one"), agent_id)
+        await runtime.send_message(Ping("two"), agent_id)
+        assert await runtime.agent_save_state(agent_id) == {"count": 2}
+
+        await runtime.agent_load_state(agent_id, {"count": 10})
+        assert await runtime.agent_save_state(agent_id) == {"count": 10}
+    finally:
+        await runtime.close()
+
+
+async def test_worker_agent_exception_is_raised_to_sender():
+    runtime = await _start_runtime()
+    try:
+        with pytest.raises(ValueError, match="echo failed"):
+            await runtime.send_message(Ping("fail"), CoreAgentId("echo", "a"))
+    finally:
+        await runtime.close()
+
+
+async def test_sharded_agent_type_must_be_registered_before_start():
+    runtime = MultiProcessRuntime(sharded_agent_types=["echo", "late"], num_workers=1)
+    await EchoAgent.register(runtime, "echo", EchoAgent)
+    runtime.start()
+    try:
+        with pytest.raises(RuntimeError):
+            await EchoAgent.register(runtime, "late", EchoAgent)
+        # Agent types that are not sharded can still be registered
+        await EchoAgent.register(runtime, "local", EchoAgent)
+        pong = await runtime.send_message(Ping("hello"), CoreAgentId("local", "a"))
+        assert pong.pid == os.getpid()
+    finally:
+        await runtime.close()
+
+
+async def test_orchestration_runs_unchanged():
+    runtime = await _start_runtime()
+    try:
+        orchestration = ConcurrentOrchestration(members=[MockAgent(), MockAgent()])
+        orchestration_result = await orchestration.invoke(task="test_message", runtime=runtime)
+        result = await orchestration_result.get(1.0)
+
+        assert len(result) == 2
+        assert all(isinstance(item, ChatMessageContent) for item in result)
+    finally:
+        await runtime.close()
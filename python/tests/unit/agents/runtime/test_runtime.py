@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import json
 import logging
 from asyncio import Event
 from collections.abc import Sequence
@@ -395,3 +396,40 @@ async def test_event_handler_exception_multi_message() -> None:
         await runtime.stop_when_idle()
 
     await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_event_payloads_are_serialized_once_per_envelope(caplog: pytest.LogCaptureFixture) -> None:
+    runtime = InProcessRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    for name in ["name1", "name2", "name3"]:
+        await LoopbackAgentWithDefaultSubscription.register(runtime, name, LoopbackAgentWithDefaultSubscription)
+    serialized: list[Any] = []
+    try_serialize = runtime._try_serialize
+
+    def counting_try_serialize(message: Any) -> str:
+        serialized.append(message)
+        return try_serialize(message)
+
+    runtime._try_serialize = counting_try_serialize  # type: ignore[method-assign]
+
+    async def send_and_publish() -> None:
+        runtime.start()
+        await runtime.publish_message(ContentMessage(content="published"), topic_id=DefaultTopicId())
+        await runtime.send_message(ContentMessage(content="sent"), CoreAgentId("name1", "default"))
+        await runtime.stop_when_idle()
+
+    with caplog.at_level(logging.WARNING, logger="in_process_runtime.events"):
+        await send_and_publish()
+    assert serialized == []
+
+    with caplog.at_level(logging.INFO, logger="in_process_runtime.events"):
+        await send_and_publish()
+    # the published message, the sent message and its response
+    assert [message.content for message in serialized] == ["published", "sent", "sent"]
+    events = [record for record in caplog.records if record.name == "in_process_runtime.events"]
+    # a send event and a delivery per subscriber for the publish, a send and a delivery for the message and response
+    assert len(events) == 8
+    assert sum(json.loads(str(event.msg))["payload"] == '{"content": "published"}' for event in events) == 4
+
+    await runtime.close()
@@ -0,0 +1,101 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import pytest
+
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import SubscriptionManager
+from semantic_kernel.agents.runtime.in_process.type_prefix_subscription import TypePrefixSubscription
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+
+
+class SourceSubscription:
+    """A subscription that is not indexed, it matches on the source of the topic."""
+
+    def __init__(self, source: str, agent_type: str, id: str) -> None:
+        self.source = source
+        self.agent_type = agent_type
+        self.id = id
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SourceSubscription) and self.id == other.id
+
+    def is_match(self, topic_id: TopicId) -> bool:
+        return topic_id.source == self.source
+
+    def map_to_agent(self, topic_id: TopicId) -> AgentId:
+        return CoreAgentId(self.agent_type, "source")
+
+
+def _agent_types(recipients: list[AgentId]) -> list[str]:
+    return [recipient.type for recipient in recipients]
+
+
+async def test_recipients_in_subscription_order():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypePrefixSubscription("chat", "prefix_agent"))
+    await manager.add_subscription(TypeSubscription("chat.group", "type_agent"))
+    await manager.add_subscription(SourceSubscription("session", "source_agent", id="source"))
+    await manager.add_subscription(TypePrefixSubscription("", "any_agent"))
+    await manager.add_subscription(TypePrefixSubscription("chat.group.x", "long_prefix_agent"))
+
+    recipients = await manager.get_subscribed_recipients(TopicId("chat.group", "session"))
+    assert _agent_types(recipients) == ["prefix_agent", "type_agent", "source_agent", "any_agent"]
+    assert recipients[0] == CoreAgentId("prefix_agent", "session")
+    assert _agent_types(await manager.get_subscribed_recipients(TopicId("other", "other"))) == ["any_agent"]
+    assert len(manager.subscriptions) == 5
+
+
+async def test_add_and_remove_update_cached_topics():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("chat", "first", id="first"))
+    chat = TopicId("chat", "default")
+    other = TopicId("other", "default")
+    assert _agent_types(await manager.get_subscribed_recipients(chat)) == ["first"]
+    assert await manager.get_subscribed_recipients(other) == []
+    cached_other = await manager.get_subscribed_recipients(other)
+
+    await manager.add_subscription(TypePrefixSubscription("ch", "second", id="second"))
+    await manager.add_subscription(SourceSubscription("default", "third", id="third"))
+    assert _agent_types(await manager.get_subscribed_recipients(chat)) == ["first", "second", "third"]
+    assert _agent_types(await manager.get_subscribed_recipients(other)) == ["third"]
+
+    await manager.remove_subscription("first")
+    await manager.remove_subscription("third")
+    assert _agent_types(await manager.get_subscribed_recipients(chat)) == ["second"]
+    assert await manager.get_subscribed_recipients(other) == []
+    # the recipients of a topic are replaced, not changed in place, while a message may be delivered to them
+    assert cached_other == []
+
+    await manager.remove_subscription("second")
+    assert await manager.get_subscribed_recipients(chat) == []
+    assert not manager._prefix_trie.get("c")
+    with pytest.raises(ValueError):
+        await manager.remove_subscription("second")
+
+
+async def test_duplicate_subscriptions():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("chat", "agent", id="a"))
+    await manager.add_subscription(TypePrefixSubscription("chat", "agent", id="b"))
+
+    for duplicate in [
+        TypeSubscription("chat", "agent"),
+        TypeSubscription("other", "other_agent", id="a"),
+        TypePrefixSubscription("chat", "agent"),
+    ]:
+        with pytest.raises(ValueError):
+            await manager.add_subscription(duplicate)
+    await manager.add_subscription(TypeSubscription("chat", "other_agent"))
+
+
+async def test_cached_topics_are_bounded():
+    manager = SubscriptionManager(max_cached_topics=2)
+    await manager.add_subscription(TypeSubscription("chat", "agent"))
+
+    for source in ["a", "b", "a", "c"]:
+        await manager.get_subscribed_recipients(TopicId("chat", source))
+    # b was the least recently used topic
+    assert list(manager._subscribed_recipients) == [TopicId("chat", "a"), TopicId("chat", "c")]
+    assert manager._cached_topics_by_type["chat"] == {TopicId("chat", "a"), TopicId("chat", "c")}
+    assert await manager.get_subscribed_recipients(TopicId("chat", "b")) == [CoreAgentId("agent", "b")]
@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 from collections.abc import AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
@@ -262,8 +262,7 @@ async def test_service_url_new(setup_ollama_chat_completion):
 
 async def test_prepare_chat_history_for_request(setup_ollama_chat_completion):
     ollama_chat_completion, _ = setup_ollama_chat_completion
-    chat_history = MagicMock(spec=ChatHistory)
-    chat_history.messages = []
+    chat_history = ChatHistory()
 
     prepared_history = ollama_chat_completion._prepare_chat_history_for_request(chat_history)
     assert prepared_history == []
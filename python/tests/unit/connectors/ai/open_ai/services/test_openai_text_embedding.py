@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from openai import AsyncClient
@@ -124,3 +125,58 @@ async def test_embedding_pes(mock_create, openai_unit_test_env) -> None:
         model=ai_model_id,
         dimensions=embedding_dimensions,
     )
+
+
+async def test_embedding_concurrent_batches(openai_unit_test_env) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create(input, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # finish the earlier batches last, to check the order of the results
+        await asyncio.sleep(0.01 * (10 - input[0]))
+        in_flight -= 1
+        return MagicMock(data=[MagicMock(embedding=[float(value)]) for value in input])
+
+    texts = list(range(10))
+    settings = OpenAIEmbeddingPromptExecutionSettings()
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_concurrent_requests = 3
+    openai_text_embedding.requests_per_minute = 1000
+    openai_text_embedding.tokens_per_minute = 1000
+
+    with patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock, side_effect=create) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(texts, settings, batch_size=2)
+
+    assert embeddings == [[float(value)] for value in texts]
+    assert mock_create.await_count == 5
+    assert max_in_flight == 3
+    assert settings.input is None
+
+
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_split_on_tokens(mock_create, openai_unit_test_env) -> None:
+    texts = ["aaaa", "bbbb", "cccccccc", "dd", "e"]
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_tokens_per_request = 8
+    openai_text_embedding.token_counter = len
+
+    await openai_text_embedding.generate_raw_embeddings(texts)
+
+    assert [call.kwargs["input"] for call in mock_create.await_args_list] == [
+        ["aaaa", "bbbb"],
+        ["cccccccc"],
+        ["dd", "e"],
+    ]
+
+
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batch_fail_cancels_others(mock_create, openai_unit_test_env) -> None:
+    mock_create.side_effect = [Exception("fail"), MagicMock(data=[])]
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_concurrent_requests = 2
+
+    with pytest.raises(ServiceResponseException):
+        await openai_text_embedding.generate_raw_embeddings(["a", "b"], batch_size=1)
@@ -0,0 +1,158 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import time
+
+import numpy as np
+from pytest import fixture
+
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.cached_chat_completion import CachedChatCompletion
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+
+
+class CountingChatCompletion(ChatCompletionClientBase):
+    calls: list[str] = []
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        self.calls.append(chat_history.messages[-1].content)
+        return [ChatMessageContent(role=AuthorRole.ASSISTANT, content=f"answer {len(self.calls)}")]
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        self.calls.append(chat_history.messages[-1].content)
+        for text in ["stream", "ed ", f"answer {len(self.calls)}"]:
+            yield [StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, content=text)]
+
+
+class KeywordEmbeddings(EmbeddingGeneratorBase):
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        return np.array([[float("price" in text), float("hours" in text), 0.1] for text in texts])
+
+
+@fixture
+def inner() -> CountingChatCompletion:
+    return CountingChatCompletion(service_id="chat", ai_model_id="mock")
+
+
+def _history(*questions: str) -> ChatHistory:
+    chat_history = ChatHistory(system_message="You answer questions.")
+    for question in questions:
+        chat_history.add_user_message(question)
+    return chat_history
+
+
+async def test_exact_cache(inner):
+    service = CachedChatCompletion(inner)
+    assert service.service_id == "chat"
+    assert service.ai_model_id == "mock"
+    settings = PromptExecutionSettings()
+
+    first = await service.get_chat_message_contents(_history("What is the price?"), settings)
+    second = await service.get_chat_message_contents(_history("What is the price?"), settings)
+    assert first[0].content == second[0].content == "answer 1"
+    assert first[0] is not second[0]
+    await service.get_chat_message_contents(_history("What is the price?"), PromptExecutionSettings(temperature=0.5))
+    await service.get_chat_message_contents(_history("What are the opening hours?"), settings)
+
+    assert len(inner.calls) == 3
+    assert (service.cache_hits, service.cache_misses) == (1, 3)
+    assert service.hit_rate == 0.25
+
+
+async def test_streaming_replay(inner):
+    service = CachedChatCompletion(inner)
+    settings = PromptExecutionSettings()
+
+    streamed = [chunk async for chunk in service.get_streaming_chat_message_contents(_history("Hi"), settings)]
+    replayed = [chunk async for chunk in service.get_streaming_chat_message_contents(_history("Hi"), settings)]
+    assert [chunk[0].content for chunk in replayed] == [chunk[0].content for chunk in streamed]
+    assert len(inner.calls) == 1
+
+    # the chunks are combined for the non-streaming API
+    messages = await service.get_chat_message_contents(_history("Hi"), settings)
+    assert messages[0].content == "streamed answer 1"
+
+    # and a response that was not streamed is replayed as a single chunk
+    await service.get_chat_message_contents(_history("Hello"), settings)
+    replayed = [chunk async for chunk in service.get_streaming_chat_message_contents(_history("Hello"), settings)]
+    assert len(replayed) == 1
+    assert isinstance(replayed[0][0], StreamingChatMessageContent)
+    assert replayed[0][0].content == "answer 2"
+    assert len(inner.calls) == 2
+
+
+async def test_incomplete_stream_is_not_cached(inner):
+    service = CachedChatCompletion(inner)
+    settings = PromptExecutionSettings()
+
+    stream = service.get_streaming_chat_message_contents(_history("Hi"), settings)
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert len(service) == 0
+
+
+async def test_eviction_and_ttl(inner, monkeypatch):
+    service = CachedChatCompletion(inner, max_entries=2, ttl=10)
+    settings = PromptExecutionSettings()
+    for question in ["a", "b", "a", "c"]:
+        await service.get_chat_message_contents(_history(question), settings)
+    # b was the least recently used
+    assert service.cache_evictions == 1
+    await service.get_chat_message_contents(_history("b"), settings)
+    assert inner.calls == ["a", "b", "c", "b"]
+
+    now = time.monotonic()
+    monkeypatch.setattr("semantic_kernel.connectors.ai.cached_chat_completion.time.monotonic", lambda: now + 11)
+    await service.get_chat_message_contents(_history("b"), settings)
+    assert inner.calls[-1] == "b"
+    assert len(inner.calls) == 5
+
+
+async def test_semantic_cache(inner):
+    service = CachedChatCompletion(
+        inner, embedding_generator=KeywordEmbeddings(ai_model_id="mock"), similarity_threshold=0.9
+    )
+    settings = PromptExecutionSettings()
+
+    await service.get_chat_message_contents(_history("What is the price?"), settings)
+    similar = await service.get_chat_message_contents(_history("Tell me the price please"), settings)
+    assert similar[0].content == "answer 1"
+    assert service.semantic_cache_hits == 1
+
+    # a different question, or the same question in another conversation, is not served from the cache
+    await service.get_chat_message_contents(_history("What are the opening hours?"), settings)
+    await service.get_chat_message_contents(_history("Hi", "What is the price?"), settings)
+    assert len(inner.calls) == 3
+
+
+async def test_auto_invoke_is_not_cached(inner):
+    class TimePlugin:
+        @kernel_function
+        def now(self) -> str:
+            return "noon"
+
+    kernel = Kernel()
+    kernel.add_plugin(TimePlugin(), "time")
+    service = CachedChatCompletion(inner)
+
+    auto = PromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+    await service.get_chat_message_contents(_history("What time is it?"), auto, kernel=kernel)
+    await service.get_chat_message_contents(_history("What time is it?"), auto, kernel=kernel)
+    assert len(inner.calls) == 2
+    assert len(service) == 0
+
+    # without auto invocation the tools are part of the key
+    manual = PromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto(auto_invoke=False))
+    await service.get_chat_message_contents(_history("What time is it?"), manual, kernel=kernel)
+    await service.get_chat_message_contents(_history("What time is it?"), manual, kernel=kernel)
+    kernel.add_plugin(TimePlugin(), "other_time")
+    await service.get_chat_message_contents(_history("What time is it?"), manual, kernel=kernel)
+    assert len(inner.calls) == 4
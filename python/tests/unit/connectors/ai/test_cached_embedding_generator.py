@@ -0,0 +1,83 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import numpy as np
+from pytest import fixture
+
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.cached_embedding_generator import CachedEmbeddingGenerator
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+
+class CountingEmbeddings(EmbeddingGeneratorBase):
+    calls: list[list[str]] = []
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        self.calls.append(list(texts))
+        dimensions = kwargs.get("dimensions", 3)
+        return np.array([[float(len(text)), float(ord(text[0])), 1.0][:dimensions] for text in texts])
+
+
+@fixture
+def inner() -> CountingEmbeddings:
+    return CountingEmbeddings(service_id="embed", ai_model_id="mock")
+
+
+async def test_cache_hits_and_misses(inner):
+    generator = CachedEmbeddingGenerator(inner)
+    assert generator.service_id == "embed"
+    assert generator.ai_model_id == "mock"
+
+    first = await generator.generate_raw_embeddings(["hello", "world", "hello"])
+    assert inner.calls == [["hello", "world"]]
+    assert first[0] == first[2] == [5.0, 104.0, 1.0]
+    assert (generator.cache_hits, generator.cache_misses) == (1, 2)
+
+    second = await generator.generate_embeddings(["world", " hello  ", "new"])
+    assert inner.calls == [["hello", "world"], ["new"]]
+    assert second.tolist() == [first[1], first[0], [3.0, 110.0, 1.0]]
+    assert (generator.cache_hits, generator.cache_misses) == (3, 3)
+    assert generator.hit_rate == 0.5
+
+
+async def test_cache_key_includes_dimensions_and_model(inner):
+    generator = CachedEmbeddingGenerator(inner)
+    await generator.generate_raw_embeddings(["hello"])
+    assert await generator.generate_raw_embeddings(["hello"], dimensions=2) == [[5.0, 104.0]]
+    await generator.generate_raw_embeddings(["hello"], PromptExecutionSettings(ai_model_id="other"))
+    assert len(inner.calls) == 3
+
+
+async def test_cache_eviction(inner):
+    generator = CachedEmbeddingGenerator(inner, max_cache_bytes=2 * 3 * 8)
+    await generator.generate_raw_embeddings(["a", "b"])
+    await generator.generate_raw_embeddings(["a"])
+    await generator.generate_raw_embeddings(["c"])
+    assert generator._cache_bytes == 48
+    # b was the least recently used
+    await generator.generate_raw_embeddings(["a", "b"])
+    assert inner.calls[-1] == ["b"]
+
+
+async def test_cache_on_disk(inner, tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    generator = CachedEmbeddingGenerator(inner, cache_path=path)
+    expected = await generator.generate_raw_embeddings(["hello", "world"])
+    generator.close()
+
+    reopened = CachedEmbeddingGenerator(inner, cache_path=path)
+    assert await reopened.generate_raw_embeddings(["world", "hello"]) == expected[::-1]
+    assert len(inner.calls) == 1
+    assert reopened.cache_hits == 2
+    reopened.close()
+
+
+async def test_cache_with_kernel(inner):
+    kernel = Kernel()
+    kernel.add_service(CachedEmbeddingGenerator(inner))
+    records = [{"content": "hello"}, {"content": "hello"}]
+    await kernel.add_embedding_to_object(
+        records, "content", "vector", execution_settings={"embed": PromptExecutionSettings()}
+    )
+    assert records[0]["vector"] == records[1]["vector"] == [5.0, 104.0, 1.0]
+    assert inner.calls == [["hello"]]
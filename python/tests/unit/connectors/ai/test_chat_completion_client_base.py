@@ -0,0 +1,80 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import ClassVar
+
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+
+
+class MultipleChoicesChatCompletion(ChatCompletionClientBase):
+    SUPPORTS_FUNCTION_CALLING: ClassVar[bool] = True
+    function_call: bool = False
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        if self.function_call and function_invoke_attempt == 0:
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    items=[FunctionCallContent(id="call", index=0, name="math-add", arguments='{"a": 1, ')],
+                )
+            ]
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    items=[FunctionCallContent(id="call", index=0, arguments='"b": 2}')],
+                )
+            ]
+            return
+        for text in ["first ", "second"]:
+            yield [
+                StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=choice_index, content=text)
+                for choice_index in range(2)
+            ]
+
+
+def _kernel() -> Kernel:
+    class MathPlugin:
+        @kernel_function
+        def add(self, a: int, b: int) -> int:
+            return a + b
+
+    kernel = Kernel()
+    kernel.add_plugin(MathPlugin(), "math")
+    return kernel
+
+
+async def test_streaming_auto_invoke_with_multiple_choices_without_function_call():
+    service = MultipleChoicesChatCompletion(ai_model_id="mock")
+    settings = PromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Hi")
+
+    chunks = [
+        chunk async for chunk in service.get_streaming_chat_message_contents(chat_history, settings, kernel=_kernel())
+    ]
+
+    assert [[message.content for message in chunk] for chunk in chunks] == [["first ", "first "], ["second", "second"]]
+    assert len(chat_history) == 1
+
+
+async def test_streaming_auto_invoke_combines_function_call_chunks():
+    service = MultipleChoicesChatCompletion(ai_model_id="mock", function_call=True)
+    settings = PromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Add 1 and 2")
+
+    [chunk async for chunk in service.get_streaming_chat_message_contents(chat_history, settings, kernel=_kernel())]
+
+    function_call = chat_history.messages[1].items[0]
+    assert isinstance(function_call, FunctionCallContent)
+    assert function_call.parse_arguments() == {"a": 1, "b": 2}
+    assert chat_history.messages[2].items[0].result == 3
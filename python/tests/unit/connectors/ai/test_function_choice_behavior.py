@@ -230,3 +230,18 @@ def test_from_string_invalid():
         match="The specified type `invalid` is not supported. Allowed types are: `auto`, `none`, `required`.",
     ):
         FunctionChoiceBehavior.from_string("invalid")
+
+
+def test_get_config_is_cached_and_formats_once(kernel: "Kernel", decorated_native_function):
+    kernel.add_function(plugin_name="test", function=decorated_native_function)
+    behavior = FunctionChoiceBehavior.Auto(filters={"included_plugins": ["test"]})
+    formatter = Mock(side_effect=lambda metadata: metadata.fully_qualified_name)
+
+    config = behavior.get_config(kernel)
+    assert behavior.get_config(kernel) is config
+    assert config.get_function_call_formats(formatter) == ["test-getLightStatus"]
+    assert config.get_function_call_formats(formatter) == ["test-getLightStatus"]
+    formatter.assert_called_once()
+
+    kernel.add_function(plugin_name="test", function=decorated_native_function, function_name="other")
+    assert behavior.get_config(kernel) is not config
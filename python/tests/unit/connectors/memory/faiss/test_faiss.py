@@ -179,7 +179,7 @@ async def test_text_search_with_filter(faiss_collection):
     results = await faiss_collection.text_search(
         search_text="content",
         options=VectorSearchOptions(
-            filter=VectorSearchFilter.any_tag_equal_to("vector", 0.1).equal_to("content", "content")
+            filter=VectorSearchFilter.any_tag_equal_to("vector", 0.1).equal_to("content", "test content")
         ),
     )
     assert len([res async for res in results.results]) == 1
@@ -203,3 +203,70 @@ async def test_create_collection_and_search(faiss_collection, dist):
         assert res.record == record1 if idx == 0 else record2
         idx += 1
     await faiss_collection.delete_collection()
+
+
+@fixture
+def filterable_data_model_def(data_model_def) -> VectorStoreRecordDefinition:
+    data_model_def.fields["content"].is_filterable = True
+    data_model_def.fields["vector"].distance_function = DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE
+    return data_model_def
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {"id": f"id{i}", "content": "even" if i % 2 == 0 else "odd", "vector": [float(i)] * 5} for i in range(count)
+    ]
+
+
+async def _search_ids(collection, vector: list[float], **options) -> list[str]:
+    results = await collection.vectorized_search(vector=vector, options=VectorSearchOptions(**options))
+    return [res.record["id"] async for res in results.results]
+
+
+async def test_upsert_replaces_vectors(faiss_collection):
+    faiss_collection.data_model_definition.fields["vector"].distance_function = "euclidean_squared_distance"
+    await faiss_collection.create_collection()
+    await faiss_collection.upsert_batch(_records(3))
+    await faiss_collection.upsert({"id": "id0", "content": "moved", "vector": [10.0] * 5})
+
+    assert faiss_collection.indexes["vector"].ntotal == 3
+    assert await _search_ids(faiss_collection, [10.0] * 5, top=1) == ["id0"]
+    assert await _search_ids(faiss_collection, [0.0] * 5, top=3) == ["id1", "id2", "id0"]
+
+
+async def test_delete_keeps_ids(faiss_collection):
+    faiss_collection.data_model_definition.fields["vector"].distance_function = "euclidean_squared_distance"
+    await faiss_collection.create_collection()
+    await faiss_collection.upsert_batch(_records(4))
+    await faiss_collection.delete("id1")
+
+    assert faiss_collection.indexes["vector"].ntotal == 3
+    assert await _search_ids(faiss_collection, [1.0] * 5, top=3) == ["id0", "id2", "id3"]
+
+
+@mark.parametrize("index", [None, faiss.IndexHNSWFlat(5, 8), faiss.IndexLSH(5, 16)])
+async def test_search_with_filter_returns_top(filterable_data_model_def, index):
+    collection = FaissCollection("test", dict, filterable_data_model_def)
+    await collection.create_collection(index=index)
+    await collection.upsert_batch(_records(20))
+
+    ids = await _search_ids(
+        collection, [0.0] * 5, top=3, include_total_count=True, filter=VectorSearchFilter.equal_to("content", "odd")
+    )
+
+    assert len(ids) == 3
+    assert all(int(id[2:]) % 2 == 1 for id in ids)
+    assert await _search_ids(collection, [0.0] * 5, filter=VectorSearchFilter.equal_to("content", "none")) == []
+
+
+async def test_search_batch(filterable_data_model_def):
+    collection = FaissCollection("test", dict, filterable_data_model_def)
+    await collection.create_collection()
+    await collection.upsert_batch(_records(10))
+
+    results = await collection.vectorized_search_batch(
+        vectors=[[0.0] * 5, [9.0] * 5], options=VectorSearchOptions(top=2, skip=1)
+    )
+
+    assert [res.record["id"] async for res in results[0].results] == ["id1", "id2"]
+    assert [res.record["id"] async for res in results[1].results] == ["id8", "id7"]
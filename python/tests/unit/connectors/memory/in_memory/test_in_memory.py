@@ -1,11 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from pytest import fixture, mark
+import numpy as np
+from pytest import approx, fixture, mark, raises
 
+from semantic_kernel.connectors.memory.in_memory.const import DISTANCE_FUNCTION_MAP
 from semantic_kernel.connectors.memory.in_memory.in_memory_collection import InMemoryVectorCollection
 from semantic_kernel.connectors.memory.in_memory.in_memory_store import InMemoryVectorStore
-from semantic_kernel.data.const import DistanceFunction
+from semantic_kernel.connectors.memory.in_memory.vector_index import FlatVectorIndex, IvfFlatVectorIndex
+from semantic_kernel.data.const import DISTANCE_FUNCTION_DIRECTION_HELPER, DistanceFunction
+from semantic_kernel.data.record_definition import VectorStoreRecordDataField
 from semantic_kernel.data.vector_search import VectorSearchFilter, VectorSearchOptions
+from semantic_kernel.exceptions import VectorStoreOperationException
 
 
 @fixture
@@ -83,10 +88,67 @@ async def test_text_search_with_filter(collection):
     results = await collection.text_search(
         search_text="content",
         options=VectorSearchOptions(
-            filter=VectorSearchFilter.any_tag_equal_to("vector", 0.1).equal_to("content", "content")
+            filter=VectorSearchFilter.any_tag_equal_to("vector", 0.1).equal_to("content", "Test Content")
         ),
     )
     assert len([res async for res in results.results]) == 1
+    # all filter clauses have to match
+    results = await collection.text_search(
+        search_text="content",
+        options=VectorSearchOptions(
+            filter=VectorSearchFilter.any_tag_equal_to("vector", 0.1).equal_to("content", "content")
+        ),
+    )
+    assert len([res async for res in results.results]) == 0
+
+
+async def test_text_search_partial_tokens(collection):
+    await collection.upsert([
+        {"id": "id1", "content": "the quick brown fox", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]},
+        {"id": "id2", "content": "a quick-witted brownie", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]},
+        {"id": "id3", "content": "slow brown dog", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]},
+    ])
+    await collection.upsert({"id": "id3", "content": "slow red dog", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]})
+    for search_text, expected in [
+        ("brown", ["id1", "id2"]),
+        ("ick brow", ["id1"]),
+        ("quick-", ["id2"]),
+        ("rown", ["id1", "id2"]),
+        ("brown dog", []),
+        ("id", ["id1", "id2", "id3"]),
+        (" ", ["id1", "id2", "id3"]),
+    ]:
+        results = await collection.text_search(search_text=search_text, options=VectorSearchOptions(top=10))
+        assert [res.record["id"] async for res in results.results] == expected, search_text
+
+
+@mark.parametrize("index_kind", ["flat"])
+async def test_vectorized_search_with_indexed_filter(data_model_definition):
+    data_model_definition.fields["content"].is_filterable = True
+    data_model_definition.fields["tags"] = VectorStoreRecordDataField(name="tags", is_filterable=True)
+    collection = InMemoryVectorCollection("test", dict, data_model_definition)
+    records = [
+        {"id": f"id{i}", "content": f"group {i % 3}", "tags": [f"t{i % 2}", "all"], "vector": [float(i), 1, 1, 1, 1]}
+        for i in range(12)
+    ]
+    await collection.upsert(records)
+    await collection.delete(["id0"])
+    await collection.upsert({"id": "id6", "content": "moved", "tags": ["t0"], "vector": [6.0, 1, 1, 1, 1]})
+
+    options = VectorSearchOptions(
+        top=10,
+        include_total_count=True,
+        filter=VectorSearchFilter.equal_to("content", "GROUP 0").any_tag_equal_to("tags", "t1"),
+    )
+    results = await collection.vectorized_search(vector=[1.0, 1, 1, 1, 1], options=options)
+    assert results.total_count == 2
+    assert sorted([res.record["id"] async for res in results.results]) == ["id3", "id9"]
+
+    options = VectorSearchOptions(
+        top=10, filter=VectorSearchFilter.any_tag_equal_to("tags", "all").equal_to("id", "id4")
+    )
+    results = await collection.vectorized_search(vector=[1.0, 1, 1, 1, 1], options=options)
+    assert [res.record["id"] async for res in results.results] == ["id4"]
 
 
 @mark.parametrize(
@@ -115,3 +177,109 @@ async def test_vectorized_search_similar(collection, distance_function):
     async for res in results.results:
         assert res.record == record1 if idx == 0 else record2
         idx += 1
+
+
+@mark.parametrize(
+    "distance_function",
+    [
+        DistanceFunction.COSINE_DISTANCE,
+        DistanceFunction.COSINE_SIMILARITY,
+        DistanceFunction.EUCLIDEAN_DISTANCE,
+        DistanceFunction.MANHATTAN,
+        DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE,
+        DistanceFunction.DOT_PROD,
+        DistanceFunction.HAMMING,
+    ],
+)
+@mark.parametrize("index_kind", ["flat"])
+async def test_vectorized_search_matches_scalar(collection, distance_function):
+    collection.data_model_definition.fields["vector"].distance_function = distance_function
+    rng = np.random.default_rng(42)
+    records = [
+        {"id": f"id{i}", "content": "test content", "vector": rng.integers(-3, 3, 5).astype(float).tolist()}
+        for i in range(200)
+    ]
+    await collection.upsert(records)
+    await collection.delete([f"id{i}" for i in range(0, 200, 3)])
+    await collection.upsert({"id": "id1", "content": "test content", "vector": [1.0, 2.0, 0.0, -1.0, 2.0]})
+    await collection.upsert({"id": "id3", "content": "test content", "vector": [1.0, 2.0, 0.0, -1.0, 2.0]})
+    query = [0.5, 1.0, -1.0, 2.0, 0.0]
+
+    distance_func = DISTANCE_FUNCTION_MAP[distance_function]
+    expected_scores = {
+        key: float(distance_func(record["vector"], query)) for key, record in collection.inner_storage.items()
+    }
+    if distance_function == DistanceFunction.COSINE_SIMILARITY:
+        expected_scores = {key: 1.0 - score for key, score in expected_scores.items()}
+    expected = sorted(
+        expected_scores.items(),
+        key=lambda item: item[1],
+        reverse=DISTANCE_FUNCTION_DIRECTION_HELPER[distance_function](1, 0),
+    )[5:15]
+
+    results = await collection.vectorized_search(
+        vector=query, options=VectorSearchOptions(top=10, skip=5, include_total_count=True)
+    )
+    assert results.total_count == len(collection.inner_storage)
+    actual = [(res.record["id"], res.score) async for res in results.results]
+    assert [key for key, _ in actual] == [key for key, _ in expected]
+    assert [score for _, score in actual] == approx([score for _, score in expected])
+
+
+async def test_vectorized_search_empty(collection):
+    results = await collection.vectorized_search(vector=[0.1, 0.2, 0.3, 0.4, 0.5], options=VectorSearchOptions())
+    assert len([res async for res in results.results]) == 0
+
+
+async def test_upsert_wrong_dimensions(collection):
+    await collection.upsert({"id": "testid1", "content": "test content", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]})
+    with raises(VectorStoreOperationException):
+        await collection.upsert({"id": "testid2", "content": "test content", "vector": [0.1, 0.2]})
+
+
+@mark.parametrize("index_kind", ["hnsw", "ivf_flat"])
+async def test_vector_index_is_flat_by_default(collection):
+    await collection.upsert({"id": "testid", "content": "test content", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]})
+    assert type(collection._vector_indexes["vector"]) is FlatVectorIndex
+
+
+@mark.parametrize("index_kind", ["ivf_flat"])
+async def test_vectorized_search_approximate_index(data_model_definition):
+    settings = {"seed": 1, "nlist": 4, "nprobe": 2}
+    collection = InMemoryVectorCollection("test", dict, data_model_definition, index_settings={"vector": settings})
+    rng = np.random.default_rng(1)
+    records = [{"id": f"id{i}", "content": "test content", "vector": rng.random(5).tolist()} for i in range(300)]
+    await collection.upsert(records)
+    results = await collection.vectorized_search(vector=records[7]["vector"], options=VectorSearchOptions(top=1))
+    assert [res.record["id"] async for res in results.results] == ["id7"]
+    assert isinstance(collection._vector_indexes["vector"], IvfFlatVectorIndex)
+
+
+@mark.parametrize(
+    "distance_function",
+    [DistanceFunction.COSINE_SIMILARITY, DistanceFunction.DOT_PROD, DistanceFunction.EUCLIDEAN_DISTANCE],
+)
+async def test_vectorized_search_batch(collection, distance_function):
+    collection.data_model_definition.fields["vector"].distance_function = distance_function
+    rng = np.random.default_rng(7)
+    records = [{"id": f"id{i}", "content": "test content", "vector": rng.random(5).tolist()} for i in range(50)]
+    await collection.upsert(records)
+    queries = rng.random((4, 5)).tolist()
+    options = VectorSearchOptions(top=5, include_total_count=True)
+
+    batch_results = await collection.vectorized_search_batch(vectors=queries, options=options)
+
+    assert len(batch_results) == 4
+    for query, batch_result in zip(queries, batch_results):
+        single_result = await collection.vectorized_search(vector=query, options=options)
+        assert batch_result.total_count == single_result.total_count == 50
+        batch = [(res.record["id"], res.score) async for res in batch_result.results]
+        single = [(res.record["id"], res.score) async for res in single_result.results]
+        assert [key for key, _ in batch] == [key for key, _ in single]
+        assert [score for _, score in batch] == approx([score for _, score in single])
+
+
+async def test_vectorized_search_batch_empty(collection):
+    assert await collection.vectorized_search_batch(vectors=[]) == []
+    results = await collection.vectorized_search_batch(vectors=[[0.1, 0.2, 0.3, 0.4, 0.5]])
+    assert len([res async for res in results[0].results]) == 0
@@ -0,0 +1,49 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from semantic_kernel.connectors.memory.in_memory.record_index import FieldIndex, TextIndex, compile_filter
+from semantic_kernel.data.text_search import AnyTagsEqualTo, EqualTo
+
+
+def test_field_index_lookup():
+    index = FieldIndex()
+    index.upsert("a", "Red")
+    index.upsert("b", ["red", "blue"])
+    index.upsert("c", "")
+    index.upsert("d", [{"not": "hashable"}])
+    assert index.lookup(EqualTo(field_name="color", value="RED")) == {"a"}
+    assert index.lookup(AnyTagsEqualTo(field_name="color", value="red")) == {"b"}
+    assert index.lookup(AnyTagsEqualTo(field_name="color", value="Red")) == {"a"}
+    assert index.lookup(EqualTo(field_name="color", value="")) == set()
+    assert index.lookup(AnyTagsEqualTo(field_name="color", value=["red"])) is None
+
+
+def test_field_index_update_and_delete():
+    index = FieldIndex()
+    index.upsert("a", ["red", "blue"])
+    index.upsert("a", ["green"])
+    assert index.lookup(AnyTagsEqualTo(field_name="color", value="red")) == set()
+    assert index.lookup(AnyTagsEqualTo(field_name="color", value="green")) == {"a"}
+    index.delete(["a", "unknown"])
+    assert index._tags == {} and index._values == {}
+
+
+def test_compile_filter():
+    record = {"color": "Red", "tags": ["x", "y"], "empty": None}
+    assert compile_filter(EqualTo(field_name="color", value="red"))(record)
+    assert not compile_filter(EqualTo(field_name="empty", value="red"))(record)
+    assert compile_filter(AnyTagsEqualTo(field_name="tags", value="y"))(record)
+    assert not compile_filter(AnyTagsEqualTo(field_name="empty", value="y"))(record)
+
+
+def test_text_index_candidates():
+    index = TextIndex()
+    index.upsert(1, ["hello brave new world", None, 5])
+    index.upsert(2, ["new worlds", ["exact value"]])
+    assert index.candidates("brave new") == {1}
+    assert index.candidates("ew worl") == {1, 2}
+    assert index.candidates("ew world ") == {1}
+    assert index.candidates("exact value") == {2}
+    assert index.candidates("...") is None
+    index.delete([1])
+    assert index.candidates("brave") == set()
+    assert index._entries.keys() == {2}
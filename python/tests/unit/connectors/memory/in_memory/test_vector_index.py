@@ -0,0 +1,132 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import numpy as np
+from pytest import approx, raises
+
+from semantic_kernel.connectors.memory.in_memory.vector_index import (
+    FlatVectorIndex,
+    IvfFlatVectorIndex,
+    select_top,
+)
+from semantic_kernel.data.const import DistanceFunction
+
+
+def test_select_top_keeps_ties_in_order():
+    scores = np.array([1.0, 0.5, 0.5, 0.5, 2.0])
+    assert select_top(scores, 2, DistanceFunction.EUCLIDEAN_DISTANCE).tolist() == [1, 2]
+    assert select_top(scores, 3, DistanceFunction.DOT_PROD).tolist() == [4, 0, 1]
+    assert select_top(scores, 10, DistanceFunction.EUCLIDEAN_DISTANCE).tolist() == [1, 2, 3, 0, 4]
+    assert select_top(scores, 0, DistanceFunction.EUCLIDEAN_DISTANCE).tolist() == []
+
+
+def test_select_top_ranks_nan_last():
+    scores = np.array([np.nan, np.nan, 0.1])
+    assert select_top(scores, 2, DistanceFunction.COSINE_DISTANCE).tolist() == [2, 0]
+    assert select_top(scores, 2, DistanceFunction.COSINE_SIMILARITY).tolist() == [2, 0]
+    assert select_top(scores, 5, DistanceFunction.COSINE_DISTANCE).tolist() == [2, 0, 1]
+
+
+def test_flat_index_grow_and_compact():
+    index = FlatVectorIndex()
+    for i in range(200):
+        index.upsert(i, [float(i), 0.0])
+    assert len(index) == 200
+    assert index.dimensions == 2
+    index.delete(range(0, 150))
+    assert len(index) == 50
+    assert 150 in index and 10 not in index
+    index.upsert(10, [1000.0, 0.0])
+    results, count = index.search([0.0, 0.0], DistanceFunction.EUCLIDEAN_DISTANCE, 3)
+    assert count == 51
+    assert results == [(150, 150.0), (151, 151.0), (152, 152.0)]
+    results, _ = index.search([2000.0, 0.0], DistanceFunction.EUCLIDEAN_DISTANCE, 1)
+    assert results == [(10, 1000.0)]
+
+
+def test_flat_index_search_keys():
+    index = FlatVectorIndex()
+    for i in range(10):
+        index.upsert(i, [float(i)])
+    results, count = index.search([0.0], DistanceFunction.MANHATTAN, 2, keys=[7, 5, 42])
+    assert count == 2
+    assert results == [(5, 5.0), (7, 7.0)]
+
+
+def test_flat_index_none_vector_removes_key():
+    index = FlatVectorIndex()
+    index.upsert("a", [1.0, 2.0])
+    index.upsert("a", None)
+    assert "a" not in index
+
+
+def test_flat_index_wrong_dimensions():
+    index = FlatVectorIndex()
+    index.upsert("a", [1.0, 2.0])
+    with raises(ValueError):
+        index.upsert("b", [1.0])
+    with raises(ValueError):
+        index.search([1.0], DistanceFunction.DOT_PROD, 1)
+
+
+def _exact_top(vectors, query, count):
+    distances = np.linalg.norm(vectors - query, axis=1)
+    return set(np.argsort(distances)[:count].tolist())
+
+
+def test_approximate_index_recall():
+    index = IvfFlatVectorIndex(DistanceFunction.EUCLIDEAN_DISTANCE, nlist=8, nprobe=4, seed=1)
+    rng = np.random.default_rng(0)
+    vectors = rng.random((1000, 8))
+    for i, vector in enumerate(vectors):
+        index.upsert(i, vector)
+    assert index._ready()
+    hits = 0
+    for query in rng.random((20, 8)):
+        results, count = index.search(query, DistanceFunction.EUCLIDEAN_DISTANCE, 10)
+        assert count == 1000
+        assert len(results) == 10
+        hits += len({key for key, _ in results} & _exact_top(vectors, query, 10))
+    assert hits / 200 >= 0.9
+
+
+def test_approximate_index_delete_and_filter():
+    index = IvfFlatVectorIndex(DistanceFunction.COSINE_SIMILARITY, nlist=4, seed=1)
+    rng = np.random.default_rng(0)
+    vectors = rng.random((400, 4))
+    for i, vector in enumerate(vectors):
+        index.upsert(i, vector)
+    index.delete(range(0, 400, 2))
+    assert len(index) == 200
+    assert index._deleted == 0
+    # the delete only marks the structure stale, the next search rebuilds it
+    assert index._stale
+    results, _ = index.search(vectors[2], DistanceFunction.COSINE_SIMILARITY, 5)
+    assert all(key % 2 == 1 for key, _ in results)
+    # updating a key replaces the vector
+    index.upsert(1, vectors[2])
+    results, _ = index.search(vectors[2], DistanceFunction.COSINE_SIMILARITY, 1)
+    assert results[0][0] == 1
+    assert results[0][1] == approx(1.0)
+    # selective filters are scored exactly
+    results, count = index.search(vectors[2], DistanceFunction.COSINE_SIMILARITY, 5, keys=[3, 5, 2])
+    assert count == 2
+    assert {key for key, _ in results} == {3, 5}
+    # other distance functions fall back to the exact search
+    results, count = index.search(vectors[2], DistanceFunction.EUCLIDEAN_DISTANCE, 1)
+    assert count == 200
+    assert results == [(1, 0.0)]
+
+
+def test_approximate_index_fallback_skips_deleted_rows():
+    index = IvfFlatVectorIndex(DistanceFunction.EUCLIDEAN_DISTANCE, nlist=8, nprobe=1, seed=1)
+    rng = np.random.default_rng(0)
+    vectors = rng.random((400, 4))
+    for i, vector in enumerate(vectors):
+        index.upsert(i, vector)
+    # fewer deletes than the compaction ratio, the deleted rows stay as tombstones
+    index.delete(range(10))
+    assert index._deleted == 10
+    # one probed cluster can not fill the results, the search falls back to the exact search
+    results, count = index.search(vectors[20], DistanceFunction.EUCLIDEAN_DISTANCE, 400)
+    assert count == 390
+    assert sorted(key for key, _ in results) == list(range(10, 400))
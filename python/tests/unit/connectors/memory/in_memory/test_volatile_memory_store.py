@@ -1,9 +1,11 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import numpy as np
-from pytest import raises
+import pytest
+from pytest import fixture, raises
 
 from semantic_kernel.memory import VolatileMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
 
 
 async def test_cosine_similarity_valid():
@@ -47,3 +49,85 @@ async def test_cosine_similarity_partial_zero_collection():
     expected_scores = np.array([1.0, -1.0])
     scores = volatile_memory_store.compute_similarity_scores(query_embedding, collection_embeddings)
     assert np.allclose(expected_scores, scores)
+
+
+def _record(id: str, embedding: list[float]) -> MemoryRecord:
+    return MemoryRecord.local_record(
+        id=id, text=f"text {id}", description=None, additional_metadata=None, embedding=np.array(embedding)
+    )
+
+
+@fixture
+async def store() -> VolatileMemoryStore:
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch(
+        "test",
+        [_record("a", [1, 0, 0]), _record("b", [1, 1, 0]), _record("c", [0, 1, 0]), _record("d", [-1, 0, 0])],
+    )
+    return store
+
+
+async def test_get_nearest_matches(store):
+    matches = await store.get_nearest_matches("test", np.array([1, 0.2, 0]), limit=2)
+    assert [record.id for record, _ in matches] == ["a", "b"]
+    assert matches[0][1] == pytest.approx(1 / np.sqrt(1.04))
+    assert all(record.embedding is None for record, _ in matches)
+    assert store._store["test"]["a"].embedding is not None
+
+    matches = await store.get_nearest_matches("test", np.array([[1, 0.2, 0]]), limit=10, min_relevance_score=0.1)
+    assert [record.id for record, _ in matches] == ["a", "b", "c"]
+
+    record, score = await store.get_nearest_match("test", np.array([0, 1, 0]), with_embedding=True)
+    assert record.id == "c"
+    assert score == pytest.approx(1.0)
+    assert record.embedding is not None
+
+
+async def test_get_nearest_match_without_match(store):
+    assert await store.get_nearest_match("test", np.array([0, 0, 1]), min_relevance_score=0.5) is None
+
+
+async def test_get_nearest_match_in_empty_collection():
+    store = VolatileMemoryStore()
+    await store.create_collection("empty")
+    assert await store.get_nearest_match("empty", np.array([1, 0, 0])) is None
+
+
+async def test_get_nearest_matches_after_upsert_and_remove(store):
+    await store.remove("test", "a")
+    await store.upsert("test", _record("c", [0, 0, 1]))
+    await store.upsert("test", _record("e", [0, 0, 0]))
+
+    matches = await store.get_nearest_matches("test", np.array([1, 0, 0]), limit=10, min_relevance_score=-1)
+    assert [record.id for record, _ in matches] == ["b", "c", "d", "e"]
+    np.testing.assert_allclose([score for _, score in matches], [1 / np.sqrt(2), 0.0, -1.0, -1.0])
+
+    await store.remove_batch("test", ["b", "c", "d", "e"])
+    assert await store.get_nearest_matches("test", np.array([1, 0, 0]), limit=1) == []
+
+
+async def test_get_nearest_matches_batch(store):
+    queries = np.array([[1, 0.2, 0], [0, 1, 0.1]])
+    batch = await store.get_nearest_matches_batch("test", queries, limit=2)
+
+    for query, matches in zip(queries, batch):
+        single = await store.get_nearest_matches("test", query, limit=2)
+        assert [record.id for record, _ in matches] == [record.id for record, _ in single]
+        np.testing.assert_allclose([score for _, score in matches], [score for _, score in single])
+
+
+async def test_get_without_embeddings(store):
+    record = await store.get("test", "a")
+    records = await store.get_batch("test", ["a", "b", "missing"])
+
+    assert record.embedding is None
+    assert record.text == "text a"
+    assert [record.id for record in records] == ["a", "b"]
+    assert all(record.embedding is None for record in records)
+    assert (await store.get("test", "a", with_embedding=True)).embedding is not None
+
+
+async def test_upsert_with_other_dimensions(store):
+    with raises(ValueError):
+        await store.upsert("test", _record("e", [1, 0]))
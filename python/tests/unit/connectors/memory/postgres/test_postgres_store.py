@@ -5,9 +5,11 @@ from dataclasses import dataclass
 from typing import Annotated, Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from psycopg import AsyncConnection, AsyncCursor
+from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
 from pytest import fixture
 
@@ -18,6 +20,7 @@ from semantic_kernel.connectors.memory.postgres.constants import DISTANCE_COLUMN
 from semantic_kernel.connectors.memory.postgres.postgres_collection import PostgresCollection
 from semantic_kernel.connectors.memory.postgres.postgres_settings import PostgresSettings
 from semantic_kernel.connectors.memory.postgres.postgres_store import PostgresStore
+from semantic_kernel.connectors.memory.postgres.utils import VectorBinaryDumper, vector_to_binary
 from semantic_kernel.data.const import DistanceFunction, IndexKind
 from semantic_kernel.data.record_definition import (
     VectorStoreRecordDataField,
@@ -26,6 +29,7 @@ from semantic_kernel.data.record_definition import (
     vectorstoremodel,
 )
 from semantic_kernel.data.vector_search import VectorSearchOptions
+from semantic_kernel.exceptions import VectorStoreOperationException
 
 
 @fixture(scope="function")
@@ -423,3 +427,178 @@ def test_settings_env_vars(monkeypatch) -> None:
 
 
 # endregion
+
+
+async def test_vector_search_batch(vector_store: PostgresStore, mock_cursor: Mock) -> None:
+    collection = vector_store.get_collection("test_collection", SimpleDataModel)
+    assert isinstance(collection, PostgresCollection)
+
+    mock_cursor.fetchall.side_effect = [
+        [(1, "[1.0, 2.0, 3.0]", {"key": "value"}, 0.1)],
+        [(2, "[3.0, 2.0, 1.0]", {"key": "value"}, 0.2)],
+    ]
+    mock_cursor.nextset = Mock(side_effect=[True, False])
+
+    search_results = await collection.vectorized_search_batch(
+        [[1.0, 2.0, 3.0], [3.0, 2.0, 1.0]],
+        options=VectorSearchOptions(top=1, include_vectors=True, include_total_count=True),
+    )
+
+    assert mock_cursor.executemany.call_count == 1
+    execute_args, execute_kwargs = mock_cursor.executemany.call_args
+    assert execute_args[1] == [["[1.0,2.0,3.0]"], ["[3.0,2.0,1.0]"]]
+    assert execute_kwargs == {"returning": True}
+    assert len(search_results) == 2
+    assert [result.total_count for result in search_results] == [1, 1]
+    records = []
+    for result in search_results:
+        records.append([res async for res in result.results])
+    assert [batch[0].record.id for batch in records] == [1, 2]
+    assert [batch[0].score for batch in records] == [0.1, 0.2]
+
+
+@fixture
+def mock_copy(mock_cursor: Mock) -> Mock:
+    # the types of the columns of SimpleDataModel, the oid of the vector type differs per database
+    mock_cursor.fetchall.return_value = [("id", 23, "int4"), ("embedding", 16390, "vector"), ("data", 3802, "jsonb")]
+    mock_cursor.adapters = MagicMock()
+    copy = mock_cursor.copy.return_value.__aenter__.return_value
+    copy.write_row = AsyncMock()
+    return copy
+
+
+async def test_upsert_bulk(vector_store: PostgresStore, mock_cursor: Mock, mock_copy: Mock) -> None:
+    collection = vector_store.get_collection("test_collection", SimpleDataModel)
+
+    async def records():
+        yield SimpleDataModel(id=1, embedding=np.array([1.0, 2.0, 3.0]), data={"key": "value1"})
+        yield SimpleDataModel(id=2, embedding=[4.0, 5.0, 6.0], data='{"key": "value2"}')
+
+    keys = await collection.upsert_bulk(records())
+
+    assert keys == [1, 2]
+    statements = [args[0] for args, _ in mock_cursor.execute.call_args_list]
+    assert statements[0].strip().startswith("SELECT a.attname, a.atttypid, t.typname")
+    assert statements[1].as_string() == (
+        'CREATE TEMP TABLE "sk_pg_staging" (LIKE "public"."test_collection" INCLUDING DEFAULTS) ON COMMIT DROP'
+    )
+    assert statements[2].as_string() == (
+        'INSERT INTO "public"."test_collection" ("id", "embedding", "data") '
+        'SELECT "id", "embedding", "data" FROM "sk_pg_staging" '
+        'ON CONFLICT ("id") DO UPDATE SET "embedding" = EXCLUDED."embedding", "data" = EXCLUDED."data"'
+    )
+    copy_args, _ = mock_cursor.copy.call_args
+    assert copy_args[0].as_string() == ('COPY "sk_pg_staging" ("id", "embedding", "data") FROM STDIN (FORMAT BINARY)')
+    mock_copy.set_types.assert_called_once_with([23, 16390, 3802])
+    dumper = mock_cursor.adapters.register_dumper.call_args.args[1]
+    assert issubclass(dumper, VectorBinaryDumper)
+    assert dumper.oid == 16390
+
+    rows = [args[0] for args, _ in mock_copy.write_row.call_args_list]
+    assert rows[0][0] == 1
+    assert rows[0][2] == {"key": "value1"}
+    assert isinstance(rows[1][2], Jsonb)
+    assert rows[1][2].obj == '{"key": "value2"}'
+    assert dumper(int).dump(rows[0][1]) == vector_to_binary([1.0, 2.0, 3.0])
+
+
+async def test_upsert_bulk_duplicate_keys(vector_store: PostgresStore, mock_cursor: Mock, mock_copy: Mock) -> None:
+    collection = vector_store.get_collection("test_collection", SimpleDataModel)
+    collection._settings.max_rows_per_transaction = 2
+
+    keys = await collection.upsert_bulk(
+        SimpleDataModel(id=i % 2, embedding=[float(i)] * 3, data={"key": f"value{i}"}) for i in range(5)
+    )
+
+    assert keys == [0, 1, 0, 1, 0]
+    assert mock_copy.write_row.call_count == 5
+    merge_statement = mock_cursor.execute.call_args_list[-1].args[0].as_string()
+    assert (
+        'SELECT DISTINCT ON ("id") "id", "embedding", "data" FROM "sk_pg_staging" ORDER BY "id", ctid DESC'
+        in merge_statement
+    )
+
+
+async def test_upsert_bulk_unsupported_vector_column(vector_store: PostgresStore, mock_cursor: Mock) -> None:
+    mock_cursor.fetchall.return_value = [("id", 23, "int4"), ("embedding", 16400, "halfvec"), ("data", 3802, "jsonb")]
+    collection = vector_store.get_collection("test_collection", SimpleDataModel)
+
+    with pytest.raises(VectorStoreOperationException, match="halfvec"):
+        await collection.upsert_bulk([SimpleDataModel(id=1, embedding=[1.0, 2.0, 3.0], data={"key": "value1"})])
+
+
+async def test_create_collection_defer_index_creation(
+    vector_store: PostgresStore, mock_cursor: Mock, mock_copy: Mock
+) -> None:
+    collection = vector_store.get_collection("test_collection", SimpleDataModel)
+    await collection.create_collection(defer_index_creation=True)
+
+    # only the table is created
+    assert mock_cursor.execute.call_count == 1
+
+    await collection.upsert_bulk([SimpleDataModel(id=1, embedding=[1.0, 2.0, 3.0], data={"key": "value1"})])
+
+    index_statement = mock_cursor.execute.call_args_list[-1].args[0].as_string()
+    assert index_statement == (
+        'CREATE INDEX "test_collection_embedding_idx" ON "public"."test_collection" '
+        'USING hnsw ("embedding" vector_cosine_ops)'
+    )
+
+    # the deferred index is created once
+    mock_cursor.execute.reset_mock()
+    await collection.create_deferred_indexes()
+    assert mock_cursor.execute.call_count == 0
+
+
+@pytest.mark.parametrize("row_count, lists", [(500, 1), (200_000, 200), (4_000_000, 2000)])
+async def test_create_collection_ivf_flat_index(
+    vector_store: PostgresStore, mock_cursor: Mock, row_count: int, lists: int
+) -> None:
+    @vectorstoremodel
+    @dataclass
+    class IvfFlatModel:
+        id: Annotated[int, VectorStoreRecordKeyField()]
+        embedding: Annotated[
+            list[float],
+            VectorStoreRecordVectorField(
+                index_kind=IndexKind.IVF_FLAT,
+                dimensions=3,
+                distance_function=DistanceFunction.EUCLIDEAN_DISTANCE,
+            ),
+        ]
+
+    mock_cursor.fetchone.return_value = (row_count,)
+    collection = vector_store.get_collection("test_collection", IvfFlatModel)
+    await collection.create_collection()
+
+    statements = [args[0].as_string() for args, _ in mock_cursor.execute.call_args_list]
+    assert statements[1] == 'SELECT count(*) FROM "public"."test_collection"'
+    assert statements[2] == (
+        'CREATE INDEX "test_collection_embedding_idx" ON "public"."test_collection" '
+        f'USING ivfflat ("embedding" vector_l2_ops) WITH (lists = {lists})'
+    )
+
+
+async def test_create_collection_defer_unsupported_index(vector_store: PostgresStore) -> None:
+    @vectorstoremodel
+    @dataclass
+    class FlatModel:
+        id: Annotated[int, VectorStoreRecordKeyField()]
+        embedding: Annotated[
+            list[float],
+            VectorStoreRecordVectorField(
+                index_kind=IndexKind.FLAT, dimensions=3, distance_function=DistanceFunction.EUCLIDEAN_DISTANCE
+            ),
+        ]
+
+    collection = vector_store.get_collection("test_collection", FlatModel)
+    with pytest.raises(VectorStoreOperationException, match="Unsupported index kind"):
+        await collection.create_collection(defer_index_creation=True)
+
+
+def test_vector_to_binary() -> None:
+    expected = b"\x00\x03\x00\x00" + np.array([1.0, 2.0, 3.0], dtype=">f4").tobytes()
+    assert vector_to_binary([1, 2, 3]) == expected
+    assert vector_to_binary(np.array([1.0, 2.0, 3.0], dtype=np.float64)) == expected
+    with pytest.raises(ValueError):
+        vector_to_binary(np.zeros((2, 3)))
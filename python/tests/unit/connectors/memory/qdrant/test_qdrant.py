@@ -337,3 +337,33 @@ async def test_search_filter(collection, mock_search):
 async def test_search_fail(collection):
     with raises(VectorSearchExecutionException, match="Search requires a vector."):
         await collection._inner_search(options=VectorSearchOptions(include_vectors=False))
+
+
+async def test_search_batch(collection):
+    from qdrant_client.models import NamedVector, ScoredPoint, SearchRequest
+
+    with patch(f"{BASE_PATH}.search_batch") as mock_search_batch:
+        mock_search_batch.return_value = [
+            [ScoredPoint(id="id1", version=1, score=0.0, payload={"content": "content"})],
+            [ScoredPoint(id="id2", version=1, score=0.0, payload={"content": "content"})],
+        ]
+        results = await collection.vectorized_search_batch(
+            vectors=[[1.0, 2.0, 3.0], [3.0, 2.0, 1.0]],
+            options=VectorSearchOptions(vector_field_name="vector", include_vectors=False),
+        )
+    assert [result.record["id"] async for result in results[0].results] == ["id1"]
+    assert [result.record["id"] async for result in results[1].results] == ["id2"]
+    mock_search_batch.assert_called_once_with(
+        collection_name="test",
+        requests=[
+            SearchRequest(
+                vector=NamedVector(name="vector", vector=vector),
+                filter=Filter(must=[]),
+                limit=3,
+                offset=0,
+                with_payload=True,
+                with_vector=False,
+            )
+            for vector in ([1.0, 2.0, 3.0], [3.0, 2.0, 1.0])
+        ],
+    )
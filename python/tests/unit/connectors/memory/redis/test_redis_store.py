@@ -1,14 +1,19 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
 from pytest import fixture, mark, raises
 from redis.asyncio.client import Redis
+from redis.exceptions import ResponseError
 
 from semantic_kernel.connectors.memory.redis.const import RedisCollectionTypes
 from semantic_kernel.connectors.memory.redis.redis_collection import RedisHashsetCollection, RedisJsonCollection
 from semantic_kernel.connectors.memory.redis.redis_store import RedisStore
+from semantic_kernel.data.vector_search import VectorSearchOptions
 from semantic_kernel.exceptions import (
     VectorStoreInitializationException,
     VectorStoreOperationException,
@@ -17,6 +22,7 @@ from semantic_kernel.exceptions import (
 BASE_PATH = "redis.asyncio.client.Redis"
 BASE_PATH_FT = "redis.commands.search.AsyncSearch"
 BASE_PATH_JSON = "redis.commands.json.commands.JSONCommands"
+BASE_PATH_PIPELINE = "redis.asyncio.client.Pipeline"
 
 
 @fixture
@@ -93,25 +99,32 @@ def mock_delete_collection():
 
 
 @fixture(autouse=True)
-def mock_upsert_hash():
-    with patch(f"{BASE_PATH}.hset", new=AsyncMock()) as mock_upsert:
-        yield mock_upsert
+def mock_pipeline_execute():
+    """Answer the commands of a pipeline, recording the commands of each call."""
+    command_stacks: list[list[tuple]] = []
 
+    def answer(args: tuple) -> Any:
+        if args[0] != "HGETALL":
+            return 1
+        if args[1].endswith("missing"):
+            return {}
+        return {b"content": b"content", b"vector": np.array([1.0, 2.0, 3.0]).tobytes()}
 
-@fixture(autouse=True)
-def mock_upsert_json():
-    with patch(f"{BASE_PATH_JSON}.set", new=AsyncMock()) as mock_upsert:
-        yield mock_upsert
+    async def execute(pipeline, raise_on_error=True):
+        command_stacks.append([args for args, _ in pipeline.command_stack])
+        results = [answer(args) for args, _ in pipeline.command_stack]
+        await pipeline.reset()
+        return results
+
+    with patch(f"{BASE_PATH_PIPELINE}.execute", autospec=True, side_effect=execute) as mock_execute:
+        mock_execute.command_stacks = command_stacks
+        yield mock_execute
 
 
 @fixture(autouse=True)
-def mock_get_hash():
-    with patch(f"{BASE_PATH}.hgetall", new=AsyncMock()) as mock_get:
-        mock_get.return_value = {
-            b"content": b"content",
-            b"vector": np.array([1.0, 2.0, 3.0]).tobytes(),
-        }
-        yield mock_get
+def mock_upsert_json():
+    with patch(f"{BASE_PATH_JSON}.mset", new=AsyncMock()) as mock_upsert:
+        yield mock_upsert
 
 
 @fixture(autouse=True)
@@ -134,12 +147,6 @@ def mock_delete_hash():
         yield mock_delete
 
 
-@fixture(autouse=True)
-def mock_delete_json():
-    with patch(f"{BASE_PATH_JSON}.delete", new=AsyncMock()) as mock_delete:
-        yield mock_delete
-
-
 def test_vector_store_defaults(vector_store):
     assert vector_store.redis_database is not None
     assert vector_store.redis_database.connection_pool.connection_kwargs["host"] == "localhost"
@@ -328,3 +335,191 @@ async def test_create_index_manual(collection_hash, mock_create_collection):
 async def test_create_index_fail(collection_hash, mock_create_collection):
     with raises(VectorStoreOperationException, match="Invalid index type supplied."):
         await collection_hash.create_collection(index_definition="index_definition", fields="fields")
+
+
+async def test_search_batch(collection_hash):
+    vector = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32).tobytes()
+    raw_result = [1, b"id1", [b"vector_distance", b"0.1", b"content", b"content", b"vector", vector]]
+    with patch("redis.asyncio.client.Pipeline.execute", new=AsyncMock()) as mock_execute:
+        mock_execute.return_value = [raw_result, raw_result]
+        results = await collection_hash.vectorized_search_batch(
+            vectors=[[1.0, 2.0, 3.0, 4.0, 5.0], [5.0, 4.0, 3.0, 2.0, 1.0]],
+            options=VectorSearchOptions(top=1, include_vectors=True),
+        )
+    assert len(results) == 2
+    for result in results:
+        assert result.total_count == 1
+        records = [res async for res in result.results]
+        assert records[0].record["id"] == "id1"
+        assert records[0].record["content"] == "content"
+        assert records[0].score == 0.1
+    mock_execute.assert_awaited_once()
+
+
+@mark.parametrize(
+    "collection, stored_vector",
+    [
+        ("collection_hash", np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32).tobytes()),
+        ("collection_json", b"[1.0, 2.0, 3.0, 4.0, 5.0]"),
+    ],
+)
+async def test_search_batch_sends_the_search_command(collection, stored_vector, request, mock_pipeline_execute):
+    collection = request.getfixturevalue(collection)
+    vector = [1.0, 2.0, 3.0, 4.0, 5.0]
+    options = VectorSearchOptions(top=2, skip=1, include_vectors=True)
+    raw_result = [1, b"id1", [b"vector_distance", b"0.1", b"content", b"content", b"vector", stored_vector]]
+    with patch(f"{BASE_PATH}.execute_command", new=AsyncMock(return_value=raw_result)) as mock_execute_command:
+        await collection.vectorized_search(vector=vector, options=options)
+    command_stacks = []
+
+    async def execute(pipeline, raise_on_error=True):
+        command_stacks.append([args for args, _ in pipeline.command_stack])
+        results = [raw_result for _ in pipeline.command_stack]
+        await pipeline.reset()
+        return results
+
+    mock_pipeline_execute.side_effect = execute
+    results = await collection.vectorized_search_batch(vectors=[vector], options=options)
+
+    # the pipelined command is the one the search of redis-py sends
+    assert command_stacks == [[mock_execute_command.await_args.args]]
+    records = [res async for res in results[0].results]
+    assert records[0].record["content"] == "content"
+    assert records[0].score == 0.1
+    assert records[0].record["vector"] == vector
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    return [{"id": f"id{index}", "content": "content", "vector": [1.0, 2.0, 3.0]} for index in range(count)]
+
+
+async def test_upsert_hash_pipelined_in_batches(collection_hash, mock_pipeline_execute):
+    collection_hash.batch_size = 2
+
+    keys = await collection_hash.upsert(records=_records(5))
+
+    assert keys == ["id0", "id1", "id2", "id3", "id4"]
+    assert [len(stack) for stack in mock_pipeline_execute.command_stacks] == [2, 2, 1]
+    assert all(args[0] == "HSET" for stack in mock_pipeline_execute.command_stacks for args in stack)
+
+
+async def test_get_hash_pipelined_in_batches(collection_hash, mock_pipeline_execute):
+    collection_hash.batch_size = 2
+
+    records = await collection_hash.get(keys=["id1", "missing", "id2"])
+
+    assert [record["id"] for record in records] == ["id1", "id2"]
+    assert records[0]["content"] == "content"
+    assert [[args[1] for args in stack] for stack in mock_pipeline_execute.command_stacks] == [
+        ["id1", "missing"],
+        ["id2"],
+    ]
+
+
+async def test_upsert_json_mset_in_batches(collection_with_prefix_json, mock_upsert_json):
+    collection_with_prefix_json.batch_size = 2
+
+    keys = await collection_with_prefix_json.upsert(records=_records(3))
+
+    assert keys == ["id0", "id1", "id2"]
+    assert mock_upsert_json.await_count == 2
+    triplets = mock_upsert_json.await_args_list[0].args[0]
+    assert [(name, path) for name, path, _ in triplets] == [("test:id0", "$"), ("test:id1", "$")]
+    assert triplets[0][2] == {"content": "content", "vector": [1.0, 2.0, 3.0]}
+
+
+async def test_upsert_json_without_mset(collection_json, mock_upsert_json, mock_pipeline_execute):
+    collection_json.batch_size = 2
+    mock_upsert_json.side_effect = ResponseError("ERR unknown command 'JSON.MSET'")
+
+    keys = await collection_json.upsert(records=_records(3))
+
+    assert keys == ["id0", "id1", "id2"]
+    # JSON.MSET is only tried once
+    assert mock_upsert_json.await_count == 1
+    assert [[args[:2] for args in stack] for stack in mock_pipeline_execute.command_stacks] == [
+        [("JSON.SET", "id0"), ("JSON.SET", "id1")],
+        [("JSON.SET", "id2")],
+    ]
+
+
+async def test_upsert_json_mset_error(collection_json, mock_upsert_json):
+    mock_upsert_json.side_effect = ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+
+    with raises(VectorStoreOperationException):
+        await collection_json.upsert(records=_records(1))
+
+
+async def test_get_json_in_batches(collection_json, mock_get_json):
+    collection_json.batch_size = 1
+
+    await collection_json.get(keys=["id1", "id2"])
+
+    assert [call.args[0] for call in mock_get_json.await_args_list] == [["id1"], ["id2"]]
+
+
+async def test_delete_json_pipelined(collection_json, mock_pipeline_execute):
+    await collection_json.delete(keys=["id1", "id2"])
+
+    assert mock_pipeline_execute.command_stacks == [[("JSON.DEL", "id1", "."), ("JSON.DEL", "id2", ".")]]
+
+
+async def test_upsert_stream(collection_hash, mock_pipeline_execute):
+    collection_hash.batch_size = 2
+    read: list[int] = []
+
+    async def records() -> AsyncIterator[dict[str, Any]]:
+        for index, record in enumerate(_records(5)):
+            read.append(index)
+            yield record
+
+    keys = await collection_hash.upsert_stream(records(), max_pending_batches=1)
+
+    assert keys == ["id0", "id1", "id2", "id3", "id4"]
+    assert read == [0, 1, 2, 3, 4]
+    assert [len(stack) for stack in mock_pipeline_execute.command_stacks] == [2, 2, 1]
+
+
+async def test_upsert_stream_backpressure(collection_hash):
+    collection_hash.batch_size = 1
+    pending = 0
+    max_pending = 0
+
+    async def upsert(records, **kwargs):
+        nonlocal pending, max_pending
+        pending += 1
+        max_pending = max(max_pending, pending)
+        await asyncio.sleep(0.01)
+        pending -= 1
+        return [record["id"] for record in records]
+
+    async def records() -> AsyncIterator[dict[str, Any]]:
+        for record in _records(6):
+            yield record
+
+    with patch.object(RedisHashsetCollection, "upsert", side_effect=upsert):
+        keys = await collection_hash.upsert_stream(records(), max_pending_batches=2)
+
+    assert keys == [f"id{index}" for index in range(6)]
+    assert max_pending == 2
+
+
+async def test_upsert_stream_error(collection_hash):
+    collection_hash.batch_size = 1
+    read: list[str] = []
+
+    async def upsert(records, **kwargs):
+        raise VectorStoreOperationException("failed")
+
+    async def records() -> AsyncIterator[dict[str, Any]]:
+        for record in _records(10):
+            read.append(record["id"])
+            yield record
+
+    with (
+        patch.object(RedisHashsetCollection, "upsert", side_effect=upsert),
+        raises(VectorStoreOperationException, match="failed"),
+    ):
+        await collection_hash.upsert_stream(records(), max_pending_batches=1)
+    # reading stops at the first failed batch
+    assert len(read) < 10
@@ -0,0 +1,151 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+from pytest import fixture, mark
+
+from semantic_kernel.connectors.memory.usearch import USearchMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+
+def _records(count: int, start: int = 0) -> list[MemoryRecord]:
+    rng = np.random.default_rng(start)
+    return [
+        MemoryRecord.local_record(
+            id=f"id{index}",
+            text=f"text {index}",
+            description=None,
+            additional_metadata=None,
+            embedding=rng.random(4, dtype=np.float32),
+        )
+        for index in range(start, start + count)
+    ]
+
+
+@fixture
+def records() -> list[MemoryRecord]:
+    return _records(10)
+
+
+async def test_append_buffer(monkeypatch, records):
+    monkeypatch.setattr("semantic_kernel.connectors.memory.usearch.usearch_memory_store._APPEND_BUFFER_SIZE", 4)
+    store = USearchMemoryStore()
+    await store.create_collection("test", ndim=4, metric="l2sq")
+    for record in records:
+        await store.upsert("test", record)
+
+    ucollection = store._collections["test"]
+    # two full buffers of four rows were flushed, each into a single chunk
+    assert ucollection.embeddings_data_table.num_rows == 8
+    assert ucollection.embeddings_data_table.column(0).num_chunks == 3
+    assert ucollection.num_rows == 10
+
+    # buffered rows are flushed when they are read
+    result = await store.get("test", "id9", with_embedding=False)
+    assert result._text == "text 9"
+    assert not ucollection.embeddings_buffer
+    match, _ = await store.get_nearest_match("test", records[9].embedding, exact=True)
+    assert match._id == "id9"
+
+
+async def test_compact(records):
+    store = USearchMemoryStore()
+    await store.create_collection("test", ndim=4, metric="l2sq")
+    await store.upsert_batch("test", records)
+    await store.remove_batch("test", ["id0", "id3", "id4"])
+    replaced = _records(1, start=7)[0]
+    replaced._text = "replaced"
+    await store.upsert("test", replaced)
+
+    ucollection = store._collections["test"]
+    assert ucollection.num_removed == 4
+    await store.compact("test")
+    assert ucollection.num_removed == 0
+    assert ucollection.embeddings_data_table.num_rows == 7
+    assert sorted(ucollection.embeddings_id_to_label.values()) == list(range(7))
+
+    for record in [*records[1:3], *records[5:7], *records[8:]]:
+        match, _ = await store.get_nearest_match("test", record.embedding, exact=True)
+        assert match._id == record._id
+        assert match._text == record._text
+    result = await store.get("test", "id7", with_embedding=True)
+    assert result._text == "replaced"
+    np.testing.assert_allclose(result.embedding, replaced.embedding, atol=1e-2)
+
+
+async def test_persist_and_view(tmp_path, records):
+    store = USearchMemoryStore(tmp_path)
+    await store.create_collection("first", ndim=4, metric="l2sq")
+    await store.create_collection("second", ndim=4, metric="l2sq")
+    await store.upsert_batch("first", records)
+    await store.upsert_batch("second", records)
+    await store.remove("first", "id0")
+    await store.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "first.arrow",
+        "first.usearch",
+        "second.arrow",
+        "second.usearch",
+    ]
+
+    store = USearchMemoryStore(tmp_path)
+    first = store._collections["first"]
+    assert first.embeddings_index_path == tmp_path / "first.usearch"
+    assert first.embeddings_data_table.num_rows == 9
+    match, _ = await store.get_nearest_match("first", records[5].embedding, exact=True)
+    assert match._id == "id5"
+
+    # the first write loads the index into memory, an unmodified collection is not saved again
+    second_files = {path: path.stat().st_mtime_ns for path in tmp_path.glob("second.*")}
+    await store.upsert("first", _records(1, start=10)[0])
+    assert first.embeddings_index_path is None
+    await store.close()
+    assert {path: path.stat().st_mtime_ns for path in tmp_path.glob("second.*")} == second_files
+
+    store = USearchMemoryStore(tmp_path)
+    result = await store.get_batch("first", ["id0", "id1", "id10"], with_embeddings=True)
+    assert [record._id for record in result] == ["id1", "id10"]
+    await store.delete_collection("second")
+    await store.close()
+    assert not list(tmp_path.glob("second.*"))
+
+
+async def test_read_parquet(tmp_path, records):
+    store = USearchMemoryStore(tmp_path)
+    await store.create_collection("test", ndim=4, metric="l2sq")
+    await store.upsert_batch("test", records)
+    await store.close()
+    arrow_file = tmp_path / "test.arrow"
+    store = USearchMemoryStore()
+    pq.write_table(store._read_embeddings_table(arrow_file)[0], tmp_path / "test.parquet")
+    arrow_file.unlink()
+
+    store = USearchMemoryStore(tmp_path)
+    result = await store.get("test", "id2", with_embedding=False)
+    assert result._text == "text 2"
+
+
+def _is_memory_mapped(path: Path) -> bool:
+    return str(path) in Path("/proc/self/maps").read_text()
+
+
+@mark.skipif(not Path("/proc/self/maps").exists(), reason="The memory maps of the process can not be listed.")
+async def test_reopen_upsert_close_does_not_rewrite_mapped_files(tmp_path, records):
+    store = USearchMemoryStore(tmp_path)
+    await store.create_collection("test", ndim=4, metric="l2sq")
+    await store.upsert_batch("test", records)
+    await store.close()
+
+    store = USearchMemoryStore(tmp_path)
+    assert _is_memory_mapped(tmp_path / "test.arrow")
+    # an append does not compact the collection, the data file is still loaded into memory before it is rewritten
+    await store.upsert("test", _records(1, start=10)[0])
+    assert not _is_memory_mapped(tmp_path / "test.arrow")
+    assert not _is_memory_mapped(tmp_path / "test.usearch")
+    await store.close()
+
+    store = USearchMemoryStore(tmp_path)
+    result = await store.get_batch("test", ["id0", "id10"], with_embeddings=False)
+    assert [record._id for record in result] == ["id0", "id10"]
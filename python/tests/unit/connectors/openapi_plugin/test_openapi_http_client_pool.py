@@ -0,0 +1,77 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import copy
+
+import pytest
+
+from semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool import OpenApiHttpClientPool
+from semantic_kernel.kernel import Kernel
+
+
+async def test_client_is_shared():
+    pool = OpenApiHttpClientPool(max_connections=10, http2=False)
+
+    client = pool.client
+
+    assert pool.client is client
+    assert not client.is_closed
+    await pool.aclose()
+    assert client.is_closed
+    assert pool.client is not client
+    await pool.aclose()
+
+
+async def test_deepcopy_of_kernel_shares_the_pool():
+    kernel = Kernel()
+    pool = kernel.openapi_http_client_pool
+    client = pool.client
+
+    kernel_copy = copy.deepcopy(kernel)
+
+    assert kernel_copy.openapi_http_client_pool is pool
+    assert pool.client is client
+    await pool.aclose()
+
+
+def test_client_is_recreated_in_another_event_loop():
+    pool = OpenApiHttpClientPool(http2=False)
+
+    async def get_client():
+        return pool.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+
+async def test_limit_per_host():
+    pool = OpenApiHttpClientPool(max_connections_per_host=2, http2=False)
+    running: dict[str, int] = {"example.com": 0, "example.org": 0}
+    max_running: dict[str, int] = {"example.com": 0, "example.org": 0}
+
+    async def request(host: str):
+        async with pool.limit(f"https://{host}/items"):
+            running[host] += 1
+            max_running[host] = max(max_running[host], running[host])
+            await asyncio.sleep(0.01)
+            running[host] -= 1
+
+    await asyncio.gather(*[request(host) for host in running for _ in range(5)])
+
+    assert max_running == {"example.com": 2, "example.org": 2}
+
+
+async def test_no_limit_per_host():
+    pool = OpenApiHttpClientPool(http2=False)
+
+    async with pool.limit("https://example.com"):
+        pass
+
+    assert pool._host_semaphores == {}
+
+
+def test_invalid_limit_per_host():
+    with pytest.raises(ValueError):
+        OpenApiHttpClientPool(max_connections_per_host=0)
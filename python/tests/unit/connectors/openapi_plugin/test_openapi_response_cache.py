@@ -0,0 +1,103 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import httpx
+import pytest
+
+from semantic_kernel.connectors.openapi_plugin.openapi_response_cache import OpenApiResponseCache
+
+URL = "https://example.com/items"
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(
+        "semantic_kernel.connectors.openapi_plugin.openapi_response_cache.time.monotonic", lambda: now[0]
+    )
+    return now
+
+
+def test_fresh_response(clock):
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {"Accept": "application/json"})
+
+    response = httpx.Response(200, text="items", headers={"Cache-Control": "max-age=60"})
+    assert cache.process_response(key, response) is None
+    assert cache.get_fresh(key) == "items"
+    clock[0] += 61
+    assert cache.get_fresh(key) is None
+    assert cache.get_validators(key) == {}
+    assert cache.hits == 1
+
+
+def test_age_is_subtracted(clock):
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {})
+    cache.process_response(key, httpx.Response(200, text="items", headers={"Cache-Control": "max-age=60", "Age": "50"}))
+
+    clock[0] += 11
+
+    assert cache.get_fresh(key) is None
+
+
+def test_revalidation(clock):
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {})
+    cache.process_response(
+        key,
+        httpx.Response(
+            200,
+            text="items",
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT", "Cache-Control": "no-cache"},
+        ),
+    )
+
+    assert cache.get_fresh(key) is None
+    assert cache.get_validators(key) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert cache.process_response(key, httpx.Response(304)) == "items"
+    assert cache.revalidations == 1
+
+
+@pytest.mark.parametrize("headers", [{"Cache-Control": "no-store, max-age=60"}, {}], ids=["no-store", "no-headers"])
+def test_not_cached(headers):
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {})
+
+    cache.process_response(key, httpx.Response(200, text="items", headers=headers))
+
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached():
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {})
+
+    cache.process_response(key, httpx.Response(500, headers={"Cache-Control": "max-age=60"}))
+
+    assert len(cache) == 0
+
+
+def test_key_includes_headers():
+    cache = OpenApiResponseCache()
+    key = cache.create_key(URL, {"Authorization": "Bearer a"})
+    cache.process_response(key, httpx.Response(200, text="items", headers={"Cache-Control": "max-age=60"}))
+
+    assert cache.get_fresh(cache.create_key(URL, {"authorization": "Bearer a"})) == "items"
+    assert cache.get_fresh(cache.create_key(URL, {"Authorization": "Bearer b"})) is None
+
+
+def test_least_recently_used_is_evicted():
+    cache = OpenApiResponseCache(max_entries=2)
+    keys = [cache.create_key(f"{URL}/{index}", {}) for index in range(3)]
+    for key in keys[:2]:
+        cache.process_response(key, httpx.Response(200, text="items", headers={"Cache-Control": "max-age=60"}))
+    cache.get_fresh(keys[0])
+
+    cache.process_response(keys[2], httpx.Response(200, text="items", headers={"Cache-Control": "max-age=60"}))
+
+    assert cache.get_fresh(keys[0]) == "items"
+    assert cache.get_fresh(keys[1]) is None
+    assert len(cache) == 2
@@ -1,13 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import json
 from collections import OrderedDict
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import httpx
 import pytest
 
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation import RestApiOperation
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_payload import RestApiPayload
 from semantic_kernel.connectors.openapi_plugin.openapi_manager import OpenApiRunner
+from semantic_kernel.connectors.openapi_plugin.openapi_response_cache import OpenApiResponseCache
 from semantic_kernel.exceptions import FunctionExecutionException
 
 
@@ -63,7 +66,7 @@ def test_build_json_payload_dynamic_payload():
     content, media_type = runner.build_json_payload(payload_metadata, arguments)
 
     runner.build_json_object.assert_called_once_with(payload_metadata.properties, arguments)
-    assert content == '{"property1": "value1", "property2": "value2"}'
+    assert content == {"property1": "value1", "property2": "value2"}
     assert media_type == "application/json"
 
 
@@ -323,3 +326,81 @@ async def test_run_operation():
 
     result = await runner.run_operation(operation, arguments, options)
     assert result == "response text"
+
+
+def _get_operation(method: str = "GET") -> MagicMock:
+    operation = MagicMock()
+    operation.method = method
+    operation.build_headers.return_value = {}
+    operation.responses = OrderedDict()
+    operation.request_body = None
+    return operation
+
+
+@pytest.fixture
+def mock_transport_requests(monkeypatch) -> list[httpx.Request]:
+    """Let the pooled clients send their requests to a mock transport, which records them."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"Cache-Control": "max-age=60"})
+        headers = {"ETag": '"v1"', "Cache-Control": "no-cache"} if request.url.path == "/etag" else {}
+        return httpx.Response(200, text=f"response {len(requests)}", headers=headers)
+
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "semantic_kernel.connectors.openapi_plugin.openapi_http_client_pool.httpx.AsyncClient",
+        lambda **kwargs: async_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return requests
+
+
+async def test_run_operation_reuses_pooled_client(mock_transport_requests):
+    runner = OpenApiRunner({})
+    runner.build_operation_url = MagicMock(return_value="http://example.com/items")
+
+    assert await runner.run_operation(_get_operation()) == "response 1"
+    client = runner.http_client_pool.client
+    assert await runner.run_operation(_get_operation()) == "response 2"
+
+    assert runner.http_client_pool.client is client
+    assert len(mock_transport_requests) == 2
+
+
+async def test_run_operation_sends_dynamic_payload(mock_transport_requests):
+    runner = OpenApiRunner({})
+    runner.build_operation_url = MagicMock(return_value="http://example.com/items")
+    runner.build_operation_payload = MagicMock(return_value=({"name": "item"}, "application/json"))
+
+    await runner.run_operation(_get_operation("POST"))
+
+    assert json.loads(mock_transport_requests[0].content) == {"name": "item"}
+
+
+async def test_run_operation_revalidates_cached_response(mock_transport_requests):
+    runner = OpenApiRunner({}, response_cache=OpenApiResponseCache())
+    runner.build_operation_url = MagicMock(return_value="http://example.com/etag")
+
+    assert await runner.run_operation(_get_operation()) == "response 1"
+    # the response is sent with no-cache, so it is revalidated with its etag
+    assert await runner.run_operation(_get_operation()) == "response 1"
+    # the 304 response allows the cached response to be used for a minute
+    assert await runner.run_operation(_get_operation()) == "response 1"
+
+    assert len(mock_transport_requests) == 2
+    assert mock_transport_requests[1].headers["If-None-Match"] == '"v1"'
+    assert runner.response_cache.revalidations == 1
+    assert runner.response_cache.hits == 1
+
+
+async def test_run_operation_does_not_cache_other_methods(mock_transport_requests):
+    runner = OpenApiRunner({}, response_cache=OpenApiResponseCache())
+    runner.build_operation_url = MagicMock(return_value="http://example.com/etag")
+
+    await runner.run_operation(_get_operation("POST"))
+    await runner.run_operation(_get_operation("POST"))
+
+    assert len(runner.response_cache) == 0
+    assert len(mock_transport_requests) == 2
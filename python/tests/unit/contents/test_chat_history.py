@@ -605,3 +605,50 @@ def test_chat_history_serialize(chat_history: ChatHistory):
     ])
     chat_history.add_tool_message([FunctionResultContent(id="test1", result=custom_result)])
     assert "CustomResultTestValue" in chat_history.serialize()
+
+
+def test_serialize_messages_only_serializes_new_messages():
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Hello")
+    chat_history.add_assistant_message("Hi")
+    serialized: list[str] = []
+
+    def serializer(message: ChatMessageContent) -> dict:
+        serialized.append(message.content)
+        return message.to_dict()
+
+    first = chat_history.serialize_messages(serializer)
+    chat_history.add_user_message("How are you?")
+    second = chat_history.serialize_messages(serializer)
+
+    assert serialized == ["Hello", "Hi", "How are you?"]
+    assert second[:2] == first
+    assert second[0] is first[0]
+    assert second == [message.to_dict() for message in chat_history.messages]
+
+
+def test_serialize_messages_changed_and_removed_messages():
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Hello")
+    chat_history.add_assistant_message("Hi")
+    chat_history.serialize_messages(ChatMessageContent.to_dict)
+
+    chat_history.messages[0].content = "Hello there"
+    chat_history.messages[1].items.append(TextContent(text="!"))
+    chat_history.remove_message(chat_history.messages[1])
+
+    assert chat_history.serialize_messages(ChatMessageContent.to_dict) == [{"role": "user", "content": "Hello there"}]
+    assert len(chat_history._serialized_messages.entries[ChatMessageContent.to_dict]) == 1
+
+
+def test_serialize_messages_keys_and_copies():
+    chat_history = ChatHistory()
+    chat_history.add_system_message("Be brief")
+
+    assert chat_history.serialize_messages(lambda message: message.role.value, key="role") == ["system"]
+    assert chat_history.serialize_messages(lambda message: message.content, key="content") == ["Be brief"]
+    assert chat_history.serialize_messages(lambda message: "changed", key="role") == ["system"]
+
+    copied = chat_history.model_copy(deep=True)
+    assert copied.serialize_messages(lambda message: "changed", key="role") == ["changed"]
+    assert copied == chat_history
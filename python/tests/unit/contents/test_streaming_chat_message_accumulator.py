@@ -0,0 +1,144 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from functools import reduce
+
+import pytest
+
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_chat_message_accumulator import StreamingChatMessageAccumulator
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.exceptions.content_exceptions import ContentAdditionException
+
+
+def _text_chunk(text: str, **kwargs) -> StreamingChatMessageContent:
+    return StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, content=text, **kwargs)
+
+
+def _call_chunk(*calls: FunctionCallContent, **kwargs) -> StreamingChatMessageContent:
+    return StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, items=list(calls), **kwargs)
+
+
+def _accumulate(chunks: list[StreamingChatMessageContent]) -> StreamingChatMessageContent | None:
+    accumulator = StreamingChatMessageAccumulator()
+    for chunk in chunks:
+        accumulator += chunk
+    assert len(accumulator) == len(chunks)
+    return accumulator.build()
+
+
+def test_accumulator_empty():
+    assert StreamingChatMessageAccumulator().build() is None
+
+
+def test_accumulator_single_chunk_is_returned_as_is():
+    chunk = _text_chunk("Hello")
+    assert _accumulate([chunk]) is chunk
+
+
+def test_accumulator_text():
+    chunks = [
+        _text_chunk("Hello", inner_content="a", metadata={"a": 1}),
+        _text_chunk(", ", inner_content="b", name="assistant"),
+        _text_chunk("world!", inner_content="c", metadata={"b": 2}, finish_reason="stop"),
+    ]
+    message = _accumulate(chunks)
+    expected = reduce(lambda x, y: x + y, chunks)
+
+    assert message.content == "Hello, world!"
+    assert message == expected
+    assert message.items[0].inner_content == expected.items[0].inner_content == ["a", "b", "c"]
+    assert message.inner_content == ["a", "b", "c"]
+    assert message.metadata == {"a": 1, "b": 2}
+    assert message.name == "assistant"
+    assert message.finish_reason == "stop"
+
+
+def test_accumulator_function_call_fragments():
+    chunks = [
+        _call_chunk(FunctionCallContent(id="call_1", index=0, name="math-Add", arguments="")),
+        _call_chunk(FunctionCallContent(id="call_2", index=1, name="math-Subtract", arguments='{"a": 1')),
+        _call_chunk(FunctionCallContent(index=0, arguments='{"a": ')),
+        _call_chunk(FunctionCallContent(index=0, arguments="1}")),
+        _call_chunk(FunctionCallContent(index=1, arguments="}")),
+        _text_chunk("Done"),
+    ]
+    message = _accumulate(chunks)
+    expected = reduce(lambda x, y: x + y, chunks)
+
+    assert message == expected
+    calls = [item for item in message.items if isinstance(item, FunctionCallContent)]
+    assert [(call.id, call.name, call.arguments) for call in calls] == [
+        ("call_1", "math-Add", '{"a": 1}'),
+        ("call_2", "math-Subtract", '{"a": 1}'),
+    ]
+    assert message.content == "Done"
+
+
+def test_accumulator_function_call_without_arguments():
+    chunks = [
+        _call_chunk(FunctionCallContent(id="call_1", index=0, name="time-Now")),
+        _call_chunk(FunctionCallContent(index=0)),
+    ]
+    message = _accumulate(chunks)
+
+    assert message.items[0].arguments == "{}"
+    assert message == reduce(lambda x, y: x + y, chunks)
+
+
+def test_accumulator_function_call_mapping_arguments():
+    chunks = [
+        _call_chunk(FunctionCallContent(id="call_1", index=0, name="math-Add", arguments={"a": 1})),
+        _call_chunk(FunctionCallContent(id="call_1", index=0, arguments={"b": 2})),
+        _call_chunk(FunctionCallContent(id="call_1", index=0, arguments='{"c": 3}')),
+    ]
+    message = _accumulate(chunks)
+
+    assert message == reduce(lambda x, y: x + y, chunks)
+    assert message.items[0].arguments == {"a": 1, "b": 2}
+    assert message.items[1].arguments == '{"c": 3}'
+
+
+def test_accumulator_keeps_other_items():
+    result = FunctionResultContent(id="call_1", name="math-Add", result="2")
+    chunks = [_text_chunk("Hello"), _call_chunk(result), _text_chunk(" world")]
+    message = _accumulate(chunks)
+
+    assert message.items[1] is result
+    assert message == reduce(lambda x, y: x + y, chunks)
+
+
+def test_accumulator_does_not_modify_chunks():
+    first = _text_chunk("Hello")
+    call = FunctionCallContent(id="call_1", index=0, name="math-Add", arguments='{"a"')
+    chunks = [
+        first,
+        _call_chunk(call),
+        _text_chunk(" world"),
+        _call_chunk(FunctionCallContent(index=0, arguments=": 1}")),
+    ]
+    _accumulate(chunks)
+
+    assert first.content == "Hello"
+    assert isinstance(first.items[0], StreamingTextContent)
+    assert call.arguments == '{"a"'
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=1, content="a"),
+        StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, content="a", ai_model_id="other"),
+        StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, content="a", encoding="ascii"),
+        StreamingChatMessageContent(role=AuthorRole.USER, choice_index=0, content="a"),
+        StreamingTextContent(choice_index=0, text="a"),
+    ],
+    ids=["choice_index", "ai_model_id", "encoding", "role", "type"],
+)
+def test_accumulator_incompatible_chunk(other):
+    accumulator = StreamingChatMessageAccumulator()
+    accumulator.add(_text_chunk("Hello"))
+    with pytest.raises(ContentAdditionException):
+        accumulator.add(other)
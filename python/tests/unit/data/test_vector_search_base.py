@@ -6,7 +6,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from semantic_kernel.data.vector_search import VectorSearchBase, VectorSearchOptions
-from semantic_kernel.exceptions.vector_store_exceptions import VectorStoreModelDeserializationException
+from semantic_kernel.exceptions.vector_store_exceptions import (
+    VectorSearchExecutionException,
+    VectorStoreModelDeserializationException,
+)
 
 
 async def test_search(vector_store_record_collection: VectorSearchBase):
@@ -42,3 +45,22 @@ async def test_get_vector_search_results_fail(vector_store_record_collection: Ve
         ):
             assert result.record == results[0]
             break
+
+
+async def test_search_batch(vector_store_record_collection: VectorSearchBase):
+    record = {"id": "test_id", "content": "test_content", "vector": [1.0, 2.0, 3.0]}
+    await vector_store_record_collection.upsert(record)
+    results = await vector_store_record_collection.vectorized_search_batch(
+        vectors=[[1.0, 2.0, 3.0], [3.0, 2.0, 1.0]], options=VectorSearchOptions(include_total_count=True)
+    )
+    assert len(results) == 2
+    for result in results:
+        assert result.total_count == 1
+        records = [rec async for rec in result.results]
+        assert records[0].record == record
+
+
+async def test_search_batch_fail(vector_store_record_collection: VectorSearchBase):
+    vector_store_record_collection._inner_search = MagicMock(side_effect=Exception("fail"))
+    with pytest.raises(VectorSearchExecutionException):
+        await vector_store_record_collection.vectorized_search_batch(vectors=[[1.0, 2.0, 3.0]])
@@ -0,0 +1,172 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.filters.filter_types import FilterTypes
+from semantic_kernel.functions.function_call_scheduler import FUNCTION_CALL_TIMEOUT_ERROR, FunctionCallScheduler
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+
+
+class TrackingPlugin:
+    def __init__(self, tracker: dict[str, int]):
+        self.tracker = tracker
+
+    @kernel_function
+    async def wait(self, seconds: float) -> str:
+        self.tracker["running"] += 1
+        self.tracker["max_running"] = max(self.tracker["max_running"], self.tracker["running"])
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.tracker["running"] -= 1
+        return f"waited {seconds}"
+
+    @kernel_function(run_in_executor=True)
+    def thread_name(self) -> str:
+        return threading.current_thread().name
+
+
+@pytest.fixture
+def tracker() -> dict[str, int]:
+    return {"running": 0, "max_running": 0}
+
+
+def _kernel(tracker: dict[str, int], **scheduler_settings) -> Kernel:
+    kernel = Kernel(function_call_scheduler=FunctionCallScheduler(**scheduler_settings))
+    kernel.add_plugin(TrackingPlugin(tracker), "first")
+    kernel.add_plugin(TrackingPlugin(tracker), "second")
+    return kernel
+
+
+def _call(index: int, name: str, arguments: str = "{}") -> FunctionCallContent:
+    return FunctionCallContent(id=f"call_{index}", name=name, arguments=arguments)
+
+
+def _results(chat_history: ChatHistory) -> list[FunctionResultContent]:
+    return [item for message in chat_history.messages for item in message.items]
+
+
+async def test_results_in_order_of_calls(tracker):
+    kernel = _kernel(tracker)
+    chat_history = ChatHistory()
+    calls = [_call(i, "first-wait", f'{{"seconds": {0.03 - i * 0.01}}}') for i in range(3)]
+
+    results = await kernel.invoke_function_calls(calls, chat_history)
+
+    assert results == [None, None, None]
+    assert [result.id for result in _results(chat_history)] == ["call_0", "call_1", "call_2"]
+    assert tracker["max_running"] == 3
+
+
+async def test_filters_edit_the_shared_history(tracker):
+    kernel = _kernel(tracker)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Wait three times")
+
+    async def auto_function_invocation_filter(context, next):
+        await next(context)
+        if context.arguments["seconds"] == 0.02:
+            context.chat_history.messages.pop(0)
+        context.chat_history.add_user_message(f"checked {context.arguments['seconds']}")
+
+    kernel.add_filter(FilterTypes.AUTO_FUNCTION_INVOCATION, auto_function_invocation_filter)
+    calls = [_call(i, "first-wait", f'{{"seconds": {seconds}}}') for i, seconds in enumerate([0.03, 0.02, 0.01])]
+
+    await kernel.invoke_function_calls(calls, chat_history)
+
+    assert [message.content for message in chat_history.messages if message.role == AuthorRole.USER] == [
+        "checked 0.01",
+        "checked 0.02",
+        "checked 0.03",
+    ]
+    results = [item for item in _results(chat_history) if isinstance(item, FunctionResultContent)]
+    assert [result.id for result in results] == ["call_0", "call_1", "call_2"]
+
+
+@pytest.mark.parametrize(
+    "settings, max_running",
+    [
+        ({"max_concurrency": 2}, 2),
+        ({"max_concurrency_per_plugin": 1}, 2),
+        ({"max_concurrency_per_plugin": 1, "plugin_concurrency": {"first": 3}}, 4),
+        ({"max_concurrency": 1, "max_concurrency_per_plugin": 2}, 1),
+    ],
+)
+async def test_concurrency_limits(tracker, settings, max_running):
+    kernel = _kernel(tracker, **settings)
+    chat_history = ChatHistory()
+    calls = [_call(i, f"{plugin}-wait", '{"seconds": 0.01}') for i, plugin in enumerate(["first", "second"] * 3)]
+
+    await kernel.invoke_function_calls(calls, chat_history)
+
+    assert tracker["max_running"] == max_running
+    assert [result.id for result in _results(chat_history)] == [f"call_{i}" for i in range(6)]
+
+
+async def test_timeout_is_a_tool_error(tracker):
+    kernel = _kernel(tracker, timeout=5, function_timeouts={"second-wait": 0.01})
+    chat_history = ChatHistory()
+
+    await kernel.invoke_function_calls(
+        [_call(0, "second-wait", '{"seconds": 10}'), _call(1, "first-wait", '{"seconds": 0}')], chat_history
+    )
+
+    timed_out, completed = _results(chat_history)
+    assert timed_out.id == "call_0"
+    assert "did not complete within 0.01 seconds" in timed_out.result
+    assert timed_out.metadata["error"] == FUNCTION_CALL_TIMEOUT_ERROR
+    assert timed_out.metadata["timeout"] == 0.01
+    assert completed.result == "waited 0.0"
+    assert tracker["running"] == 0
+
+
+async def test_run_in_executor(tracker):
+    with ThreadPoolExecutor(thread_name_prefix="sk-test") as executor:
+        kernel = _kernel(tracker, executor=executor)
+        chat_history = ChatHistory()
+
+        await kernel.invoke_function_calls([_call(0, "first-thread_name")], chat_history)
+
+    assert _results(chat_history)[0].result.startswith("sk-test")
+
+
+async def test_limits_after_event_loop_change(tracker):
+    kernel = _kernel(tracker, max_concurrency=1)
+    calls = [_call(0, "first-wait", '{"seconds": 0}'), _call(1, "second-wait", '{"seconds": 0}')]
+    await kernel.invoke_function_calls(calls, ChatHistory())
+
+    # the semaphores of the previous event loop can not be used in a new event loop
+    await asyncio.to_thread(asyncio.run, kernel.invoke_function_calls(calls, ChatHistory()))
+
+
+def test_invalid_limits():
+    with pytest.raises(ValidationError):
+        FunctionCallScheduler(max_concurrency=0)
+
+
+def test_clone_shares_scheduler(tracker):
+    kernel = _kernel(tracker, max_concurrency=1)
+    assert kernel.clone().function_call_scheduler is kernel.function_call_scheduler
+
+
+@pytest.mark.parametrize("is_streaming", [True, False])
+async def test_timeout_result_follows_is_streaming(tracker, is_streaming):
+    kernel = _kernel(tracker, timeout=0.01)
+    chat_history = ChatHistory()
+
+    await kernel.invoke_function_calls(
+        [_call(0, "first-wait", '{"seconds": 10}')], chat_history, is_streaming=is_streaming
+    )
+
+    assert isinstance(chat_history.messages[0], StreamingChatMessageContent) is is_streaming
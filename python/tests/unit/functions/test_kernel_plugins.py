@@ -536,3 +536,14 @@ def test_from_openapi_missing_document_and_parsed_spec_throws():
 def test_parse_or_copy_fail():
     with raises(ValueError):
         KernelPlugin._parse_or_copy(None, "test")
+
+
+def test_version_changes_when_functions_are_set(decorated_native_function):
+    plugin = KernelPlugin(name="test_plugin")
+    other = KernelPlugin(name="other_plugin")
+    version = plugin.version
+
+    plugin["getLightStatus"] = decorated_native_function
+
+    assert plugin.version != version
+    assert plugin.version != other.version
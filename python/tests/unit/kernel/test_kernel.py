@@ -4,7 +4,7 @@ import os
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Union, get_type_hints
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,6 +14,8 @@ from semantic_kernel.connectors.ai.chat_completion_client_base import ChatComple
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.openapi_plugin import OpenAPIFunctionExecutionParameters, OpenApiHttpClientPool
+from semantic_kernel.connectors.openapi_plugin.openapi_runner import OpenApiRunner
 from semantic_kernel.const import METADATA_EXCEPTION_KEY
 from semantic_kernel.contents import ChatMessageContent
 from semantic_kernel.contents.chat_history import ChatHistory
@@ -96,6 +98,12 @@ def test_kernel_init_with_kernel_plugin_list():
     assert kernel.plugins is not None
 
 
+def test_kernel_type_hints_resolve():
+    # the json schema of a model that holds a kernel is built from the type hints of the kernel
+    hints = get_type_hints(Kernel)
+    assert "plugins" in hints
+
+
 # endregion
 # region Invoke Functions
 
@@ -574,6 +582,35 @@ def test_plugins_add_plugins(kernel: Kernel):
     assert len(kernel.plugins) == 2
 
 
+def test_plugins_version_changes_when_functions_are_added(kernel: Kernel, decorated_native_function):
+    version = kernel.plugins_version
+
+    kernel.add_function(plugin_name="TestPlugin", function=decorated_native_function)
+    added = kernel.plugins_version
+    kernel.add_plugin(KernelPlugin(name="TestPlugin2"))
+
+    assert added != version
+    assert kernel.plugins_version != added
+    assert kernel.plugins_version == kernel.plugins_version
+
+
+def test_function_metadata_is_cached_until_plugins_change(kernel: Kernel, decorated_native_function):
+    kernel.add_function(plugin_name="TestPlugin", function=decorated_native_function)
+
+    first = kernel.get_list_of_function_metadata({"included_plugins": ["TestPlugin"]})
+    second = kernel.get_list_of_function_metadata({"included_plugins": ["TestPlugin"]})
+    assert second == first
+    assert second is not first
+    assert kernel.function_data_cache_hit_rate == 0.5
+
+    kernel.add_function(plugin_name="TestPlugin2", function=decorated_native_function)
+    assert len(kernel.get_full_list_of_function_metadata()) == 2
+
+    del kernel.plugins["TestPlugin"]
+    assert [metadata.plugin_name for metadata in kernel.get_full_list_of_function_metadata()] == ["TestPlugin2"]
+    assert kernel.get_list_of_function_metadata({"included_plugins": ["TestPlugin"]}) == []
+
+
 def test_add_function_from_prompt(kernel: Kernel):
     prompt = """
     Write a short story about two Corgis on an adventure.
@@ -683,6 +720,45 @@ def test_import_plugin_from_openapi(kernel: Kernel):
     assert plugin.functions.get("SetSecret") is not None
 
 
+@pytest.mark.parametrize(
+    "execution_settings",
+    [None, OpenAPIFunctionExecutionParameters(enable_dynamic_payload=False)],
+    ids=["no_settings", "settings"],
+)
+def test_import_plugin_from_openapi_shares_http_client_pool(kernel: Kernel, execution_settings):
+    openapi_spec_file = os.path.join(
+        os.path.dirname(__file__), "../../assets/test_plugins", "TestOpenAPIPlugin", "akv-openapi.yaml"
+    )
+
+    with patch(
+        "semantic_kernel.connectors.openapi_plugin.openapi_manager.OpenApiRunner", wraps=OpenApiRunner
+    ) as runner_class:
+        kernel.add_plugin_from_openapi("first", openapi_spec_file, execution_settings=execution_settings)
+        kernel.add_plugin_from_openapi("second", openapi_spec_file, execution_settings=execution_settings)
+
+    pools = [call.kwargs["http_client_pool"] for call in runner_class.call_args_list]
+    assert pools == [kernel.openapi_http_client_pool, kernel.openapi_http_client_pool]
+    if execution_settings:
+        assert runner_class.call_args.kwargs["enable_dynamic_payload"] is False
+        assert execution_settings.http_client_pool is None
+
+
+def test_import_plugin_from_openapi_with_http_client_pool(kernel: Kernel):
+    openapi_spec_file = os.path.join(
+        os.path.dirname(__file__), "../../assets/test_plugins", "TestOpenAPIPlugin", "akv-openapi.yaml"
+    )
+    pool = OpenApiHttpClientPool(max_connections_per_host=4)
+
+    with patch(
+        "semantic_kernel.connectors.openapi_plugin.openapi_manager.OpenApiRunner", wraps=OpenApiRunner
+    ) as runner_class:
+        kernel.add_plugin_from_openapi(
+            "first", openapi_spec_file, execution_settings=OpenAPIFunctionExecutionParameters(http_client_pool=pool)
+        )
+
+    assert runner_class.call_args.kwargs["http_client_pool"] is pool
+
+
 def test_get_plugin(kernel: Kernel):
     kernel.add_plugin(KernelPlugin(name="TestPlugin"))
     plugin = kernel.get_plugin("TestPlugin")
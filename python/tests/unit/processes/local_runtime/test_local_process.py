@@ -2,13 +2,17 @@
 
 
 import asyncio
+from queue import Queue
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel, Field
 
 from semantic_kernel.exceptions.kernel_exceptions import KernelException
 from semantic_kernel.exceptions.process_exceptions import ProcessEventUndefinedException
+from semantic_kernel.functions import kernel_function
 from semantic_kernel.kernel import Kernel
+from semantic_kernel.processes import const
 from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess
 from semantic_kernel.processes.kernel_process.kernel_process_edge import KernelProcessEdge
 from semantic_kernel.processes.kernel_process.kernel_process_event import (
@@ -16,10 +20,15 @@ from semantic_kernel.processes.kernel_process.kernel_process_event import (
     KernelProcessEventVisibility,
 )
 from semantic_kernel.processes.kernel_process.kernel_process_state import KernelProcessState
+from semantic_kernel.processes.kernel_process.kernel_process_step import KernelProcessStep
+from semantic_kernel.processes.kernel_process.kernel_process_step_context import KernelProcessStepContext
 from semantic_kernel.processes.kernel_process.kernel_process_step_info import KernelProcessStepInfo
+from semantic_kernel.processes.kernel_process.kernel_process_step_state import KernelProcessStepState
+from semantic_kernel.processes.local_runtime.local_kernel_process_context import LocalKernelProcessContext
 from semantic_kernel.processes.local_runtime.local_message import LocalMessage
 from semantic_kernel.processes.local_runtime.local_process import LocalProcess
 from semantic_kernel.processes.local_runtime.local_step import LocalStep
+from semantic_kernel.processes.process_builder import ProcessBuilder
 
 
 @pytest.fixture
@@ -356,3 +365,84 @@ def mock_process_with_steps(mock_process, mock_kernel, build_model):
 
     local_process.steps = [step_1, step_2]
     return local_process
+
+
+class FanOutSourceStep(KernelProcessStep):
+    @kernel_function
+    async def start(self, context: KernelProcessStepContext, value: int):
+        await context.emit_event(process_event="Started", data=value)
+
+
+class FanOutWorkerStep(KernelProcessStep):
+    @kernel_function
+    async def work(self, context: KernelProcessStepContext, value: int):
+        await context.emit_event(process_event="Done", data=value + 1)
+
+
+class FanInState(BaseModel):
+    received: list[int] = Field(default_factory=list)
+
+
+class FanInStep(KernelProcessStep[FanInState]):
+    state: FanInState = Field(default_factory=FanInState)
+
+    async def activate(self, state: KernelProcessStepState[FanInState]):
+        self.state = state.state
+
+    @kernel_function
+    async def collect(self, value: int):
+        self.state.received.append(value)
+
+
+def build_fan_out_process(workers: int) -> KernelProcess:
+    process = ProcessBuilder(name="FanOut")
+    source = process.add_step(FanOutSourceStep, name="Source")
+    collector = process.add_step(FanInStep, name="Collector")
+    process.on_input_event("Start").send_event_to(source)
+    for index in range(workers):
+        worker = process.add_step(FanOutWorkerStep, name=f"Worker{index}")
+        source.on_event("Started").send_event_to(worker)
+        worker.on_event("Done").send_event_to(collector)
+    return process.build()
+
+
+async def test_internal_execute_fan_out_fan_in():
+    process_context = LocalKernelProcessContext(build_fan_out_process(3), Kernel())
+    local_process = process_context.local_process
+
+    with patch.object(
+        LocalProcess, "enqueue_step_messages", autospec=True, side_effect=LocalProcess.enqueue_step_messages
+    ) as enqueue_step_messages:
+        await process_context.start_with_event(KernelProcessEvent(id="Start", data=1))
+
+    state = await process_context.get_state()
+    collector_state = next(step.state for step in state.steps if step.state.name == "Collector")
+    assert collector_state.state.received == [2, 2, 2]
+    assert [(m.messages, m.active_steps) for m in local_process.superstep_metrics] == [(1, 1), (3, 3), (3, 1)]
+    # all 5 steps are checked for events once, after that only the steps that received messages
+    assert enqueue_step_messages.call_count == 5 + 1 + 3 + 1
+
+
+def test_collect_inboxes_groups_messages_by_destination(mock_process, mock_kernel, build_model):
+    local_process = LocalProcess(process=mock_process, kernel=mock_kernel)
+    step_1, step_2 = MagicMock(spec=LocalStep), MagicMock(spec=LocalStep)
+    channel: Queue[LocalMessage] = Queue()
+    for destination_id in ["step_1", "step_2", "step_1", const.END_PROCESS_ID, "step_2"]:
+        channel.put(LocalMessage(source_id="source", destination_id=destination_id, function_name="f", values={}))
+
+    inboxes = local_process._collect_inboxes(channel, {"step_1": step_1, "step_2": step_2})
+
+    assert channel.empty()
+    assert inboxes["step_1"][0] is step_1
+    assert len(inboxes["step_1"][1]) == 2
+    assert inboxes["step_2"][0] is step_2
+    assert len(inboxes["step_2"][1]) == 1
+
+
+def test_collect_inboxes_unknown_destination(mock_process, mock_kernel, build_model):
+    local_process = LocalProcess(process=mock_process, kernel=mock_kernel)
+    channel: Queue[LocalMessage] = Queue()
+    channel.put(LocalMessage(source_id="source", destination_id="unknown", function_name="f", values={}))
+
+    with pytest.raises(KernelException, match="unknown"):
+        local_process._collect_inboxes(channel, {})
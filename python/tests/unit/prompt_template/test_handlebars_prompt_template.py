@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from unittest.mock import patch
+
 import pytest
 from pytest import mark
 
@@ -13,6 +15,7 @@ from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.handlebars_prompt_template import HandlebarsPromptTemplate
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+from semantic_kernel.prompt_template.utils.template_function_helpers import create_template_helper_from_function
 
 
 def create_handlebars_prompt_template(
@@ -340,3 +343,28 @@ async def test_helpers_chat_history_not_chat_history(kernel: Kernel):
     chat_history = "this is not a chathistory object"
     rendered = await target.render(kernel, KernelArguments(chat_history=chat_history))
     assert rendered.strip() == ""
+
+
+async def test_it_creates_helpers_for_referenced_functions_only(kernel: Kernel, decorated_native_function):
+    kernel.add_function(plugin_name="plug", function=decorated_native_function)
+    kernel.add_function(plugin_name="other", function=decorated_native_function)
+    target = create_handlebars_prompt_template("Function: {{plug-getLightStatus arg1='test'}}")
+
+    with patch(
+        "semantic_kernel.prompt_template.handlebars_prompt_template.create_template_helper_from_function",
+        wraps=create_template_helper_from_function,
+    ) as create_helper:
+        assert await target.render(kernel) == "Function: test"
+
+    create_helper.assert_called_once()
+    assert create_helper.call_args.args[0].fully_qualified_name == "plug-getLightStatus"
+
+
+async def test_it_resolves_functions_added_after_a_render(kernel: Kernel, decorated_native_function):
+    target = create_handlebars_prompt_template("{{plug-getLightStatus}}")
+    with pytest.raises(HandlebarsTemplateRenderException):
+        await target.render(kernel, KernelArguments(arg1="test"))
+
+    kernel.add_function(plugin_name="plug", function=decorated_native_function)
+
+    assert await target.render(kernel, KernelArguments(arg1="test")) == "test"
@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from unittest.mock import patch
+
 import pytest
 from pytest import mark
 
@@ -13,6 +15,7 @@ from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.jinja2_prompt_template import Jinja2PromptTemplate
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+from semantic_kernel.prompt_template.utils.template_function_helpers import create_template_helper_from_function
 
 
 def create_jinja2_prompt_template(template: str) -> Jinja2PromptTemplate:
@@ -333,3 +336,38 @@ async def test_helpers_chat_history_messages_non(kernel: Kernel):
     chat_history = "text instead of a chat_history object"
     rendered = await target.render(kernel, KernelArguments(chat_history=chat_history))
     assert rendered.strip() == ""
+
+
+async def test_it_compiles_the_template_once(kernel: Kernel):
+    target = create_jinja2_prompt_template("{{ input }}")
+
+    with patch.object(target._env, "from_string", wraps=target._env.from_string) as from_string:
+        assert await target.render(kernel, KernelArguments(input="a")) == "a"
+        assert await target.render(kernel, KernelArguments(input="b")) == "b"
+
+    from_string.assert_called_once()
+
+
+async def test_it_creates_helpers_for_referenced_functions_only(kernel: Kernel, decorated_native_function):
+    kernel.add_function(plugin_name="plug", function=decorated_native_function)
+    kernel.add_function(plugin_name="other", function=decorated_native_function)
+    target = create_jinja2_prompt_template("Function: {{ plug_getLightStatus(arg1='test') }}")
+
+    with patch(
+        "semantic_kernel.prompt_template.jinja2_prompt_template.create_template_helper_from_function",
+        wraps=create_template_helper_from_function,
+    ) as create_helper:
+        assert await target.render(kernel, KernelArguments()) == "Function: test"
+
+    create_helper.assert_called_once()
+    assert create_helper.call_args.args[0].fully_qualified_name == "plug-getLightStatus"
+
+
+async def test_it_resolves_functions_added_after_a_render(kernel: Kernel, decorated_native_function):
+    target = create_jinja2_prompt_template("{{ plug_getLightStatus(arg1='test') }}")
+    with pytest.raises(Jinja2TemplateRenderException):
+        await target.render(kernel, KernelArguments())
+
+    kernel.add_function(plugin_name="plug", function=decorated_native_function)
+
+    assert await target.render(kernel, KernelArguments()) == "test"
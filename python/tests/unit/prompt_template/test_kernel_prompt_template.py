@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+
 import pytest
 
 from semantic_kernel.exceptions.template_engine_exceptions import TemplateRenderException
@@ -137,3 +139,83 @@ async def test_it_renders_code_error(kernel: Kernel):
     target = create_kernel_prompt_template(template, allow_dangerously_set_content=True)
     with pytest.raises(TemplateRenderException):
         await target.render(kernel, arguments)
+
+
+async def test_it_renders_code_blocks_concurrently(kernel: Kernel):
+    running = 0
+    max_running = 0
+
+    @kernel_function(name="function")
+    async def my_function(value: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # finish in reverse order, to check the output order is kept
+        await asyncio.sleep(0.01 * (5 - int(value)))
+        running -= 1
+        return f"<{value}>"
+
+    kernel.add_function("test", KernelFunction.from_method(my_function, "test"))
+    template = "".join(f"{i}:{{{{test.function '{i}'}}}};" for i in range(5))
+    target = KernelPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(name="test", template=template),
+        max_concurrent_code_blocks=3,
+    )
+
+    result = await target.render(kernel, KernelArguments())
+
+    assert result == "".join(f"{i}:&lt;{i}&gt;;" for i in range(5))
+    assert max_running == 3
+
+
+async def test_it_renders_blocks_in_template_order_by_default(kernel: Kernel):
+    calls: list[str] = []
+
+    class Value:
+        def __str__(self) -> str:
+            calls.append("variable")
+            return "value"
+
+    @kernel_function(name="function")
+    def my_function() -> str:
+        calls.append("function")
+        return "result"
+
+    kernel.add_function("test", KernelFunction.from_method(my_function, "test"))
+    target = create_kernel_prompt_template("{{$a}} {{test.function}}", allow_dangerously_set_content=True)
+
+    result = await target.render(kernel, KernelArguments(a=Value()))
+
+    assert result == "value result"
+    assert calls == ["variable", "function"]
+
+
+async def test_it_raises_the_first_error_when_rendering_concurrently(kernel: Kernel):
+    @kernel_function(name="function")
+    async def my_function(value: str) -> str:
+        await asyncio.sleep(0.01 * (5 - int(value)))
+        if value in ("1", "3"):
+            raise ValueError(f"Error {value}")
+        return value
+
+    kernel.add_function("test", KernelFunction.from_method(my_function, "test"))
+    template = "".join(f"{{{{test.function '{i}'}}}}" for i in range(5))
+    target = KernelPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(name="test", template=template),
+        max_concurrent_code_blocks=5,
+    )
+
+    with pytest.raises(TemplateRenderException) as exc_info:
+        await target.render(kernel, KernelArguments())
+
+    cause = exc_info.value
+    while cause.__cause__ is not None:
+        cause = cause.__cause__
+    assert str(cause) == "Error 1"
+
+
+async def test_it_renders_text_and_variables_without_code_blocks(kernel: Kernel):
+    target = create_kernel_prompt_template("foo-{{$bar}}-baz")
+    target.max_concurrent_code_blocks = 4
+
+    assert await target.render(kernel, KernelArguments(bar="BAR")) == "foo-BAR-baz"
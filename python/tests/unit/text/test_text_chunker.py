@@ -1,12 +1,17 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import os
+from unittest.mock import patch
+
+from pytest import importorskip, raises
 
 from semantic_kernel.text import (
+    get_tiktoken_tokenizer,
     split_markdown_lines,
     split_markdown_paragraph,
     split_plaintext_lines,
     split_plaintext_paragraph,
+    split_text_stream,
 )
 
 NEWLINE = os.linesep
@@ -144,6 +149,15 @@ def test_split_markdown_paragraph_empty_input():
     assert expected == split
 
 
+def test_split_text_paragraph_many_short_lines():
+    """Test split_paragraph() with lines that count as 0 tokens on their own"""
+    split = split_plaintext_paragraph(["ab"] * 100, max_tokens=10)
+
+    assert len(split) == 8
+    assert all(len(paragraph) // 4 <= 11 for paragraph in split)
+    assert "".join(split).replace(NEWLINE, "") == "ab" * 100
+
+
 def test_split_text_paragraph_evenly():
     """Test split_paragraph() with evenly split input"""
     text = [
@@ -532,3 +546,61 @@ def test_split_md_on_newlines():
     max_token_per_line = 15
     split = split_markdown_paragraph(test, max_token_per_line)
     assert expected == split
+
+
+class WordTokenizer:
+    """A tokenizer with one token per word, including its trailing whitespace."""
+
+    def encode(self, text: str) -> list[int]:
+        return [len(word) for word in text.split(" ") if word]
+
+    def decode(self, tokens) -> str:
+        return " ".join("x" * token for token in tokens)
+
+
+def test_split_text_stream():
+    lines = [f"line {i} has five words{NEWLINE}" for i in range(10)]
+    chunks = list(split_text_stream("".join(lines), max_tokens=12, token_counter=lambda text: len(text.split())))
+    assert chunks == ["".join(lines[i : i + 2]).strip() for i in range(0, 10, 2)]
+
+
+def test_split_text_stream_from_iterable():
+    parts = ["first li", "ne\nsecond line\nthi", "rd line"]
+    chunks = list(split_text_stream(iter(parts), max_tokens=2, token_counter=lambda text: len(text.split())))
+    assert chunks == ["first line", "second line", "third line"]
+
+
+def test_split_text_stream_overlap():
+    text = "\n".join(f"w{i}" for i in range(8))
+    chunks = list(split_text_stream(text, max_tokens=4, overlap_tokens=2, token_counter=lambda text: len(text.split())))
+    assert chunks == ["w0\nw1\nw2\nw3", "w2\nw3\nw4\nw5", "w4\nw5\nw6\nw7"]
+
+
+def test_split_text_stream_long_line():
+    text = "This is a test of the emergency broadcast system. This is only a test."
+    chunks = list(split_text_stream(text, max_tokens=8, token_counter=lambda text: len(text.split())))
+    assert chunks == ["This is a test of the", "emergency broadcast system. This is only a test."]
+    assert all(len(chunk.split()) <= 8 for chunk in chunks)
+
+
+def test_split_text_stream_with_tokenizer():
+    text = "a" * 5 + " " + " ".join(["b"] * 10)
+    chunks = list(split_text_stream(text, max_tokens=4, tokenizer=WordTokenizer()))
+    assert all(len(WordTokenizer().encode(chunk)) <= 4 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_text_stream_invalid_arguments():
+    with raises(ValueError):
+        list(split_text_stream("text", max_tokens=0))
+    with raises(ValueError):
+        list(split_text_stream("text", max_tokens=2, overlap_tokens=2))
+
+
+def test_get_tiktoken_tokenizer():
+    tiktoken = importorskip("tiktoken")
+    with patch.object(tiktoken, "get_encoding", return_value=WordTokenizer()) as get_encoding:
+        get_tiktoken_tokenizer.cache_clear()
+        assert get_tiktoken_tokenizer("test_encoding") is get_tiktoken_tokenizer("test_encoding")
+        get_encoding.assert_called_once_with("test_encoding")
+    get_tiktoken_tokenizer.cache_clear()
@@ -0,0 +1,30 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import time
+
+import pytest
+
+from semantic_kernel.utils.async_utils import RateLimiter
+
+
+async def test_rate_limiter():
+    limiter = RateLimiter(4, period=0.2)
+    start = time.monotonic()
+    for _ in range(4):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05
+    await limiter.acquire(2)
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_rate_limiter_amount_over_limit():
+    limiter = RateLimiter(2, period=0.1)
+    await limiter.acquire(5)
+    start = time.monotonic()
+    await limiter.acquire(1)
+    assert time.monotonic() - start >= 0.04
+
+
+def test_rate_limiter_invalid_limit():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
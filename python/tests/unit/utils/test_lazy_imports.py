@@ -0,0 +1,64 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+LAZY_PACKAGES = [
+    "semantic_kernel",
+    "semantic_kernel.connectors.ai",
+    "semantic_kernel.connectors.ai.anthropic",
+    "semantic_kernel.connectors.ai.azure_ai_inference",
+    "semantic_kernel.connectors.ai.nvidia",
+    "semantic_kernel.connectors.ai.ollama",
+    "semantic_kernel.connectors.ai.onnx",
+    "semantic_kernel.connectors.ai.open_ai",
+    "semantic_kernel.contents",
+    "semantic_kernel.core_plugins",
+    "semantic_kernel.data",
+    "semantic_kernel.filters",
+    "semantic_kernel.functions",
+    "semantic_kernel.memory",
+    "semantic_kernel.prompt_template",
+    "semantic_kernel.services",
+]
+
+
+def _imported_modules(statement: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    ).stderr
+    return {line.rsplit("|", 1)[-1].strip() for line in output.splitlines() if line.startswith("import time:")}
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_lazy_attributes(package):
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+    with pytest.raises(AttributeError):
+        module.DoesNotExist  # noqa: B018
+
+
+def test_functions_exports_the_kernel_function_decorator():
+    import semantic_kernel.functions.kernel_function  # noqa: F401
+    from semantic_kernel.functions import kernel_function
+
+    assert callable(kernel_function)
+
+
+@pytest.mark.parametrize(
+    "statement, not_imported",
+    [
+        ("import semantic_kernel", {"semantic_kernel.kernel", "pydantic"}),
+        ("from semantic_kernel import Kernel", {"openai", "httpx", "pybars", "jinja2"}),
+        ("from semantic_kernel.functions import kernel_function", {"openai", "pybars", "jinja2"}),
+        ("from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion", {"pybars", "jinja2"}),
+    ],
+)
+def test_import_time(statement, not_imported):
+    assert not _imported_modules(statement) & not_imported